@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Build the bundled offline gazetteer for release builds.
+
+Downloads the GeoNames cities dump and admin1 names and writes
+src/accessiweather/resources/gazetteer.tsv.gz, which the packaged app uses for
+instant location suggestions without a first-run download.
+
+Usage:
+    python scripts/build_gazetteer.py                     # cities15000 dump
+    python scripts/build_gazetteer.py cities5000.zip      # a denser dump
+"""
+
+import sys
+from pathlib import Path
+
+
+def main() -> int:
+    """Download GeoNames data and write the bundled gazetteer."""
+    project_root = Path(__file__).resolve().parents[1]
+    sys.path.insert(0, str(project_root / "src"))
+
+    from accessiweather.gazetteer import (
+        BUNDLED_GAZETTEER_FILE,
+        GEONAMES_CITIES_FILE,
+        download_gazetteer,
+    )
+
+    cities_file = sys.argv[1] if len(sys.argv) > 1 else GEONAMES_CITIES_FILE
+    try:
+        gazetteer = download_gazetteer(BUNDLED_GAZETTEER_FILE, cities_file=cities_file)
+    except Exception as exc:
+        print(f"Error: failed to build gazetteer from {cities_file}: {exc}", file=sys.stderr)
+        return 1
+
+    size_kb = BUNDLED_GAZETTEER_FILE.stat().st_size / 1024
+    print(f"Generated {BUNDLED_GAZETTEER_FILE}")
+    print(f"  places: {len(gazetteer)}")
+    print(f"  size:   {size_kb:.0f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
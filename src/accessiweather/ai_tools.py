@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import threading
+import time
+from collections.abc import Sequence
 from typing import Any
 
 from accessiweather.ai_tool_formatters import (
@@ -25,6 +29,24 @@ from accessiweather.services.weather_service.weather_service import WeatherServi
 
 logger = logging.getLogger(__name__)
 
+# Tools that only read weather data; their results are reused for identical
+# calls within one conversation. Tools that touch saved locations always run.
+CACHEABLE_TOOLS = frozenset(
+    {
+        "get_current_weather",
+        "get_forecast",
+        "get_alerts",
+        "get_hourly_forecast",
+        "search_location",
+        "query_open_meteo",
+        "get_area_forecast_discussion",
+        "get_wpc_discussion",
+        "get_spc_outlook",
+    }
+)
+# Reused results must not outlive a normal refresh interval.
+TOOL_RESULT_TTL_SECONDS = 600.0
+
 __all__ = [
     "CORE_TOOLS",
     "DISCUSSION_TOOLS",
@@ -48,7 +70,7 @@ class LocationResolver:
 
     Uses the app's current location as a shortcut when the query matches
     the default location name (case-insensitive), otherwise falls back to
-    the GeocodingService.
+    the GeocodingService. Successful lookups are memoized per resolver.
     """
 
     def __init__(
@@ -72,6 +94,8 @@ class LocationResolver:
         self.default_lat = default_lat
         self.default_lon = default_lon
         self.default_name = default_name
+        self._resolved: dict[str, tuple[float, float, str]] = {}
+        self._lock = threading.Lock()
 
     def _matches_default(self, location_str: str) -> bool:
         """Check if a location string matches the default location name."""
@@ -105,9 +129,17 @@ class LocationResolver:
             )
             return (self.default_lat, self.default_lon, self.default_name)  # type: ignore[return-value]
 
+        key = location_str.strip().lower()
+        with self._lock:
+            cached = self._resolved.get(key)
+        if cached is not None:
+            return cached
+
         result = self.geocoding_service.geocode_address(location_str)
         if result is None:
             raise ValueError(f"Could not resolve location: {location_str}")
+        with self._lock:
+            self._resolved[key] = result
         return result
 
 
@@ -157,6 +189,8 @@ class WeatherToolExecutor:
             "get_wpc_discussion": self._get_wpc_discussion,
             "get_spc_outlook": self._get_spc_outlook,
         }
+        self._results: dict[tuple[str, str], tuple[float, str]] = {}
+        self._results_lock = threading.Lock()
 
     def execute(self, tool_name: str, arguments: dict[str, Any]) -> str:
         """
@@ -177,8 +211,17 @@ class WeatherToolExecutor:
         handler = self._tool_handlers.get(tool_name)
         if handler is None:
             raise ValueError(f"Unknown tool: {tool_name}")
+
+        key = self._result_key(tool_name, arguments)
+        if key is not None:
+            with self._results_lock:
+                cached = self._results.get(key)
+            if cached is not None and time.monotonic() - cached[0] < TOOL_RESULT_TTL_SECONDS:
+                logger.debug("Reusing result for repeated tool call %s", tool_name)
+                return cached[1]
+
         try:
-            return handler(arguments)
+            result = handler(arguments)
         except ValueError as e:
             logger.warning("Tool execution failed for %s: %s", tool_name, e)
             return f"Error: {e}"
@@ -186,6 +229,63 @@ class WeatherToolExecutor:
             logger.error("Unexpected error executing tool %s: %s", tool_name, e)
             return f"Error fetching weather data: {e}"
 
+        # Error strings are returned to the model but never reused.
+        if key is not None and not result.startswith("Error"):
+            with self._results_lock:
+                self._results[key] = (time.monotonic(), result)
+        return result
+
+    def clear_cache(self) -> None:
+        """Forget reused tool results, e.g. when a new conversation starts."""
+        with self._results_lock:
+            self._results.clear()
+
+    def execute_many(self, calls: Sequence[tuple[str, dict[str, Any]]]) -> list[str]:
+        """
+        Execute all tool calls from one model turn in order.
+
+        Identical calls in the batch run once and share their result. Calls
+        run one after another: the weather tools share the NOAA client's
+        rate limiter, so running them in parallel would not finish sooner.
+
+        Args:
+            calls: ``(tool_name, arguments)`` pairs in the order the model sent them.
+
+        Returns:
+            One result string per call, in the same order. Failures (including
+            unknown tools) are reported as ``"Error executing ..."`` strings.
+
+        """
+        done: dict[tuple[str, str], str] = {}
+        results: list[str] = []
+        for tool_name, arguments in calls:
+            key = self._call_key(tool_name, arguments)
+            result = done.get(key)
+            if result is None:
+                try:
+                    result = self.execute(tool_name, arguments)
+                except Exception as exc:
+                    logger.warning("Tool call %s failed: %s", tool_name, exc, exc_info=True)
+                    result = f"Error executing {tool_name}: {exc}"
+                done[key] = result
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _call_key(tool_name: str, arguments: dict[str, Any]) -> tuple[str, str]:
+        """Return the key that identifies repeated calls to the same tool."""
+        return (tool_name, json.dumps(arguments, sort_keys=True, default=str))
+
+    @classmethod
+    def _result_key(cls, tool_name: str, arguments: dict[str, Any]) -> tuple[str, str] | None:
+        """Return the memo key for a cacheable tool call, or None."""
+        if tool_name not in CACHEABLE_TOOLS:
+            return None
+        try:
+            return cls._call_key(tool_name, arguments)
+        except (TypeError, ValueError):
+            return None
+
     def _resolve_location(self, location: str) -> tuple[float, float, str]:
         """
         Resolve a location string to coordinates.
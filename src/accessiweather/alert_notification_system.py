@@ -77,14 +77,22 @@ class AlertNotificationSystem:
 
         logger.info("AlertNotificationSystem initialized")
 
-    async def process_and_notify(self, alerts: WeatherAlerts) -> int:
+    async def process_and_notify(
+        self, alerts: WeatherAlerts, location_name: str | None = None
+    ) -> int:
         """
         Process alerts and send notifications for qualifying alerts.
 
         When multiple alerts are processed in a batch, only one sound is played
         (for the most severe alert) to avoid overlapping sounds.
 
-        Returns
+        Args:
+        ----
+            alerts: Alerts fetched for one location
+            location_name: Saved location the alerts belong to, named in the
+                notification title when it is not the current location
+
+        Returns:
         -------
             Number of notifications sent.
 
@@ -152,7 +160,7 @@ class AlertNotificationSystem:
                     # Only play sound for the first notification to avoid overlap
                     play_sound = i == 0
                     success = await self._send_alert_notification(
-                        alert, reason, play_sound=play_sound
+                        alert, reason, play_sound=play_sound, location_name=location_name
                     )
                     if success:
                         notifications_sent += 1
@@ -224,7 +232,11 @@ class AlertNotificationSystem:
             return False
 
     async def _send_alert_notification(
-        self, alert: WeatherAlert, reason: str, play_sound: bool = True
+        self,
+        alert: WeatherAlert,
+        reason: str,
+        play_sound: bool = True,
+        location_name: str | None = None,
     ) -> bool:
         """
         Send a notification for a specific alert.
@@ -234,6 +246,7 @@ class AlertNotificationSystem:
             alert: The weather alert to notify about
             reason: The reason for notification (new_alert, escalation, etc.)
             play_sound: Whether to play a sound with this notification
+            location_name: Optional location name to prefix the title with
 
         Returns:
         -------
@@ -249,6 +262,8 @@ class AlertNotificationSystem:
                 include_expiration=True,
                 settings=self.settings,
             )
+            if location_name:
+                title = f"{location_name}: {title}"
 
             logger.debug(
                 f"[notify] _send_alert_notification: reason={reason!r}, "
@@ -312,6 +327,7 @@ class AlertNotificationSystem:
     async def notify_lifecycle_changes(
         self,
         diff: AlertLifecycleDiff,
+        location_name: str | None = None,
     ) -> int:
         """
         Fire desktop notifications for updated, escalated, extended, and cancelled alerts.
@@ -325,6 +341,8 @@ class AlertNotificationSystem:
         ----
             diff: The :class:`~accessiweather.alert_lifecycle.AlertLifecycleDiff`
                 produced by the most recent fetch.
+            location_name: Saved location the diff belongs to, named in the
+                notification title when it is not the current location
 
         Returns:
         -------
@@ -346,7 +364,9 @@ class AlertNotificationSystem:
                 continue
             reason = "content_changed"
             try:
-                success = await self._send_alert_notification(change.alert, reason, play_sound=True)
+                success = await self._send_alert_notification(
+                    change.alert, reason, play_sound=True, location_name=location_name
+                )
                 if success:
                     sent += 1
                     logger.info(
@@ -364,7 +384,7 @@ class AlertNotificationSystem:
                 continue
             try:
                 success = await self._send_alert_notification(
-                    change.alert, "escalation", play_sound=True
+                    change.alert, "escalation", play_sound=True, location_name=location_name
                 )
                 if success:
                     sent += 1
@@ -384,7 +404,7 @@ class AlertNotificationSystem:
                 continue
             try:
                 success = await self._send_alert_notification(
-                    change.alert, "extended", play_sound=False
+                    change.alert, "extended", play_sound=False, location_name=location_name
                 )
                 if success:
                     sent += 1
@@ -399,6 +419,8 @@ class AlertNotificationSystem:
         for change in diff.cancelled_alerts:
             try:
                 title = f"CANCELLED: {change.title}" if change.title else "Alert Cancelled"
+                if location_name:
+                    title = f"{location_name}: {title}"
                 message = (
                     f"The alert '{change.title}' has been cancelled or expired."
                     if change.title
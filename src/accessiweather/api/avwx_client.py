@@ -8,6 +8,7 @@ from typing import Any
 
 import httpx
 
+from ..http_session import shared_transport
 from ..models.weather import AviationData
 
 logger = logging.getLogger(__name__)
@@ -80,7 +81,9 @@ async def fetch_avwx_taf(
     headers = {"Accept": "application/json"}
 
     own_client = http_client is None
-    client: httpx.AsyncClient = http_client or httpx.AsyncClient(timeout=timeout)
+    client: httpx.AsyncClient = http_client or httpx.AsyncClient(
+        timeout=timeout, transport=shared_transport()
+    )
 
     try:
         response = await client.get(url, params=params, headers=headers)
@@ -35,10 +35,35 @@ def initialize_components(app: AccessiWeatherApp) -> None:
     # backfill/update the zone fields on saved Locations. Without this the
     # hook in weather_client_nws is a silent no-op — legacy saved locations
     # never populate cwa_office and Forecast Products can't fetch anything.
-    from .weather_client_nws import set_zone_drift_sink
+    from .weather_client_nws import (
+        set_cancel_reference_tracker,
+        set_points_cache,
+        set_validator_store,
+        set_zone_drift_sink,
+    )
 
     set_zone_drift_sink(app.config_manager._locations)
 
+    # Persist /points grid metadata across refreshes and restarts so a normal
+    # refresh costs zero /points round-trips for saved locations.
+    from .nws_points_cache import NwsPointsCache
+
+    set_points_cache(NwsPointsCache(runtime_paths=app.runtime_paths))
+
+    # Revalidate forecast, alert and product fetches with ETag/Last-Modified
+    # so unchanged documents come back as 304 and skip re-parsing.
+    from .nws_validator_store import NwsValidatorStore
+
+    set_validator_store(NwsValidatorStore())
+
+    # Only ask NWS for cancel messages newer than the last poll; the rolling
+    # set of confirmed cancels survives restarts in runtime state.
+    from .nws_cancel_references import NwsCancelReferenceTracker
+
+    set_cancel_reference_tracker(
+        NwsCancelReferenceTracker(runtime_state_manager=app.runtime_state_manager)
+    )
+
     # Defer update service initialization to background (using wx.CallLater)
     app.update_service = None
     wx.CallLater(100, _initialize_update_service_deferred, app)
@@ -78,9 +103,14 @@ def initialize_components(app: AccessiWeatherApp) -> None:
     )
 
     # Lazy import LocationManager
-    from .location_manager import LocationManager
+    from .geocoding_cache import GeocodingCache
+    from .location_manager import LocationManager, set_geocoding_cache
 
+    # Shared by the location dialogs' own managers so repeated searches are
+    # answered from disk instead of re-running the variant fan-out.
+    set_geocoding_cache(GeocodingCache(runtime_paths=app.runtime_paths))
     app.location_manager = LocationManager()
+    wx.CallLater(250, _load_gazetteer_deferred, app)
 
     config = app.config_manager.get_config()
 
@@ -103,6 +133,7 @@ def initialize_components(app: AccessiWeatherApp) -> None:
 
     ai_cache_ttl = getattr(config.settings, "ai_cache_ttl", 300)  # 5 minutes default
     app.ai_explanation_cache = Cache(default_ttl=ai_cache_ttl)
+    app.ai_explanation_cache.start_background_sweep()
 
     # Lazy import alert components
     from .alert_manager import AlertManager
@@ -172,14 +203,32 @@ def _initialize_weather_history_deferred(app: AccessiWeatherApp) -> None:
     """Initialize weather history service in a deferred manner."""
     try:
         from .weather_history import WeatherHistoryService
+        from .weather_history_archive import WeatherHistoryArchive
 
-        app.weather_history_service = WeatherHistoryService()
+        app.weather_history_service = WeatherHistoryService(
+            archive=WeatherHistoryArchive(runtime_paths=app.runtime_paths)
+        )
         logger.info("Weather history service initialized (deferred)")
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.warning("Failed to initialize weather history service: %s", exc)
         app.weather_history_service = None
 
 
+def _load_gazetteer_deferred(app: AccessiWeatherApp) -> None:
+    """Load the offline gazetteer in a background thread, downloading it if missing."""
+    import threading
+
+    def load_in_thread() -> None:
+        try:
+            from .gazetteer import load_or_download_gazetteer, set_default_gazetteer
+
+            set_default_gazetteer(load_or_download_gazetteer(app.runtime_paths))
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.warning("Failed to load offline gazetteer: %s", exc)
+
+    threading.Thread(target=load_in_thread, daemon=True).start()
+
+
 def load_initial_data(app: AccessiWeatherApp) -> None:
     """Load persisted configuration and kick off initial data fetches."""
     logger.info("Loading initial data")
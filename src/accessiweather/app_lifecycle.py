@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import logging
 
@@ -380,6 +381,14 @@ class AppLifecycleMixin:
 
         # Stop async loop
         if self._async_loop:
+            # Release pooled HTTP connections on the loop that owns them first.
+            if getattr(self, "weather_client", None) is not None:
+                try:
+                    asyncio.run_coroutine_threadsafe(
+                        self.weather_client.close(), self._async_loop
+                    ).result(timeout=2.0)
+                except Exception:
+                    logger.debug("Could not close HTTP sessions during shutdown", exc_info=True)
             self._async_loop.call_soon_threadsafe(self._async_loop.stop)
 
         # Close main window and exit
@@ -7,13 +7,17 @@ instance as their first argument and operate on its timer attributes.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import logging
 import time
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 import wx
 
+from .refresh_scheduler import ALL_LOCATIONS, EVENTS, WEATHER, RefreshScheduler
+
 if TYPE_CHECKING:
     from .app import AccessiWeatherApp
 
@@ -24,6 +28,10 @@ logger = logging.getLogger(__name__)
 # laptop sleep/wake; long enough to avoid overhead.
 AUTO_UPDATE_POLL_INTERVAL_MS = 15 * 60 * 1000
 
+# Upper bound on how long the refresh scheduler sleeps, so location changes
+# and alert state are re-planned promptly even when nothing is due.
+REFRESH_SCHEDULER_MAX_SLEEP_SECONDS = 60.0
+
 
 def stop_auto_update_checks(app: AccessiWeatherApp) -> None:
     """Stop and detach the automatic update-check timer, if present."""
@@ -108,7 +116,12 @@ def on_auto_update_check_timer(app: AccessiWeatherApp, event) -> None:
 
 
 def stop_background_updates(app: AccessiWeatherApp) -> None:
-    """Stop any running background timers."""
+    """Stop the refresh scheduler and any running background timers."""
+    scheduler_future = getattr(app, "_refresh_scheduler_future", None)
+    if scheduler_future is not None:
+        scheduler_future.cancel()
+        app._refresh_scheduler_future = None
+
     weather_timer = getattr(app, "_update_timer", None)
     if weather_timer:
         weather_timer.Stop()
@@ -119,13 +132,34 @@ def stop_background_updates(app: AccessiWeatherApp) -> None:
 
 
 def start_background_updates(app: AccessiWeatherApp) -> None:
-    """Start split background timers for full refreshes and lightweight event checks."""
+    """
+    Start background refreshes.
+
+    With the async loop running, an adaptive :class:`RefreshScheduler` plans
+    full refreshes per location and batched event checks. Without it (e.g.
+    before the loop starts) split fixed-interval wx timers are used instead.
+    """
     try:
         from .constants import ALERT_POLL_INTERVAL_SECONDS
 
         stop_background_updates(app)
         settings = app.config_manager.get_settings()
         interval_minutes = getattr(settings, "update_interval_minutes", 10)
+
+        loop = getattr(app, "_async_loop", None)
+        if loop is not None:
+            app._refresh_scheduler = RefreshScheduler()
+            app._refresh_scheduler_future = asyncio.run_coroutine_threadsafe(
+                run_refresh_scheduler(app, app._refresh_scheduler), loop
+            )
+            logger.info(
+                "Adaptive background updates started (base weather interval %s minutes, "
+                "events every %ss)",
+                interval_minutes,
+                ALERT_POLL_INTERVAL_SECONDS,
+            )
+            return
+
         interval_ms = interval_minutes * 60 * 1000
         event_interval_ms = ALERT_POLL_INTERVAL_SECONDS * 1000
 
@@ -146,6 +180,107 @@ def start_background_updates(app: AccessiWeatherApp) -> None:
         logger.error(f"Failed to start background updates: {e}")
 
 
+async def run_refresh_scheduler(app: AccessiWeatherApp, scheduler: RefreshScheduler) -> None:
+    """Plan, wait for and dispatch background refreshes until cancelled."""
+    from .constants import ALERT_POLL_INTERVAL_SECONDS
+
+    event_interval = timedelta(seconds=ALERT_POLL_INTERVAL_SECONDS)
+    scheduler.schedule(ALL_LOCATIONS, EVENTS, event_interval)
+    try:
+        while True:
+            try:
+                plan_location_refreshes(app, scheduler)
+            except Exception as e:
+                logger.debug(f"Failed to plan background refreshes: {e}")
+            wait = scheduler.seconds_until_next()
+            if wait is None or wait > REFRESH_SCHEDULER_MAX_SLEEP_SECONDS:
+                wait = REFRESH_SCHEDULER_MAX_SLEEP_SECONDS
+            await asyncio.sleep(wait)
+
+            due = scheduler.pop_due()
+            if not due:
+                continue
+            if any(kind == EVENTS for _, kind in due):
+                scheduler.schedule(ALL_LOCATIONS, EVENTS, event_interval)
+            try:
+                await dispatch_due_refreshes(app, due)
+            except Exception as e:
+                logger.error(f"Background refresh batch failed: {e}")
+    finally:
+        for task in list(getattr(app, "_pre_warm_tasks", None) or ()):
+            task.cancel()
+
+
+def plan_location_refreshes(app: AccessiWeatherApp, scheduler: RefreshScheduler) -> None:
+    """
+    Plan a full refresh for each location that needs one and drop stale plans.
+
+    An existing plan is kept unless the newly suggested interval is shorter
+    than its remaining wait, so a location that turns active (new alerts,
+    likely precipitation) is pulled forward instead of waiting out a quiet plan.
+    """
+    client = getattr(app, "weather_client", None)
+    if client is None:
+        return
+    current = app.config_manager.get_current_location()
+    wanted: set[str] = set()
+    for location in app.config_manager.get_all_locations():
+        is_current = current is not None and location.name == current.name
+        interval = client.suggest_refresh_interval(location, active_location=is_current)
+        if interval is None:
+            continue
+        wanted.add(location.name)
+        remaining = scheduler.seconds_until(location.name, WEATHER)
+        if remaining is None or interval.total_seconds() < remaining:
+            scheduler.schedule(location.name, WEATHER, interval)
+    for name in scheduler.planned_keys(WEATHER) - wanted:
+        scheduler.cancel(name, WEATHER)
+
+
+async def dispatch_due_refreshes(app: AccessiWeatherApp, due: list[tuple[str, str]]) -> None:
+    """
+    Run one coalesced batch of due refreshes.
+
+    The active location and event checks go through the same main-window
+    paths as before (on the UI thread); other due locations are refreshed
+    together in a single pre-warm batch that runs as its own task, so a slow
+    batch never holds up the scheduler's next wake-up.
+    """
+    if any(kind == EVENTS for _, kind in due):
+        wx.CallAfter(app._on_event_check_update, None)
+
+    due_names = {key for key, kind in due if kind == WEATHER}
+    if not due_names:
+        return
+    current = app.config_manager.get_current_location()
+    if current is not None and current.name in due_names:
+        wx.CallAfter(app._on_background_update, None)
+    others = [
+        location
+        for location in app.config_manager.get_all_locations()
+        if location.name in due_names and (current is None or location.name != current.name)
+    ]
+    if others:
+        tasks = getattr(app, "_pre_warm_tasks", None)
+        if tasks is None:
+            tasks = app._pre_warm_tasks = set()
+        task = asyncio.create_task(
+            app.weather_client.pre_warm_batch(others, active_location=current)
+        )
+        tasks.add(task)
+        task.add_done_callback(lambda done: _finish_pre_warm_task(tasks, done))
+
+
+def _finish_pre_warm_task(tasks: set[asyncio.Task], task: asyncio.Task) -> None:
+    """Forget a finished pre-warm batch and log its failure, if any."""
+    tasks.discard(task)
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.error(f"Background pre-warm batch failed: {error}")
+
+
 def on_background_update(app: AccessiWeatherApp, event) -> None:
     """Handle slower full weather refresh timer event."""
     if app.main_window and not app.is_updating:
@@ -4,23 +4,27 @@ Cache module for AccessiWeather.
 This module provides caching functionality to reduce API calls and improve performance.
 """
 
-import json
 import logging
+import sys
+import threading
 import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from .cache_format import decode_header, decode_sections, encode_cache_entry
 from .cache_serialization import (
     _deserialize_alert,  # noqa: F401 - compatibility re-export for existing tests/callers
-    _deserialize_datetime,
     _deserialize_weather_data,
     _safe_location_key,
     _serialize_alert,  # noqa: F401 - compatibility re-export for existing tests/callers
-    _serialize_datetime,
     _serialize_weather_data,
 )
+from .cache_store import STORE_FILENAME, SnapshotRow, SnapshotStore
 from .models import Location, WeatherData
 
 logger = logging.getLogger(__name__)
@@ -30,28 +34,122 @@ logger = logging.getLogger(__name__)
 CACHE_SCHEMA_VERSION = 6
 
 
+# Defaults for the in-memory Cache. Text products and AI responses are a few KB
+# each, so these bound a long-running session to a few MB.
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_SWEEP_INTERVAL_SECONDS = 60.0
+
+# Per-namespace entry limits. A key's namespace is the text before its first
+# ":" (e.g. ``nws_text_product:AFD:PHI``); keys without one are unlimited
+# beyond the cache-wide bounds.
+DEFAULT_NAMESPACE_QUOTAS: dict[str, int] = {
+    "nws_text_product": 256,
+    "nws_text_product_history": 64,
+    "iem_text_product": 128,
+    "ai_explanation": 64,
+    "ai_text_product": 64,
+    "surf_conditions": 32,
+}
+
+
 @dataclass
 class CacheEntry:
     """A cache entry with value and expiration time."""
 
     value: Any
     expiration: float  # Expiration time as Unix timestamp
+    size: int = 0  # Approximate size of ``value`` in bytes
+    namespace: str = ""
+    stale_until: float = 0.0  # Kept for stale reads until this Unix timestamp
+
+    def retained_until(self) -> float:
+        """Return when the entry may be dropped entirely."""
+        return max(self.expiration, self.stale_until)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time counters for a :class:`Cache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    approx_bytes: int
+    namespaces: dict[str, int]
+
+
+def _namespace_for(key: str) -> str:
+    namespace, sep, _rest = key.partition(":")
+    return namespace if sep else ""
+
+
+def _approximate_size(value: Any, _depth: int = 0) -> int:
+    """Estimate the memory held by a cached value without walking huge graphs."""
+    if isinstance(value, str | bytes | bytearray):
+        return len(value) + 49
+    if _depth >= 4:
+        return sys.getsizeof(value, 64)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            _approximate_size(k, _depth + 1) + _approximate_size(v, _depth + 1)
+            for k, v in value.items()
+        )
+    if isinstance(value, list | tuple | set | frozenset):
+        return sys.getsizeof(value) + sum(_approximate_size(item, _depth + 1) for item in value)
+    fields = getattr(value, "__dict__", None)
+    if isinstance(fields, dict):
+        return sys.getsizeof(value, 64) + _approximate_size(fields, _depth + 1)
+    return sys.getsizeof(value, 64)
 
 
 class Cache:
-    """A simple in-memory cache with TTL support."""
-
-    def __init__(self, default_ttl: int = 300):
+    """
+    An in-memory TTL cache with LRU eviction and memory accounting.
+
+    The cache is bounded by an entry count, an approximate byte budget and
+    optional per-namespace entry quotas; the least recently used entries are
+    evicted first. Expired entries are dropped when read, when ``cleanup()``
+    runs, and periodically once :meth:`start_background_sweep` is called.
+    """
+
+    def __init__(
+        self,
+        default_ttl: int = 300,
+        *,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = DEFAULT_MAX_BYTES,
+        namespace_quotas: dict[str, int] | None = None,
+    ):
         """
         Initialize the cache.
 
         Args:
         ----
             default_ttl: Default time-to-live in seconds (default: 5 minutes)
+            max_entries: Maximum number of entries (``None`` for no limit)
+            max_bytes: Approximate memory budget in bytes (``None`` for no limit)
+            namespace_quotas: Entry limits per key namespace; defaults to
+                ``DEFAULT_NAMESPACE_QUOTAS``
 
         """
-        self.data: dict[str, CacheEntry] = {}
+        self.data: OrderedDict[str, CacheEntry] = OrderedDict()
         self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.namespace_quotas = dict(
+            DEFAULT_NAMESPACE_QUOTAS if namespace_quotas is None else namespace_quotas
+        )
+        self._lock = threading.RLock()
+        self._bytes = 0
+        self._namespace_counts: dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._sweep_stop: threading.Event | None = None
         logger.debug(f"Initialized cache with default TTL of {default_ttl} seconds")
 
     def get(self, key: str) -> Any | None:
@@ -67,24 +165,22 @@ class Cache:
             The cached value or None if not found or expired
 
         """
-        if key not in self.data:
-            logger.debug(f"Cache miss for '{key}'")
-            return None
-
-        entry = self.data[key]
-        current_time = time.time()
-
-        # Check if the entry has expired
-        if entry.expiration < current_time:
-            logger.debug(f"Cache entry for '{key}' has expired")
-            # Remove the expired entry
-            del self.data[key]
-            return None
-
-        logger.debug(f"Cache hit for '{key}' (expires in {int(entry.expiration - current_time)}s)")
-        return entry.value
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                self._misses += 1
+                logger.debug(f"Cache miss for '{key}'")
+                return None
+
+            self._hits += 1
+            logger.debug(
+                f"Cache hit for '{key}' (expires in {int(entry.expiration - time.time())}s)"
+            )
+            return entry.value
 
-    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+    def set(
+        self, key: str, value: Any, ttl: float | None = None, *, stale_ttl: float = 0.0
+    ) -> None:
         """
         Set a value in the cache.
 
@@ -93,19 +189,38 @@ class Cache:
             key: The cache key
             value: The value to cache
             ttl: Time-to-live in seconds (uses default_ttl if None)
+            stale_ttl: Extra seconds after expiry during which the value can
+                still be read with ``get_entry(key, allow_stale=True)``
 
         """
         if ttl is None:
             ttl = self.default_ttl
 
         expiration = time.time() + ttl
-        self.data[key] = CacheEntry(value=value, expiration=expiration)
+        entry = CacheEntry(
+            value=value,
+            expiration=expiration,
+            size=_approximate_size(value),
+            namespace=_namespace_for(key),
+            stale_until=expiration + max(0.0, stale_ttl),
+        )
+        with self._lock:
+            self._remove(key)
+            self.data[key] = entry
+            self._bytes += entry.size
+            self._namespace_counts[entry.namespace] = (
+                self._namespace_counts.get(entry.namespace, 0) + 1
+            )
+            self._enforce_limits(entry.namespace)
         logger.debug(f"Cached value for '{key}' with TTL of {ttl} seconds")
 
     def has_key(self, key: str) -> bool:
         """
         Check if a key exists in the cache and is not expired.
 
+        A missing key counts as a miss; the hit is counted by the ``get()``
+        that normally follows a positive check.
+
         Args:
         ----
             key: The cache key
@@ -115,19 +230,28 @@ class Cache:
             True if the key exists and is not expired, False otherwise
 
         """
-        if key not in self.data:
-            return False
-
-        entry = self.data[key]
-        current_time = time.time()
+        with self._lock:
+            if self._live_entry(key) is None:
+                self._misses += 1
+                return False
+            return True
 
-        # Check if the entry has expired
-        if entry.expiration < current_time:
-            # Remove the expired entry
-            del self.data[key]
-            return False
+    def get_entry(self, key: str, *, allow_stale: bool = False) -> CacheEntry | None:
+        """
+        Return the raw entry for ``key`` without touching hit/miss counters.
 
-        return True
+        With ``allow_stale`` an expired entry is still returned while it is
+        inside the ``stale_ttl`` window it was stored with; callers can compare
+        ``entry.expiration`` with the current time to tell the two apart.
+        """
+        with self._lock:
+            entry = self.data.get(key)
+            if entry is None:
+                return None
+            now = time.time()
+            if entry.expiration >= now or (allow_stale and entry.stale_until >= now):
+                return entry
+            return None
 
     def invalidate(self, key: str) -> None:
         """
@@ -138,26 +262,121 @@ class Cache:
             key: The cache key to invalidate
 
         """
-        if key in self.data:
-            del self.data[key]
-            logger.debug(f"Invalidated cache entry for '{key}'")
+        with self._lock:
+            if self._remove(key):
+                logger.debug(f"Invalidated cache entry for '{key}'")
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self.data.clear()
+        with self._lock:
+            self.data.clear()
+            self._bytes = 0
+            self._namespace_counts.clear()
         logger.debug("Cleared all cache entries")
 
     def cleanup(self) -> None:
         """Remove all expired entries from the cache."""
         current_time = time.time()
-        expired_keys = [key for key, entry in self.data.items() if entry.expiration < current_time]
-
-        for key in expired_keys:
-            del self.data[key]
+        with self._lock:
+            expired_keys = [
+                key for key, entry in self.data.items() if entry.retained_until() < current_time
+            ]
+            for key in expired_keys:
+                self._remove(key)
+            self._expirations += len(expired_keys)
 
         if expired_keys:
             logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
 
+    def stats(self) -> CacheStats:
+        """Return hit/miss/eviction counters and current memory accounting."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self.data),
+                approx_bytes=self._bytes,
+                namespaces={ns: count for ns, count in self._namespace_counts.items() if count},
+            )
+
+    def start_background_sweep(
+        self, interval_seconds: float = DEFAULT_SWEEP_INTERVAL_SECONDS
+    ) -> None:
+        """
+        Run ``cleanup()`` every ``interval_seconds`` on a daemon thread.
+
+        The thread holds only a weak reference, so it exits once the cache is
+        garbage collected or :meth:`stop_background_sweep` is called.
+        """
+        with self._lock:
+            if self._sweep_stop is not None:
+                return
+            stop = threading.Event()
+            self._sweep_stop = stop
+
+        cache_ref = weakref.ref(self)
+
+        def sweep() -> None:
+            while not stop.wait(interval_seconds):
+                cache = cache_ref()
+                if cache is None:
+                    return
+                try:
+                    cache.cleanup()
+                except Exception:  # noqa: BLE001
+                    logger.debug("Background cache sweep failed", exc_info=True)
+                del cache
+
+        threading.Thread(target=sweep, name="cache-sweep", daemon=True).start()
+
+    def stop_background_sweep(self) -> None:
+        """Stop the background expiry sweep if it is running."""
+        with self._lock:
+            stop, self._sweep_stop = self._sweep_stop, None
+        if stop is not None:
+            stop.set()
+
+    def _live_entry(self, key: str) -> CacheEntry | None:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        now = time.time()
+        if entry.expiration < now:
+            logger.debug(f"Cache entry for '{key}' has expired")
+            if entry.stale_until < now:
+                self._remove(key)
+                self._expirations += 1
+            return None
+        self.data.move_to_end(key)
+        return entry
+
+    def _remove(self, key: str) -> bool:
+        entry = self.data.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        self._namespace_counts[entry.namespace] -= 1
+        return True
+
+    def _enforce_limits(self, namespace: str) -> None:
+        quota = self.namespace_quotas.get(namespace)
+        if quota is not None:
+            while self._namespace_counts.get(namespace, 0) > quota:
+                oldest = next(k for k, e in self.data.items() if e.namespace == namespace)
+                self._evict(oldest)
+        while self.data and (
+            (self.max_entries is not None and len(self.data) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes and len(self.data) > 1)
+        ):
+            self._evict(next(iter(self.data)))
+
+    def _evict(self, key: str) -> None:
+        self._remove(key)
+        self._evictions += 1
+        logger.debug(f"Evicted cache entry '{key}'")
+
 
 class WeatherDataCache:
     """Persist the latest weather data per location for offline fallback."""
@@ -168,94 +387,168 @@ class WeatherDataCache:
 
         Args:
         ----
-            cache_dir: Directory where cache files are stored.
+            cache_dir: Directory holding the cache database.
             max_age_minutes: Age threshold before cached entries expire.
 
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.max_age = timedelta(minutes=max_age_minutes)
+        self._store = SnapshotStore(self.cache_dir / STORE_FILENAME)
 
     def store(self, location: Location, weather: WeatherData) -> None:
         try:
-            payload = {
-                "schema_version": CACHE_SCHEMA_VERSION,
-                "saved_at": _serialize_datetime(datetime.now(UTC)),
-                "location": {
-                    "name": location.name,
-                    "latitude": location.latitude,
-                    "longitude": location.longitude,
-                    **({"country_code": location.country_code} if location.country_code else {}),
-                },
-                "weather": _serialize_weather_data(weather),
+            location_payload = {
+                "name": location.name,
+                "latitude": location.latitude,
+                "longitude": location.longitude,
+                **({"country_code": location.country_code} if location.country_code else {}),
             }
-            path = self._path_for_location(location)
-            with path.open("w", encoding="utf-8") as fh:
-                json.dump(payload, fh, indent=2)
+            key = _safe_location_key(location)
+            saved_at = time.time()
+            encoded = encode_cache_entry(
+                schema_version=CACHE_SCHEMA_VERSION,
+                saved_at=saved_at,
+                location_key=key,
+                sections={"location": location_payload, **_serialize_weather_data(weather)},
+            )
+            self._store.put(SnapshotRow(key, CACHE_SCHEMA_VERSION, saved_at, encoded))
         except Exception as exc:  # noqa: BLE001
             logger.debug(f"Failed to persist weather cache: {exc}")
 
-    def load(self, location: Location, *, allow_stale: bool = True) -> WeatherData | None:
-        path = self._path_for_location(location)
-        if not path.exists():
-            return None
+    def load(
+        self,
+        location: Location,
+        *,
+        allow_stale: bool = True,
+        sections: Iterable[str] | None = None,
+    ) -> WeatherData | None:
+        """
+        Load cached weather data for a location.
+
+        Args:
+        ----
+            location: Location to load.
+            allow_stale: Return entries older than ``max_age`` (marked stale).
+            sections: ``WeatherData`` fields to decode (e.g. ``("current",)``).
+                Fields that are not requested are left at their defaults.
+                ``None`` decodes everything.
+
+        """
+        return self.load_many([location], allow_stale=allow_stale, sections=sections).get(
+            location.name
+        )
 
+    def load_many(
+        self,
+        locations: Iterable[Location],
+        *,
+        allow_stale: bool = True,
+        sections: Iterable[str] | None = None,
+    ) -> dict[str, WeatherData]:
+        """
+        Load cached weather data for several locations with one query.
+
+        Returns a mapping of location name to data; locations without a usable
+        entry are omitted. Arguments match :meth:`load`.
+        """
+        by_key = {_safe_location_key(location): location for location in locations}
         try:
-            with path.open(encoding="utf-8") as fh:
-                payload = json.load(fh)
+            rows = self._store.get_many(list(by_key))
         except Exception as exc:  # noqa: BLE001
             logger.debug(f"Failed to read cached weather data: {exc}")
-            return None
+            return {}
 
-        # Validate cache schema version
-        cached_schema_version = payload.get("schema_version", 1)
-        if cached_schema_version != CACHE_SCHEMA_VERSION:
-            logger.debug(
-                f"Cache schema version mismatch for {location.name}: "
-                f"cached={cached_schema_version}, current={CACHE_SCHEMA_VERSION}. "
-                f"Invalidating cache."
-            )
-            path.unlink(missing_ok=True)
-            return None
+        names = None if sections is None else {"location", *sections}
+        now = datetime.now(UTC)
+        loaded: dict[str, WeatherData] = {}
+        for key, row in rows.items():
+            location = by_key[key]
+            # Validate cache schema version
+            if row.schema_version != CACHE_SCHEMA_VERSION:
+                logger.debug(
+                    f"Cache schema version mismatch for {location.name}: "
+                    f"cached={row.schema_version}, current={CACHE_SCHEMA_VERSION}. "
+                    f"Invalidating cache."
+                )
+                self.invalidate(location)
+                continue
+
+            saved_at = datetime.fromtimestamp(row.saved_at, UTC)
+            age = now - saved_at
+            if not allow_stale and age > self.max_age:
+                continue
 
-        saved_at = _deserialize_datetime(payload.get("saved_at")) or datetime.now(UTC)
-        age = datetime.now(UTC) - saved_at
-        if not allow_stale and age > self.max_age:
-            return None
+            try:
+                payload = decode_sections(row.payload, decode_header(row.payload), names)
+            except Exception as exc:  # noqa: BLE001
+                # An undecodable row would fail the same way on every load.
+                logger.debug(f"Failed to decode cached weather data, removing it: {exc}")
+                self.invalidate(location)
+                continue
+
+            location_data = payload.pop("location", None) or {}
+            normalized_location = Location(
+                name=location_data.get("name", location.name),
+                latitude=location_data.get("latitude", location.latitude),
+                longitude=location_data.get("longitude", location.longitude),
+                country_code=location_data.get("country_code"),
+            )
 
-        location_data = payload.get("location") or {}
-        loc_name = location_data.get("name", location.name)
-        loc_lat = location_data.get("latitude", location.latitude)
-        loc_lon = location_data.get("longitude", location.longitude)
-        normalized_location = Location(
-            name=loc_name,
-            latitude=loc_lat,
-            longitude=loc_lon,
-            country_code=location_data.get("country_code"),
-        )
+            weather = _deserialize_weather_data(payload, normalized_location)
+            weather.stale = age > self.max_age
+            weather.stale_since = saved_at
+            weather.stale_reason = "Cached data"
+            loaded[location.name] = weather
+        return loaded
 
-        weather_payload = payload.get("weather")
-        if not isinstance(weather_payload, dict):
-            return None
+    def locations_with_data(
+        self, locations: Iterable[Location], *, fresh_only: bool = False
+    ) -> list[Location]:
+        """
+        Return the given locations that have a cached entry, in input order.
 
-        weather = _deserialize_weather_data(weather_payload, normalized_location)
-        weather.stale = age > self.max_age
-        weather.stale_since = saved_at
-        weather.stale_reason = "Cached data"
-        return weather
+        With ``fresh_only`` only entries younger than ``max_age`` count. Only
+        the index is consulted; no payload is decoded.
+        """
+        candidates = list(locations)
+        cutoff = time.time() - self.max_age.total_seconds() if fresh_only else float("-inf")
+        try:
+            keys = self._store.keys_saved_since(
+                [_safe_location_key(location) for location in candidates],
+                cutoff,
+                CACHE_SCHEMA_VERSION,
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Failed to query weather cache index: {exc}")
+            return []
+        return [location for location in candidates if _safe_location_key(location) in keys]
 
     def purge_expired(self) -> None:
-        now = datetime.now(UTC)
-        for path in self.cache_dir.glob("*.json"):
-            try:
-                with path.open(encoding="utf-8") as fh:
-                    payload = json.load(fh)
-                saved_at = _deserialize_datetime(payload.get("saved_at")) or now
-                if now - saved_at > self.max_age * 2:
-                    path.unlink(missing_ok=True)
-            except Exception:  # noqa: BLE001
+        try:
+            removed = self._store.purge(
+                time.time() - self.max_age.total_seconds() * 2, CACHE_SCHEMA_VERSION
+            )
+            if removed:
+                logger.debug(f"Purged {removed} expired weather cache entries")
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Weather cache purge failed: {exc}")
+        # Per-location files from earlier cache formats are no longer read.
+        for pattern in ("*.json", "*.awc"):
+            for path in self.cache_dir.glob(pattern):
                 path.unlink(missing_ok=True)
 
+    def compact(self) -> None:
+        """Reclaim space left by deleted entries in the cache database."""
+        try:
+            self._store.compact()
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Weather cache compaction failed: {exc}")
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self._store.close()
+
     def invalidate(self, location: Location) -> None:
         """
         Invalidate cache entry for a specific location.
@@ -265,11 +558,8 @@ class WeatherDataCache:
             location: The location to invalidate cache for
 
         """
-        path = self._path_for_location(location)
-        if path.exists():
-            path.unlink(missing_ok=True)
-            logger.debug(f"Invalidated cache for location '{location.name}'")
-
-    def _path_for_location(self, location: Location) -> Path:
-        filename = f"{_safe_location_key(location)}.json"
-        return self.cache_dir / filename
+        try:
+            if self._store.delete(_safe_location_key(location)):
+                logger.debug(f"Invalidated cache for location '{location.name}'")
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Failed to invalidate weather cache: {exc}")
@@ -0,0 +1,165 @@
+"""
+Binary container format for persisted weather cache entries.
+
+Each entry is one self-describing blob (stored in the cache database by
+``cache_store``).
+
+Layout (little-endian)::
+
+    fixed header   magic "AWXC", format version (u16), schema version (u16),
+                   saved_at epoch seconds (f64), header length (u32),
+                   location-key length (u16), section count (u16)
+    location key   UTF-8
+    section table  per section: name length (u8), name, flags (u8),
+                   offset (u32), length (u32)
+    section data   one compact JSON document per section, zlib-compressed
+                   when flags has SECTION_COMPRESSED set
+
+Each section is decoded independently, so a caller that only needs
+``current`` does not materialize the hourly and daily forecasts.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+import zlib
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_MAGIC = b"AWXC"
+CACHE_FILE_FORMAT_VERSION = 1
+
+SECTION_COMPRESSED = 0x01
+# Small sections (current conditions, flags) are cheaper to store raw than to
+# pay zlib's fixed overhead on every read.
+COMPRESS_THRESHOLD_BYTES = 1024
+
+_FIXED_HEADER = struct.Struct("<4sHHdIHH")
+_SECTION_ENTRY = struct.Struct("<BII")
+
+
+class CacheFormatError(ValueError):
+    """Raised when bytes are not a readable cache container."""
+
+
+@dataclass(frozen=True)
+class CacheFileHeader:
+    """Metadata stored ahead of the section payloads."""
+
+    schema_version: int
+    saved_at: float
+    location_key: str
+    sections: dict[str, tuple[int, int, int]]
+    """Section name -> (flags, offset, length); offsets are from the start of the buffer."""
+
+
+def encode_cache_entry(
+    *,
+    schema_version: int,
+    saved_at: float,
+    location_key: str,
+    sections: Mapping[str, Any],
+) -> bytes:
+    """Encode JSON-serializable sections into a single cache container."""
+    key_bytes = location_key.encode("utf-8")
+    blobs: list[tuple[bytes, int, bytes]] = []
+    for name, value in sections.items():
+        data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        flags = 0
+        if len(data) >= COMPRESS_THRESHOLD_BYTES:
+            data = zlib.compress(data, 1)
+            flags |= SECTION_COMPRESSED
+        blobs.append((name.encode("utf-8"), flags, data))
+
+    header_length = (
+        _FIXED_HEADER.size
+        + len(key_bytes)
+        + sum(1 + len(name) + _SECTION_ENTRY.size for name, _flags, _data in blobs)
+    )
+    table = bytearray()
+    offset = header_length
+    for name, flags, data in blobs:
+        table += bytes((len(name),)) + name + _SECTION_ENTRY.pack(flags, offset, len(data))
+        offset += len(data)
+
+    return b"".join(
+        [
+            _FIXED_HEADER.pack(
+                CACHE_FILE_MAGIC,
+                CACHE_FILE_FORMAT_VERSION,
+                schema_version,
+                saved_at,
+                header_length,
+                len(key_bytes),
+                len(blobs),
+            ),
+            key_bytes,
+            bytes(table),
+            *(data for _name, _flags, data in blobs),
+        ]
+    )
+
+
+def decode_header(buffer: bytes | memoryview) -> CacheFileHeader:
+    """Parse the header of a cache container without touching section data."""
+    view = memoryview(buffer)
+    if len(view) < _FIXED_HEADER.size:
+        raise CacheFormatError("truncated cache header")
+    magic, format_version, schema_version, saved_at, header_length, key_length, count = (
+        _FIXED_HEADER.unpack_from(view, 0)
+    )
+    if magic != CACHE_FILE_MAGIC:
+        raise CacheFormatError("not a weather cache file")
+    if format_version != CACHE_FILE_FORMAT_VERSION:
+        raise CacheFormatError(f"unsupported cache format version {format_version}")
+    if len(view) < header_length:
+        raise CacheFormatError("truncated cache header")
+
+    position = _FIXED_HEADER.size
+    location_key = bytes(view[position : position + key_length]).decode("utf-8")
+    position += key_length
+    sections: dict[str, tuple[int, int, int]] = {}
+    for _ in range(count):
+        name_length = view[position]
+        position += 1
+        name = bytes(view[position : position + name_length]).decode("utf-8")
+        position += name_length
+        flags, offset, length = _SECTION_ENTRY.unpack_from(view, position)
+        position += _SECTION_ENTRY.size
+        sections[name] = (flags, offset, length)
+    if position != header_length:
+        raise CacheFormatError("corrupt cache section table")
+    return CacheFileHeader(
+        schema_version=schema_version,
+        saved_at=saved_at,
+        location_key=location_key,
+        sections=sections,
+    )
+
+
+def decode_sections(
+    buffer: bytes | memoryview,
+    header: CacheFileHeader,
+    names: Iterable[str] | None = None,
+) -> dict[str, Any]:
+    """Decode the requested sections (all of them when ``names`` is None)."""
+    view = memoryview(buffer)
+    wanted = header.sections.keys() if names is None else names
+    decoded: dict[str, Any] = {}
+    for name in wanted:
+        entry = header.sections.get(name)
+        if entry is None:
+            continue
+        flags, offset, length = entry
+        if offset + length > len(view):
+            raise CacheFormatError(f"cache section {name!r} is truncated")
+        data = view[offset : offset + length]
+        if flags & SECTION_COMPRESSED:
+            data = zlib.decompress(data)
+        decoded[name] = json.loads(bytes(data))
+    return decoded
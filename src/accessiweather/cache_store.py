@@ -0,0 +1,173 @@
+"""
+Single-file SQLite store backing the offline weather cache.
+
+Every location's latest snapshot lives in one ``snapshots`` table keyed by the
+cache location key. The schema version and ``saved_at`` are plain indexed
+columns, so expiry, purge and "which locations have data" are single queries
+that never read the payload. Payloads are opaque blobs (see ``cache_format``).
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+STORE_FILENAME = "weather_cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    location_key TEXT PRIMARY KEY,
+    schema_version INTEGER NOT NULL,
+    saved_at REAL NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_saved_at ON snapshots (saved_at);
+"""
+
+# SQLite caps bound parameters per statement (999 on older builds).
+_MAX_QUERY_PARAMS = 500
+
+
+@dataclass(frozen=True)
+class SnapshotRow:
+    """One stored snapshot."""
+
+    location_key: str
+    schema_version: int
+    saved_at: float
+    payload: bytes
+
+
+class SnapshotStore:
+    """Thread-safe wrapper around the snapshot database."""
+
+    def __init__(self, path: Path):
+        """Open (or create) the database at ``path``."""
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def put(self, row: SnapshotRow) -> None:
+        """Insert or replace a snapshot in a single transaction."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO snapshots "
+                    "(location_key, schema_version, saved_at, payload) VALUES (?, ?, ?, ?)",
+                    (row.location_key, row.schema_version, row.saved_at, row.payload),
+                )
+
+    def get(self, location_key: str) -> SnapshotRow | None:
+        """Return the snapshot stored for ``location_key``."""
+        rows = self.get_many([location_key])
+        return rows.get(location_key)
+
+    def get_many(self, location_keys: Sequence[str]) -> dict[str, SnapshotRow]:
+        """Return the snapshots stored for any of ``location_keys``."""
+        return {
+            row[0]: SnapshotRow(row[0], row[1], row[2], bytes(row[3]))
+            for row in self._select_in(
+                "SELECT location_key, schema_version, saved_at, payload FROM snapshots",
+                location_keys,
+            )
+        }
+
+    def keys_saved_since(
+        self, location_keys: Sequence[str], saved_after: float, schema_version: int
+    ) -> set[str]:
+        """Return which of ``location_keys`` have a current-schema snapshot newer than a cutoff."""
+        return {
+            row[0]
+            for row in self._select_in(
+                "SELECT location_key FROM snapshots WHERE saved_at >= ? AND schema_version = ?",
+                location_keys,
+                (saved_after, schema_version),
+            )
+        }
+
+    def delete(self, location_key: str) -> bool:
+        """Remove one snapshot; return True when a row existed."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM snapshots WHERE location_key = ?", (location_key,)
+                )
+            return cursor.rowcount > 0
+
+    def purge(self, saved_before: float, schema_version: int) -> int:
+        """Delete snapshots older than a cutoff or from another schema version."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM snapshots WHERE saved_at < ? OR schema_version != ?",
+                    (saved_before, schema_version),
+                )
+            return cursor.rowcount
+
+    def compact(self) -> None:
+        """Reclaim free pages and fold the write-ahead log back into the database."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("VACUUM")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        """Close the database connection (it is reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _select_in(
+        self, query: str, location_keys: Sequence[str], params: Iterable[object] = ()
+    ) -> list[tuple]:
+        keys = list(dict.fromkeys(location_keys))
+        results: list[tuple] = []
+        joiner = " AND " if " WHERE " in query else " WHERE "
+        with self._lock:
+            conn = self._connection()
+            for start in range(0, len(keys), _MAX_QUERY_PARAMS):
+                chunk = keys[start : start + _MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                results.extend(
+                    conn.execute(
+                        f"{query}{joiner}location_key IN ({placeholders})",
+                        (*params, *chunk),
+                    ).fetchall()
+                )
+        return results
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            try:
+                self._conn = self._open()
+            except sqlite3.DatabaseError as exc:
+                # A corrupt cache is not worth keeping; start over.
+                logger.warning(f"Resetting unreadable weather cache database: {exc}")
+                for suffix in ("", "-wal", "-shm"):
+                    Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+                self._conn = self._open()
+        return self._conn
+
+    def _open(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # The cache is used from both the UI thread and the async worker loop;
+        # the store serializes access with its own lock.
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+        except Exception:
+            conn.close()
+            raise
+        return conn
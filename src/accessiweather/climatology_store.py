@@ -0,0 +1,173 @@
+"""Persistent per-location day-of-year temperature normals for anomaly callouts."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Sequence
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from .json_store import VersionedJsonStore
+from .paths import RuntimeStoragePaths, resolve_default_runtime_storage
+
+logger = logging.getLogger(__name__)
+
+CLIMATOLOGY_SCHEMA_VERSION = 1
+MAX_CLIMATOLOGY_LOCATIONS = 64
+# The Open-Meteo archive trails the present by about five days.
+ARCHIVE_LAG_DAYS = 5
+
+
+def build_window_normals(
+    series_start: date,
+    temps: Sequence[float | None],
+    years: Sequence[int],
+    window_days: int,
+) -> dict[int, list[float | None]]:
+    """
+    Return ``{year: [mean per day of year]}`` for ±``window_days`` windows.
+
+    Each entry is the mean of the valid values in ``temps`` (a daily series
+    beginning at ``series_start``) within ``window_days`` of that date, or
+    ``None`` when the window holds no data. Prefix sums make every window an
+    O(1) lookup, so a full table costs one pass over the series.
+    """
+    sums = [0.0]
+    counts = [0]
+    for value in temps:
+        valid = value is not None
+        sums.append(sums[-1] + (float(value) if valid else 0.0))
+        counts.append(counts[-1] + (1 if valid else 0))
+    length = len(temps)
+
+    normals: dict[int, list[float | None]] = {}
+    for year in years:
+        first = date(year, 1, 1)
+        offset = (first - series_start).days
+        days_in_year = (date(year + 1, 1, 1) - first).days
+        row: list[float | None] = []
+        for day in range(days_in_year):
+            center = offset + day
+            lo = max(0, center - window_days)
+            hi = min(length, center + window_days + 1)
+            count = counts[hi] - counts[lo] if hi > lo else 0
+            row.append((sums[hi] - sums[lo]) / count if count else None)
+        normals[year] = row
+    return normals
+
+
+class ClimatologyStore:
+    """
+    Keep per-location window-mean normals in a small JSON file.
+
+    Normals are built from one bulk archive download covering every baseline
+    year and are only rebuilt when a new calendar year starts (or once the
+    archive has caught up on days that were still missing at build time).
+    """
+
+    def __init__(
+        self,
+        *,
+        path: Path | str | None = None,
+        runtime_paths: RuntimeStoragePaths | None = None,
+        max_locations: int = MAX_CLIMATOLOGY_LOCATIONS,
+        today_fn: Callable[[], date] | None = None,
+    ) -> None:
+        """Initialize the store with an optional persistence path and clock."""
+        resolved_path = path
+        if resolved_path is None:
+            resolved_path = (
+                runtime_paths or resolve_default_runtime_storage()
+            ).climatology_cache_file
+        self._store = VersionedJsonStore(
+            resolved_path, schema_version=CLIMATOLOGY_SCHEMA_VERSION, label="climatology cache"
+        )
+        self._max_locations = max(1, int(max_locations))
+        self._today_fn = today_fn or date.today
+        self._lock = threading.Lock()
+        self._records: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def key_for(latitude: float, longitude: float) -> str:
+        """Return the store key; normals are shared by points within about a kilometre."""
+        return f"{float(latitude):.2f},{float(longitude):.2f}"
+
+    def archived_through(self) -> date:
+        """Return the last date the archive is expected to have data for."""
+        return self._today_fn() - timedelta(days=ARCHIVE_LAG_DAYS)
+
+    def needs_refresh(
+        self, latitude: float, longitude: float, current_date: date, window_days: int
+    ) -> bool:
+        """Return True when normals for ``current_date.year`` are missing or can be extended."""
+        with self._lock:
+            record = self._records.get(self.key_for(latitude, longitude))
+        if record is None or record["base_year"] != current_date.year:
+            return True
+        wanted_through = date(current_date.year - 1, 12, 31) + timedelta(days=window_days)
+        fetched_through = date.fromisoformat(record["fetched_through"])
+        if fetched_through >= wanted_through:
+            return False
+        # Only re-download once at least a window's worth of new days exists.
+        return self.archived_through() >= fetched_through + timedelta(days=window_days)
+
+    def put(
+        self,
+        latitude: float,
+        longitude: float,
+        *,
+        base_year: int,
+        fetched_through: date,
+        normals: dict[int, list[float | None]],
+    ) -> None:
+        """Store normals built for ``base_year`` from data archived through ``fetched_through``."""
+        record = {
+            "base_year": base_year,
+            "fetched_through": fetched_through.isoformat(),
+            "normals": {str(year): row for year, row in normals.items()},
+        }
+        with self._lock:
+            key = self.key_for(latitude, longitude)
+            self._records.pop(key, None)
+            self._records[key] = record
+            while len(self._records) > self._max_locations:
+                self._records.pop(next(iter(self._records)))
+            self._store.save(self._records)
+
+    def window_mean(self, latitude: float, longitude: float, anchor: date) -> float | None:
+        """Return the stored window mean around ``anchor``, or ``None`` when unknown."""
+        with self._lock:
+            record = self._records.get(self.key_for(latitude, longitude))
+        if record is None:
+            return None
+        row = record["normals"].get(str(anchor.year))
+        if not row:
+            return None
+        index = (anchor - date(anchor.year, 1, 1)).days
+        return row[index] if index < len(row) else None
+
+    def __len__(self) -> int:
+        """Return the number of stored locations."""
+        return len(self._records)
+
+    def _load(self) -> None:
+        records: dict[str, dict[str, Any]] = {}
+        for key, record in self._store.load().items():
+            base_year = record.get("base_year")
+            fetched_through = record.get("fetched_through")
+            normals = record.get("normals")
+            if not isinstance(base_year, int) or not isinstance(normals, dict):
+                continue
+            try:
+                date.fromisoformat(fetched_through)
+            except (TypeError, ValueError):
+                continue
+            records[key] = {
+                "base_year": base_year,
+                "fetched_through": fetched_through,
+                "normals": {year: row for year, row in normals.items() if isinstance(row, list)},
+            }
+        self._records = records
@@ -0,0 +1,109 @@
+"""Section-level memoization for WeatherPresenter."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+# A few entries per section covers flipping between saved locations (and the
+# cached-then-fresh presentation on each switch) without holding many models.
+MAX_ENTRIES_PER_SECTION = 8
+
+
+@dataclass(frozen=True)
+class SectionMemoStats:
+    """Hit/miss counters for one memoized presentation section."""
+
+    section: str
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Return hits as a fraction of lookups (0.0 when never looked up)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def identity_token(value: Any) -> int | None:
+    """Return a cheap identity fingerprint for an input model (``None`` stays ``None``)."""
+    return None if value is None else id(value)
+
+
+def format_memo_stats(stats: Sequence[SectionMemoStats]) -> str:
+    """Render memo counters as one plain-text line per section."""
+    if not stats:
+        return "No presentation sections have been built yet."
+    return "\n".join(
+        f"{item.section}: {item.hits} reused, {item.misses} rebuilt ({item.hit_rate:.0%} reused)"
+        for item in stats
+    )
+
+
+class PresentationMemo:
+    """
+    Reuse section presentations whose inputs have not changed.
+
+    Keys are built from input identities (weather models are not mutated once
+    a refresh hands them to the presenter), plus whatever plain values a
+    section also depends on. Each entry keeps strong references to the input
+    objects in its key so their ``id()`` cannot be recycled while the entry
+    lives.
+    """
+
+    def __init__(self, *, max_entries_per_section: int = MAX_ENTRIES_PER_SECTION) -> None:
+        """Initialize an empty memo."""
+        self._max_entries = max(1, int(max_entries_per_section))
+        self._lock = threading.Lock()
+        self._entries: dict[str, OrderedDict[Hashable, tuple[Sequence[Any], Any]]] = {}
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+
+    def get_or_build(
+        self,
+        section: str,
+        key: Hashable,
+        anchors: Sequence[Any],
+        build: Callable[[], _T],
+    ) -> _T:
+        """Return the memoized value for ``(section, key)`` or build and store it."""
+        with self._lock:
+            entries = self._entries.setdefault(section, OrderedDict())
+            entry = entries.get(key)
+            if entry is not None:
+                entries.move_to_end(key)
+                self._hits[section] = self._hits.get(section, 0) + 1
+                return entry[1]
+            self._misses[section] = self._misses.get(section, 0) + 1
+
+        value = build()
+        with self._lock:
+            entries = self._entries.setdefault(section, OrderedDict())
+            entries[key] = (tuple(anchors), value)
+            entries.move_to_end(key)
+            while len(entries) > self._max_entries:
+                entries.popitem(last=False)
+        return value
+
+    def stats(self) -> list[SectionMemoStats]:
+        """Return hit/miss counters for every section looked up so far."""
+        with self._lock:
+            sections = sorted(set(self._hits) | set(self._misses))
+            return [
+                SectionMemoStats(
+                    section=section,
+                    hits=self._hits.get(section, 0),
+                    misses=self._misses.get(section, 0),
+                )
+                for section in sections
+            ]
+
+    def clear(self) -> None:
+        """Drop every memoized section (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
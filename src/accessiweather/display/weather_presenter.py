@@ -29,11 +29,13 @@ from ..models import (
     WeatherAlerts,
     WeatherData,
 )
+from ..performance.timer import span
 from ..services.mobility_briefing import build_mobility_briefing
 from ..units import resolve_display_unit_system, resolve_temperature_unit_preference
 from ..utils import TemperatureUnit
 from .presentation.aviation import build_aviation
 from .presentation.environmental import AirQualityPresentation, build_air_quality_panel
+from .presentation.memo import PresentationMemo, SectionMemoStats, identity_token
 from .presentation.models import (
     AlertPresentation,
     AlertsPresentation,
@@ -69,6 +71,7 @@ class WeatherPresenter:
     def __init__(self, settings: AppSettings):
         """Store the active application settings for presentation decisions."""
         self.settings = settings
+        self._memo = PresentationMemo()
 
     # ------------------------------------------------------------------
     # Public API
@@ -76,64 +79,158 @@ class WeatherPresenter:
 
     def present(self, weather_data: WeatherData) -> WeatherPresentation:
         """Build a structured presentation for the given weather data."""
+        with span("presenter_build"):
+            return self._present(weather_data)
+
+    def memo_stats(self) -> list[SectionMemoStats]:
+        """Return per-section hit/miss counters for :meth:`present`."""
+        return self._memo.stats()
+
+    def _present(self, weather_data: WeatherData) -> WeatherPresentation:
+        # Sections are reused while their inputs are the same objects and the
+        # settings/location are unchanged. Clock-dependent inputs add a token:
+        # the first upcoming hourly period and the currently active alerts.
         unit_pref, unit_system = self._resolve_unit_preferences(weather_data.location)
+        memo = self._memo
+        context = (repr(self.settings), repr(weather_data.location))
+        current_data = weather_data.current
+        environmental = weather_data.environmental
+        hourly = weather_data.hourly_forecast
+        minutely = weather_data.minutely_precipitation
+        trends = weather_data.trend_insights
+        alerts_data = weather_data.alerts
+        hourly_key = (id(hourly), identity_token(_first_upcoming_period(hourly)))
+        # Lists are keyed on their items so in-place appends are noticed; the
+        # item tuples are anchored to keep those ids from being recycled.
+        trend_items = tuple(trends) if trends else ()
+        active_alerts = tuple(alerts_data.get_active_alerts()) if alerts_data else ()
+        trends_key = tuple(map(id, trend_items))
+        active_alert_ids = tuple(map(id, active_alerts))
 
         air_quality_panel = (
-            build_air_quality_panel(
-                weather_data.location, weather_data.environmental, settings=self.settings
+            memo.get_or_build(
+                "air_quality",
+                (*context, id(environmental)),
+                (environmental,),
+                lambda: build_air_quality_panel(
+                    weather_data.location, environmental, settings=self.settings
+                ),
             )
-            if weather_data.environmental
+            if environmental
             else None
         )
 
+        anomaly_callout = getattr(weather_data, "anomaly_callout", None)
         current = (
-            self._build_current_conditions(
-                weather_data.current,
-                weather_data.location,
-                unit_pref,
-                settings=self.settings,
-                environmental=weather_data.environmental,
-                trends=weather_data.trend_insights,
-                hourly_forecast=weather_data.hourly_forecast,
-                minutely_precipitation=weather_data.minutely_precipitation,
-                air_quality=air_quality_panel,
-                alerts=weather_data.alerts,
-                unit_system=unit_system,
-                anomaly_callout=getattr(weather_data, "anomaly_callout", None),
+            memo.get_or_build(
+                "current_conditions",
+                (
+                    *context,
+                    id(current_data),
+                    id(environmental),
+                    trends_key,
+                    *hourly_key,
+                    id(minutely),
+                    id(alerts_data),
+                    active_alert_ids,
+                    id(anomaly_callout),
+                    id(air_quality_panel),
+                ),
+                (
+                    current_data,
+                    environmental,
+                    trend_items,
+                    hourly,
+                    minutely,
+                    alerts_data,
+                    active_alerts,
+                    anomaly_callout,
+                    air_quality_panel,
+                ),
+                lambda: self._build_current_conditions(
+                    current_data,
+                    weather_data.location,
+                    unit_pref,
+                    settings=self.settings,
+                    environmental=environmental,
+                    trends=trends,
+                    hourly_forecast=hourly,
+                    minutely_precipitation=minutely,
+                    air_quality=air_quality_panel,
+                    alerts=alerts_data,
+                    unit_system=unit_system,
+                    anomaly_callout=anomaly_callout,
+                ),
             )
-            if weather_data.current
+            if current_data
             else None
         )
-        forecast = (
-            self._build_forecast(
-                weather_data.forecast,
-                weather_data.hourly_forecast,
-                weather_data.location,
-                unit_pref,
-                marine=weather_data.marine,
-                confidence=weather_data.forecast_confidence,
-                mobility_briefing=build_mobility_briefing(weather_data),
+        forecast = None
+        if weather_data.forecast:
+            mobility_briefing = memo.get_or_build(
+                "mobility_briefing",
+                (id(minutely), id(current_data), *hourly_key),
+                (minutely, current_data, hourly),
+                lambda: build_mobility_briefing(weather_data),
+            )
+            forecast = memo.get_or_build(
+                "forecast",
+                (
+                    *context,
+                    id(weather_data.forecast),
+                    *hourly_key,
+                    id(weather_data.marine),
+                    id(weather_data.forecast_confidence),
+                    mobility_briefing,
+                ),
+                (
+                    weather_data.forecast,
+                    hourly,
+                    weather_data.marine,
+                    weather_data.forecast_confidence,
+                ),
+                lambda: self._build_forecast(
+                    weather_data.forecast,
+                    hourly,
+                    weather_data.location,
+                    unit_pref,
+                    marine=weather_data.marine,
+                    confidence=weather_data.forecast_confidence,
+                    mobility_briefing=mobility_briefing,
+                ),
             )
-            if weather_data.forecast
-            else None
-        )
         alerts = (
-            self._build_alerts(
-                weather_data.alerts,
-                weather_data.location,
-                lifecycle_diff=weather_data.alert_lifecycle_diff,
+            memo.get_or_build(
+                "alerts",
+                (
+                    *context,
+                    id(alerts_data),
+                    active_alert_ids,
+                    id(weather_data.alert_lifecycle_diff),
+                ),
+                (alerts_data, active_alerts, weather_data.alert_lifecycle_diff),
+                lambda: self._build_alerts(
+                    alerts_data,
+                    weather_data.location,
+                    lifecycle_diff=weather_data.alert_lifecycle_diff,
+                ),
             )
-            if weather_data.alerts
+            if alerts_data
             else None
         )
-        aviation = self._build_aviation(weather_data.aviation, weather_data.location)
+        aviation = memo.get_or_build(
+            "aviation",
+            (*context, id(weather_data.aviation)),
+            (weather_data.aviation,),
+            lambda: self._build_aviation(weather_data.aviation, weather_data.location),
+        )
         summary_text = self._build_summary(weather_data, unit_pref)
-        trend_summary = format_trend_lines(
-            weather_data.trend_insights,
-            current=weather_data.current,
-            hourly_forecast=weather_data.hourly_forecast,
-            include_pressure=getattr(self.settings, "show_pressure_trend", True),
-            unit_pref=unit_pref,
+        trend_summary = list(
+            self._trend_lines(
+                weather_data,
+                unit_pref,
+                include_pressure=getattr(self.settings, "show_pressure_trend", True),
+            )
         )
         status_messages = self._build_status_messages(weather_data)
         source_attribution = self._build_source_attribution(weather_data)
@@ -151,6 +248,32 @@ class WeatherPresenter:
             source_attribution=source_attribution,
         )
 
+    def _trend_lines(
+        self, weather_data: WeatherData, unit_pref: TemperatureUnit, *, include_pressure: bool
+    ) -> list[str]:
+        hourly = weather_data.hourly_forecast
+        trend_items = tuple(weather_data.trend_insights or ())
+        return self._memo.get_or_build(
+            "trend_lines",
+            (
+                repr(self.settings),
+                unit_pref,
+                include_pressure,
+                tuple(map(id, trend_items)),
+                id(weather_data.current),
+                id(hourly),
+                identity_token(_first_upcoming_period(hourly)),
+            ),
+            (trend_items, weather_data.current, hourly),
+            lambda: format_trend_lines(
+                weather_data.trend_insights,
+                current=weather_data.current,
+                hourly_forecast=hourly,
+                include_pressure=include_pressure,
+                unit_pref=unit_pref,
+            ),
+        )
+
     def present_current(
         self,
         current: CurrentConditions | None,
@@ -309,12 +432,7 @@ class WeatherPresenter:
             if active_count > 0:
                 parts.append(f"{active_count} alert{'s' if active_count != 1 else ''}")
 
-        trend_lines = format_trend_lines(
-            weather_data.trend_insights,
-            current=weather_data.current,
-            hourly_forecast=weather_data.hourly_forecast,
-            unit_pref=unit_pref,
-        )
+        trend_lines = self._trend_lines(weather_data, unit_pref, include_pressure=True)
         if trend_lines:
             parts.append(trend_lines[0])
 
@@ -377,3 +495,11 @@ from .presentation.formatters import (  # noqa: E402
     format_display_datetime,
     format_temperature_pair,
 )
+
+
+def _first_upcoming_period(hourly: HourlyForecast | None):
+    """Return the first period the hourly sections would show right now."""
+    if not hourly or not hourly.periods:
+        return None
+    upcoming = hourly.get_next_hours(1)
+    return upcoming[0] if upcoming else None
@@ -0,0 +1,405 @@
+"""
+Offline gazetteer of populated places for instant location suggestions.
+
+The gazetteer is a gzip-compressed, tab-separated file whose rows are sorted
+by a precomputed folded search key (``name admin1 country`` lowered to ASCII
+words). Loading is a single pass with no sorting or transliteration,
+and a prefix query is two binary searches plus a population ranking over the
+matching slice.
+
+Release builds bundle ``resources/gazetteer.tsv.gz`` (generated by
+``scripts/build_gazetteer.py``). Installs without it download the GeoNames
+dump in the background via :func:`load_or_download_gazetteer` and keep the
+result in the runtime config directory, which also takes precedence over the
+bundled copy; a failed download is not retried for
+``GAZETTEER_RETRY_INTERVAL`` seconds. :func:`build_gazetteer_from_geonames`
+converts a GeoNames ``cities*`` dump into the compact format.
+
+Place data comes from GeoNames (https://www.geonames.org/) under the Creative
+Commons Attribution 4.0 License; keep :data:`GEONAMES_ATTRIBUTION` wherever
+the data is credited.
+"""
+
+from __future__ import annotations
+
+import gzip
+import heapq
+import io
+import logging
+import os
+import tempfile
+import threading
+import time
+import zipfile
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+
+import httpx
+
+from .openmeteo_geocoding_client import format_place_name, normalize_place_name
+from .paths import RuntimeStoragePaths
+
+logger = logging.getLogger(__name__)
+
+GAZETTEER_FORMAT_HEADER = "#accessiweather-gazetteer\t2"
+BUNDLED_GAZETTEER_FILE = Path(__file__).parent / "resources" / "gazetteer.tsv.gz"
+# Sorts after every character a folded key can contain ([a-z0-9 ]).
+_KEY_UPPER_BOUND = "\x7f"
+
+GEONAMES_DUMP_URL = "https://download.geonames.org/export/dump"
+# Places with at least 15,000 people: ~30k rows, about 1 MB once compacted.
+GEONAMES_CITIES_FILE = "cities15000.zip"
+GEONAMES_ADMIN1_FILE = "admin1CodesASCII.txt"
+GEONAMES_COUNTRY_FILE = "countryInfo.txt"
+GEONAMES_DOWNLOAD_TIMEOUT = 60.0
+GEONAMES_ATTRIBUTION = "Place names from GeoNames (geonames.org), licensed under CC BY 4.0."
+# A week; offline or blocked installs should not hit GeoNames on every start.
+GAZETTEER_RETRY_INTERVAL = 7 * 24 * 60 * 60
+
+_DEFAULT_GAZETTEER: Gazetteer | None = None
+_DEFAULT_GAZETTEER_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class GazetteerEntry:
+    """A populated place from the offline gazetteer."""
+
+    name: str
+    latitude: float
+    longitude: float
+    country_code: str
+    admin1: str | None = None
+    population: int = 0
+    country: str = ""
+
+    @property
+    def country_label(self) -> str:
+        """Return the country name, falling back to the ISO code when it is unknown."""
+        return self.country or self.country_code
+
+    @property
+    def display_name(self) -> str:
+        """Generate the same display name the online location search uses."""
+        return format_place_name(self.name, self.admin1, self.country_label)
+
+
+class Gazetteer:
+    """Sorted-key index over :class:`GazetteerEntry` rows supporting prefix search."""
+
+    def __init__(self, entries: Iterable[GazetteerEntry] = ()) -> None:
+        """Build the index from entries in any order."""
+        keyed = sorted(
+            ((self.key_for(entry), entry) for entry in entries),
+            key=lambda item: (item[0], -item[1].population),
+        )
+        self._keys: list[str] = [key for key, _ in keyed]
+        self._entries: list[GazetteerEntry] = [entry for _, entry in keyed]
+
+    @staticmethod
+    def key_for(entry: GazetteerEntry) -> str:
+        """Return the folded search key for an entry."""
+        return normalize_place_name(
+            " ".join(part for part in (entry.name, entry.admin1, entry.country_label) if part)
+        )
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        country_codes: Iterable[str] | None = None,
+    ) -> list[GazetteerEntry]:
+        """
+        Return up to ``limit`` places whose key starts with ``query``, most populous first.
+
+        Args:
+            query: Partial place name; accents, case and punctuation are ignored
+            limit: Maximum number of entries to return
+            country_codes: Optional ISO country codes to restrict results to
+
+        """
+        prefix = normalize_place_name(query)
+        if not prefix or limit <= 0:
+            return []
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + _KEY_UPPER_BOUND, lo)
+        candidates = self._entries[lo:hi]
+        if country_codes is not None:
+            allowed = {code.upper() for code in country_codes}
+            candidates = [entry for entry in candidates if entry.country_code in allowed]
+        return heapq.nlargest(limit, candidates, key=lambda entry: entry.population)
+
+    def write(self, path: Path | str) -> None:
+        """Write the gazetteer in the compact sorted format read by :meth:`from_file`."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part = path.with_name(path.name + ".part")
+        with gzip.open(part, "wt", encoding="utf-8", newline="\n") as handle:
+            handle.write(GAZETTEER_FORMAT_HEADER + "\n")
+            for key, entry in zip(self._keys, self._entries, strict=True):
+                handle.write(
+                    "\t".join(
+                        (
+                            key,
+                            _clean(entry.name),
+                            f"{entry.latitude:.5f}",
+                            f"{entry.longitude:.5f}",
+                            entry.country_code,
+                            _clean(entry.country),
+                            _clean(entry.admin1 or ""),
+                            str(entry.population),
+                        )
+                    )
+                    + "\n"
+                )
+        os.replace(part, path)
+
+    @classmethod
+    def from_file(cls, path: Path | str) -> Gazetteer:
+        """
+        Load a gazetteer written by :meth:`write`.
+
+        Raises:
+            ValueError: If the file is not in the gazetteer format
+
+        """
+        gazetteer = cls()
+        keys: list[str] = []
+        entries: list[GazetteerEntry] = []
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            if handle.readline().rstrip("\n") != GAZETTEER_FORMAT_HEADER:
+                raise ValueError(f"Not a gazetteer file: {path}")
+            for line in handle:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) != 8:
+                    continue
+                key, name, lat, lon, country_code, country, admin1, population = fields
+                try:
+                    entry = GazetteerEntry(
+                        name=name,
+                        latitude=float(lat),
+                        longitude=float(lon),
+                        country_code=country_code,
+                        admin1=admin1 or None,
+                        population=int(population or 0),
+                        country=country,
+                    )
+                except ValueError:
+                    continue
+                keys.append(key)
+                entries.append(entry)
+        if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+            logger.debug("Gazetteer file %s is not sorted; re-indexing", path)
+            return cls(entries)
+        gazetteer._keys = keys
+        gazetteer._entries = entries
+        return gazetteer
+
+    def __len__(self) -> int:
+        """Return the number of places in the gazetteer."""
+        return len(self._entries)
+
+
+@contextmanager
+def _open_geonames_text(source: Path) -> Iterator[TextIO]:
+    """Open a GeoNames dump that may be plain text, gzip or a one-file zip."""
+    if source.suffix == ".zip":
+        with zipfile.ZipFile(source) as archive:
+            member = next(name for name in archive.namelist() if name.endswith(".txt"))
+            with archive.open(member) as raw:
+                yield io.TextIOWrapper(raw, encoding="utf-8")
+        return
+    opener = gzip.open if source.suffix == ".gz" else open
+    with opener(source, "rt", encoding="utf-8") as handle:
+        yield handle
+
+
+def parse_geonames_admin1_names(source: Path | str) -> dict[str, str]:
+    """Map GeoNames ``CC.code`` admin1 keys to names from ``admin1CodesASCII.txt``."""
+    names: dict[str, str] = {}
+    with _open_geonames_text(Path(source)) as handle:
+        for line in handle:
+            fields = line.rstrip("\n").split("\t")
+            if len(fields) >= 2 and fields[0] and fields[1]:
+                names[fields[0]] = fields[1]
+    return names
+
+
+def parse_geonames_country_names(source: Path | str) -> dict[str, str]:
+    """Map ISO country codes to names from GeoNames ``countryInfo.txt``."""
+    names: dict[str, str] = {}
+    with _open_geonames_text(Path(source)) as handle:
+        for line in handle:
+            if line.startswith("#"):
+                continue
+            fields = line.rstrip("\n").split("\t")
+            if len(fields) >= 5 and fields[0] and fields[4]:
+                names[fields[0].upper()] = fields[4]
+    return names
+
+
+def build_gazetteer_from_geonames(
+    source: Path | str,
+    *,
+    min_population: int = 0,
+    admin1_names: Mapping[str, str] | None = None,
+    country_names: Mapping[str, str] | None = None,
+) -> Gazetteer:
+    """
+    Build a gazetteer from a GeoNames ``cities*`` dump (plain, gzip or zip).
+
+    Only populated places (feature class ``P``) are kept. GeoNames admin1
+    codes are abbreviations or bare numbers, so they are replaced by the name
+    from ``admin1_names`` (see :func:`parse_geonames_admin1_names`) or dropped
+    when no name is known; country names come from ``country_names`` (see
+    :func:`parse_geonames_country_names`). Entries then read like the online
+    search results, e.g. "Springfield, Illinois".
+    """
+    entries: list[GazetteerEntry] = []
+    with _open_geonames_text(Path(source)) as handle:
+        for line in handle:
+            fields = line.rstrip("\n").split("\t")
+            if len(fields) < 15 or fields[6] != "P":
+                continue
+            country_code = fields[8].upper()
+            admin1: str | None = fields[10] or None
+            if admin1:
+                admin1 = (admin1_names or {}).get(f"{country_code}.{admin1}")
+            try:
+                population = int(fields[14] or 0)
+                entry = GazetteerEntry(
+                    name=fields[1],
+                    latitude=float(fields[4]),
+                    longitude=float(fields[5]),
+                    country_code=country_code,
+                    admin1=admin1,
+                    population=population,
+                    country=(country_names or {}).get(country_code, ""),
+                )
+            except ValueError:
+                continue
+            if population >= min_population:
+                entries.append(entry)
+    return Gazetteer(entries)
+
+
+def download_gazetteer(
+    destination: Path | str,
+    *,
+    client: httpx.Client | None = None,
+    base_url: str = GEONAMES_DUMP_URL,
+    cities_file: str = GEONAMES_CITIES_FILE,
+) -> Gazetteer:
+    """
+    Download the GeoNames dump, build a gazetteer and write it to ``destination``.
+
+    The dump files are streamed to a temporary directory beside
+    ``destination`` and removed afterwards; the gazetteer itself is replaced
+    atomically.
+
+    Raises:
+        httpx.HTTPError: If any GeoNames file cannot be downloaded
+
+    """
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    owns_client = client is None
+    http = client or httpx.Client(timeout=GEONAMES_DOWNLOAD_TIMEOUT, follow_redirects=True)
+    try:
+        with tempfile.TemporaryDirectory(dir=destination.parent) as scratch:
+            paths = {}
+            for name in (cities_file, GEONAMES_ADMIN1_FILE, GEONAMES_COUNTRY_FILE):
+                paths[name] = Path(scratch) / name
+                with http.stream("GET", f"{base_url}/{name}") as response:
+                    response.raise_for_status()
+                    with paths[name].open("wb") as handle:
+                        for chunk in response.iter_bytes():
+                            handle.write(chunk)
+            gazetteer = build_gazetteer_from_geonames(
+                paths[cities_file],
+                admin1_names=parse_geonames_admin1_names(paths[GEONAMES_ADMIN1_FILE]),
+                country_names=parse_geonames_country_names(paths[GEONAMES_COUNTRY_FILE]),
+            )
+            gazetteer.write(destination)
+    finally:
+        if owns_client:
+            http.close()
+    logger.info("Downloaded offline gazetteer with %d places to %s", len(gazetteer), destination)
+    return gazetteer
+
+
+def load_gazetteer(runtime_paths: RuntimeStoragePaths | None = None) -> Gazetteer | None:
+    """Load the user's downloaded gazetteer, else the bundled one; ``None`` if neither exists."""
+    candidates = []
+    if runtime_paths is not None:
+        candidates.append(runtime_paths.gazetteer_file)
+    candidates.append(BUNDLED_GAZETTEER_FILE)
+    for path in candidates:
+        if not path.exists():
+            continue
+        try:
+            gazetteer = Gazetteer.from_file(path)
+        except Exception as exc:
+            logger.warning("Failed to load gazetteer %s: %s", path, exc)
+            continue
+        logger.info("Loaded offline gazetteer with %d places from %s", len(gazetteer), path)
+        return gazetteer
+    return None
+
+
+def load_or_download_gazetteer(
+    runtime_paths: RuntimeStoragePaths,
+    *,
+    retry_interval: float = GAZETTEER_RETRY_INTERVAL,
+    client: httpx.Client | None = None,
+) -> Gazetteer | None:
+    """
+    Load the gazetteer, downloading it when missing unless a recent attempt failed.
+
+    A failed download leaves a marker file beside the gazetteer; while it is
+    younger than ``retry_interval`` seconds no new download is attempted, so
+    offline starts stay offline. Returns ``None`` when no gazetteer is available.
+    """
+    gazetteer = load_gazetteer(runtime_paths)
+    if gazetteer is not None:
+        return gazetteer
+    marker = runtime_paths.gazetteer_download_failed_file
+    try:
+        if time.time() - marker.stat().st_mtime < retry_interval:
+            logger.debug("Skipping gazetteer download; last attempt failed recently")
+            return None
+    except OSError:
+        pass
+    logger.info("Downloading offline place names from %s", GEONAMES_DUMP_URL)
+    try:
+        gazetteer = download_gazetteer(runtime_paths.gazetteer_file, client=client)
+    except Exception as exc:
+        logger.warning("Failed to download offline gazetteer: %s", exc)
+        try:
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError:
+            logger.debug("Failed to record gazetteer download failure", exc_info=True)
+        return None
+    marker.unlink(missing_ok=True)
+    return gazetteer
+
+
+def set_default_gazetteer(gazetteer: Gazetteer | None) -> None:
+    """Register (or clear) the gazetteer used for offline location suggestions."""
+    global _DEFAULT_GAZETTEER
+    with _DEFAULT_GAZETTEER_LOCK:
+        _DEFAULT_GAZETTEER = gazetteer
+
+
+def get_default_gazetteer() -> Gazetteer | None:
+    """Return the registered gazetteer, if one has been loaded."""
+    with _DEFAULT_GAZETTEER_LOCK:
+        return _DEFAULT_GAZETTEER
+
+
+def _clean(value: str) -> str:
+    return value.replace("\t", " ").replace("\n", " ")
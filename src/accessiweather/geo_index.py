@@ -0,0 +1,279 @@
+"""
+Geometry matching for advisory polygons against saved locations.
+
+NWS alerts, SIGMETs and CWAs carry GeoJSON polygons in longitude/latitude.
+:class:`GeoShape` answers point-in-polygon and point-to-polygon distance
+queries behind a bounding-box prefilter, and :class:`SpatialIndex` packs many
+shapes into an R-tree (sort-tile-recursive bulk load) so one refresh can match
+every active advisory against every location without testing each pair.
+
+Distances use a local equirectangular projection around the query point,
+which is accurate to well under a percent at the tens of miles these queries
+use. Shapes that cross the antimeridian are not split.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE = EARTH_RADIUS_MILES * math.pi / 180
+DEFAULT_NODE_CAPACITY = 8
+
+Ring = tuple[tuple[float, float], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class BBox:
+    """Longitude/latitude bounding box."""
+
+    min_lon: float
+    min_lat: float
+    max_lon: float
+    max_lat: float
+
+    @classmethod
+    def around(cls, lat: float, lon: float, miles: float = 0.0) -> BBox:
+        """Return the box covering every point within ``miles`` of ``(lat, lon)``."""
+        dlat = miles / MILES_PER_DEGREE
+        cos_lat = math.cos(math.radians(min(abs(lat) + dlat, 89.9)))
+        dlon = miles / (MILES_PER_DEGREE * cos_lat)
+        return cls(lon - dlon, lat - dlat, lon + dlon, lat + dlat)
+
+    @classmethod
+    def union(cls, boxes: Iterable[BBox]) -> BBox:
+        """Return the smallest box containing all ``boxes``."""
+        boxes = list(boxes)
+        return cls(
+            min(box.min_lon for box in boxes),
+            min(box.min_lat for box in boxes),
+            max(box.max_lon for box in boxes),
+            max(box.max_lat for box in boxes),
+        )
+
+    def intersects(self, other: BBox) -> bool:
+        """Return True when the two boxes overlap or touch."""
+        return (
+            self.min_lon <= other.max_lon
+            and other.min_lon <= self.max_lon
+            and self.min_lat <= other.max_lat
+            and other.min_lat <= self.max_lat
+        )
+
+    @property
+    def center(self) -> tuple[float, float]:
+        """Return the ``(lon, lat)`` midpoint."""
+        return (self.min_lon + self.max_lon) / 2, (self.min_lat + self.max_lat) / 2
+
+
+class GeoShape:
+    """One or more polygons, each an outer ring followed by any holes."""
+
+    __slots__ = ("bbox", "polygons")
+
+    def __init__(self, polygons: Iterable[Iterable[Ring]]) -> None:
+        """Build a shape from polygons given as ``(lon, lat)`` rings."""
+        self.polygons: tuple[tuple[Ring, ...], ...] = tuple(
+            tuple(rings) for rings in polygons if rings
+        )
+        if not self.polygons:
+            raise ValueError("GeoShape needs at least one polygon")
+        points = [point for rings in self.polygons for point in rings[0]]
+        self.bbox = BBox(
+            min(lon for lon, _ in points),
+            min(lat for _, lat in points),
+            max(lon for lon, _ in points),
+            max(lat for _, lat in points),
+        )
+
+    @classmethod
+    def from_geojson(cls, geometry: Any) -> GeoShape | None:
+        """
+        Parse a GeoJSON ``Polygon``, ``MultiPolygon`` or ``GeometryCollection``.
+
+        Returns ``None`` for missing, malformed or non-areal geometry so callers
+        can fall back to zone or text matching.
+        """
+        polygons = _geojson_polygons(geometry)
+        return cls(polygons) if polygons else None
+
+    def contains(self, lat: float, lon: float) -> bool:
+        """Return True when the point is inside the shape (holes excluded)."""
+        bbox = self.bbox
+        if not (bbox.min_lon <= lon <= bbox.max_lon and bbox.min_lat <= lat <= bbox.max_lat):
+            return False
+        # Even-odd crossings over the outer ring and its holes together.
+        for rings in self.polygons:
+            inside = False
+            for ring in rings:
+                x1, y1 = ring[-1]
+                for x2, y2 in ring:
+                    if (y1 > lat) != (y2 > lat) and lon < x1 + (lat - y1) * (x2 - x1) / (y2 - y1):
+                        inside = not inside
+                    x1, y1 = x2, y2
+            if inside:
+                return True
+        return False
+
+    def distance_miles(self, lat: float, lon: float) -> float:
+        """Return the distance in miles from the point to the shape (0 when inside)."""
+        if self.contains(lat, lon):
+            return 0.0
+        x_scale = MILES_PER_DEGREE * math.cos(math.radians(lat))
+        best = math.inf
+        for rings in self.polygons:
+            for ring in rings:
+                ax = (ring[-1][0] - lon) * x_scale
+                ay = (ring[-1][1] - lat) * MILES_PER_DEGREE
+                for point_lon, point_lat in ring:
+                    bx = (point_lon - lon) * x_scale
+                    by = (point_lat - lat) * MILES_PER_DEGREE
+                    best = min(best, _origin_to_segment(ax, ay, bx, by))
+                    ax, ay = bx, by
+        return best
+
+    def within(self, lat: float, lon: float, miles: float = 0.0) -> bool:
+        """Return True when the point is inside the shape or within ``miles`` of it."""
+        if miles <= 0:
+            return self.contains(lat, lon)
+        if not self.bbox.intersects(BBox.around(lat, lon, miles)):
+            return False
+        return self.distance_miles(lat, lon) <= miles
+
+
+class _Node:
+    __slots__ = ("bbox", "children", "leaf")
+
+    def __init__(self, bbox: BBox, children: list[Any], leaf: bool) -> None:
+        self.bbox = bbox
+        self.children = children
+        self.leaf = leaf
+
+
+class SpatialIndex(Generic[T]):
+    """Static R-tree over :class:`GeoShape` entries, bulk-loaded with sort-tile-recursive."""
+
+    def __init__(
+        self,
+        entries: Iterable[tuple[T, GeoShape]],
+        *,
+        node_capacity: int = DEFAULT_NODE_CAPACITY,
+    ) -> None:
+        """Index ``(item, shape)`` pairs; query results keep this input order."""
+        self._items: list[T] = []
+        self._shapes: list[GeoShape] = []
+        for item, shape in entries:
+            self._items.append(item)
+            self._shapes.append(shape)
+        self._capacity = max(2, int(node_capacity))
+        level = [_Node(shape.bbox, [index], True) for index, shape in enumerate(self._shapes)]
+        self._root: _Node | None = None
+        while len(level) > 1:
+            level = self._pack(level)
+        if level:
+            self._root = level[0]
+
+    def __len__(self) -> int:
+        """Return the number of indexed shapes."""
+        return len(self._items)
+
+    def _pack(self, nodes: list[_Node]) -> list[_Node]:
+        capacity = self._capacity
+        node_count = math.ceil(len(nodes) / capacity)
+        slice_size = capacity * math.ceil(math.sqrt(node_count))
+        nodes = sorted(nodes, key=lambda node: node.bbox.center[0])
+        parents: list[_Node] = []
+        for start in range(0, len(nodes), slice_size):
+            column = sorted(nodes[start : start + slice_size], key=lambda node: node.bbox.center[1])
+            for offset in range(0, len(column), capacity):
+                group = column[offset : offset + capacity]
+                parents.append(_Node(BBox.union(node.bbox for node in group), group, False))
+        return parents
+
+    def candidates(self, bbox: BBox) -> list[int]:
+        """Return indices of shapes whose bounding box intersects ``bbox``, in input order."""
+        if self._root is None or not self._root.bbox.intersects(bbox):
+            return []
+        found: list[int] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.leaf:
+                found.extend(node.children)
+                continue
+            stack.extend(child for child in node.children if child.bbox.intersects(bbox))
+        found.sort()
+        return found
+
+    def within(self, lat: float, lon: float, miles: float = 0.0) -> list[T]:
+        """Return items whose shape covers the point or lies within ``miles`` of it."""
+        query = BBox.around(lat, lon, max(miles, 0.0))
+        return [
+            self._items[index]
+            for index in self.candidates(query)
+            if self._shapes[index].within(lat, lon, miles)
+        ]
+
+    def match_points(
+        self, points: Mapping[K, tuple[float, float]], miles: float = 0.0
+    ) -> dict[K, list[T]]:
+        """Map each ``key -> (lat, lon)`` to the items covering or near that point."""
+        return {key: self.within(lat, lon, miles) for key, (lat, lon) in points.items()}
+
+
+def _origin_to_segment(ax: float, ay: float, bx: float, by: float) -> float:
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    t = 0.0 if length_sq == 0 else max(0.0, min(1.0, -(ax * dx + ay * dy) / length_sq))
+    return math.hypot(ax + t * dx, ay + t * dy)
+
+
+def _geojson_ring(coordinates: Any) -> Ring | None:
+    if not isinstance(coordinates, list):
+        return None
+    ring: list[tuple[float, float]] = []
+    for position in coordinates:
+        if not isinstance(position, list | tuple) or len(position) < 2:
+            return None
+        lon, lat = position[0], position[1]
+        if not isinstance(lon, int | float) or not isinstance(lat, int | float):
+            return None
+        ring.append((float(lon), float(lat)))
+    if len(ring) > 1 and ring[0] == ring[-1]:
+        ring.pop()
+    return tuple(ring) if len(ring) >= 3 else None
+
+
+def _geojson_polygon(coordinates: Any) -> list[Ring]:
+    if not isinstance(coordinates, list) or not coordinates:
+        return []
+    outer = _geojson_ring(coordinates[0])
+    if outer is None:
+        return []
+    holes = [ring for ring in map(_geojson_ring, coordinates[1:]) if ring is not None]
+    return [outer, *holes]
+
+
+def _geojson_polygons(geometry: Any) -> list[list[Ring]]:
+    if not isinstance(geometry, dict):
+        return []
+    kind = geometry.get("type")
+    coordinates = geometry.get("coordinates")
+    if kind == "Polygon":
+        polygon = _geojson_polygon(coordinates)
+        return [polygon] if polygon else []
+    if kind == "MultiPolygon" and isinstance(coordinates, list):
+        return [polygon for polygon in map(_geojson_polygon, coordinates) if polygon]
+    if kind == "GeometryCollection":
+        return [
+            polygon
+            for member in geometry.get("geometries") or []
+            for polygon in _geojson_polygons(member)
+        ]
+    return []
@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 import re
 
+from .gazetteer import Gazetteer, GazetteerEntry, get_default_gazetteer
 from .openmeteo_geocoding_client import (
     GeocodingResult,
     OpenMeteoGeocodingClient,
@@ -28,7 +29,11 @@ class GeocodingService:
     ALLOWED_COUNTRY_CODES = ["US"]
 
     def __init__(
-        self, user_agent: str = "AccessiWeather", timeout: int = 10, data_source: str = "nws"
+        self,
+        user_agent: str = "AccessiWeather",
+        timeout: int = 10,
+        data_source: str = "nws",
+        gazetteer: Gazetteer | None = None,
     ) -> None:
         """
         Initialize the geocoding service.
@@ -37,6 +42,8 @@ class GeocodingService:
             user_agent: User agent string for API requests
             timeout: Timeout in seconds for geocoding requests
             data_source: The data source to use ('nws' or 'auto')
+            gazetteer: Offline place index for suggestions; defaults to the
+                gazetteer registered at startup, if any
 
         """
         self.client = OpenMeteoGeocodingClient(
@@ -44,6 +51,7 @@ class GeocodingService:
             timeout=float(timeout),
         )
         self.data_source = data_source
+        self._gazetteer = gazetteer
 
     def is_zip_code(self, text: str) -> bool:
         """
@@ -223,10 +231,32 @@ class GeocodingService:
         )
         return False
 
+    def suggest_offline(self, query: str, limit: int = 5) -> list[GazetteerEntry]:
+        """
+        Suggest places from the offline gazetteer without touching the network.
+
+        Args:
+            query: Partial location name
+            limit: Maximum number of places to return
+
+        Returns:
+            Matching places, most populous first (empty when no gazetteer is loaded)
+
+        """
+        gazetteer = self._gazetteer if self._gazetteer is not None else get_default_gazetteer()
+        query = query.strip()
+        if gazetteer is None or len(query) < 2 or self.is_zip_code(query):
+            return []
+        country_codes = self.ALLOWED_COUNTRY_CODES if self.data_source == "nws" else None
+        return gazetteer.search(query, limit=limit, country_codes=country_codes)
+
     def suggest_locations(self, query: str, limit: int = 5) -> list[str]:
         """
         Suggest location completions based on partial input.
 
+        Offline gazetteer matches come first; the geocoding API is only asked
+        when they do not fill ``limit``.
+
         Args:
             query: Partial address or location name
             limit: Maximum number of suggestions to return
@@ -235,6 +265,15 @@ class GeocodingService:
             List of suggested location strings (filtered by data_source)
 
         """
+        offline = [entry.display_name for entry in self.suggest_offline(query, limit=limit)]
+        if len(offline) >= limit:
+            return offline
+        online = self._suggest_online(query, limit)
+        merged = list(dict.fromkeys(offline + online))
+        return merged[:limit]
+
+    def _suggest_online(self, query: str, limit: int) -> list[str]:
+        """Suggest location completions from the geocoding API."""
         try:
             # Clean up the query string
             query = query.strip()
@@ -0,0 +1,151 @@
+"""Persistent cache for Open-Meteo geocoding search results."""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .json_store import VersionedJsonStore
+from .paths import RuntimeStoragePaths, resolve_default_runtime_storage
+
+logger = logging.getLogger(__name__)
+
+# Place names and coordinates practically never change, so hits stay fresh for
+# a month. Misses expire sooner in case the gazetteer gains the place.
+DEFAULT_GEOCODING_TTL_SECONDS = 30 * 24 * 60 * 60
+DEFAULT_GEOCODING_MISS_TTL_SECONDS = 24 * 60 * 60
+MAX_GEOCODING_CACHE_ENTRIES = 512
+GEOCODING_CACHE_SCHEMA_VERSION = 1
+
+
+def normalize_query(query: str) -> str:
+    """Return the cache form of a search query (case- and whitespace-insensitive)."""
+    return re.sub(r"\s+", " ", query).strip().casefold()
+
+
+class GeocodingCache:
+    """Keep raw geocoding result items per normalized query in a small JSON file."""
+
+    def __init__(
+        self,
+        *,
+        path: Path | str | None = None,
+        runtime_paths: RuntimeStoragePaths | None = None,
+        ttl_seconds: float = DEFAULT_GEOCODING_TTL_SECONDS,
+        miss_ttl_seconds: float = DEFAULT_GEOCODING_MISS_TTL_SECONDS,
+        max_entries: int = MAX_GEOCODING_CACHE_ENTRIES,
+        time_fn: Callable[[], float] | None = None,
+        save_delay: float = 2.0,
+    ) -> None:
+        """
+        Initialize the cache with an optional persistence path, TTLs and clock.
+
+        ``save_delay`` is how long :meth:`put` waits before writing the file,
+        so searches typed in quick succession share one write off the caller's
+        thread.
+        """
+        resolved_path = path
+        if resolved_path is None:
+            resolved_path = (
+                runtime_paths or resolve_default_runtime_storage()
+            ).geocoding_cache_file
+        self._store = VersionedJsonStore(
+            resolved_path,
+            schema_version=GEOCODING_CACHE_SCHEMA_VERSION,
+            label="geocoding cache",
+            save_delay=save_delay,
+        )
+        self._ttl_seconds = float(ttl_seconds)
+        self._miss_ttl_seconds = float(miss_ttl_seconds)
+        self._max_entries = max(1, int(max_entries))
+        self._time_fn = time_fn or time.time
+        self._lock = threading.Lock()
+        self._records: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def key_for(query: str, count: int, language: str = "en") -> str:
+        """Return the cache key for a search."""
+        return f"{normalize_query(query)}|{int(count)}|{language}"
+
+    def get(self, query: str, count: int, language: str = "en") -> list[dict[str, Any]] | None:
+        """
+        Return cached result items for a search, or ``None`` on a miss.
+
+        An empty list is a cached "no results" answer, not a miss.
+        """
+        with self._lock:
+            record = self._records.get(self.key_for(query, count, language))
+            if record is None or record["expires_at"] <= self._time_fn():
+                return None
+            return [dict(item) for item in record["results"]]
+
+    def put(
+        self,
+        query: str,
+        count: int,
+        results: list[dict[str, Any]],
+        language: str = "en",
+    ) -> None:
+        """Store the result items returned for a search."""
+        items = [dict(item) for item in results if isinstance(item, dict)]
+        now = self._time_fn()
+        ttl = self._ttl_seconds if items else self._miss_ttl_seconds
+        with self._lock:
+            self._records[self.key_for(query, count, language)] = {
+                "results": items,
+                "fetched_at": now,
+                "expires_at": now + ttl,
+            }
+            self._enforce_limit()
+        self._store.save_soon(self._snapshot)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._records.clear()
+            self._store.save(self._records)
+
+    def flush(self) -> None:
+        """Write any pending :meth:`put` to disk now."""
+        self._store.flush()
+
+    def __len__(self) -> int:
+        """Return the number of cached searches."""
+        return len(self._records)
+
+    def _enforce_limit(self) -> None:
+        overflow = len(self._records) - self._max_entries
+        if overflow <= 0:
+            return
+        oldest = sorted(self._records, key=lambda key: self._records[key]["fetched_at"])
+        for key in oldest[:overflow]:
+            self._records.pop(key, None)
+
+    def _snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return dict(self._records)
+
+    def _load(self) -> None:
+        records: dict[str, dict[str, Any]] = {}
+        for key, record in self._store.load().items():
+            results = record.get("results")
+            fetched_at = record.get("fetched_at")
+            expires_at = record.get("expires_at")
+            if not isinstance(results, list):
+                continue
+            if not isinstance(fetched_at, int | float) or not isinstance(expires_at, int | float):
+                continue
+            records[key] = {
+                "results": [item for item in results if isinstance(item, dict)],
+                "fetched_at": float(fetched_at),
+                "expires_at": float(expires_at),
+            }
+
+        self._records = records
+        self._enforce_limit()
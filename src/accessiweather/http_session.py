@@ -0,0 +1,155 @@
+"""
+Process-wide pooled HTTP transport shared by every API client.
+
+Most fetch helpers open a short-lived ``httpx.AsyncClient`` for a single call.
+On its own each of those pays for a DNS lookup and a TLS handshake. Passing
+``transport=shared_transport()`` to those clients routes their requests
+through one connection pool per event loop instead, so a Pirate Weather call,
+an AirNow lookup and an NWS alerts fetch reuse warm keep-alive connections.
+httpcore already keeps connections per origin inside the pool, which gives
+per-host reuse without one pool object per provider.
+
+Closing a client that uses the shared transport does not close the pool; the
+pool is released by :func:`close_shared_transports` (called from
+``WeatherClient.close()``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+
+import httpx
+from httpx._utils import URLPattern, get_environment_proxies
+
+from .performance.timer import span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=15,
+    max_connections=30,
+    keepalive_expiry=30.0,
+)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Forward requests to a pooled transport while ignoring per-client close calls."""
+
+    def __init__(self, pool: httpx.AsyncBaseTransport):
+        self._pool = pool
+        self.is_closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.is_closed:
+            raise RuntimeError("Shared HTTP transport has been closed")
+        with span("http_request", provider=request.url.host):
+            return await self._pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # Called whenever a short-lived AsyncClient exits; the pool outlives it.
+        return None
+
+    async def close_pool(self) -> None:
+        self.is_closed = True
+        await self._pool.aclose()
+
+
+class _ProxyRoutedPool(httpx.AsyncBaseTransport):
+    """Send each request through the proxy its scheme and host call for."""
+
+    def __init__(
+        self,
+        direct: httpx.AsyncBaseTransport,
+        mounts: dict[URLPattern, httpx.AsyncBaseTransport | None],
+    ):
+        self._direct = direct
+        # Most specific pattern first, as httpx orders its own mounts.
+        self._mounts = dict(sorted(mounts.items()))
+
+    def _transport_for(self, url: httpx.URL) -> httpx.AsyncBaseTransport:
+        for pattern, transport in self._mounts.items():
+            if pattern.matches(url):
+                return self._direct if transport is None else transport
+        return self._direct
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport_for(request.url).handle_async_request(request)
+
+    async def aclose(self) -> None:
+        transports = {id(t): t for t in self._mounts.values() if t is not None}
+        for transport in [self._direct, *transports.values()]:
+            await transport.aclose()
+
+
+def _build_pool() -> httpx.AsyncBaseTransport:
+    # An explicit transport disables httpx's own proxy environment handling,
+    # so rebuild it here: one pool per proxy URL, mounted per scheme, with
+    # NO_PROXY hosts routed straight to the direct pool.
+    direct = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=DEFAULT_POOL_LIMITS)
+    proxies = get_environment_proxies()
+    if not any(proxies.values()):
+        return direct
+    pools: dict[str, httpx.AsyncHTTPTransport] = {}
+    mounts: dict[URLPattern, httpx.AsyncBaseTransport | None] = {}
+    for pattern, proxy_url in proxies.items():
+        if proxy_url and proxy_url not in pools:
+            pools[proxy_url] = httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE, limits=DEFAULT_POOL_LIMITS, proxy=proxy_url
+            )
+        mounts[URLPattern(pattern)] = pools[proxy_url] if proxy_url else None
+    return _ProxyRoutedPool(direct, mounts)
+
+
+_lock = threading.Lock()
+_transports: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedTransport] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def shared_transport() -> httpx.AsyncBaseTransport | None:
+    """
+    Return the pooled transport for the running event loop.
+
+    Connections cannot move between event loops, so each loop gets its own
+    pool. Outside a running loop ``None`` is returned, which makes
+    ``httpx.AsyncClient(transport=None)`` fall back to a private transport.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    with _lock:
+        transport = _transports.get(loop)
+        if transport is None or transport.is_closed:
+            transport = _SharedTransport(_build_pool())
+            _transports[loop] = transport
+        return transport
+
+
+async def close_shared_transports() -> None:
+    """Close the pool owned by the running loop and forget pools of closed loops."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    with _lock:
+        current = _transports.pop(loop, None) if loop is not None else None
+        for other_loop in [other for other in _transports if other.is_closed()]:
+            _transports.pop(other_loop, None)
+    if current is not None:
+        try:
+            await current.close_pool()
+        except Exception:  # noqa: BLE001
+            logger.debug("Failed to close shared HTTP transport", exc_info=True)
+
+
+def reset_shared_transports() -> None:
+    """Drop every registered pool without closing it (test helper)."""
+    with _lock:
+        _transports.clear()
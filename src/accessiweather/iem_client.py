@@ -9,6 +9,7 @@ from typing import Any, Literal
 
 import httpx
 
+from .http_session import shared_transport
 from .models import TextProduct
 
 logger = logging.getLogger(__name__)
@@ -232,7 +233,9 @@ async def fetch_iem_afos_text(
 
     if client is not None:
         return await _run(client)
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+    async with httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, transport=shared_transport()
+    ) as new_client:
         return await _run(new_client)
 
 
@@ -430,7 +433,9 @@ async def fetch_iem_spc_outlook(
 
     if client is not None:
         return await _run(client)
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+    async with httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, transport=shared_transport()
+    ) as new_client:
         return await _run(new_client)
 
 
@@ -490,7 +495,9 @@ async def fetch_iem_spc_mcds(
 
     if client is not None:
         return await _run(client)
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+    async with httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, transport=shared_transport()
+    ) as new_client:
         return await _run(new_client)
 
 
@@ -540,7 +547,9 @@ async def fetch_iem_spc_watches(
 
     if client is not None:
         return await _run(client)
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+    async with httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, transport=shared_transport()
+    ) as new_client:
         return await _run(new_client)
 
 
@@ -649,7 +658,9 @@ async def fetch_iem_wpc_outlook(
 
     if client is not None:
         return await _run(client)
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+    async with httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, transport=shared_transport()
+    ) as new_client:
         return await _run(new_client)
 
 
@@ -752,7 +763,9 @@ async def fetch_iem_wpc_mpds(
 
     if client is not None:
         return await _run(client)
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+    async with httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, transport=shared_transport()
+    ) as new_client:
         return await _run(new_client)
 
 
@@ -0,0 +1,142 @@
+"""Atomic, schema-versioned JSON files backing the small on-disk caches."""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Stores with a deferred save still pending; flushed at interpreter exit.
+_PENDING_STORES: weakref.WeakSet[VersionedJsonStore] = weakref.WeakSet()
+_PENDING_LOCK = threading.Lock()
+
+
+class VersionedJsonStore:
+    """
+    Read and write ``{"schema_version": n, "entries": {...}}`` JSON files.
+
+    Writes go to a ``.tmp`` sibling that is moved into place with
+    :func:`os.replace`, so readers never see a partial file. A file written
+    with another schema version loads as empty. Callers validate individual
+    entries themselves; this class only guarantees the outer shape.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        schema_version: int,
+        label: str,
+        save_delay: float = 2.0,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            path: JSON file to read and write
+            schema_version: Version written to, and required from, the file
+            label: Human-readable name used in log messages
+            save_delay: Seconds :meth:`save_soon` waits to coalesce writes
+
+        """
+        self.path = Path(path)
+        self._schema_version = schema_version
+        self._label = label
+        self._save_delay = max(0.0, float(save_delay))
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._snapshot: Callable[[], Mapping[str, Any]] | None = None
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        """Return the stored entries whose values are objects, or ``{}`` when unusable."""
+        if not self.path.exists():
+            return {}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception as exc:
+            logger.warning("Failed to load %s: %s", self._label, exc)
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        if payload.get("schema_version") != self._schema_version:
+            logger.debug("Discarding %s with unknown schema version", self._label)
+            return {}
+        entries = payload.get("entries")
+        if not isinstance(entries, dict):
+            return {}
+        return {
+            key: value
+            for key, value in entries.items()
+            if isinstance(key, str) and isinstance(value, dict)
+        }
+
+    def save(self, entries: Mapping[str, Any]) -> bool:
+        """Write ``entries`` atomically now; return False (after logging) on failure."""
+        tmp_file = self.path.with_suffix(self.path.suffix + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps(
+                {"schema_version": self._schema_version, "entries": entries},
+                sort_keys=True,
+            )
+            tmp_file.write_text(payload, encoding="utf-8")
+            os.replace(tmp_file, self.path)
+            return True
+        except Exception as exc:
+            logger.warning("Failed to save %s: %s", self._label, exc)
+            try:
+                if tmp_file.exists():
+                    tmp_file.unlink()
+            except Exception:
+                logger.debug("Failed to remove %s temp file", self._label, exc_info=True)
+            return False
+
+    def save_soon(self, snapshot: Callable[[], Mapping[str, Any]]) -> None:
+        """
+        Save ``snapshot()`` once after ``save_delay`` seconds, off the calling thread.
+
+        Repeated calls before the timer fires collapse into one write of the
+        latest snapshot. ``snapshot`` runs on the timer thread, so it must take
+        whatever lock guards the caller's records and return a copy.
+        """
+        if self._save_delay == 0:
+            self.save(snapshot())
+            return
+        with _PENDING_LOCK:
+            _PENDING_STORES.add(self)
+        with self._lock:
+            self._snapshot = snapshot
+            if self._timer is None:
+                self._timer = threading.Timer(self._save_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write any pending :meth:`save_soon` snapshot now."""
+        with self._lock:
+            snapshot, self._snapshot = self._snapshot, None
+            timer, self._timer = self._timer, None
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+        with _PENDING_LOCK:
+            _PENDING_STORES.discard(self)
+        if snapshot is not None:
+            self.save(snapshot())
+
+
+def _flush_pending_stores() -> None:
+    with _PENDING_LOCK:
+        stores = list(_PENDING_STORES)
+    for store in stores:
+        store.flush()
+
+
+atexit.register(_flush_pending_stores)
@@ -7,10 +7,14 @@ replacing the complex location service with direct operations.
 
 import logging
 import re
+from dataclasses import asdict
 
 import httpx
 
+from .geocoding_cache import GeocodingCache
+from .http_session import shared_transport
 from .models import Location
+from .openmeteo_geocoding_client import OpenMeteoGeocodingClient, format_place_name
 from .utils.log_sanitize import sanitize_log
 from .utils.retry_utils import (
     RETRYABLE_EXCEPTIONS,
@@ -20,6 +24,20 @@ from .utils.retry_utils import (
 
 logger = logging.getLogger(__name__)
 
+_GEOCODING_CACHE: GeocodingCache | None = None
+
+
+def set_geocoding_cache(cache: GeocodingCache | None) -> None:
+    """
+    Register (or clear) the persistent geocoding search cache.
+
+    Location dialogs build their own ``LocationManager``, so the cache is a
+    module-global registration rather than a constructor argument at every
+    call site. Pass ``None`` to clear.
+    """
+    global _GEOCODING_CACHE
+    _GEOCODING_CACHE = cache
+
 
 class LocationManager:
     """Simple location manager with geocoding support via Open-Meteo."""
@@ -34,12 +52,21 @@ class LocationManager:
     )
     STARTS_WITH_NUMBER_PATTERN = re.compile(r"^\s*\d+\b")
 
-    def __init__(self):
-        """Initialize the instance."""
+    def __init__(self, geocoding_cache: GeocodingCache | None = None):
+        """
+        Initialize the instance.
+
+        Args:
+            geocoding_cache: Optional persistent search cache. Defaults to the
+                cache registered with :func:`set_geocoding_cache`, if any.
+
+        """
         self.timeout = 10.0
         self.geocoding_base_url = "https://geocoding-api.open-meteo.com/v1"
         self.census_geocoding_base_url = "https://geocoding.geo.census.gov/geocoder"
         self.nominatim_base_url = "https://nominatim.openstreetmap.org"
+        self._geocoding_cache = geocoding_cache
+        self._fallback_geocoder: OpenMeteoGeocodingClient | None = None
 
     @async_retry_with_backoff(max_attempts=3, base_delay=1.0, timeout=15.0)
     async def search_locations(self, query: str, limit: int = 5) -> list[Location]:
@@ -64,6 +91,12 @@ class LocationManager:
                     )
                     return address_locations
 
+            cache = self._geocoding_cache if self._geocoding_cache is not None else _GEOCODING_CACHE
+            cached = cache.get(query, limit) if cache is not None else None
+            if cached is not None:
+                logger.debug(f"Geocoding cache hit for '{sanitize_log(query)}'")
+                return self._locations_from_results(cached, limit)
+
             url = f"{self.geocoding_base_url}/search"
             params = {
                 "name": query,
@@ -72,55 +105,45 @@ class LocationManager:
                 "format": "json",
             }
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, transport=shared_transport()
+            ) as client:
                 response = await client.get(url, params=params)
                 response.raise_for_status()
                 data = response.json()
 
-                results = data.get("results", [])
-                if not results:
-                    # Fallback: use OpenMeteoGeocodingClient with Unicode variant expansion
+            # Sort by population (higher first) for better relevance; fallback
+            # matches below arrive already ranked by how well they match.
+            results = sorted(
+                data.get("results", []), key=lambda x: x.get("population", 0) or 0, reverse=True
+            )
+            if not results:
+                # Fallback: fan out Unicode and simplified variants concurrently
+                logger.info(
+                    f"No direct results for '{sanitize_log(query)}', trying Unicode fallback..."
+                )
+                fallback_results = await self._get_fallback_geocoder().search_fallbacks_async(
+                    query, count=limit
+                )
+                if fallback_results:
                     logger.info(
-                        f"No direct results for '{sanitize_log(query)}', trying Unicode fallback..."
+                        f"Unicode fallback found {len(fallback_results)} results "
+                        f"for '{sanitize_log(query)}'"
                     )
-                    from .openmeteo_geocoding_client import OpenMeteoGeocodingClient
-
-                    fallback_client = OpenMeteoGeocodingClient(timeout=self.timeout)
-                    fallback_results = fallback_client.search(query, count=limit)
-                    if fallback_results:
-                        logger.info(
-                            f"Unicode fallback found {len(fallback_results)} results "
-                            f"for '{sanitize_log(query)}'"
-                        )
-                        return [
-                            Location(
-                                name=r.display_name or r.name,
-                                latitude=r.latitude,
-                                longitude=r.longitude,
-                                country_code=r.country_code or "",
-                            )
-                            for r in fallback_results[:limit]
-                        ]
-                    logger.info(f"No locations found for query: {sanitize_log(query)}")
-                    return []
-
-                # Sort by population (higher first) for better relevance
-                results.sort(key=lambda x: x.get("population", 0) or 0, reverse=True)
-
-                # Parse and deduplicate results
-                unique_locations: dict[str, Location] = {}
-                for item in results:
-                    location = self._parse_geocoding_result(item)
-                    if location:
-                        key = location.name.lower()
-                        if key not in unique_locations:
-                            unique_locations[key] = location
-                        if len(unique_locations) >= limit:
-                            break
-
-                locations = list(unique_locations.values())
-                logger.info(f"Found {len(locations)} locations for query: {sanitize_log(query)}")
-                return locations
+                results = [asdict(result) for result in fallback_results]
+
+            # Only answers from queries that all completed reach this point (a
+            # failed fallback variant raises), so an empty list is a real miss.
+            # The cache writes its file later on its own thread.
+            if cache is not None:
+                cache.put(query, limit, results)
+            if not results:
+                logger.info(f"No locations found for query: {sanitize_log(query)}")
+                return []
+
+            locations = self._locations_from_results(results, limit)
+            logger.info(f"Found {len(locations)} locations for query: {sanitize_log(query)}")
+            return locations
 
         except Exception as e:
             logger.error(f"Failed to search locations: {e}")
@@ -128,6 +151,24 @@ class LocationManager:
                 raise
             return []
 
+    def _locations_from_results(self, results: list[dict], limit: int) -> list[Location]:
+        """Turn ranked Open-Meteo result items into de-duplicated locations."""
+        unique_locations: dict[str, Location] = {}
+        for item in results:
+            location = self._parse_geocoding_result(item)
+            if location:
+                key = location.name.lower()
+                if key not in unique_locations:
+                    unique_locations[key] = location
+                if len(unique_locations) >= limit:
+                    break
+        return list(unique_locations.values())
+
+    def _get_fallback_geocoder(self) -> OpenMeteoGeocodingClient:
+        if self._fallback_geocoder is None:
+            self._fallback_geocoder = OpenMeteoGeocodingClient(timeout=self.timeout)
+        return self._fallback_geocoder
+
     def _looks_like_street_address(self, query: str) -> bool:
         """Return True when a query has enough street-address shape for Census geocoding."""
         return bool(
@@ -144,7 +185,9 @@ class LocationManager:
             "format": "json",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+        async with httpx.AsyncClient(
+            timeout=self.timeout, follow_redirects=True, transport=shared_transport()
+        ) as client:
             response = await client.get(url, params=params)
             response.raise_for_status()
             data = response.json()
@@ -194,7 +237,9 @@ class LocationManager:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, follow_redirects=True, transport=shared_transport()
+            ) as client:
                 response = await client.get(url, headers=headers)
         except Exception as exc:  # noqa: BLE001 - reverse lookup should never block manual save
             logger.debug("Reverse geocoding failed for (%s, %s): %s", latitude, longitude, exc)
@@ -252,7 +297,9 @@ class LocationManager:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, follow_redirects=True, transport=shared_transport()
+            ) as client:
                 response = await client.get(url, params=params, headers=headers)
         except Exception as exc:  # noqa: BLE001 - manual location entry must remain available
             logger.debug(
@@ -374,24 +421,10 @@ class LocationManager:
             lat = float(data.get("latitude", 0))
             lon = float(data.get("longitude", 0))
 
-            # Build location name from available fields
-            name = data.get("name", "")
-            admin1 = data.get("admin1", "")  # State/province
-            country = data.get("country", "")
             country_code = data.get("country_code", "")
-
-            # Build a nice display name
-            name_parts = [name] if name else []
-
-            # Add state/province for context
-            if admin1 and admin1 != name:
-                name_parts.append(admin1)
-
-            # Add country if not US (to avoid redundancy for US locations)
-            if country and country not in ("United States", "United States of America"):
-                name_parts.append(country)
-
-            display_name = ", ".join(name_parts) if name_parts else "Unknown Location"
+            display_name = format_place_name(
+                data.get("name", ""), data.get("admin1", ""), data.get("country", "")
+            )
 
             return Location(
                 name=display_name,
@@ -543,7 +576,9 @@ class LocationManager:
             # Use a simple IP geolocation service
             url = "http://ip-api.com/json/"
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, transport=shared_transport()
+            ) as client:
                 response = await client.get(url)
                 response.raise_for_status()
                 data = response.json()
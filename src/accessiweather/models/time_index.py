@@ -0,0 +1,103 @@
+"""Sorted time index for nearest, window and next-N lookups over timed items."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from typing import Generic, Literal, TypeVar
+
+T = TypeVar("T")
+
+NaiveTimes = Literal["utc", "local"]
+
+
+def epoch_seconds(value: datetime | None, naive_as: NaiveTimes = "utc") -> float | None:
+    """
+    Return POSIX seconds for ``value``.
+
+    Aware datetimes are absolute. Naive ones are read as UTC or as local wall
+    time depending on ``naive_as``.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None and naive_as == "utc":
+        value = value.replace(tzinfo=UTC)
+    try:
+        return value.timestamp()
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+class TimeIndex(Generic[T]):
+    """
+    Items ordered by epoch time with bisect-based queries.
+
+    Building costs O(n log n) once; each query is O(log n) plus the size of
+    its result. Items without a usable time are kept aside in ``untimed``.
+    Items sharing a timestamp keep their input order.
+    """
+
+    __slots__ = ("items", "timestamps", "untimed")
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        key: Callable[[T], datetime | None],
+        *,
+        naive_as: NaiveTimes = "utc",
+    ) -> None:
+        """Index ``items`` by the datetime returned from ``key``."""
+        timed: list[tuple[float, T]] = []
+        self.untimed: list[T] = []
+        for item in items:
+            ts = epoch_seconds(key(item), naive_as)
+            if ts is None:
+                self.untimed.append(item)
+            else:
+                timed.append((ts, item))
+        timed.sort(key=lambda pair: pair[0])
+        self.timestamps: list[float] = [ts for ts, _ in timed]
+        self.items: list[T] = [item for _, item in timed]
+
+    def __len__(self) -> int:
+        """Return the number of timed items."""
+        return len(self.items)
+
+    def nearest(self, target_ts: float, max_delta_seconds: float | None = None) -> T | None:
+        """
+        Return the item closest to ``target_ts`` (earlier wins ties).
+
+        Returns ``None`` when the index is empty or the closest item is more
+        than ``max_delta_seconds`` away.
+        """
+        timestamps = self.timestamps
+        if not timestamps:
+            return None
+        right = bisect_left(timestamps, target_ts)
+        if right == 0:
+            best = 0
+        else:
+            # First of any run of equal timestamps, matching a linear scan.
+            best = bisect_left(timestamps, timestamps[right - 1])
+            if (
+                right < len(timestamps)
+                and timestamps[right] - target_ts < target_ts - timestamps[best]
+            ):
+                best = right
+        if max_delta_seconds is not None and abs(timestamps[best] - target_ts) > max_delta_seconds:
+            return None
+        return self.items[best]
+
+    def window(self, start_ts: float, end_ts: float) -> list[T]:
+        """Return items with ``start_ts <= time < end_ts`` in time order."""
+        lo = bisect_left(self.timestamps, start_ts)
+        hi = bisect_left(self.timestamps, end_ts, lo)
+        return self.items[lo:hi]
+
+    def next_n(self, from_ts: float, count: int) -> list[T]:
+        """Return up to ``count`` items at or after ``from_ts`` in time order."""
+        if count <= 0:
+            return []
+        lo = bisect_left(self.timestamps, from_ts)
+        return self.items[lo : lo + count]
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
+from .time_index import TimeIndex
+
 
 @dataclass
 class ForecastPeriod:
@@ -139,6 +141,28 @@ class HourlyForecast:
         """Check if we have any hourly forecast data."""
         return len(self.periods) > 0
 
+    def time_index(self) -> TimeIndex[HourlyForecastPeriod]:
+        """
+        Return the periods indexed by start time, built once and reused.
+
+        Naive start times are read as UTC when any period carries a timezone
+        and as local wall time otherwise. The index is rebuilt if ``periods``
+        is replaced or changes length.
+        """
+        periods = self.periods
+        cached = self.__dict__.get("_time_index_cache")
+        if cached is not None and cached[0] is periods and cached[1] == len(periods):
+            return cached[2]
+        naive_as = (
+            "utc"
+            if any(p.start_time and p.start_time.tzinfo is not None for p in periods)
+            else "local"
+        )
+        index = TimeIndex(periods, lambda p: p.start_time, naive_as=naive_as)
+        # Kept outside the dataclass fields so asdict(), == and replace() ignore it.
+        self.__dict__["_time_index_cache"] = (periods, len(periods), index)
+        return index
+
     def get_next_hours(self, count: int = 6) -> list[HourlyForecastPeriod]:
         """
         Get the next N hours of forecast data.
@@ -155,46 +179,14 @@ class HourlyForecast:
         if not self.periods:
             return []
 
-        def _to_timestamp(dt: datetime | None, *, as_utc: bool) -> float | None:
-            if dt is None:
-                return None
-            if as_utc:
-                dt = dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
-                return dt.timestamp()
-            if dt.tzinfo is not None:
-                dt = dt.astimezone()
-            return dt.timestamp()
-
-        has_aware_times = any(
-            p.start_time and p.start_time.tzinfo is not None for p in self.periods
-        )
-        now_reference = datetime.now(UTC) if has_aware_times else datetime.now()
-        now_ts = now_reference.timestamp()
-        tolerance = timedelta(hours=1)
-        tolerance_seconds = tolerance.total_seconds()
-
-        sortable_periods: list[tuple[HourlyForecastPeriod, float]] = []
-        unordered_periods: list[HourlyForecastPeriod] = []
-        for period in self.periods:
-            ts = _to_timestamp(period.start_time, as_utc=has_aware_times)
-            if ts is None:
-                unordered_periods.append(period)
-            else:
-                sortable_periods.append((period, ts))
-
-        sortable_periods.sort(key=lambda item: item[1])
-
-        upcoming: list[HourlyForecastPeriod] = []
-        for period, ts in sortable_periods:
-            if ts >= now_ts - tolerance_seconds:
-                upcoming.append(period)
-                if len(upcoming) == count:
-                    break
-
+        index = self.time_index()
+        # Include the hour in progress (it started up to an hour ago).
+        tolerance_seconds = timedelta(hours=1).total_seconds()
+        upcoming = index.next_n(datetime.now(UTC).timestamp() - tolerance_seconds, count)
         if upcoming:
-            return upcoming[:count]
+            return upcoming
 
-        fallback = [period for period, _ in sortable_periods] + unordered_periods
+        fallback = index.items + index.untimed
         return fallback[:count]
 
 
@@ -7,6 +7,7 @@ from accessiweather.noaa_radio.station_availability import (
 )
 from accessiweather.noaa_radio.station_db import StationDatabase
 from accessiweather.noaa_radio.stations import Station
+from accessiweather.noaa_radio.stream_prober import StreamProber, StreamProbeResult
 from accessiweather.noaa_radio.stream_url import StreamURLProvider
 from accessiweather.noaa_radio.weatherindex_client import WeatherIndexClient
 from accessiweather.noaa_radio.wxradio_client import WxRadioClient
@@ -17,6 +18,8 @@ __all__ = [
     "StationAvailabilityEntry",
     "StationAvailabilityService",
     "StationDatabase",
+    "StreamProbeResult",
+    "StreamProber",
     "StreamURLProvider",
     "WeatherIndexClient",
     "WxRadioClient",
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
 from collections.abc import Callable
 from pathlib import Path
@@ -13,9 +14,21 @@ from accessiweather.paths import RuntimeStoragePaths, resolve_default_runtime_st
 
 logger = logging.getLogger(__name__)
 
+STREAM_HISTORY_KEY = "stream_history"
+MAX_STREAM_HISTORY_ENTRIES = 256
+# Weight of the newest probe in a mirror's smoothed latency.
+STREAM_LATENCY_SMOOTHING = 0.5
+# Added per consecutive failure so failing mirrors sort after every live one.
+STREAM_FAILURE_PENALTY_SECONDS = 60.0
+
 
 class StationAvailabilityCache:
-    """Track temporarily suppressed stations in a small JSON file."""
+    """
+    Track temporarily suppressed stations in a small JSON file.
+
+    The same file keeps per-URL stream history (smoothed time-to-first-audio
+    and consecutive failures) so the fastest live mirror can be tried first.
+    """
 
     def __init__(
         self,
@@ -33,6 +46,8 @@ class StationAvailabilityCache:
         self._path = Path(resolved_path)
         self._time_fn = time_fn or time.time
         self._records: dict[str, dict[str, Any]] = {}
+        self._stream_history: dict[str, dict[str, Any]] = {}
+        self._lock = threading.RLock()
         self._load()
 
     def suppress(self, call_sign: str, ttl_seconds: int, reason: str) -> None:
@@ -70,6 +85,56 @@ class StationAvailabilityCache:
         self._prune_expired()
         return sorted(self._records)
 
+    def record_stream_result(self, url: str, latency_seconds: float | None) -> None:
+        """Record a stream probe: latency on success, ``None`` on failure."""
+        if not url:
+            return
+        with self._lock:
+            entry = self._stream_history.pop(url, None) or {"latency": None, "failures": 0}
+            if latency_seconds is None:
+                entry["failures"] = int(entry["failures"]) + 1
+            else:
+                previous = entry["latency"]
+                latency = max(0.0, float(latency_seconds))
+                entry["latency"] = (
+                    latency
+                    if previous is None
+                    else STREAM_LATENCY_SMOOTHING * latency
+                    + (1 - STREAM_LATENCY_SMOOTHING) * float(previous)
+                )
+                entry["failures"] = 0
+            entry["updated_at"] = self._time_fn()
+            # Re-inserting keeps the dict ordered oldest-updated first.
+            self._stream_history[url] = entry
+            while len(self._stream_history) > MAX_STREAM_HISTORY_ENTRIES:
+                self._stream_history.pop(next(iter(self._stream_history)))
+            self._save()
+
+    def get_stream_record(self, url: str) -> dict[str, Any] | None:
+        """Return the recorded stream history for a URL, if any."""
+        with self._lock:
+            entry = self._stream_history.get(url)
+            return dict(entry) if entry is not None else None
+
+    def get_stream_scores(self, urls: list[str]) -> dict[str, float]:
+        """
+        Return a sort score (lower is better) for each URL with recorded history.
+
+        Live mirrors score their smoothed latency; failing mirrors add a
+        penalty per consecutive failure. URLs never probed are omitted.
+        """
+        scores: dict[str, float] = {}
+        with self._lock:
+            for url in urls:
+                entry = self._stream_history.get(url)
+                if entry is None:
+                    continue
+                latency = entry["latency"]
+                scores[url] = (float(latency) if latency is not None else 0.0) + (
+                    int(entry["failures"]) * STREAM_FAILURE_PENALTY_SECONDS
+                )
+        return scores
+
     def _load(self) -> None:
         if not self._path.exists():
             return
@@ -82,8 +147,11 @@ class StationAvailabilityCache:
         if not isinstance(payload, dict):
             return
 
+        self._stream_history = self._parse_stream_history(payload.get(STREAM_HISTORY_KEY))
         records: dict[str, dict[str, Any]] = {}
         for call_sign, record in payload.items():
+            if call_sign == STREAM_HISTORY_KEY:
+                continue
             if not isinstance(call_sign, str) or not isinstance(record, dict):
                 continue
             expires_at = record.get("expires_at")
@@ -100,16 +168,44 @@ class StationAvailabilityCache:
         self._records = records
         self._prune_expired()
 
+    @staticmethod
+    def _parse_stream_history(raw: Any) -> dict[str, dict[str, Any]]:
+        if not isinstance(raw, dict):
+            return {}
+        history: dict[str, dict[str, Any]] = {}
+        entries = [
+            (url, entry)
+            for url, entry in raw.items()
+            if isinstance(url, str)
+            and isinstance(entry, dict)
+            and isinstance(entry.get("updated_at"), int | float)
+            and isinstance(entry.get("failures"), int)
+            and (entry.get("latency") is None or isinstance(entry.get("latency"), int | float))
+        ]
+        for url, entry in sorted(entries, key=lambda item: item[1]["updated_at"]):
+            history[url] = {
+                "latency": float(entry["latency"]) if entry["latency"] is not None else None,
+                "failures": max(0, entry["failures"]),
+                "updated_at": float(entry["updated_at"]),
+            }
+        while len(history) > MAX_STREAM_HISTORY_ENTRIES:
+            history.pop(next(iter(history)))
+        return history
+
     def _save(self) -> None:
         self._prune_expired()
-        try:
-            self._path.parent.mkdir(parents=True, exist_ok=True)
-            self._path.write_text(
-                json.dumps(self._records, indent=2, sort_keys=True),
-                encoding="utf-8",
-            )
-        except Exception as exc:
-            logger.warning("Failed to save NOAA radio availability cache: %s", exc)
+        with self._lock:
+            payload: dict[str, Any] = dict(self._records)
+            if self._stream_history:
+                payload[STREAM_HISTORY_KEY] = self._stream_history
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._path.write_text(
+                    json.dumps(payload, indent=2, sort_keys=True),
+                    encoding="utf-8",
+                )
+            except Exception as exc:
+                logger.warning("Failed to save NOAA radio availability cache: %s", exc)
 
     def _prune_expired(self) -> None:
         now = self._time_fn()
@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Mapping
 from pathlib import Path
 
+from accessiweather.noaa_radio.availability_cache import STREAM_FAILURE_PENALTY_SECONDS
+
 logger = logging.getLogger(__name__)
 DEFAULT_STATION_LIMIT = 10
+# Scores at or above this belong to mirrors with at least one recent failure.
+STREAM_FAILURE_SCORE = STREAM_FAILURE_PENALTY_SECONDS
 
 
 class RadioPreferences:
@@ -116,12 +121,34 @@ class RadioPreferences:
             del self._prefs[call_sign.upper()]
             self._save()
 
-    def reorder_urls(self, call_sign: str, urls: list[str]) -> list[str]:
-        """Reorder URLs so the preferred one is first, if set."""
+    def reorder_urls(
+        self,
+        call_sign: str,
+        urls: list[str],
+        stream_scores: Mapping[str, float] | None = None,
+    ) -> list[str]:
+        """
+        Reorder URLs so the preferred one is first, if set.
+
+        When ``stream_scores`` (lower is better, see
+        ``StationAvailabilityCache.get_stream_scores``) are given, the remaining
+        URLs are sorted by score. Unscored URLs keep their order and sit between
+        live mirrors and ones that have been failing.
+        """
+        ordered = list(urls)
+        if stream_scores:
+
+            def sort_key(url: str) -> tuple[int, float]:
+                score = stream_scores.get(url)
+                if score is None:
+                    return (1, 0.0)
+                return (2 if score >= STREAM_FAILURE_SCORE else 0, score)
+
+            ordered.sort(key=sort_key)
         preferred = self.get_preferred_url(call_sign)
-        if preferred and preferred in urls:
-            return [preferred] + [u for u in urls if u != preferred]
-        return list(urls)
+        if preferred and preferred in ordered:
+            return [preferred] + [u for u in ordered if u != preferred]
+        return ordered
 
     def get_favorite_stations(self) -> list[str]:
         """Return favorite station call signs in saved order."""
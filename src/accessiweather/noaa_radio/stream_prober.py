@@ -0,0 +1,130 @@
+"""Concurrent liveness probing for NOAA Weather Radio stream mirrors."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from accessiweather.noaa_radio.availability_cache import StationAvailabilityCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROBE_TIMEOUT = 5.0
+MAX_PROBE_WORKERS = 6
+
+
+@dataclass(frozen=True)
+class StreamProbeResult:
+    """Outcome of probing one stream URL."""
+
+    url: str
+    latency: float | None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True when the stream delivered audio bytes."""
+        return self.latency is not None
+
+
+class StreamProber:
+    """
+    Open candidate stream URLs concurrently and time their first audio bytes.
+
+    Every finished probe is recorded in the optional availability cache, so
+    mirrors that lose a race still contribute latency and failure history.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = DEFAULT_PROBE_TIMEOUT,
+        history: StationAvailabilityCache | None = None,
+        client: httpx.Client | None = None,
+        max_workers: int = MAX_PROBE_WORKERS,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        """Initialize the prober with an optional history cache and HTTP client."""
+        self._history = history
+        self._owns_client = client is None
+        self._client = client or httpx.Client(
+            timeout=httpx.Timeout(timeout),
+            follow_redirects=True,
+            headers={"Icy-MetaData": "0"},
+        )
+        self._clock = clock or time.monotonic
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, int(max_workers)),
+            thread_name_prefix="noaa-stream-probe",
+        )
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def probe(self, url: str) -> StreamProbeResult:
+        """Return the time-to-first-audio-bytes for ``url``, or the failure reason."""
+        started = self._clock()
+        try:
+            with self._client.stream("GET", url) as response:
+                response.raise_for_status()
+                for chunk in response.iter_bytes():
+                    if chunk:
+                        result = StreamProbeResult(url=url, latency=self._clock() - started)
+                        break
+                else:
+                    result = StreamProbeResult(url=url, latency=None, error="empty stream")
+        except Exception as exc:
+            result = StreamProbeResult(url=url, latency=None, error=str(exc) or type(exc).__name__)
+        self._record(result)
+        return result
+
+    def probe_all(self, urls: list[str]) -> list[StreamProbeResult]:
+        """Probe every URL concurrently and return results fastest first."""
+        futures = [self._executor.submit(self.probe, url) for url in dict.fromkeys(urls)]
+        results = [future.result() for future in futures]
+        return sorted(results, key=lambda result: (not result.ok, result.latency or 0.0))
+
+    def race(self, urls: list[str]) -> StreamProbeResult | None:
+        """
+        Return the first URL to deliver audio, or ``None`` when every probe fails.
+
+        Losing probes keep running in the background so their outcome still
+        lands in the history cache.
+        """
+        pending: set[Future[StreamProbeResult]] = {
+            self._executor.submit(self.probe, url) for url in dict.fromkeys(urls)
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result.ok:
+                    return result
+        return None
+
+    def close(self) -> None:
+        """Stop accepting probes and release the HTTP client."""
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._owns_client:
+            self._client.close()
+
+    def _record(self, result: StreamProbeResult) -> None:
+        if not result.ok:
+            logger.debug("Stream probe failed for %s: %s", result.url, result.error)
+        with self._lock:
+            # Probes cut off by close() fail for reasons unrelated to the mirror.
+            if self._history is None or self._closed:
+                return
+            try:
+                self._history.record_stream_result(result.url, result.latency)
+            except Exception:
+                logger.debug("Failed to record stream probe result", exc_info=True)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from typing import TYPE_CHECKING
 
@@ -9,6 +10,8 @@ if TYPE_CHECKING:
     from accessiweather.noaa_radio.weatherindex_client import WeatherIndexClient
     from accessiweather.noaa_radio.wxradio_client import WxRadioClient
 
+PREWARM_MAX_WORKERS = 4
+
 
 class StreamURLProvider:
     """
@@ -433,7 +436,18 @@ class StreamURLProvider:
         ``get_stream_urls`` lookup (e.g. when the user presses Play) hits a warm
         cache instead of blocking on a network request. Intended to be called
         from a background thread. Safe to call multiple times.
+
+        Lookups run on a small thread pool so one slow station does not hold
+        up the rest of the list.
         """
-        for call_sign in call_signs:
-            with suppress(Exception):
-                self.get_stream_urls(call_sign)
+        unique = list(dict.fromkeys(c.upper().strip() for c in call_signs if c.strip()))
+        if not unique:
+            return
+        # Every lookup reads the shared wxradio directory; fetch it once up
+        # front instead of letting each worker race to fill it.
+        self.prewarm_cache()
+        workers = min(PREWARM_MAX_WORKERS, len(unique))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="noaa-prewarm") as pool:
+            for future in [pool.submit(self.get_stream_urls, c) for c in unique]:
+                with suppress(Exception):
+                    future.result()
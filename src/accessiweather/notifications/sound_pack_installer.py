@@ -7,6 +7,8 @@ import tempfile
 import zipfile
 from pathlib import Path
 
+from ..services.community_soundpack_service import INSTALL_MANIFEST_NAME
+
 logger = logging.getLogger(__name__)
 
 
@@ -155,7 +157,8 @@ class SoundPackInstaller:
         try:
             with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zip_file:
                 for file_path in pack_dir.rglob("*"):
-                    if file_path.is_file():
+                    # The community install manifest describes this copy only.
+                    if file_path.is_file() and file_path.name != INSTALL_MANIFEST_NAME:
                         # Add file to ZIP with relative path
                         arcname = file_path.relative_to(pack_dir)
                         zip_file.write(file_path, arcname)
@@ -206,6 +209,62 @@ class SoundPackInstaller:
 
         return sorted(packs, key=lambda x: x["name"])
 
+    def validate_pack_directory(self, pack_dir: Path) -> tuple[bool, str]:
+        """
+        Validate a pack directory written by a direct (non-ZIP) install.
+
+        Args:
+        ----
+            pack_dir: Directory holding the pack's pack.json and sounds
+
+        Returns:
+        -------
+            Tuple of (is_valid, error_message)
+
+        """
+        return self._validate_extracted_pack(pack_dir)
+
+    def resolve_pack_directory(self, pack_dir: str) -> Path:
+        """
+        Return the install path for ``pack_dir``, which must stay inside the packs directory.
+
+        Args:
+        ----
+            pack_dir: Directory name for the pack (may come from remote metadata)
+
+        Returns:
+        -------
+            The resolved install path
+
+        Raises:
+        ------
+            ValueError: If the name would place the pack outside the sound packs directory
+
+        """
+        root = self.soundpacks_dir.resolve()
+        target = (root / pack_dir).resolve()
+        if target == root or not target.is_relative_to(root):
+            raise ValueError(f"Unsafe sound pack directory name: {pack_dir!r}")
+        return target
+
+    def find_pack_directory(self, display_name: str) -> str | None:
+        """
+        Return the directory of the installed pack whose pack.json name matches.
+
+        Args:
+        ----
+            display_name: The ``name`` field from pack.json
+
+        Returns:
+        -------
+            The pack directory name, or None if no installed pack matches
+
+        """
+        for pack_info in self.list_installed_packs():
+            if pack_info["name"] == display_name:
+                return pack_info["directory"]
+        return None
+
     def _validate_extracted_pack(self, pack_dir: Path) -> tuple[bool, str]:
         """
         Validate an extracted sound pack directory.
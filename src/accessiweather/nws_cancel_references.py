@@ -0,0 +1,134 @@
+"""Incremental tracker for confirmed NWS cancel references."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .runtime_state import RuntimeStateManager
+
+logger = logging.getLogger(__name__)
+
+RUNTIME_STATE_SECTION = "nws_cancel_references"
+# Cancel messages can be indexed a little after their ``sent`` time, so each
+# incremental query reaches slightly behind the previous high-water mark.
+QUERY_OVERLAP = timedelta(minutes=2)
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+class NwsCancelReferenceTracker:
+    """
+    Keep a rolling, time-indexed set of alert ids confirmed cancelled by NWS.
+
+    Each query only needs to cover messages sent since the previous successful
+    query (the high-water mark), minus a small overlap. References expire once
+    their cancel message is older than the retention window, which matches the
+    lookback the non-incremental query used to re-download on every poll.
+    State is mirrored to the runtime-state file whenever the set changes.
+    """
+
+    def __init__(
+        self,
+        *,
+        runtime_state_manager: RuntimeStateManager | None = None,
+        retention: timedelta = timedelta(minutes=15),
+        time_fn: Callable[[], datetime] | None = None,
+    ) -> None:
+        """Initialize the tracker, optionally persisting through ``runtime_state_manager``."""
+        self._runtime_state_manager = runtime_state_manager
+        self._retention = retention
+        self._time_fn = time_fn or (lambda: datetime.now(UTC))
+        self._lock = threading.Lock()
+        self._references: dict[str, datetime] = {}
+        self._high_water_mark: datetime | None = None
+        self._loaded = runtime_state_manager is None
+
+    def now(self) -> datetime:
+        """Return the tracker clock's current time."""
+        return self._time_fn()
+
+    def query_start(self, now: datetime, lookback: timedelta) -> datetime:
+        """Return the ``start`` for the next cancel query ending at ``now``."""
+        with self._lock:
+            self._ensure_loaded()
+            floor = now - max(lookback, self._retention)
+            if self._high_water_mark is None:
+                return now - lookback
+            return max(floor, self._high_water_mark - QUERY_OVERLAP)
+
+    def record(self, references: Mapping[str, datetime], query_end: datetime) -> set[str]:
+        """Merge newly fetched references, advance the high-water mark and return the live set."""
+        with self._lock:
+            self._ensure_loaded()
+            changed = False
+            for alert_id, sent in references.items():
+                if self._references.get(alert_id) != sent:
+                    self._references[alert_id] = sent
+                    changed = True
+            if self._high_water_mark is None or query_end > self._high_water_mark:
+                self._high_water_mark = query_end
+            changed |= self._expire(query_end)
+            if changed:
+                self._save()
+            return set(self._references)
+
+    def references(self) -> set[str]:
+        """Return the confirmed cancel ids that have not expired yet."""
+        with self._lock:
+            self._ensure_loaded()
+            if self._expire(self.now()):
+                self._save()
+            return set(self._references)
+
+    def _expire(self, now: datetime) -> bool:
+        cutoff = now - self._retention
+        expired = [alert_id for alert_id, sent in self._references.items() if sent < cutoff]
+        for alert_id in expired:
+            del self._references[alert_id]
+        return bool(expired)
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            section = self._runtime_state_manager.load_section(RUNTIME_STATE_SECTION)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Failed to load NWS cancel references: %s", exc)
+            return
+        self._high_water_mark = _parse_timestamp(section.get("high_water_mark"))
+        references = section.get("references")
+        if isinstance(references, dict):
+            for alert_id, sent in references.items():
+                parsed = _parse_timestamp(sent)
+                if isinstance(alert_id, str) and parsed is not None:
+                    self._references[alert_id] = parsed
+
+    def _save(self) -> None:
+        if self._runtime_state_manager is None:
+            return
+        self._runtime_state_manager.save_section(
+            RUNTIME_STATE_SECTION,
+            {
+                "schema_version": 1,
+                "high_water_mark": (
+                    self._high_water_mark.isoformat() if self._high_water_mark else None
+                ),
+                "references": {
+                    alert_id: sent.isoformat() for alert_id, sent in self._references.items()
+                },
+            },
+        )
@@ -0,0 +1,177 @@
+"""Persistent cache for NWS ``/points`` grid metadata."""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .json_store import VersionedJsonStore
+from .paths import RuntimeStoragePaths, resolve_default_runtime_storage
+
+logger = logging.getLogger(__name__)
+
+# Grid office, forecast URLs, station list and timezone for a point change only
+# when NWS re-grids an office, so a week is a safe freshness window. Expired
+# entries are revalidated (conditional GET) rather than discarded.
+DEFAULT_POINTS_TTL_SECONDS = 7 * 24 * 60 * 60
+MAX_POINTS_CACHE_ENTRIES = 256
+POINTS_CACHE_SCHEMA_VERSION = 1
+
+
+class NwsPointsCache:
+    """Keep ``/points`` responses per rounded coordinate in a small JSON file."""
+
+    def __init__(
+        self,
+        *,
+        path: Path | str | None = None,
+        runtime_paths: RuntimeStoragePaths | None = None,
+        ttl_seconds: float = DEFAULT_POINTS_TTL_SECONDS,
+        max_entries: int = MAX_POINTS_CACHE_ENTRIES,
+        time_fn: Callable[[], float] | None = None,
+        save_delay: float = 2.0,
+    ) -> None:
+        """
+        Initialize the cache with an optional persistence path, TTL and clock.
+
+        ``save_delay`` is how long :meth:`put` and :meth:`touch` wait before
+        writing the file, so a refresh that resolves several locations costs
+        one write on a background thread instead of one per location.
+        """
+        resolved_path = path
+        if resolved_path is None:
+            resolved_path = (
+                runtime_paths or resolve_default_runtime_storage()
+            ).nws_points_cache_file
+        self._store = VersionedJsonStore(
+            resolved_path,
+            schema_version=POINTS_CACHE_SCHEMA_VERSION,
+            label="NWS points cache",
+            save_delay=save_delay,
+        )
+        self._ttl_seconds = float(ttl_seconds)
+        self._max_entries = max(1, int(max_entries))
+        self._time_fn = time_fn or time.time
+        self._lock = threading.Lock()
+        self._records: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def key_for(latitude: float, longitude: float) -> str:
+        """Return the cache key for a coordinate (NWS resolves points at 4 decimals)."""
+        return f"{float(latitude):.4f},{float(longitude):.4f}"
+
+    def get(self, latitude: float, longitude: float) -> dict[str, Any] | None:
+        """Return a copy of the cached point payload when it is still fresh."""
+        record = self.get_record(latitude, longitude)
+        if record is None or record["expires_at"] <= self._time_fn():
+            return None
+        return copy.deepcopy(record["payload"])
+
+    def get_record(self, latitude: float, longitude: float) -> dict[str, Any] | None:
+        """Return the cached record (fresh or expired) including validators, if any."""
+        with self._lock:
+            record = self._records.get(self.key_for(latitude, longitude))
+            return copy.deepcopy(record) if record is not None else None
+
+    def is_fresh(self, latitude: float, longitude: float) -> bool:
+        """Return True when a non-expired entry exists for the coordinate."""
+        return self.get(latitude, longitude) is not None
+
+    def put(
+        self,
+        latitude: float,
+        longitude: float,
+        payload: dict[str, Any],
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a freshly fetched ``/points`` payload."""
+        properties = payload.get("properties") if isinstance(payload, dict) else None
+        if not isinstance(properties, dict):
+            return
+        now = self._time_fn()
+        with self._lock:
+            self._records[self.key_for(latitude, longitude)] = {
+                # Only ``properties`` is consumed downstream; dropping the
+                # JSON-LD context and geometry keeps the file small.
+                "payload": {"properties": copy.deepcopy(properties)},
+                "fetched_at": now,
+                "expires_at": now + self._ttl_seconds,
+                "etag": etag if isinstance(etag, str) else None,
+                "last_modified": last_modified if isinstance(last_modified, str) else None,
+            }
+            self._enforce_limit()
+        self._store.save_soon(self._snapshot)
+
+    def touch(self, latitude: float, longitude: float) -> None:
+        """Extend an entry's freshness after a successful revalidation (304)."""
+        with self._lock:
+            record = self._records.get(self.key_for(latitude, longitude))
+            if record is None:
+                return
+            record["expires_at"] = self._time_fn() + self._ttl_seconds
+        self._store.save_soon(self._snapshot)
+
+    def invalidate(self, latitude: float, longitude: float) -> None:
+        """Remove the entry for a coordinate."""
+        with self._lock:
+            if self._records.pop(self.key_for(latitude, longitude), None) is not None:
+                self._store.save(self._records)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._records.clear()
+            self._store.save(self._records)
+
+    def flush(self) -> None:
+        """Write any pending :meth:`put` or :meth:`touch` to disk now."""
+        self._store.flush()
+
+    def __len__(self) -> int:
+        """Return the number of cached coordinates."""
+        return len(self._records)
+
+    def _enforce_limit(self) -> None:
+        overflow = len(self._records) - self._max_entries
+        if overflow <= 0:
+            return
+        oldest = sorted(self._records, key=lambda key: self._records[key]["fetched_at"])
+        for key in oldest[:overflow]:
+            self._records.pop(key, None)
+
+    def _snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {key: dict(record) for key, record in self._records.items()}
+
+    def _load(self) -> None:
+        records: dict[str, dict[str, Any]] = {}
+        for key, record in self._store.load().items():
+            point_payload = record.get("payload")
+            fetched_at = record.get("fetched_at")
+            expires_at = record.get("expires_at")
+            if not isinstance(point_payload, dict) or not isinstance(
+                point_payload.get("properties"), dict
+            ):
+                continue
+            if not isinstance(fetched_at, int | float) or not isinstance(expires_at, int | float):
+                continue
+            etag = record.get("etag")
+            last_modified = record.get("last_modified")
+            records[key] = {
+                "payload": point_payload,
+                "fetched_at": float(fetched_at),
+                "expires_at": float(expires_at),
+                "etag": etag if isinstance(etag, str) else None,
+                "last_modified": last_modified if isinstance(last_modified, str) else None,
+            }
+
+        self._records = records
+        self._enforce_limit()
@@ -0,0 +1,137 @@
+"""In-memory ``ETag``/``Last-Modified`` validators for NWS forecast and alert fetches."""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+# One entry per distinct URL (forecast, hourly, gridpoint, alerts, product
+# listing) per saved location; a few hundred covers large location lists.
+MAX_VALIDATOR_ENTRIES = 512
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+def freshness_lifetime(headers: Mapping[str, Any]) -> float | None:
+    """
+    Return how many seconds a response stays fresh according to its headers.
+
+    ``Cache-Control: max-age`` wins over ``Expires`` (measured against the
+    response ``Date``), as in RFC 9111. Returns ``None`` when the response
+    carries neither.
+    """
+    cache_control = headers.get("Cache-Control")
+    if isinstance(cache_control, str):
+        match = _MAX_AGE_RE.search(cache_control)
+        if match:
+            return float(match.group(1))
+    expires = headers.get("Expires")
+    date = headers.get("Date")
+    if not isinstance(expires, str) or not isinstance(date, str):
+        return None
+    try:
+        expires_at = parsedate_to_datetime(expires)
+        sent_at = parsedate_to_datetime(date)
+    except (TypeError, ValueError):
+        return None
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=UTC)
+    if sent_at.tzinfo is None:
+        sent_at = sent_at.replace(tzinfo=UTC)
+    return max(0.0, (expires_at - sent_at).total_seconds())
+
+
+@dataclass(frozen=True)
+class ValidatorRecord:
+    """Validators returned with a response and the model parsed from its body."""
+
+    etag: str | None
+    last_modified: str | None
+    value: Any
+    # Wall-clock time (``time.time()``) until which the provider says the
+    # document is fresh, from ``Cache-Control``/``Expires``; ``None`` if unknown.
+    fresh_until: float | None = None
+
+
+class NwsValidatorStore:
+    """
+    Remember response validators alongside the already-parsed model.
+
+    A ``304 Not Modified`` answer to a conditional request means the body we
+    parsed last time is still current, so the stored model is handed back
+    as-is instead of re-downloading and re-parsing the document. Stored models
+    are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, *, max_entries: int = MAX_VALIDATOR_ENTRIES) -> None:
+        """Initialize an empty store holding at most ``max_entries`` URLs."""
+        self._max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._records: OrderedDict[str, ValidatorRecord] = OrderedDict()
+
+    @staticmethod
+    def key_for(url: str, params: Mapping[str, Any] | None = None, variant: str = "") -> str:
+        """
+        Return the store key for a request.
+
+        ``variant`` distinguishes parses of the same URL that depend on caller
+        state (for example the location's timezone).
+        """
+        query = "&".join(f"{name}={params[name]}" for name in sorted(params or {}))
+        return f"{url}?{query}#{variant}"
+
+    def get(self, key: str) -> ValidatorRecord | None:
+        """Return the record for ``key`` and mark it recently used."""
+        with self._lock:
+            record = self._records.get(key)
+            if record is not None:
+                self._records.move_to_end(key)
+            return record
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        fresh_until: float | None = None,
+    ) -> None:
+        """Store the parsed model for a response that carried validators."""
+        etag = etag if isinstance(etag, str) and etag else None
+        last_modified = last_modified if isinstance(last_modified, str) and last_modified else None
+        with self._lock:
+            if etag is None and last_modified is None:
+                # Nothing to revalidate with next time.
+                self._records.pop(key, None)
+                return
+            self._records[key] = ValidatorRecord(etag, last_modified, value, fresh_until)
+            self._records.move_to_end(key)
+            while len(self._records) > self._max_entries:
+                self._records.popitem(last=False)
+
+    def fresh_until(self, key: str) -> float | None:
+        """Return the provider freshness deadline recorded for ``key``, if any."""
+        with self._lock:
+            record = self._records.get(key)
+            return record.fresh_until if record is not None else None
+
+    def invalidate(self, key: str) -> None:
+        """Forget the validators for ``key``."""
+        with self._lock:
+            self._records.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every stored record."""
+        with self._lock:
+            self._records.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored records."""
+        return len(self._records)
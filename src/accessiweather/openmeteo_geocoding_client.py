@@ -9,6 +9,7 @@ API Documentation: https://open-meteo.com/en/docs/geocoding-api
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import time
@@ -19,6 +20,8 @@ from typing import Any
 
 import httpx
 
+from .http_session import shared_transport
+
 _unidecode: Callable[[str], str]
 
 try:
@@ -101,12 +104,39 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# Parallel fallback lookups; small enough to stay clear of Open-Meteo rate limits.
+DEFAULT_FALLBACK_CONCURRENCY = 4
+# US places are shown as "City, State"; the country would only repeat itself.
+_OMITTED_COUNTRY_NAMES = frozenset({"United States", "United States of America"})
+
 
 def _transliterate(value: str) -> str:
     """Return a best-effort ASCII transliteration for matching location names."""
     return _unidecode(value)
 
 
+def normalize_place_name(text: str) -> str:
+    """Fold a place name to lowercase ASCII words for accent-insensitive matching."""
+    ascii_text = _transliterate(text).casefold()
+    return re.sub(r"\s+", " ", re.sub(r"[^a-z0-9]+", " ", ascii_text)).strip()
+
+
+def format_place_name(name: str, admin1: str | None = None, country: str | None = None) -> str:
+    """
+    Join a place, its state or province and its country into one display name.
+
+    The region is skipped when it repeats the place name, and the country is
+    skipped for US places, e.g. "Springfield, Illinois" and
+    "Tromsø, Troms, Norway".
+    """
+    parts = [name] if name else []
+    if admin1 and admin1 != name:
+        parts.append(admin1)
+    if country and country not in _OMITTED_COUNTRY_NAMES:
+        parts.append(country)
+    return ", ".join(parts) if parts else "Unknown Location"
+
+
 class OpenMeteoGeocodingError(Exception):
     """Base exception for Open-Meteo Geocoding API errors."""
 
@@ -138,11 +168,7 @@ class GeocodingResult:
     @property
     def display_name(self) -> str:
         """Generate human-readable display name."""
-        parts = [self.name]
-        if self.admin1:
-            parts.append(self.admin1)
-        parts.append(self.country)
-        return ", ".join(parts)
+        return format_place_name(self.name, self.admin1, self.country)
 
 
 class OpenMeteoGeocodingClient:
@@ -231,23 +257,7 @@ class OpenMeteoGeocodingClient:
             try:
                 logger.debug(f"Making geocoding request to {url} with params: {params}")
                 response = self.client.get(url, params=params)
-
-                # Check for HTTP errors
-                if response.status_code == 400:
-                    error_data = response.json() if response.content else {}
-                    error_msg = error_data.get("reason", "Bad request")
-                    raise OpenMeteoGeocodingApiError(f"API error: {error_msg}")
-                if response.status_code == 429:
-                    raise OpenMeteoGeocodingApiError("Rate limit exceeded")
-                if response.status_code >= 500:
-                    raise OpenMeteoGeocodingApiError(f"Server error: {response.status_code}")
-
-                response.raise_for_status()
-
-                # Parse JSON response
-                data: dict[str, Any] = response.json()
-                logger.debug(f"Received geocoding response with keys: {list(data.keys())}")
-                return data
+                return self._parse_response(response)
 
             except httpx.TimeoutException as e:
                 if attempt < self.max_retries:
@@ -281,6 +291,163 @@ class OpenMeteoGeocodingClient:
         # This should never be reached due to the exception handling above
         raise OpenMeteoGeocodingApiError("Request failed after all retries")
 
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> dict[str, Any]:
+        """Map HTTP errors to geocoding exceptions and return the JSON body."""
+        if response.status_code == 400:
+            error_data = response.json() if response.content else {}
+            error_msg = error_data.get("reason", "Bad request")
+            raise OpenMeteoGeocodingApiError(f"API error: {error_msg}")
+        if response.status_code == 429:
+            raise OpenMeteoGeocodingApiError("Rate limit exceeded")
+        if response.status_code >= 500:
+            raise OpenMeteoGeocodingApiError(f"Server error: {response.status_code}")
+
+        response.raise_for_status()
+
+        data: dict[str, Any] = response.json()
+        logger.debug(f"Received geocoding response with keys: {list(data.keys())}")
+        return data
+
+    async def _make_request_async(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Make a single non-blocking request to the Open-Meteo Geocoding API.
+
+        Fallback variants are fanned out concurrently, so failures are not
+        retried here; one failed variant simply contributes no results.
+        """
+        url = f"{self.BASE_URL}/{endpoint}"
+        try:
+            response = await client.get(url, params=params)
+            return self._parse_response(response)
+        except OpenMeteoGeocodingError:
+            raise
+        except (httpx.TimeoutException, httpx.NetworkError) as e:
+            raise OpenMeteoGeocodingNetworkError(f"Network error: {e!s}") from e
+        except Exception as e:
+            raise OpenMeteoGeocodingApiError(f"Unexpected error: {e!s}") from e
+
+    async def search_async(
+        self,
+        name: str,
+        count: int = 10,
+        language: str = "en",
+        max_concurrency: int = DEFAULT_FALLBACK_CONCURRENCY,
+    ) -> list[GeocodingResult]:
+        """
+        Search for locations by name without blocking the event loop.
+
+        Behaves like :meth:`search`, but the fallback queries run concurrently
+        (see :meth:`search_fallbacks_async`).
+        """
+        search_name = name.strip()
+        params = self._search_params(count, language)
+        async with self._async_client() as client:
+            data = await self._make_request_async(client, "search", {**params, "name": search_name})
+        direct_results = self._parse_results(data)
+        if direct_results:
+            return direct_results
+        return await self.search_fallbacks_async(
+            search_name, count=count, language=language, max_concurrency=max_concurrency
+        )
+
+    async def search_fallbacks_async(
+        self,
+        name: str,
+        count: int = 10,
+        language: str = "en",
+        max_concurrency: int = DEFAULT_FALLBACK_CONCURRENCY,
+    ) -> list[GeocodingResult]:
+        """
+        Run the fallback queries for ``name`` concurrently and return the best match.
+
+        At most ``max_concurrency`` requests are in flight. Queries keep the
+        priority order of :meth:`_build_fallback_queries`: a match is returned
+        as soon as every higher-priority query has finished without one, and
+        the remaining requests are cancelled. When nothing matched and any query
+        failed, the first error is raised rather than returning an empty list.
+        """
+        search_name = name.strip()
+        queries = self._build_fallback_queries(search_name)
+        if not queries:
+            return []
+
+        params = self._search_params(count, language)
+        semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+        async with self._async_client() as client:
+
+            async def run_query(query: str) -> list[GeocodingResult]:
+                async with semaphore:
+                    data = await self._make_request_async(
+                        client, "search", {**params, "name": query}
+                    )
+                return self._filter_matching_results(
+                    search_name,
+                    self._parse_results(data),
+                    fallback_query=query,
+                )
+
+            errors: list[BaseException] = []
+            tasks = [asyncio.create_task(run_query(query)) for query in queries]
+            try:
+                next_index = 0
+                pending = set(tasks)
+                while pending:
+                    _done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    # Walk the finished prefix in priority order.
+                    while next_index < len(tasks) and tasks[next_index].done():
+                        task = tasks[next_index]
+                        error = task.exception()
+                        if error is not None:
+                            logger.debug(
+                                "Geocoding fallback query '%s' failed: %s",
+                                queries[next_index],
+                                error,
+                            )
+                            errors.append(error)
+                        elif task.result():
+                            logger.info(
+                                "Geocoding fallback matched '%s' using retry query '%s'",
+                                search_name,
+                                queries[next_index],
+                            )
+                            return task.result()
+                        next_index += 1
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        # A failed variant might have matched, so "no such place" is only
+        # reported when every query actually answered.
+        if errors:
+            raise errors[0]
+        return []
+
+    def _async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout),
+            headers={"User-Agent": self.user_agent},
+            follow_redirects=True,
+            transport=shared_transport(),
+        )
+
+    @staticmethod
+    def _search_params(count: int, language: str) -> dict[str, Any]:
+        return {
+            "count": min(count, 100),  # API max is 100
+            "language": language,
+            "format": "json",
+        }
+
     def search(
         self,
         name: str,
@@ -300,11 +467,7 @@ class OpenMeteoGeocodingClient:
 
         """
         search_name = name.strip()
-        params = {
-            "count": min(count, 100),  # API max is 100
-            "language": language,
-            "format": "json",
-        }
+        params = self._search_params(count, language)
 
         direct_results = self._search_once(search_name, params)
         if direct_results:
@@ -485,8 +648,7 @@ class OpenMeteoGeocodingClient:
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text for accent-insensitive comparisons."""
-        ascii_text = _transliterate(text).casefold()
-        return re.sub(r"\s+", " ", re.sub(r"[^a-z0-9]+", " ", ascii_text)).strip()
+        return normalize_place_name(text)
 
     def _parse_results(self, data: dict[str, Any]) -> list[GeocodingResult]:
         """
@@ -170,6 +170,30 @@ class RuntimeStoragePaths:
     def noaa_radio_availability_file(self) -> Path:
         return self.config_root / "noaa_radio_availability.json"
 
+    @property
+    def nws_points_cache_file(self) -> Path:
+        return self.config_root / "nws_points_cache.json"
+
+    @property
+    def geocoding_cache_file(self) -> Path:
+        return self.config_root / "geocoding_cache.json"
+
+    @property
+    def gazetteer_file(self) -> Path:
+        return self.config_root / "gazetteer.tsv.gz"
+
+    @property
+    def gazetteer_download_failed_file(self) -> Path:
+        return self.config_root / "gazetteer.download-failed"
+
+    @property
+    def climatology_cache_file(self) -> Path:
+        return self.config_root / "climatology_cache.json"
+
+    @property
+    def weather_history_archive_file(self) -> Path:
+        return self.config_root / "weather_history_archive.json"
+
     @property
     def activation_request_file(self) -> Path:
         return self.state_dir / "activation_request.json"
@@ -1,5 +1,19 @@
 """Performance monitoring and profiling utilities."""
 
-from .timer import measure, measure_async
+from .metrics import (
+    MetricsRegistry,
+    OperationStats,
+    format_operation_stats,
+    get_metrics_registry,
+)
+from .timer import measure, measure_async, span
 
-__all__ = ["measure", "measure_async"]
+__all__ = [
+    "MetricsRegistry",
+    "OperationStats",
+    "format_operation_stats",
+    "get_metrics_registry",
+    "measure",
+    "measure_async",
+    "span",
+]
@@ -0,0 +1,167 @@
+"""In-process latency histograms for instrumented operations."""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+# Enough recent samples per operation for stable p95 without unbounded growth.
+DEFAULT_WINDOW_SIZE = 512
+
+
+@dataclass(frozen=True)
+class OperationStats:
+    """Latency summary for one operation (optionally scoped to a provider)."""
+
+    operation: str
+    provider: str | None
+    count: int
+    failures: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    last_ms: float
+
+
+class _Series:
+    __slots__ = ("count", "failures", "last_ms", "max_ms", "samples")
+
+    def __init__(self, window_size: int) -> None:
+        self.samples: deque[float] = deque(maxlen=window_size)
+        self.count = 0
+        self.failures = 0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    # Nearest-rank percentile over an already sorted sample window.
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class MetricsRegistry:
+    """
+    Aggregate span durations per ``(operation, provider)``.
+
+    Recording is a lock-protected deque append, so spans are cheap enough to
+    leave on in normal use. Percentiles are computed over the most recent
+    ``window_size`` samples; ``count``, ``failures`` and ``max_ms`` cover the
+    whole session (until :meth:`reset`).
+    """
+
+    def __init__(
+        self,
+        *,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        time_fn: Callable[[], float] | None = None,
+    ) -> None:
+        """Initialize an empty registry."""
+        self._window_size = max(1, int(window_size))
+        self._time_fn = time_fn or time.time
+        self._lock = threading.Lock()
+        self._series: dict[tuple[str, str | None], _Series] = {}
+        self._started_at = self._time_fn()
+
+    def record(
+        self,
+        operation: str,
+        elapsed_ms: float,
+        *,
+        provider: str | None = None,
+        failed: bool = False,
+    ) -> None:
+        """Add one span duration."""
+        key = (operation, provider)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(self._window_size)
+            series.samples.append(elapsed_ms)
+            series.count += 1
+            series.last_ms = elapsed_ms
+            series.max_ms = max(series.max_ms, elapsed_ms)
+            if failed:
+                series.failures += 1
+
+    def snapshot(self) -> list[OperationStats]:
+        """Return stats for every recorded operation, sorted by operation then provider."""
+        with self._lock:
+            items = [
+                (
+                    key,
+                    list(series.samples),
+                    series.count,
+                    series.failures,
+                    series.max_ms,
+                    series.last_ms,
+                )
+                for key, series in self._series.items()
+            ]
+        stats = []
+        for (operation, provider), samples, count, failures, max_ms, last_ms in items:
+            ordered = sorted(samples)
+            stats.append(
+                OperationStats(
+                    operation=operation,
+                    provider=provider,
+                    count=count,
+                    failures=failures,
+                    p50_ms=_percentile(ordered, 0.50),
+                    p95_ms=_percentile(ordered, 0.95),
+                    max_ms=max_ms,
+                    last_ms=last_ms,
+                )
+            )
+        stats.sort(key=lambda item: (item.operation, item.provider or ""))
+        return stats
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable dump of the current stats."""
+        return {
+            "started_at": self._started_at,
+            "generated_at": self._time_fn(),
+            "window_size": self._window_size,
+            "operations": [asdict(item) for item in self.snapshot()],
+        }
+
+    def to_json(self, *, indent: int | None = 2) -> str:
+        """Return :meth:`to_dict` encoded as JSON."""
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def reset(self) -> None:
+        """Drop all recorded samples."""
+        with self._lock:
+            self._series.clear()
+            self._started_at = self._time_fn()
+
+
+def format_operation_stats(stats: list[OperationStats]) -> str:
+    """Render stats as one plain-text line per operation (screen-reader friendly)."""
+    if not stats:
+        return "No operations have been recorded yet."
+    lines = []
+    for item in stats:
+        label = f"{item.operation} ({item.provider})" if item.provider else item.operation
+        failures = f", {item.failures} failed" if item.failures else ""
+        lines.append(
+            f"{label}: {item.count} calls{failures}; "
+            f"p50 {item.p50_ms:.0f} ms, p95 {item.p95_ms:.0f} ms, max {item.max_ms:.0f} ms"
+        )
+    return "\n".join(lines)
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _registry
@@ -10,6 +10,8 @@ from collections.abc import Callable
 from contextlib import asynccontextmanager, contextmanager
 from typing import Any, TypeVar
 
+from .metrics import get_metrics_registry
+
 logger = logging.getLogger("performance")
 
 # Enable performance logging via environment variable
@@ -18,6 +20,41 @@ PERFORMANCE_MODE = os.environ.get("ACCESSIWEATHER_PERFORMANCE", "").lower() in (
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+@contextmanager
+def span(operation_name: str, *, provider: str | None = None):
+    """
+    Record the duration of an operation in the metrics registry.
+
+    Unlike :func:`measure` this does not log each call, so it is suitable for
+    hot paths (every provider request, parse step and UI update). Works inside
+    ``async`` functions too; the awaited time is included.
+
+    Example:
+    -------
+        with span("parse", provider="nws"):
+            forecast = parse_nws_forecast(payload)
+
+    """
+    start_time = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except Exception:
+        failed = True
+        raise
+    finally:
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        get_metrics_registry().record(operation_name, elapsed_ms, provider=provider, failed=failed)
+        if PERFORMANCE_MODE:
+            logger.debug(
+                "span %s%s %.2fms%s",
+                operation_name,
+                f" [{provider}]" if provider else "",
+                elapsed_ms,
+                " (failed)" if failed else "",
+            )
+
+
 @contextmanager
 def measure(operation_name: str):
     """
@@ -43,6 +80,7 @@ def measure(operation_name: str):
         raise
     finally:
         elapsed_ms = (time.perf_counter() - start_time) * 1000
+        get_metrics_registry().record(operation_name, elapsed_ms, failed=exception_info is not None)
         if exception_info:
             logger.warning(
                 f"⏱️  {operation_name} failed after {elapsed_ms:.2f}ms - {exception_info}"
@@ -76,6 +114,7 @@ async def measure_async(operation_name: str):
         raise
     finally:
         elapsed_ms = (time.perf_counter() - start_time) * 1000
+        get_metrics_registry().record(operation_name, elapsed_ms, failed=exception_info is not None)
         if exception_info:
             logger.warning(
                 f"⏱️  {operation_name} failed after {elapsed_ms:.2f}ms - {exception_info}"
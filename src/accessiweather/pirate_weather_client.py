@@ -17,6 +17,7 @@ import time
 
 import httpx
 
+from .http_session import shared_transport
 from .models import (
     CurrentConditions,
     Forecast,
@@ -24,6 +25,7 @@ from .models import (
     Location,
     WeatherAlerts,
 )
+from .performance.timer import span
 from .pirate_weather_current import parse_current_conditions
 from .pirate_weather_parsing import (
     _build_alert_id,  # noqa: F401 - compatibility re-export for tests/callers
@@ -130,7 +132,9 @@ class PirateWeatherClient:
             "version": _PIRATE_WEATHER_API_VERSION,
         }
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, follow_redirects=True, transport=shared_transport()
+            ) as client:
                 headers = {"User-Agent": self.user_agent}
                 response = await client.get(url, params=params, headers=headers)
 
@@ -230,19 +234,23 @@ class PirateWeatherClient:
 
     def _parse_current_conditions(self, data: dict) -> CurrentConditions:
         """Parse Pirate Weather ``currently`` block into CurrentConditions."""
-        return parse_current_conditions(self, data)
+        with span("parse", provider="pirateweather"):
+            return parse_current_conditions(self, data)
 
     def _parse_forecast(self, data: dict, days: int | None = None) -> Forecast | None:
         """Parse Pirate Weather ``daily`` block into a Forecast."""
-        return parse_forecast(self, data, days=days)
+        with span("parse", provider="pirateweather"):
+            return parse_forecast(self, data, days=days)
 
     def _parse_hourly_forecast(self, data: dict) -> HourlyForecast:
         """Parse Pirate Weather ``hourly`` block into an HourlyForecast."""
-        return parse_hourly_forecast(self, data)
+        with span("parse", provider="pirateweather"):
+            return parse_hourly_forecast(self, data)
 
     def _parse_alerts(self, data: dict) -> WeatherAlerts:
         """Parse Pirate Weather ``alerts`` list into WeatherAlerts."""
-        return parse_alerts(self, data)
+        with span("parse", provider="pirateweather"):
+            return parse_alerts(self, data)
 
     def _map_severity(self, severity: str | None) -> str:
         """Map Pirate Weather severity string to standard levels."""
@@ -28,12 +28,12 @@ from .provider_normalization import (
     normalize_dewpoint_pair,
     normalize_humidity_percent,
     normalize_millibars,
-    normalize_speed_pair,
-    normalize_temperature_pair,
     normalize_visibility_pair,
     pirate_temperature_unit,
     pirate_visibility_unit,
     pirate_wind_unit,
+    speed_pair_converter,
+    temperature_pair_converter,
 )
 from .weather_client_parsers import degrees_to_cardinal
 
@@ -305,6 +305,10 @@ def parse_hourly_forecast(client: Any, data: dict) -> HourlyForecast:
     wind_unit = pirate_wind_unit(client.units)
     visibility_unit = pirate_visibility_unit(client.units)
 
+    # Units are fixed per response, so resolve each one once rather than per hour.
+    normalize_temperature = temperature_pair_converter(temperature_unit)
+    normalize_speed = speed_pair_converter(wind_unit)
+
     periods: list[HourlyForecastPeriod] = []
     for hour in hourly_items:
         time_val = hour.get("time")
@@ -313,7 +317,7 @@ def parse_hourly_forecast(client: Any, data: dict) -> HourlyForecast:
         else:
             start_time = datetime.now(UTC)
 
-        temperature = normalize_temperature_pair(hour.get("temperature"), temperature_unit)
+        temperature = normalize_temperature(hour.get("temperature"))
 
         humidity = normalize_humidity_percent(hour.get("humidity"), fraction=True)
         dewpoint = normalize_dewpoint_pair(
@@ -327,9 +331,9 @@ def parse_hourly_forecast(client: Any, data: dict) -> HourlyForecast:
 
         wind_raw = hour.get("windSpeed")
         wind_str = format_speed(wind_raw, wind_unit)
-        wind_speed = normalize_speed_pair(wind_raw, wind_unit)
+        wind_speed = normalize_speed(wind_raw)
 
-        wind_gust = normalize_speed_pair(hour.get("windGust"), wind_unit)
+        wind_gust = normalize_speed(hour.get("windGust"))
 
         precip_prob_raw = hour.get("precipProbability")
         precip_prob = round(precip_prob_raw * 100) if precip_prob_raw is not None else None
@@ -344,7 +348,7 @@ def parse_hourly_forecast(client: Any, data: dict) -> HourlyForecast:
 
         visibility = normalize_visibility_pair(hour.get("visibility"), visibility_unit)
 
-        feels_like = normalize_temperature_pair(hour.get("apparentTemperature"), temperature_unit)
+        feels_like = normalize_temperature(hour.get("apparentTemperature"))
 
         condition = _data_point_condition(hour)
         precipitation_type = _normalize_precipitation_type(hour.get("precipType"))
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from .utils.temperature_utils import TemperatureUnit, calculate_dewpoint
 from .weather_client_parsers import (
     convert_f_to_c,
-    convert_wind_speed_to_mph_and_kph,
     normalize_pressure,
-    normalize_temperature,
+    temperature_converter,
+    wind_speed_to_kph_converter,
+    wind_speed_to_mph_converter,
 )
 
 KM_PER_MILE = 1.609344
@@ -78,13 +80,22 @@ def normalize_humidity_percent(value: object, *, fraction: bool = False) -> int
     return round(numeric)
 
 
+def temperature_pair_converter(unit: str | None) -> Callable[[object], TemperaturePair]:
+    """Resolve a temperature unit once and return a value normalizer for it."""
+    convert = temperature_converter(unit)
+
+    def normalize(value: object) -> TemperaturePair:
+        numeric = as_float(value)
+        if numeric is None:
+            return TemperaturePair(None, None)
+        return TemperaturePair(*convert(numeric))
+
+    return normalize
+
+
 def normalize_temperature_pair(value: object, unit: str | None) -> TemperaturePair:
     """Normalize a provider temperature value to Fahrenheit and Celsius."""
-    numeric = as_float(value)
-    if numeric is None:
-        return TemperaturePair(None, None)
-    temp_f, temp_c = normalize_temperature(numeric, unit)
-    return TemperaturePair(temp_f, temp_c)
+    return temperature_pair_converter(unit)(value)
 
 
 def normalize_dewpoint_pair(
@@ -156,13 +167,24 @@ def _canonical_wind_unit(unit: str | None) -> str | None:
     return unit
 
 
+def speed_pair_converter(unit: str | None) -> Callable[[object], SpeedPair]:
+    """Resolve a wind speed unit once and return a value normalizer for it."""
+    unit_code = _canonical_wind_unit(unit)
+    to_mph = wind_speed_to_mph_converter(unit_code)
+    to_kph = wind_speed_to_kph_converter(unit_code)
+
+    def normalize(value: object) -> SpeedPair:
+        numeric = as_float(value)
+        if numeric is None:
+            return SpeedPair(None, None)
+        return SpeedPair(to_mph(numeric), to_kph(numeric))
+
+    return normalize
+
+
 def normalize_speed_pair(value: object, unit: str | None) -> SpeedPair:
     """Normalize wind speed to miles per hour and kilometers per hour."""
-    numeric = as_float(value)
-    if numeric is None:
-        return SpeedPair(None, None)
-    mph, kph = convert_wind_speed_to_mph_and_kph(numeric, _canonical_wind_unit(unit))
-    return SpeedPair(mph, kph)
+    return speed_pair_converter(unit)(value)
 
 
 def format_speed(value: object, unit_label: str) -> str | None:
@@ -173,6 +195,44 @@ def format_speed(value: object, unit_label: str) -> str | None:
     return f"{round(numeric)} {unit_label}"
 
 
+def visibility_converter(
+    unit: str | None,
+    *,
+    cap_miles: float | None = None,
+) -> Callable[[float], VisibilityPair]:
+    """Resolve a visibility unit once and return a value-to-pair converter."""
+    unit_text = (unit or "").strip().lower().replace(" ", "_")
+    if "ft" in unit_text or "feet" in unit_text:
+
+        def to_miles(numeric: float) -> tuple[float, float]:
+            miles = numeric / 5280
+            return miles, miles * KM_PER_MILE
+
+    elif "km" in unit_text or "kilometer" in unit_text or "kilometre" in unit_text:
+
+        def to_miles(numeric: float) -> tuple[float, float]:
+            return numeric / KM_PER_MILE, numeric
+
+    elif unit_text in {"mi", "mile", "miles"}:
+
+        def to_miles(numeric: float) -> tuple[float, float]:
+            return numeric, numeric * KM_PER_MILE
+
+    else:
+
+        def to_miles(numeric: float) -> tuple[float, float]:
+            return numeric / 1609.344, numeric / 1000
+
+    if cap_miles is None:
+        return lambda numeric: VisibilityPair(*to_miles(numeric))
+
+    def capped(numeric: float) -> VisibilityPair:
+        miles = min(to_miles(numeric)[0], cap_miles)
+        return VisibilityPair(miles, miles * KM_PER_MILE)
+
+    return capped
+
+
 def normalize_visibility_pair(
     value: object,
     unit: str | None,
@@ -183,25 +243,7 @@ def normalize_visibility_pair(
     numeric = as_float(value)
     if numeric is None:
         return VisibilityPair(None, None)
-
-    unit_text = (unit or "").strip().lower().replace(" ", "_")
-    if "ft" in unit_text or "feet" in unit_text:
-        miles = numeric / 5280
-        kilometers = miles * KM_PER_MILE
-    elif "km" in unit_text or "kilometer" in unit_text or "kilometre" in unit_text:
-        miles = numeric / KM_PER_MILE
-        kilometers = numeric
-    elif unit_text in {"mi", "mile", "miles"}:
-        miles = numeric
-        kilometers = numeric * KM_PER_MILE
-    else:
-        miles = numeric / 1609.344
-        kilometers = numeric / 1000
-
-    if cap_miles is not None:
-        miles = min(miles, cap_miles)
-        kilometers = miles * KM_PER_MILE
-    return VisibilityPair(miles, kilometers)
+    return visibility_converter(unit, cap_miles=cap_miles)(numeric)
 
 
 def classify_apparent_temperature(
@@ -0,0 +1,121 @@
+"""Adaptive per-location planning for background weather and event refreshes."""
+
+from __future__ import annotations
+
+import heapq
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+# Refresh kinds. Event checks cover every saved location in one batched
+# request, so they are planned under ``ALL_LOCATIONS`` rather than per key.
+WEATHER = "weather"
+EVENTS = "events"
+ALL_LOCATIONS = "*"
+
+# Active alerts or likely precipitation tighten full refreshes to this cadence.
+ACTIVE_REFRESH_INTERVAL = timedelta(minutes=5)
+# Quiet weather stretches the configured interval by this factor, up to the cap.
+QUIET_BACKOFF_FACTOR = 2
+QUIET_MAX_REFRESH_INTERVAL = timedelta(minutes=60)
+# Work falling due within this many seconds of the next item runs in the same batch.
+COALESCE_WINDOW_SECONDS = 30.0
+
+
+def plan_refresh_interval(
+    base_interval: timedelta,
+    *,
+    active_alerts: bool,
+    precipitation_likely: bool,
+    fresh_for: timedelta | None = None,
+) -> timedelta:
+    """
+    Return how long to wait before the next full refresh of one location.
+
+    Active alerts or likely precipitation refresh at ``ACTIVE_REFRESH_INTERVAL``
+    (or the configured interval when that is already shorter). Otherwise the
+    configured interval is stretched by ``QUIET_BACKOFF_FACTOR`` and, when the
+    provider said how long its forecast stays fresh (``fresh_for``), held off
+    until then; quiet plans never exceed ``QUIET_MAX_REFRESH_INTERVAL`` or
+    drop below the configured interval.
+    """
+    if active_alerts or precipitation_likely:
+        return min(base_interval, ACTIVE_REFRESH_INTERVAL)
+    quiet = base_interval * QUIET_BACKOFF_FACTOR
+    if fresh_for is not None:
+        quiet = max(quiet, fresh_for)
+    return max(base_interval, min(quiet, QUIET_MAX_REFRESH_INTERVAL))
+
+
+class RefreshScheduler:
+    """
+    Due-time queue of ``(key, kind)`` refreshes.
+
+    Each pair has at most one pending due time; planning it again replaces
+    the previous one. :meth:`pop_due` hands back everything due now plus
+    anything due within the coalesce window so nearby work shares one wake-up.
+    """
+
+    def __init__(
+        self,
+        *,
+        coalesce_window: float = COALESCE_WINDOW_SECONDS,
+        time_fn: Callable[[], float] | None = None,
+    ) -> None:
+        """Initialize an empty scheduler."""
+        self._coalesce_window = max(0.0, float(coalesce_window))
+        self._time_fn = time_fn or time.monotonic
+        self._due: dict[tuple[str, str], float] = {}
+        # Lazily pruned heap of (due_at, key, kind); entries whose due time no
+        # longer matches ``_due`` were replaced or cancelled.
+        self._heap: list[tuple[float, str, str]] = []
+
+    def schedule(self, key: str, kind: str, delay: timedelta) -> None:
+        """Plan ``(key, kind)`` to run after ``delay``, replacing any existing plan."""
+        due_at = self._time_fn() + max(0.0, delay.total_seconds())
+        self._due[(key, kind)] = due_at
+        heapq.heappush(self._heap, (due_at, key, kind))
+
+    def seconds_until(self, key: str, kind: str) -> float | None:
+        """Return seconds until ``(key, kind)`` is due, or ``None`` when it is not planned."""
+        due_at = self._due.get((key, kind))
+        if due_at is None:
+            return None
+        return max(0.0, due_at - self._time_fn())
+
+    def cancel(self, key: str, kind: str) -> None:
+        """Drop the pending plan for ``(key, kind)``, if any."""
+        self._due.pop((key, kind), None)
+
+    def planned_keys(self, kind: str) -> set[str]:
+        """Return every key with a pending plan of ``kind``."""
+        return {key for key, planned_kind in self._due if planned_kind == kind}
+
+    def seconds_until_next(self) -> float | None:
+        """Return seconds until the earliest pending plan, or ``None`` when idle."""
+        self._prune()
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - self._time_fn())
+
+    def pop_due(self) -> list[tuple[str, str]]:
+        """Remove and return the plans due now plus any due within the coalesce window."""
+        now = self._time_fn()
+        self._prune()
+        if not self._heap or self._heap[0][0] > now:
+            return []
+        horizon = now + self._coalesce_window
+        due: list[tuple[str, str]] = []
+        while self._heap and self._heap[0][0] <= horizon:
+            _, key, kind = heapq.heappop(self._heap)
+            del self._due[(key, kind)]
+            due.append((key, kind))
+            self._prune()
+        return due
+
+    def _prune(self) -> None:
+        while self._heap:
+            due_at, key, kind = self._heap[0]
+            if self._due.get((key, kind)) == due_at:
+                return
+            heapq.heappop(self._heap)
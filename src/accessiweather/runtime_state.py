@@ -44,6 +44,13 @@ _DEFAULT_RUNTIME_STATE: dict[str, Any] = {
             "last_check_time": None,
         },
     },
+    # Confirmed NWS cancel references (alert id -> cancel sent time) and the
+    # end of the last successful cancel query, so polls only ask for newer ones.
+    "nws_cancel_references": {
+        "schema_version": 1,
+        "high_water_mark": None,
+        "references": {},
+    },
     "meta": {
         "migrated_from": [],
         "migrated_at": None,
@@ -53,6 +60,7 @@ _DEFAULT_RUNTIME_STATE: dict[str, Any] = {
 _SECTION_DEFAULTS: dict[str, dict[str, Any]] = {
     "alerts": _DEFAULT_RUNTIME_STATE["alerts"],
     "notification_events": _DEFAULT_RUNTIME_STATE["notification_events"],
+    "nws_cancel_references": _DEFAULT_RUNTIME_STATE["nws_cancel_references"],
 }
 
 
@@ -204,6 +212,8 @@ class RuntimeStateManager:
             return self._load_legacy_alerts_section()
         if section == "notification_events":
             return self._load_legacy_notification_events_section()
+        if section == "nws_cancel_references":
+            return None
         raise KeyError(f"Unknown runtime-state section: {section}")
 
     def _load_legacy_alerts_section(self) -> dict[str, Any] | None:
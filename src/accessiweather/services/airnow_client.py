@@ -12,6 +12,7 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import httpx
 
 from ..cache import Cache
+from ..http_session import shared_transport
 from ..models import Location
 
 logger = logging.getLogger(__name__)
@@ -107,7 +108,9 @@ class AirNowClient:
         headers = {"User-Agent": self.user_agent}
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, headers=headers) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, headers=headers, transport=shared_transport()
+            ) as client:
                 response = await client.get(self.ENDPOINT, params=params)
                 response.raise_for_status()
                 payload = response.json()
@@ -147,7 +150,9 @@ class AirNowClient:
         }
         headers = {"User-Agent": self.user_agent}
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, headers=headers) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, headers=headers, transport=shared_transport()
+            ) as client:
                 response = await client.get(self.ENDPOINT, params=params)
         except Exception as exc:  # noqa: BLE001 - reason must not leak the keyed URL
             return False, f"Could not reach AirNow ({type(exc).__name__})"
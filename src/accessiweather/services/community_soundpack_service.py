@@ -10,6 +10,10 @@ Design notes:
 - Provides simple in-memory caching for the list of packs
 - Supports authentication via GitHub App for higher rate limits when available
 - Gracefully handles rate limits and transient errors with lightweight retries
+- Repository packs are fetched blob-by-blob with bounded concurrency and each
+  blob is streamed to a ``.part`` file on disk before it is moved into place
+- Direct installs record the files they wrote (path and blob SHA) in a manifest,
+  so updates only ever replace or prune files the service itself installed
 """
 
 from __future__ import annotations
@@ -17,24 +21,92 @@ from __future__ import annotations
 import asyncio
 import base64
 import contextlib
+import hashlib
 import json
 import logging
+import os
 import shutil
 import tempfile
 import zipfile
-from collections.abc import Callable
-from pathlib import Path
+from collections.abc import Awaitable, Callable
+from pathlib import Path, PurePosixPath
 from typing import Any
 
 import httpx
 
 from accessiweather.constants import COMMUNITY_REPO_NAME, COMMUNITY_REPO_OWNER
 
+from ..json_store import VersionedJsonStore
 from ..utils.retry_utils import async_retry_with_backoff, is_retryable_http_error
 from .community_soundpack_models import CommunityPack as CommunityPack
 
 logger = logging.getLogger(__name__)
 
+# Blobs fetched from raw.githubusercontent.com at once for repository packs.
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+
+# Written into each directly installed pack: {rel_path: {"sha": blob_sha}}.
+INSTALL_MANIFEST_NAME = ".community-install.json"
+INSTALL_MANIFEST_SCHEMA_VERSION = 1
+
+ProgressCallback = Callable[[float, int, int], asyncio.Future | bool | None]
+
+
+class _DownloadCancelled(Exception):
+    """Raised inside blob tasks when the progress callback asks to stop."""
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Return the git blob SHA-1 for ``data`` (as listed in a git tree)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data, usedforsecurity=False).hexdigest()
+
+
+def file_blob_sha(path: Path) -> str:
+    """Return the git blob SHA-1 of the file at ``path`` without reading it all at once."""
+    digest = hashlib.sha1(b"blob %d\0" % path.stat().st_size, usedforsecurity=False)
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _manifest_store(pack_dir: Path) -> VersionedJsonStore:
+    return VersionedJsonStore(
+        pack_dir / INSTALL_MANIFEST_NAME,
+        schema_version=INSTALL_MANIFEST_SCHEMA_VERSION,
+        label="community pack install manifest",
+    )
+
+
+def read_install_manifest(pack_dir: Path) -> dict[str, str] | None:
+    """
+    Return the files a community install wrote into ``pack_dir``, keyed by path.
+
+    Returns ``None`` when the directory holds no install manifest, i.e. the pack
+    was not installed (or not yet tracked) by :meth:`CommunitySoundPackService.install_repo_pack`.
+    """
+    store = _manifest_store(pack_dir)
+    if not store.path.is_file():
+        return None
+    return {
+        rel_path: entry["sha"]
+        for rel_path, entry in store.load().items()
+        if isinstance(entry.get("sha"), str)
+    }
+
+
+def is_managed_install(pack_dir: Path) -> bool:
+    """Return True when ``pack_dir`` was installed by the community pack service."""
+    return read_install_manifest(pack_dir) is not None
+
+
+def _checked_tree_path(rel_path: str) -> PurePosixPath:
+    """Return ``rel_path`` as a relative path, rejecting absolute or parent segments."""
+    path = PurePosixPath(rel_path)
+    if not rel_path or path.is_absolute() or ".." in path.parts or "\\" in rel_path:
+        raise RuntimeError(f"Unsafe path in repository tree: {rel_path!r}")
+    return path
+
 
 class CommunitySoundPackService:
     """Service for discovering and downloading community sound packs from GitHub."""
@@ -403,71 +475,290 @@ class CommunitySoundPackService:
         self,
         pack: CommunityPack,
         final_path: Path,
-        progress_callback: Callable[[float, int, int], asyncio.Future | bool | None] | None,
+        progress_callback: ProgressCallback | None,
+        max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
     ) -> Path:
-        ref = pack.ref or "main"
         tree_entries = await self._fetch_tree_entries(pack)
-        if not tree_entries:
+        blobs = [item for item in tree_entries if item.get("type") == "blob"]
+        if not blobs:
             raise RuntimeError(f"No files found for {pack.name}")
+        for item in blobs:
+            _checked_tree_path(item.get("path") or "")
 
-        total_bytes = sum(
-            int(item.get("size") or 0) for item in tree_entries if item.get("type") == "blob"
-        )
-        downloaded = 0
+        try:
+            with (
+                tempfile.TemporaryDirectory(
+                    prefix=f".{final_path.stem}-", suffix=".parts", dir=final_path.parent
+                ) as parts_dir,
+                zipfile.ZipFile(final_path, "w", compression=zipfile.ZIP_DEFLATED) as zipf,
+            ):
+                parts_root = Path(parts_dir)
+
+                async def add_blob(rel_path: str, part_path: Path) -> None:
+                    # Runs on the event loop, so writes never interleave.
+                    zipf.write(part_path, rel_path)
+                    part_path.unlink()
+
+                await self._download_blobs(
+                    pack,
+                    blobs,
+                    lambda rel_path: parts_root / f"{_checked_tree_path(rel_path)}.part",
+                    add_blob,
+                    progress_callback,
+                    max_concurrency,
+                )
+            return final_path
+        except BaseException:
+            with contextlib.suppress(Exception):
+                if final_path.exists():
+                    final_path.unlink()
+            raise
+
+    async def install_repo_pack(
+        self,
+        pack: CommunityPack,
+        target_dir: Path,
+        progress_callback: ProgressCallback | None = None,
+        max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY,
+        validate: Callable[[Path], tuple[bool, str]] | None = None,
+        overwrite_unmanaged: bool = False,
+    ) -> Path:
+        """
+        Download a repository pack directly into its install directory.
+
+        Every file the install writes is recorded with its git blob SHA in an
+        :data:`INSTALL_MANIFEST_NAME` manifest. An update only transfers files
+        whose SHA differs from the tree, and only touches files the manifest
+        says it wrote and the user has not changed since: user-added sounds
+        and edited files (``pack.json`` included) are kept. Files dropped from
+        the tree are pruned under the same rule. Blobs are streamed to ``.part``
+        siblings and moved into place, and ``pack.json`` and the manifest are
+        replaced last. A fresh install is assembled in a staging directory
+        beside ``target_dir`` and only moved into place once ``validate``
+        accepts it.
+
+        Args:
+        ----
+            pack: Repository-backed CommunityPack (``repo_path`` and ``tree_sha`` set)
+            target_dir: Install directory for the pack (created if missing)
+            progress_callback: Optional callback(progress, downloaded_bytes, total_bytes)
+            max_concurrency: Maximum number of blobs downloaded at once
+            validate: Optional check run on a fresh install before it is moved into place
+            overwrite_unmanaged: Allow installing over an existing directory that has
+                no install manifest; the caller must have asked the user first
+
+        Returns:
+        -------
+            The install directory.
+
+        Raises:
+        ------
+            RuntimeError: If ``target_dir`` exists without a manifest and
+                ``overwrite_unmanaged`` is False, or the download fails.
+
+        """
+        if not pack.repo_path:
+            raise RuntimeError(f"Pack {pack.name} is not a repository pack")
+
+        updating = target_dir.exists()
+        manifest: dict[str, str] = {}
+        if updating:
+            existing = read_install_manifest(target_dir)
+            if existing is None and not overwrite_unmanaged:
+                raise RuntimeError(
+                    f"{target_dir.name} was not installed from the community packs; "
+                    "confirm before replacing it"
+                )
+            manifest = existing or {}
+
+        tree_entries = await self._fetch_tree_entries(pack)
+        blobs = [item for item in tree_entries if item.get("type") == "blob"]
+        if not blobs:
+            raise RuntimeError(f"No files found for {pack.name}")
 
-        staging_dir = Path(tempfile.mkdtemp(prefix="aw_pack_", dir=str(final_path.parent)))
+        if updating:
+            root = target_dir.resolve()
+        else:
+            target_dir.parent.mkdir(parents=True, exist_ok=True)
+            root = Path(
+                tempfile.mkdtemp(
+                    prefix=f".{target_dir.name}-", suffix=".staging", dir=target_dir.parent
+                )
+            ).resolve()
+        wanted: set[str] = set()
+        changed: list[dict[str, Any]] = []
+        installed: dict[str, str] = {}
+        deferred: list[tuple[Path, Path]] = []
+        completed = False
         try:
-            for item in tree_entries:
-                if item.get("type") != "blob":
-                    continue
+            for item in blobs:
                 rel_path = item.get("path") or ""
-                target_path = staging_dir / rel_path
-                # Defense-in-depth: ensure a malicious/unexpected tree path can't
-                # escape the staging directory (path traversal / zip-slip).
-                staging_root = staging_dir.resolve()
-                if not target_path.resolve().is_relative_to(staging_root):
+                tree_path = _checked_tree_path(rel_path)
+                target_path = root / tree_path
+                if not target_path.resolve().is_relative_to(root):
                     raise RuntimeError(f"Unsafe path in repository tree: {rel_path!r}")
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                raw_url = (
-                    f"https://raw.githubusercontent.com/{self.repo_owner}/{self.repo_name}/"
-                    f"{ref}/{pack.repo_path}/{rel_path}"
-                )
-                async with self._http.stream("GET", raw_url) as resp:
+                rel_path = tree_path.as_posix()
+                if rel_path == INSTALL_MANIFEST_NAME:
+                    continue
+                wanted.add(rel_path)
+                sha = item.get("sha") or ""
+                if target_path.is_file():
+                    local_sha = file_blob_sha(target_path)
+                    if local_sha == sha:
+                        installed[rel_path] = sha
+                        continue
+                    if manifest.get(rel_path) != local_sha and not (
+                        overwrite_unmanaged and not manifest
+                    ):
+                        logger.info("Keeping locally changed file in %s: %s", pack.name, rel_path)
+                        continue
+                changed.append({**item, "path": rel_path})
+            logger.info(
+                "Installing %s: %d of %d files changed", pack.name, len(changed), len(blobs)
+            )
+            shas = {item["path"]: item.get("sha") or "" for item in changed}
+
+            def part_path_for(rel_path: str) -> Path:
+                target_path = root / rel_path
+                return target_path.with_name(target_path.name + ".part")
+
+            async def place_blob(rel_path: str, part_path: Path) -> None:
+                target_path = root / rel_path
+                if rel_path == "pack.json":
+                    deferred.append((part_path, target_path))
+                else:
+                    os.replace(part_path, target_path)
+                installed[rel_path] = shas[rel_path]
+
+            await self._download_blobs(
+                pack, changed, part_path_for, place_blob, progress_callback, max_concurrency
+            )
+            if updating:
+                self._remove_stale_files(root, manifest, wanted)
+            for part_path, target_path in deferred:
+                os.replace(part_path, target_path)
+            deferred.clear()
+            _manifest_store(root).save({path: {"sha": sha} for path, sha in installed.items()})
+            completed = True
+            if not updating:
+                if validate is not None:
+                    ok, message = validate(root)
+                    if not ok:
+                        raise RuntimeError(f"Invalid sound pack: {message}")
+                os.replace(root, target_dir)
+            return target_dir
+        except BaseException:
+            for part_path, _target_path in deferred:
+                with contextlib.suppress(OSError):
+                    part_path.unlink()
+            if not updating:
+                shutil.rmtree(root, ignore_errors=True)
+            elif not completed:
+                # Keep tracking both the files already replaced and the ones
+                # still to come, so the next update can finish the job.
+                merged = {**manifest, **installed}
+                _manifest_store(root).save({path: {"sha": sha} for path, sha in merged.items()})
+            raise
+
+    @staticmethod
+    def _remove_stale_files(root: Path, manifest: dict[str, str], wanted: set[str]) -> None:
+        """Delete installed files that left the tree, unless the user changed them."""
+        for rel_path, sha in manifest.items():
+            if rel_path in wanted:
+                continue
+            try:
+                path = root / _checked_tree_path(rel_path)
+            except RuntimeError:
+                continue
+            if not path.resolve().is_relative_to(root) or not path.is_file():
+                continue
+            if file_blob_sha(path) != sha:
+                logger.info("Keeping locally changed file no longer in pack: %s", path)
+                continue
+            logger.debug("Removing file no longer in pack: %s", path)
+            path.unlink(missing_ok=True)
+            for parent in path.parents:
+                if parent == root:
+                    break
+                try:
+                    parent.rmdir()  # only succeeds once the directory is empty
+                except OSError:
+                    break
+
+    async def _download_blobs(
+        self,
+        pack: CommunityPack,
+        blobs: list[dict[str, Any]],
+        part_path_for: Callable[[str], Path],
+        on_blob: Callable[[str, Path], Awaitable[None]],
+        progress_callback: ProgressCallback | None,
+        max_concurrency: int,
+    ) -> None:
+        """
+        Fetch ``blobs`` with bounded concurrency, streaming each one to disk.
+
+        Each blob is written chunk by chunk to ``part_path_for(rel_path)`` and
+        then handed to ``on_blob(rel_path, part_path)``, which takes ownership of
+        the file. Partial files are removed when a download fails.
+        """
+        ref = pack.ref or "main"
+        total_bytes = sum(int(item.get("size") or 0) for item in blobs)
+        downloaded = 0
+        semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+        async def report(count: int) -> None:
+            nonlocal downloaded
+            downloaded += count
+            if progress_callback is None:
+                return
+            pct = (downloaded / total_bytes * 100.0) if total_bytes else 0.0
+            try:
+                res = progress_callback(pct, downloaded, total_bytes)
+                if asyncio.iscoroutine(res):
+                    res = await res  # type: ignore[assignment]
+            except Exception as cb_err:
+                logger.debug("Progress callback error ignored: %s", cb_err)
+                return
+            if res is False:
+                raise _DownloadCancelled
+
+        async def fetch(item: dict[str, Any]) -> None:
+            rel_path = item.get("path") or ""
+            raw_url = (
+                f"https://raw.githubusercontent.com/{self.repo_owner}/{self.repo_name}/"
+                f"{ref}/{pack.repo_path}/{rel_path}"
+            )
+            part_path = part_path_for(rel_path)
+            try:
+                async with semaphore, self._http.stream("GET", raw_url) as resp:
                     if resp.status_code != 200:
                         raise RuntimeError(
                             f"Failed to download {rel_path} (status {resp.status_code})"
                         )
-                    with target_path.open("wb") as f:
+                    part_path.parent.mkdir(parents=True, exist_ok=True)
+                    with part_path.open("wb") as handle:
                         async for chunk in resp.aiter_bytes(chunk_size=65536):
                             if not chunk:
                                 continue
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            if progress_callback is not None:
-                                pct = (downloaded / total_bytes * 100.0) if total_bytes else 0.0
-                                try:
-                                    res = progress_callback(pct, downloaded, total_bytes)
-                                    if asyncio.iscoroutine(res):
-                                        res = await res  # type: ignore[assignment]
-                                    if res is False:
-                                        raise asyncio.CancelledError(
-                                            "Download cancelled by callback"
-                                        )
-                                except Exception as cb_err:
-                                    logger.debug("Progress callback error ignored: %s", cb_err)
-            # Bundle into zip
-            with zipfile.ZipFile(final_path, "w", compression=zipfile.ZIP_DEFLATED) as zipf:
-                for file_path in staging_dir.rglob("*"):
-                    if file_path.is_file():
-                        zipf.write(file_path, arcname=file_path.relative_to(staging_dir))
-            return final_path
-        except Exception:
-            with contextlib.suppress(Exception):
-                if final_path.exists():
-                    final_path.unlink()
-            raise
-        finally:
-            shutil.rmtree(staging_dir, ignore_errors=True)
+                            handle.write(chunk)
+                            await report(len(chunk))
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    part_path.unlink(missing_ok=True)
+                raise
+            await on_blob(rel_path, part_path)
+
+        # A TaskGroup cancels the remaining blobs as soon as one fails; surface
+        # the first failure itself so callers and retries see the usual types.
+        try:
+            async with asyncio.TaskGroup() as group:
+                for item in blobs:
+                    group.create_task(fetch(item))
+        except BaseExceptionGroup as exc_group:
+            first = exc_group.exceptions[0]
+            if isinstance(first, _DownloadCancelled):
+                raise asyncio.CancelledError("Download cancelled by callback") from None
+            raise first from None
 
     @async_retry_with_backoff(
         max_attempts=2,
@@ -8,6 +8,7 @@ from typing import Any, Protocol
 
 import httpx
 
+from ..http_session import shared_transport
 from ..models import EnvironmentalConditions, HourlyAirQuality, HourlyUVIndex, Location
 from ..utils.retry_utils import async_retry_with_backoff
 from .airnow_client import AirNowClient, AirNowObservation
@@ -92,7 +93,9 @@ class EnvironmentalDataClient:
                 "timezone": "auto",
             }
 
-            async with httpx.AsyncClient(timeout=self.timeout, headers=headers) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, headers=headers, transport=shared_transport()
+            ) as client:
                 response = await client.get(self.AIR_QUALITY_ENDPOINT, params=params)
                 response.raise_for_status()
 
@@ -208,7 +211,9 @@ class EnvironmentalDataClient:
             # Use the forecast endpoint (not air quality or pollen)
             forecast_endpoint = "https://api.open-meteo.com/v1/forecast"
 
-            async with httpx.AsyncClient(timeout=self.timeout, headers=headers) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, headers=headers, transport=shared_transport()
+            ) as client:
                 response = await client.get(forecast_endpoint, params=params)
                 response.raise_for_status()
 
@@ -271,7 +276,9 @@ class EnvironmentalDataClient:
             include_air_quality and not airnow_supplied_current
         )
         if needs_openmeteo_client:
-            async with httpx.AsyncClient(timeout=self.timeout, headers=headers) as client:
+            async with httpx.AsyncClient(
+                timeout=self.timeout, headers=headers, transport=shared_transport()
+            ) as client:
                 if include_air_quality and not airnow_supplied_current:
                     await self._populate_air_quality(client, params, environmental)
                 if include_pollen:
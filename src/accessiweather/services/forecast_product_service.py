@@ -12,14 +12,22 @@ product type:
 
 Failed fetches (:class:`TextProductFetchError`) are NOT cached — the caller
 sees the exception and the next call retries.
+
+Concurrent requests for the same key share one in-flight fetch. Expired
+entries stay readable for one more TTL: they are returned immediately while a
+single background refresh replaces them (stale-while-revalidate). Notification
+checks use :meth:`ForecastProductService.get_fresh`, which never returns an
+expired product.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from datetime import datetime
-from typing import Any, Literal
+from functools import partial
+from typing import Any, Literal, TypeVar
 
 from ..cache import Cache
 from ..iem_client import (
@@ -58,6 +66,12 @@ _PRODUCT_TTLS: dict[str, int] = {
     "SURF_CONDITIONS": 3600,
 }
 
+# Expired entries remain servable for this multiple of their TTL while a
+# background refresh runs.
+_STALE_TTL_FACTOR = 1.0
+
+T = TypeVar("T")
+
 FetcherResult = TextProduct | list[TextProduct] | None
 Fetcher = Callable[..., Awaitable[FetcherResult]]
 HistoryFetcher = Callable[..., Awaitable[list[TextProduct]]]
@@ -109,6 +123,7 @@ class ForecastProductService:
 
         """
         self._cache = cache
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
         self._fetcher: Fetcher = fetcher or get_nws_text_product
         self._history_fetcher: HistoryFetcher = history_fetcher or get_nws_text_product_history
         self._daily_climate_fetcher: DailyClimateFetcher = (
@@ -170,6 +185,68 @@ class ForecastProductService:
             station = station[1:]
         return station
 
+    def _flight(self, key: str, start: Callable[[], Awaitable[T]]) -> asyncio.Future[T]:
+        """Return the in-flight fetch for ``key``, starting it with ``start`` if needed."""
+        flight = self._in_flight.get(key)
+        if flight is None or flight.done() or flight.get_loop() is not asyncio.get_running_loop():
+            flight = asyncio.ensure_future(start())
+            self._in_flight[key] = flight
+            flight.add_done_callback(partial(self._flight_done, key))
+        return flight
+
+    def _flight_done(self, key: str, flight: asyncio.Future[Any]) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+        # Retrieving the exception keeps unawaited background refreshes quiet.
+        if not flight.cancelled() and flight.exception() is not None:
+            logger.debug("Forecast product fetch for %s failed: %s", key, flight.exception())
+
+    async def _store(self, key: str, pending: Awaitable[T], ttl: float | Callable[[T], float]) -> T:
+        result = await pending
+        seconds = ttl(result) if callable(ttl) else ttl
+        self._cache.set(key, result, ttl=seconds, stale_ttl=seconds * _STALE_TTL_FACTOR)
+        return result
+
+    async def _cached_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[T]],
+        *,
+        ttl: float | Callable[[T], float],
+        accept: Callable[[Any], bool] | None = None,
+        allow_stale: bool = True,
+    ) -> T:
+        """
+        Serve ``key`` from cache, coalescing concurrent misses into one fetch.
+
+        Fresh entries are returned directly. An expired entry still inside its
+        stale window is returned immediately and one background refresh is
+        started, unless ``allow_stale`` is False. Otherwise every concurrent
+        caller awaits the same fetch. ``accept`` rejects cached values of an
+        unexpected shape.
+        """
+
+        def usable(value: Any) -> bool:
+            return accept is None or accept(value)
+
+        # has_key() distinguishes "cached value that happens to be None/[]"
+        # from "cache miss". Call it first, then fetch the value.
+        if self._cache.has_key(key):
+            cached = self._cache.get(key)
+            if usable(cached):
+                return cached
+
+        def start() -> Awaitable[T]:
+            # fetch() is called here, synchronously, so a request is issued
+            # even when nobody awaits the refresh.
+            return self._store(key, fetch(), ttl)
+
+        stale = self._cache.get_entry(key, allow_stale=True) if allow_stale else None
+        if stale is not None and usable(stale.value):
+            self._flight(key, start)
+            return stale.value
+        return await asyncio.shield(self._flight(key, start))
+
     @classmethod
     def daily_climate_station_candidates(cls, location: object) -> list[str]:
         """Return likely CLI station identifiers for a saved/current location."""
@@ -184,14 +261,12 @@ class ForecastProductService:
         return candidates
 
     async def _get_daily_climate_locations(self) -> set[str]:
-        key = self._iem_cache_key("CLI", "locations")
-        if self._cache.has_key(key):
-            cached = self._cache.get(key)
-            if isinstance(cached, set):
-                return cached
-        result = await self._daily_climate_location_fetcher()
-        self._cache.set(key, result, ttl=86400)
-        return result
+        return await self._cached_fetch(
+            self._iem_cache_key("CLI", "locations"),
+            self._daily_climate_location_fetcher,
+            ttl=86400,
+            accept=lambda cached: isinstance(cached, set),
+        )
 
     async def get_daily_climate_report(
         self, station_id: str, **fetcher_kwargs: Any
@@ -200,14 +275,12 @@ class ForecastProductService:
         station = self._normalize_daily_climate_station(station_id)
         if not station:
             return None
-        key = self._iem_cache_key("CLI", station, "latest")
-        if self._cache.has_key(key):
-            cached = self._cache.get(key)
-            if cached is None or isinstance(cached, TextProduct):
-                return cached
-        result = await self._daily_climate_fetcher(station, **fetcher_kwargs)
-        self._cache.set(key, result, ttl=self._TTLS.get("CLI", 3600))
-        return result
+        return await self._cached_fetch(
+            self._iem_cache_key("CLI", station, "latest"),
+            lambda: self._daily_climate_fetcher(station, **fetcher_kwargs),
+            ttl=self._TTLS.get("CLI", 3600),
+            accept=_is_optional_product,
+        )
 
     async def get_daily_climate_report_for_location(
         self,
@@ -215,6 +288,16 @@ class ForecastProductService:
         **fetcher_kwargs: Any,
     ) -> TextProduct | None:
         """Try likely CLI stations for a location until a report is found."""
+        return await asyncio.shield(
+            self._flight(
+                f"{self._location_cache_key(location)}:report",
+                lambda: self._resolve_daily_climate_report(location, **fetcher_kwargs),
+            )
+        )
+
+    async def _resolve_daily_climate_report(
+        self, location: object, **fetcher_kwargs: Any
+    ) -> TextProduct | None:
         primary_candidates = self.daily_climate_station_candidates(location)
         candidates = list(primary_candidates)
         latitude = getattr(location, "latitude", None)
@@ -270,12 +353,27 @@ class ForecastProductService:
         or Pirate Weather summaries use ``product_type="SURF_CONDITIONS"`` so the
         UI can label them as non-official surf/beach context.
         """
-        key = self._surf_conditions_cache_key(location)
-        if self._cache.has_key(key):
-            cached = self._cache.get(key)
-            if cached is None or isinstance(cached, TextProduct):
-                return cached
+        return await self._cached_fetch(
+            self._surf_conditions_cache_key(location),
+            lambda: self._fetch_surf_conditions(
+                location, weather_client=weather_client, **fetcher_kwargs
+            ),
+            ttl=self._surf_conditions_ttl,
+            accept=_is_optional_product,
+        )
+
+    def _surf_conditions_ttl(self, result: TextProduct | None) -> float:
+        if isinstance(result, TextProduct) and result.product_type == "SRF":
+            return self._TTLS.get("SRF", 3600)
+        return self._TTLS.get("SURF_CONDITIONS", 3600)
 
+    async def _fetch_surf_conditions(
+        self,
+        location: object,
+        *,
+        weather_client: object | None,
+        **fetcher_kwargs: Any,
+    ) -> TextProduct | None:
         cwa_office = (getattr(location, "cwa_office", None) or "").strip().upper()
         if cwa_office:
             try:
@@ -283,7 +381,6 @@ class ForecastProductService:
             except TextProductFetchError:
                 official = None
             if isinstance(official, TextProduct):
-                self._cache.set(key, official, ttl=self._TTLS.get("SRF", 3600))
                 return official
 
         try:
@@ -300,8 +397,6 @@ class ForecastProductService:
             except Exception:  # noqa: BLE001
                 logger.debug("Pirate Weather beach conditions fallback failed", exc_info=True)
                 derived = None
-
-        self._cache.set(key, derived, ttl=self._TTLS.get("SURF_CONDITIONS", 3600))
         return derived
 
     async def get(
@@ -318,22 +413,33 @@ class ForecastProductService:
         returned. :class:`TextProductFetchError` from the fetcher propagates
         unchanged and is NOT cached.
         """
-        key = self._cache_key(product_type, cwa_office)
-
-        # has_key() distinguishes "cached value that happens to be None/[]"
-        # from "cache miss". Call it first, then fetch the value.
-        if self._cache.has_key(key):
-            return self._cache.get(key)
+        # Failures propagate from the shared fetch and are not cached, so the
+        # next call retries.
+        return await self._cached_fetch(
+            self._cache_key(product_type, cwa_office),
+            lambda: self._fetcher(product_type, cwa_office, **fetcher_kwargs),
+            ttl=self._TTLS.get(product_type, self._cache.default_ttl),
+        )
 
-        try:
-            result = await self._fetcher(product_type, cwa_office, **fetcher_kwargs)
-        except TextProductFetchError:
-            # Do not cache failures — let the next call retry.
-            raise
+    async def get_fresh(
+        self,
+        product_type: ProductType,
+        cwa_office: str,
+        **fetcher_kwargs: Any,
+    ) -> FetcherResult:
+        """
+        Return a text product that is within its TTL, fetching it if needed.
 
-        ttl = self._TTLS.get(product_type, self._cache.default_ttl)
-        self._cache.set(key, result, ttl=ttl)
-        return result
+        Unlike :meth:`get` an expired entry is never served while it refreshes;
+        the caller waits for the (shared) fetch instead. Notification checks
+        use this so an outdated HWO or SPS is never reported as current.
+        """
+        return await self._cached_fetch(
+            self._cache_key(product_type, cwa_office),
+            lambda: self._fetcher(product_type, cwa_office, **fetcher_kwargs),
+            ttl=self._TTLS.get(product_type, self._cache.default_ttl),
+            allow_stale=False,
+        )
 
     async def get_history(
         self,
@@ -352,26 +458,18 @@ class ForecastProductService:
         current AFD/HWO/SPS/SRF fetches never collide with historical listings.
         """
         key = self._history_cache_key(product_type, cwa_office, limit, start, end)
-
-        if self._cache.has_key(key):
-            cached = self._cache.get(key)
-            if isinstance(cached, list):
-                return cached
-
         history_kwargs: dict[str, Any] = {"limit": limit, **fetcher_kwargs}
         if start is not None:
             history_kwargs["start"] = start
         if end is not None:
             history_kwargs["end"] = end
 
-        try:
-            result = await self._history_fetcher(product_type, cwa_office, **history_kwargs)
-        except TextProductFetchError:
-            raise
-
-        ttl = self._TTLS.get(product_type, self._cache.default_ttl)
-        self._cache.set(key, result, ttl=ttl)
-        return result
+        return await self._cached_fetch(
+            key,
+            lambda: self._history_fetcher(product_type, cwa_office, **history_kwargs),
+            ttl=self._TTLS.get(product_type, self._cache.default_ttl),
+            accept=lambda cached: isinstance(cached, list),
+        )
 
     async def get_iem_afos(self, product_id: str, **kwargs: Any) -> TextProduct:
         """Fetch raw IEM AFOS text for advanced product lookup."""
@@ -387,13 +485,12 @@ class ForecastProductService:
             kwargs.get("matches", ""),
             kwargs.get("aviation_afd", ""),
         ]
-        key = self._iem_cache_key("AFOS", *cache_parts)
-        cached = self._cache.get(key)
-        if isinstance(cached, TextProduct):
-            return cached
-        result = await fetch_iem_afos_text(product_key, **kwargs)
-        self._cache.set(key, result, ttl=self._TTLS.get("AFD", 3600))
-        return result
+        return await self._cached_fetch(
+            self._iem_cache_key("AFOS", *cache_parts),
+            lambda: fetch_iem_afos_text(product_key, **kwargs),
+            ttl=self._TTLS.get("AFD", 3600),
+            accept=_is_product,
+        )
 
     async def get_iem_spc_outlook(
         self,
@@ -411,20 +508,20 @@ class ForecastProductService:
         key = self._iem_cache_key(
             "SPC_OUTLOOK", latitude, longitude, day, current, valid_key, max_items
         )
-        cached = self._cache.get(key)
-        if isinstance(cached, TextProduct):
-            return cached
-        result = await fetch_iem_spc_outlook(
-            latitude,
-            longitude,
-            day=day,
-            current=current,
-            valid_at=valid_at,
-            max_items=max_items,
-            timeout=timeout,
+        return await self._cached_fetch(
+            key,
+            lambda: fetch_iem_spc_outlook(
+                latitude,
+                longitude,
+                day=day,
+                current=current,
+                valid_at=valid_at,
+                max_items=max_items,
+                timeout=timeout,
+            ),
+            ttl=self._TTLS.get("SPS", 900),
+            accept=_is_product,
         )
-        self._cache.set(key, result, ttl=self._TTLS.get("SPS", 900))
-        return result
 
     async def get_iem_spc_mcds(
         self,
@@ -443,20 +540,20 @@ class ForecastProductService:
         key = self._iem_cache_key(
             "SPC_MCD", latitude, longitude, active_only, start_key, end_key, max_items
         )
-        cached = self._cache.get(key)
-        if isinstance(cached, TextProduct):
-            return cached
-        result = await fetch_iem_spc_mcds(
-            latitude,
-            longitude,
-            active_only=active_only,
-            start=start,
-            end=end,
-            max_items=max_items,
-            timeout=timeout,
+        return await self._cached_fetch(
+            key,
+            lambda: fetch_iem_spc_mcds(
+                latitude,
+                longitude,
+                active_only=active_only,
+                start=start,
+                end=end,
+                max_items=max_items,
+                timeout=timeout,
+            ),
+            ttl=self._TTLS.get("SPS", 900),
+            accept=_is_product,
         )
-        self._cache.set(key, result, ttl=self._TTLS.get("SPS", 900))
-        return result
 
     async def get_iem_spc_watches(
         self,
@@ -470,18 +567,18 @@ class ForecastProductService:
         """Fetch structured IEM SPC watch summaries."""
         valid_key = valid_at.isoformat() if valid_at is not None else "latest"
         key = self._iem_cache_key("SPC_WATCHES", latitude, longitude, valid_key, max_items)
-        cached = self._cache.get(key)
-        if isinstance(cached, TextProduct):
-            return cached
-        result = await fetch_iem_spc_watches(
-            latitude,
-            longitude,
-            valid_at=valid_at,
-            max_items=max_items,
-            timeout=timeout,
+        return await self._cached_fetch(
+            key,
+            lambda: fetch_iem_spc_watches(
+                latitude,
+                longitude,
+                valid_at=valid_at,
+                max_items=max_items,
+                timeout=timeout,
+            ),
+            ttl=self._TTLS.get("SPS", 900),
+            accept=_is_product,
         )
-        self._cache.set(key, result, ttl=self._TTLS.get("SPS", 900))
-        return result
 
     async def get_iem_wpc_outlook(
         self,
@@ -497,20 +594,20 @@ class ForecastProductService:
         """Fetch a structured IEM WPC excessive rainfall outlook summary."""
         valid_key = valid_at.isoformat() if valid_at is not None else "latest"
         key = self._iem_cache_key("WPC_ERO", latitude, longitude, day, valid_key, limit, max_items)
-        cached = self._cache.get(key)
-        if isinstance(cached, TextProduct):
-            return cached
-        result = await fetch_iem_wpc_outlook(
-            latitude,
-            longitude,
-            day=day,
-            valid_at=valid_at,
-            limit=limit,
-            max_items=max_items,
-            timeout=timeout,
+        return await self._cached_fetch(
+            key,
+            lambda: fetch_iem_wpc_outlook(
+                latitude,
+                longitude,
+                day=day,
+                valid_at=valid_at,
+                limit=limit,
+                max_items=max_items,
+                timeout=timeout,
+            ),
+            ttl=self._TTLS.get("SPS", 900),
+            accept=_is_product,
         )
-        self._cache.set(key, result, ttl=self._TTLS.get("SPS", 900))
-        return result
 
     async def get_iem_wpc_mpds(
         self,
@@ -529,17 +626,25 @@ class ForecastProductService:
         key = self._iem_cache_key(
             "WPC_MPD", latitude, longitude, active_only, start_key, end_key, max_items
         )
-        cached = self._cache.get(key)
-        if isinstance(cached, TextProduct):
-            return cached
-        result = await fetch_iem_wpc_mpds(
-            latitude,
-            longitude,
-            active_only=active_only,
-            start=start,
-            end=end,
-            max_items=max_items,
-            timeout=timeout,
+        return await self._cached_fetch(
+            key,
+            lambda: fetch_iem_wpc_mpds(
+                latitude,
+                longitude,
+                active_only=active_only,
+                start=start,
+                end=end,
+                max_items=max_items,
+                timeout=timeout,
+            ),
+            ttl=self._TTLS.get("SPS", 900),
+            accept=_is_product,
         )
-        self._cache.set(key, result, ttl=self._TTLS.get("SPS", 900))
-        return result
+
+
+def _is_product(value: Any) -> bool:
+    return isinstance(value, TextProduct)
+
+
+def _is_optional_product(value: Any) -> bool:
+    return value is None or isinstance(value, TextProduct)
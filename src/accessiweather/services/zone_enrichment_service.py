@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING
 
 import httpx
 
+from ..http_session import shared_transport
 from ..location_classification import is_us_location
 
 if TYPE_CHECKING:
@@ -201,7 +202,7 @@ class ZoneEnrichmentService:
                 response = await self._client.get(url, headers=headers, timeout=self._timeout)
             else:
                 async with httpx.AsyncClient(
-                    timeout=self._timeout, follow_redirects=True
+                    timeout=self._timeout, follow_redirects=True, transport=shared_transport()
                 ) as client:
                     response = await client.get(url, headers=headers)
         except httpx.HTTPError as exc:
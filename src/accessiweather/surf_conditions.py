@@ -10,6 +10,7 @@ from typing import Any
 
 import httpx
 
+from .http_session import shared_transport
 from .models import Location, TextProduct
 from .weather_client_parsers import degrees_to_cardinal
 
@@ -199,7 +200,9 @@ async def fetch_openmeteo_marine_surf_conditions(
 
     if client is not None:
         return await _run(client)
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+    async with httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, transport=shared_transport()
+    ) as new_client:
         return await _run(new_client)
 
 
@@ -15,6 +15,7 @@ from ...notifications.sound_pack_installer import SoundPackInstaller
 from ...services.community_soundpack_service import (
     CommunityPack,
     CommunitySoundPackService,
+    is_managed_install,
 )
 from .progress_dialog import ProgressDialog
 
@@ -319,6 +320,38 @@ class CommunityPacksBrowserDialog(wx.Dialog):
         if not pack:
             return
 
+        target_dir: Path | None = None
+        overwrite_unmanaged = False
+        if pack.repo_path and not pack.download_url:
+            # Repository packs are written straight into the install directory;
+            # an existing install is updated in place and only changed files
+            # are downloaded.
+            pack_dir = self.installer.find_pack_directory(pack.name) or (
+                f"{pack.name}-{pack.version}".replace(" ", "_")
+            )
+            try:
+                # Pack names come from the remote index; never install outside
+                # the sound packs directory.
+                target_dir = self.installer.resolve_pack_directory(pack_dir)
+            except ValueError as exc:
+                wx.MessageBox(str(exc), "Install Failed", wx.OK | wx.ICON_ERROR)
+                return
+            if target_dir.exists() and not is_managed_install(target_dir):
+                # The folder was not written by a community install (it may be
+                # the user's own pack with the same name), so nothing in it is
+                # replaced without asking.
+                answer = wx.MessageBox(
+                    f'A sound pack folder named "{target_dir.name}" already exists and was '
+                    "not installed from the community packs.\n\n"
+                    f'Replace its files with "{pack.name}" {pack.version}? '
+                    "Files that are not part of the community pack are kept.",
+                    "Replace Sound Pack?",
+                    wx.YES_NO | wx.NO_DEFAULT | wx.ICON_WARNING,
+                )
+                if answer != wx.YES:
+                    return
+                overwrite_unmanaged = True
+
         # Show progress dialog
         progress = ProgressDialog(self, f"Downloading {pack.name}", "Preparing download...")
         progress.Show()
@@ -338,16 +371,31 @@ class CommunityPacksBrowserDialog(wx.Dialog):
                             detail = f"{downloaded / (1024 * 1024):.1f} MB downloaded"
                         return progress.update_progress(pct, f"Downloading {pack.name}...", detail)
 
-                    zip_path = loop.run_until_complete(
-                        self.service.download_pack(pack, tmp_dir, on_progress)
-                    )
+                    if target_dir is not None:
+                        loop.run_until_complete(
+                            self.service.install_repo_pack(
+                                pack,
+                                target_dir,
+                                on_progress,
+                                validate=self.installer.validate_pack_directory,
+                                overwrite_unmanaged=overwrite_unmanaged,
+                            )
+                        )
+                        if progress.is_cancelled:
+                            wx.CallAfter(self._on_download_cancelled, progress)
+                            return
+                        ok, msg = self.installer.validate_pack_directory(target_dir)
+                    else:
+                        zip_path = loop.run_until_complete(
+                            self.service.download_pack(pack, tmp_dir, on_progress)
+                        )
 
-                    if progress.is_cancelled:
-                        wx.CallAfter(self._on_download_cancelled, progress)
-                        return
+                        if progress.is_cancelled:
+                            wx.CallAfter(self._on_download_cancelled, progress)
+                            return
 
-                    progress.set_status("Installing...", f"Installing {pack.name}")
-                    ok, msg = self.installer.install_from_zip(zip_path, None)
+                        progress.set_status("Installing...", f"Installing {pack.name}")
+                        ok, msg = self.installer.install_from_zip(zip_path, None)
 
                     if ok:
                         wx.CallAfter(self._on_install_success, progress, pack.name)
@@ -664,9 +664,70 @@ class AddLocationDialog(wx.Dialog):
         self.results_list.DeleteAllItems()
         self._search_results = []
 
+        # Show offline gazetteer matches immediately; online results are appended to them.
+        offline_locations = self._offline_locations(query)
+        if offline_locations:
+            self._show_search_results(offline_locations)
+            self._update_status(
+                f"Showing {len(offline_locations)} offline matches, searching online..."
+            )
+
         # Run async search
         self.app.run_async(self._do_search(query))
 
+    def _offline_locations(self, query: str, limit: int = 10) -> list[Location]:
+        """Return instant matches from the offline gazetteer, if one is loaded."""
+        from ...gazetteer import get_default_gazetteer
+        from ...models import Location
+
+        gazetteer = get_default_gazetteer()
+        if gazetteer is None:
+            return []
+        return [
+            Location(
+                name=entry.display_name,
+                latitude=entry.latitude,
+                longitude=entry.longitude,
+                country_code=entry.country_code or None,
+            )
+            for entry in gazetteer.search(query, limit=limit)
+        ]
+
+    def _show_search_results(self, locations: list[Location]) -> None:
+        """Replace the results list with the given locations."""
+        self._search_results = []
+        self.results_list.DeleteAllItems()
+        self._append_search_results(locations)
+
+    def _append_search_results(self, locations: list[Location]) -> int:
+        """
+        Add locations not already listed to the end of the results list.
+
+        Existing rows stay where they are, so the screen-reader cursor and any
+        selection are not disturbed. Returns the number of rows added.
+        """
+        added = 0
+        for location in locations:
+            if any(self._same_place(location, listed) for listed in self._search_results):
+                continue
+            self._search_results.append(location)
+            coords_str = self.location_manager.format_coordinates(
+                location.latitude, location.longitude
+            )
+            index = self.results_list.InsertItem(self.results_list.GetItemCount(), location.name)
+            self.results_list.SetItem(index, 1, coords_str)
+            added += 1
+        return added
+
+    @staticmethod
+    def _same_place(first: Location, second: Location) -> bool:
+        """Treat results with the same name at nearly the same coordinates as one place."""
+        return (
+            first.name.casefold() == second.name.casefold()
+            and abs(first.latitude - second.latitude) < 0.02
+            and abs(first.longitude - second.longitude) < 0.02
+        )
+
     def _on_use_current_location(self, event) -> None:
         """Handle one-time current-location detection button press."""
         if self._is_detecting_current_location:
@@ -748,23 +809,26 @@ class AddLocationDialog(wx.Dialog):
         self._is_searching = False
         self.search_button.Enable()
 
-        if locations:
-            self._search_results = locations
-
-            for location in locations:
-                coords_str = self.location_manager.format_coordinates(
-                    location.latitude, location.longitude
+        if self._search_results:
+            # Offline matches are already listed; keep them in place and append.
+            added = self._append_search_results(locations)
+            if added:
+                self._update_status(
+                    f"Found {added} more online locations; "
+                    f"{len(self._search_results)} locations listed"
                 )
-                index = self.results_list.InsertItem(
-                    self.results_list.GetItemCount(), location.name
+            else:
+                self._update_status(
+                    f"No new online matches; showing {len(self._search_results)} locations"
                 )
-                self.results_list.SetItem(index, 1, coords_str)
+        elif locations:
+            self._show_search_results(locations)
 
-            self._update_status(f"Found {len(locations)} locations")
+            self._update_status(f"Found {len(self._search_results)} locations")
 
             # Auto-fill name if empty
-            if not self.name_input.GetValue().strip() and locations:
-                self.name_input.SetValue(locations[0].name)
+            if not self.name_input.GetValue().strip():
+                self.name_input.SetValue(self._search_results[0].name)
         else:
             self._update_status("No locations found. Try a different search term.", is_error=True)
 
@@ -773,6 +837,11 @@ class AddLocationDialog(wx.Dialog):
         """Handle search error."""
         self._is_searching = False
         self.search_button.Enable()
+        if self._search_results:
+            self._update_status(
+                f"Online search failed; showing {len(self._search_results)} offline matches"
+            )
+            return
         self._update_status(f"Search failed: {error}", is_error=True)
 
     def _on_result_selected(self, event):
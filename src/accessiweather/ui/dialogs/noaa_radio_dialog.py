@@ -14,6 +14,8 @@ from accessiweather.noaa_radio import (
     StationAvailabilityCache,
     StationAvailabilityService,
     StationDatabase,
+    StreamProber,
+    StreamProbeResult,
     StreamURLProvider,
 )
 from accessiweather.noaa_radio.preferences import DEFAULT_STATION_LIMIT, RadioPreferences
@@ -191,6 +193,7 @@ class NOAARadioDialog(wx.Dialog):
             weatherindex_client=weatherindex,
             availability_cache=self._availability_cache,
         )
+        self._stream_prober = StreamProber(history=self._availability_cache)
         self._station_base_labels: list[str] = []
         self._station_load_generation = 0
         self._current_urls: list[str] = self._session.current_urls
@@ -461,11 +464,62 @@ class NOAARadioDialog(wx.Dialog):
 
         self._session.playing_station = station
         self._playing_station = station
-        self._session.current_urls = self._prefs.reorder_urls(station.call_sign, urls)
+        self._session.current_urls = self._prefs.reorder_urls(
+            station.call_sign,
+            urls,
+            stream_scores=self._availability_cache.get_stream_scores(urls),
+        )
         self._current_urls = self._session.current_urls
         self._session.current_url_index = 0
         self._current_url_index = 0
-        self._try_play_current(station.call_sign)
+        if len(self._current_urls) > 1:
+            self._race_streams_async(station.call_sign, self._current_urls)
+        else:
+            self._try_play_current(station.call_sign)
+
+    def _race_streams_async(self, call_sign: str, urls: list[str]) -> None:
+        """Probe every mirror concurrently and start playback on the first to respond."""
+        self._set_status(f"Connecting to {call_sign} ({len(urls)} streams)...")
+        thread = threading.Thread(
+            target=self._race_streams_worker,
+            args=(call_sign, urls),
+            daemon=True,
+        )
+        thread.start()
+
+    def _race_streams_worker(self, call_sign: str, urls: list[str]) -> None:
+        """Worker that races stream mirrors off the UI thread."""
+        try:
+            winner = self._stream_prober.race(urls)
+        except Exception as e:
+            logger.debug(f"Stream race failed for {call_sign}: {e}")
+            winner = None
+        wx.CallAfter(self._on_stream_race_finished, call_sign, urls, winner)
+
+    def _on_stream_race_finished(
+        self, call_sign: str, urls: list[str], winner: StreamProbeResult | None
+    ) -> None:
+        """
+        Start the race winner, or fall back to trying mirrors in order.
+
+        A stream the user marked as preferred stays first; the winner then
+        leads the remaining mirrors instead.
+        """
+        # Ignore stale races: the dialog closed or another station was started.
+        if self._closed or self._session.current_urls is not urls:
+            return
+        if winner is not None and winner.url in urls:
+            preferred = self._prefs.get_preferred_url(call_sign)
+            pinned = [preferred] if preferred in urls and preferred != winner.url else []
+            # Move the winner to the front (after any preferred stream) so the
+            # in-order fallback in _try_play_current still visits every mirror once.
+            self._session.current_urls = (
+                pinned + [winner.url] + [u for u in urls if u != winner.url and u not in pinned]
+            )
+            self._current_urls = self._session.current_urls
+            self._session.current_url_index = 0
+            self._current_url_index = 0
+        self._try_play_current(call_sign)
 
     def _try_play_current(self, call_sign: str) -> None:
         """Try playing the current URL index, auto-advancing on failure."""
@@ -713,6 +767,7 @@ class NOAARadioDialog(wx.Dialog):
         """Dismiss the dialog while leaving any active stream playing."""
         self._closed = True
         self._health_timer.Stop()
+        self._stream_prober.close()
         self._session.unbind_callbacks()
         self.Destroy()
 
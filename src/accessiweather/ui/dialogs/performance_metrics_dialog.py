@@ -0,0 +1,109 @@
+"""Debug dialog showing per-operation latency percentiles from the metrics registry."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import wx
+
+from ...display.presentation.memo import format_memo_stats
+from ...performance.metrics import (
+    MetricsRegistry,
+    format_operation_stats,
+    get_metrics_registry,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def save_metrics_json(parent, registry: MetricsRegistry | None = None) -> None:
+    """Prompt for a path and write the current metrics as JSON."""
+    registry = registry or get_metrics_registry()
+    with wx.FileDialog(
+        parent,
+        "Save performance metrics",
+        wildcard="JSON files (*.json)|*.json",
+        defaultFile="accessiweather_performance.json",
+        style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
+    ) as dlg:
+        if dlg.ShowModal() != wx.ID_OK:
+            return
+        path = Path(dlg.GetPath())
+    try:
+        path.write_text(registry.to_json(), encoding="utf-8")
+    except OSError as exc:
+        logger.error(f"Failed to save performance metrics: {exc}")
+        wx.MessageBox(
+            f"Failed to save performance metrics: {exc}",
+            "Save Failed",
+            wx.OK | wx.ICON_ERROR,
+        )
+        return
+    wx.MessageBox(
+        f"Performance metrics saved to:\n{path}",
+        "Metrics Saved",
+        wx.OK | wx.ICON_INFORMATION,
+    )
+
+
+class PerformanceMetricsDialog(wx.Dialog):
+    """Read-only view of the span percentiles recorded this session."""
+
+    def __init__(self, parent, registry: MetricsRegistry | None = None, presenter=None):
+        """
+        Create the dialog for ``registry`` (the process-wide one by default).
+
+        When ``presenter`` is given its section memo hit rates are listed too.
+        """
+        super().__init__(
+            parent,
+            title="Performance Metrics",
+            size=(700, 500),
+            style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER,
+        )
+        self.registry = registry or get_metrics_registry()
+        self.presenter = presenter
+
+        panel = wx.Panel(self)
+        main_sizer = wx.BoxSizer(wx.VERTICAL)
+
+        label = wx.StaticText(panel, label="&Operations (p50, p95 and max latency):")
+        main_sizer.Add(label, 0, wx.LEFT | wx.RIGHT | wx.TOP, 10)
+
+        self.report_text = wx.TextCtrl(
+            panel, style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_DONTWRAP
+        )
+        self.report_text.SetName("Performance metrics")
+        main_sizer.Add(self.report_text, 1, wx.EXPAND | wx.ALL, 10)
+
+        button_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        refresh_btn = wx.Button(panel, wx.ID_REFRESH, "&Refresh")
+        reset_btn = wx.Button(panel, wx.ID_ANY, "Re&set")
+        save_btn = wx.Button(panel, wx.ID_SAVE, "Save as &JSON...")
+        close_btn = wx.Button(panel, wx.ID_CLOSE, "Close")
+        for button in (refresh_btn, reset_btn, save_btn):
+            button_sizer.Add(button, 0, wx.RIGHT, 5)
+        button_sizer.AddStretchSpacer()
+        button_sizer.Add(close_btn, 0)
+        main_sizer.Add(button_sizer, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.BOTTOM, 10)
+        panel.SetSizer(main_sizer)
+
+        refresh_btn.Bind(wx.EVT_BUTTON, lambda e: self._refresh())
+        reset_btn.Bind(wx.EVT_BUTTON, self._on_reset)
+        save_btn.Bind(wx.EVT_BUTTON, lambda e: save_metrics_json(self, self.registry))
+        close_btn.Bind(wx.EVT_BUTTON, lambda e: self.EndModal(wx.ID_CLOSE))
+        self.SetEscapeId(wx.ID_CLOSE)
+
+        self._refresh()
+        self.report_text.SetFocus()
+
+    def _refresh(self) -> None:
+        report = format_operation_stats(self.registry.snapshot())
+        if self.presenter is not None:
+            report += "\n\nPresenter sections:\n" + format_memo_stats(self.presenter.memo_stats())
+        self.report_text.SetValue(report)
+
+    def _on_reset(self, event) -> None:
+        self.registry.reset()
+        self._refresh()
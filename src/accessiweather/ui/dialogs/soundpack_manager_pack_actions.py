@@ -11,6 +11,7 @@ from pathlib import Path
 import wx
 
 from accessiweather.notifications.sound_pack_installer import safe_extractall
+from accessiweather.services.community_soundpack_service import INSTALL_MANIFEST_NAME
 
 logger = logging.getLogger(__name__)
 
@@ -287,7 +288,7 @@ class SoundPackManagerPackActionsMixin:
             try:
                 with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
                     for file_path in info.path.rglob("*"):
-                        if file_path.is_file():
+                        if file_path.is_file() and file_path.name != INSTALL_MANIFEST_NAME:
                             arcname = file_path.relative_to(info.path)
                             zf.write(file_path, arcname)
 
@@ -74,6 +74,9 @@ class WeatherAssistantDialog(wx.Dialog):
         self.app = app
         self._conversation: list[dict[str, str]] = []
         self._is_generating = False
+        # Kept for the dialog's lifetime so repeated tool calls and geocoding
+        # lookups within the conversation are reused.
+        self._tool_executor: WeatherToolExecutor | None = None
         self._announcer = ScreenReaderAnnouncer()
 
         self._create_widgets()
@@ -259,7 +262,9 @@ class WeatherAssistantDialog(wx.Dialog):
         messages: list[dict] = [{"role": "system", "content": system_message}]
         messages.extend(self._conversation)
 
-        tool_executor = self._get_tool_executor()
+        if self._tool_executor is None:
+            self._tool_executor = self._get_tool_executor()
+        tool_executor = self._tool_executor
         logger.info("Tool executor: %s", "available" if tool_executor else "NONE")
 
         def do_generate():
@@ -335,23 +340,31 @@ class WeatherAssistantDialog(wx.Dialog):
                         }
                         messages.append(tool_call_msg)
 
-                        # Execute each tool call
+                        # Execute all tool calls from this turn, running repeats once
+                        parsed: list[tuple[str, dict] | str] = []
                         for tool_call in assistant_message.tool_calls:
                             tool_name = tool_call.function.name
                             try:
-                                arguments = json.loads(tool_call.function.arguments)
-                                result = tool_executor.execute(tool_name, arguments)
+                                parsed.append((tool_name, json.loads(tool_call.function.arguments)))
                             except Exception as exc:
                                 logger.warning(
                                     "Tool call %s failed: %s", tool_name, exc, exc_info=True
                                 )
-                                result = f"Error executing {tool_name}: {exc}"
+                                parsed.append(f"Error executing {tool_name}: {exc}")
 
+                        results = iter(
+                            tool_executor.execute_many(
+                                [call for call in parsed if isinstance(call, tuple)]
+                            )
+                        )
+                        for tool_call, call in zip(
+                            assistant_message.tool_calls, parsed, strict=True
+                        ):
                             messages.append(
                                 {
                                     "role": "tool",
                                     "tool_call_id": tool_call.id,
-                                    "content": result,
+                                    "content": next(results) if isinstance(call, tuple) else call,
                                 }
                             )
 
@@ -422,6 +435,8 @@ class WeatherAssistantDialog(wx.Dialog):
     def _on_clear(self, event: wx.Event) -> None:
         """Clear chat history."""
         self._conversation.clear()
+        if self._tool_executor is not None:
+            self._tool_executor.clear_cache()
         self.history_display.SetValue("")
         self._set_status("")
         self._add_welcome_message()
@@ -80,7 +80,10 @@ class MainWindowCommandMixin:
         # Prefer a cache shared with the rest of the app when one exists;
         # fall back to an owned instance. Keeps tests from having to wire
         # the full app graph just to construct the dialog.
-        cache = getattr(self.app, "cache", None) or Cache()
+        cache = getattr(self.app, "cache", None)
+        if cache is None:
+            cache = Cache()
+            cache.start_background_sweep()
         self._forecast_product_service = ForecastProductService(cache)
         return self._forecast_product_service
 
@@ -320,6 +323,20 @@ class MainWindowCommandMixin:
 
         self._on_notification_event_data_received(mock_data)
 
+    def _on_show_performance_metrics(self) -> None:
+        """Open the performance metrics dialog."""
+        from .dialogs.performance_metrics_dialog import PerformanceMetricsDialog
+
+        dlg = PerformanceMetricsDialog(self, presenter=getattr(self.app, "presenter", None))
+        dlg.ShowModal()
+        dlg.Destroy()
+
+    def _on_save_performance_metrics(self) -> None:
+        """Save the recorded performance metrics as JSON."""
+        from .dialogs.performance_metrics_dialog import save_metrics_json
+
+        save_metrics_json(self)
+
     def _on_test_notifications(self) -> None:
         """Run notification tests and show pass/fail results."""
         from ..notifications.notification_test import run_notification_test
@@ -377,6 +394,7 @@ class MainWindowCommandMixin:
     def _on_about(self) -> None:
         """Show about dialog."""
         from accessiweather import __version__
+        from accessiweather.gazetteer import GEONAMES_ATTRIBUTION
 
         portable = bool(getattr(self.app, "_portable_mode", False))
         mode_label = "Portable" if portable else "Installed"
@@ -390,6 +408,7 @@ class MainWindowCommandMixin:
             "Built with wxPython for screen reader compatibility.\n\n"
             f"Mode: {mode_label}\n"
             f"Config path: {config_path}\n\n"
+            f"{GEONAMES_ATTRIBUTION}\n\n"
             "https://github.com/Orinks/AccessiWeather",
             "About AccessiWeather",
             wx.OK | wx.ICON_INFORMATION,
@@ -8,9 +8,11 @@ from .main_window_shared import *  # noqa: F403
 
 class MainWindowDisplayMixin:
     def _set_forecast_sections(self, daily_text: str, hourly_text: str) -> None:
-        """Update the daily and hourly forecast controls together."""
-        self.daily_forecast_display.SetValue(daily_text)
-        self.hourly_forecast_display.SetValue(hourly_text)
+        """Update the daily and hourly forecast controls, skipping unchanged ones."""
+        if self.daily_forecast_display.GetValue() != daily_text:
+            self.daily_forecast_display.SetValue(daily_text)
+        if self.hourly_forecast_display.GetValue() != hourly_text:
+            self.hourly_forecast_display.SetValue(hourly_text)
 
     def append_event_center_entry(self, text: str, *, category: str | None = None) -> None:
         """Append a timestamped reviewable line to the Event Center."""
@@ -220,7 +222,11 @@ class MainWindowDisplayMixin:
 
         for loc in all_locs:
             lines.append(f"--- {loc.name} ---")
-            cached = weather_client.get_cached_weather(loc) if weather_client else None
+            cached = (
+                weather_client.get_cached_weather(loc, sections=("current", "alerts"))
+                if weather_client
+                else None
+            )
 
             if cached and cached.has_any_data() and cached.current:
                 cc = cached.current
@@ -431,9 +437,13 @@ class MainWindowDisplayMixin:
         """Get or create a cached fallback notifier for event notifications."""
         return main_window_notification_events.get_fallback_notifier(self)
 
-    def _on_notification_event_data_received(self, weather_data) -> None:
+    def _on_notification_event_data_received(
+        self, weather_data, location_name: str | None = None
+    ) -> None:
         """Handle lightweight event data without refreshing the visible weather UI."""
-        main_window_notification_events.on_notification_event_data_received(self, weather_data)
+        main_window_notification_events.on_notification_event_data_received(
+            self, weather_data, location_name
+        )
 
     def _process_notification_events(self, weather_data) -> None:
         """
@@ -7,6 +7,7 @@ This keeps lightweight polling and event notification logic out of
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from typing import TYPE_CHECKING
@@ -51,15 +52,54 @@ async def fetch_notification_event_data(window: MainWindow) -> None:
     """Fetch only the lightweight data needed for notifications."""
     try:
         location = window.app.config_manager.get_current_location()
-        if not location:
-            return
+    except Exception as e:
+        logger.debug(f"Failed to read the current location for event polling: {e}")
+        location = None
+
+    # The other-locations batch must not depend on the current-location poll
+    # succeeding, so both run side by side with their own error handling.
+    await asyncio.gather(
+        fetch_current_location_event_data(window, location),
+        fetch_other_locations_alert_data(window, location),
+    )
+
 
+async def fetch_current_location_event_data(window: MainWindow, location) -> None:
+    """Fetch lightweight notification data for the current location."""
+    if not location:
+        return
+    try:
         weather_data = await window.app.weather_client.get_notification_event_data(location)
         wx.CallAfter(window._on_notification_event_data_received, weather_data)
     except Exception as e:
         logger.debug(f"Failed to fetch lightweight notification data: {e}")
 
 
+async def fetch_other_locations_alert_data(window: MainWindow, current_location) -> None:
+    """Poll alerts for every other saved location in one batched request."""
+    try:
+        current_name = getattr(current_location, "name", None)
+        others = [
+            saved
+            for saved in window.app.config_manager.get_all_locations()
+            if saved.name != current_name
+        ]
+        if not others:
+            return
+        batch = await window.app.weather_client.get_batched_alert_event_data(others)
+        for weather_data in batch:
+            alerts = weather_data.alerts
+            diff = weather_data.alert_lifecycle_diff
+            if (alerts and alerts.has_alerts()) or (diff is not None and diff.has_changes):
+                wx.CallAfter(
+                    window._on_notification_event_data_received,
+                    weather_data,
+                    weather_data.location.name,
+                )
+    except Exception as e:
+        logger.debug(f"Failed to poll alerts for other saved locations: {e}")
+
+
 def get_notification_event_manager(window: MainWindow):
     """Get or create the notification event manager for AFD/severe risk notifications."""
     if (
@@ -390,10 +430,15 @@ def get_fallback_notifier(window: MainWindow):
     return window._fallback_notifier
 
 
-def on_notification_event_data_received(window: MainWindow, weather_data) -> None:
+def on_notification_event_data_received(
+    window: MainWindow, weather_data, location_name: str | None = None
+) -> None:
     """
     Handle lightweight event data without refreshing the visible weather UI.
 
+    ``location_name`` is set for alerts polled for a saved location other than
+    the current one, so the notification says which place it is about.
+
     Note: We only process alert notifications here, NOT discussion updates.
     Discussion updates are handled in _on_weather_data_received after full weather
     refreshes. This prevents duplicate notifications when full refresh and event
@@ -421,7 +466,9 @@ def on_notification_event_data_received(window: MainWindow, weather_data) -> Non
                 ],
             )
             window.app.run_async(
-                window.app.alert_notification_system.process_and_notify(weather_data.alerts)
+                window.app.alert_notification_system.process_and_notify(
+                    weather_data.alerts, location_name=location_name
+                )
             )
 
         if (
@@ -440,7 +487,7 @@ def on_notification_event_data_received(window: MainWindow, weather_data) -> Non
             )
             window.app.run_async(
                 window.app.alert_notification_system.notify_lifecycle_changes(
-                    weather_data.alert_lifecycle_diff
+                    weather_data.alert_lifecycle_diff, location_name=location_name
                 )
             )
 
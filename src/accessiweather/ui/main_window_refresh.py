@@ -5,7 +5,15 @@ from __future__ import annotations
 
 import asyncio
 
+from ..performance.timer import span
 from .main_window_shared import *  # noqa: F403
+from .main_window_text import MainWindowText, build_main_window_text
+
+
+def _set_text_if_changed(control, text: str) -> None:
+    """Replace a text control's value only when it differs."""
+    if control.GetValue() != text:
+        control.SetValue(text)
 
 
 class MainWindowRefreshMixin:
@@ -31,7 +39,8 @@ class MainWindowRefreshMixin:
         When the All Locations view is active the summary is rebuilt from
         whatever is currently in the cache — no new network requests are made.
         """
-        # All Locations view: fetch fresh data for all locations sequentially then re-render.
+        # All Locations view: fetch fresh data for all locations concurrently, re-rendering
+        # the summary as results arrive.
         if getattr(self, "_all_locations_active", False):
             self.refresh_button.Disable()
             self.app.run_async(self._fetch_all_locations_data())
@@ -85,11 +94,18 @@ class MainWindowRefreshMixin:
             # Pre-warm NWS text products (AFD/HWO/SPS/SRF) for the active location
             # so the Forecast Products dialog and Unit 10/11 notification
             # checks see fresh data without issuing an on-demand fetch.
-            await self._pre_warm_products_for_location(location)
+            await self._pre_warm_products_for_location(location, for_notifications=True)
+
+            # Build the section text in a worker thread so long hourly sections
+            # don't stall the UI; the main thread only applies what changed.
+            text = await asyncio.to_thread(build_main_window_text, self.app.presenter, weather_data)
+            if generation != self._fetch_generation:
+                logger.debug(f"Discarding superseded presentation for {location.name}")
+                return
 
             # Update UI on main thread after active-location text products are
             # warm so HWO/SPS/CLI notification checks can read the cache.
-            wx.CallAfter(self._on_weather_data_received, weather_data)
+            wx.CallAfter(self._on_weather_data_received, weather_data, text=text)
 
             # Pre-warm cache for other locations in background (non-blocking)
             if not force_refresh:
@@ -100,16 +116,45 @@ class MainWindowRefreshMixin:
             wx.CallAfter(self._on_weather_error, str(e))
 
     async def _fetch_all_locations_data(self) -> None:
-        """Fetch fresh weather data for all saved locations sequentially, then re-render summary."""
+        """Fetch fresh weather data for all saved locations concurrently, then re-render summary."""
         try:
             all_locations = self.app.config_manager.get_all_locations()
             if all_locations and self.app.weather_client:
-                await self.app.weather_client.pre_warm_batch(all_locations)
+                await self.app.weather_client.pre_warm_batch(
+                    all_locations,
+                    active_location=self.app.config_manager.get_current_location(),
+                    on_progress=self._on_all_locations_progress,
+                )
         except Exception as e:
             logger.error(f"Failed to refresh all locations: {e}")
         finally:
             wx.CallAfter(self._on_all_locations_refresh_complete)
 
+    def _on_all_locations_progress(
+        self, location: Location, success: bool, completed: int, total: int
+    ) -> None:
+        """Schedule a summary re-render as each location in the batch finishes."""
+        logger.debug(
+            "All Locations refresh %d/%d: %s (%s)",
+            completed,
+            total,
+            location.name,
+            "ok" if success else "failed",
+        )
+        if not success or completed >= total:
+            return
+        # Coalesce bursts of completions into a single pending re-render.
+        if getattr(self, "_all_locations_render_pending", False):
+            return
+        self._all_locations_render_pending = True
+        wx.CallAfter(self._render_all_locations_progress)
+
+    def _render_all_locations_progress(self) -> None:
+        """Re-render the All Locations summary with the results cached so far."""
+        self._all_locations_render_pending = False
+        if getattr(self, "_all_locations_active", False):
+            self._show_all_locations_summary()
+
     def _on_all_locations_refresh_complete(self) -> None:
         """Handle completion of all-locations background refresh on the main thread."""
         if getattr(self, "_all_locations_active", False):
@@ -121,15 +166,11 @@ class MainWindowRefreshMixin:
         """Pre-warm cache for non-current locations so switching is instant."""
         try:
             all_locations = self.app.config_manager.get_all_locations()
-            uncached = [
-                loc
-                for loc in all_locations
-                if loc.name != current_location.name
-                and not (
-                    self.app.weather_client.get_cached_weather(loc)
-                    and self.app.weather_client.get_cached_weather(loc).has_any_data()
-                )
-            ]
+            others = [loc for loc in all_locations if loc.name != current_location.name]
+            cached_names = {
+                loc.name for loc in self.app.weather_client.locations_with_cached_data(others)
+            }
+            uncached = [loc for loc in others if loc.name not in cached_names]
             if uncached:
                 logger.debug(f"Pre-warming cache for {len(uncached)} locations")
                 await self.app.weather_client.pre_warm_batch(uncached)
@@ -144,10 +185,16 @@ class MainWindowRefreshMixin:
         except Exception as e:
             logger.debug(f"Cache pre-warm failed (non-critical): {e}")
 
-    async def _pre_warm_products_for_location(self, location: Location) -> None:
+    async def _pre_warm_products_for_location(
+        self, location: Location, *, for_notifications: bool = False
+    ) -> None:
         """
         Pre-warm AFD/HWO/SPS/SRF/CLI caches for a single location.
 
+        With ``for_notifications`` the HWO and SPS products that feed the
+        notification checks are awaited until fresh instead of being served
+        stale while they refresh in the background.
+
         Non-US locations and US locations without a populated ``cwa_office``
         are skipped. Each product fetch is wrapped in its own try/except so
         one failure (e.g. an NWS 404 for HWO) never prevents the next product
@@ -170,8 +217,11 @@ class MainWindowRefreshMixin:
             return
 
         async def _pre_warm_text_product(product_type: str) -> None:
+            fetch = service.get
+            if for_notifications and product_type in ("HWO", "SPS"):
+                fetch = service.get_fresh
             try:
-                await service.get(product_type, location.cwa_office)
+                await fetch(product_type, location.cwa_office)
             except TextProductFetchError:
                 logger.debug(
                     "Pre-warm %s for %s (%s) failed",
@@ -211,122 +261,102 @@ class MainWindowRefreshMixin:
             _pre_warm_daily_climate(),
         )
 
-    def _on_weather_data_received(self, weather_data, *, play_refresh_sound: bool = True) -> None:
-        """Handle received weather data (called on main thread)."""
+    def _on_weather_data_received(
+        self,
+        weather_data,
+        *,
+        play_refresh_sound: bool = True,
+        text: MainWindowText | None = None,
+    ) -> None:
+        """
+        Handle received weather data (called on main thread).
+
+        ``text`` is the section text prebuilt off the UI thread; when omitted
+        (e.g. showing cached data on a location switch) it is built here.
+        """
         # Guard: if we switched to All Locations view, ignore stale single-location data.
         if getattr(self, "_all_locations_active", False):
             logger.debug("Ignoring stale weather data received while All Locations view is active")
             return
         try:
-            self.app.current_weather_data = weather_data
-            self._update_precipitation_timeline_menu_state(weather_data)
-
-            # Use presenter to create formatted presentation
-            presentation = self.app.presenter.present(weather_data)
-
-            # Update current conditions (with data source attribution appended)
-            current_text = ""
-            if presentation.current_conditions:
-                current_text = presentation.current_conditions.fallback_text
-            else:
-                current_text = "No current conditions available."
-
-            # Append data source attribution to current conditions for screen reader accessibility
-            if presentation.source_attribution and presentation.source_attribution.summary_text:
-                current_text += f"\n\n{presentation.source_attribution.summary_text}"
-
-            self.current_conditions.SetValue(current_text)
-
-            # Update stale/cached data warning
-            if presentation.status_messages:
-                warning_text = " ".join(presentation.status_messages)
-                self.stale_warning_label.SetLabel(warning_text)
-            else:
-                self.stale_warning_label.SetLabel("")
-
-            # Update forecast
-            if presentation.forecast:
-                daily_sections = [presentation.forecast.daily_section_text]
-                if presentation.forecast.marine_section_text:
-                    daily_sections.append(presentation.forecast.marine_section_text)
-                daily_text = "\n\n".join(section for section in daily_sections if section).rstrip()
-                daily_text = daily_text or "No daily forecast available."
-                hourly_text = (
-                    presentation.forecast.hourly_section_text or "No hourly forecast available."
-                )
-                self._set_forecast_sections(daily_text, hourly_text)
-                if presentation.forecast.mobility_briefing:
-                    self.append_event_center_entry(
-                        presentation.forecast.mobility_briefing,
-                        category="Briefing",
+            with span("ui_update"):
+                self.app.current_weather_data = weather_data
+                self._update_precipitation_timeline_menu_state(weather_data)
+
+                if text is None:
+                    text = build_main_window_text(self.app.presenter, weather_data)
+
+                # Only touch controls whose text changed so screen readers keep
+                # their reading position in unchanged sections.
+                _set_text_if_changed(self.current_conditions, text.current_conditions)
+                if self.stale_warning_label.GetLabel() != text.status:
+                    self.stale_warning_label.SetLabel(text.status)
+                self._set_forecast_sections(text.daily_forecast, text.hourly_forecast)
+                if text.mobility_briefing:
+                    self.append_event_center_entry(text.mobility_briefing, category="Briefing")
+
+                # Update lifecycle label map from the current active alerts, then refresh the alerts list.
+                if weather_data.alerts is not None:
+                    from accessiweather.alert_lifecycle import compute_lifecycle_labels
+
+                    active_alerts = weather_data.alerts.get_active_alerts()
+                    self._alert_lifecycle_labels = compute_lifecycle_labels(active_alerts)
+
+                # Update alerts
+                self._update_alerts(weather_data.alerts, self._alert_lifecycle_labels)
+
+                # Process alert notifications on full refresh too (AlertManager deduplicates
+                # so the lightweight event poll won't re-notify for the same alerts).
+                if (
+                    weather_data.alerts
+                    and weather_data.alerts.has_alerts()
+                    and self.app.alert_notification_system
+                ):
+                    active_alerts = weather_data.alerts.get_active_alerts()
+                    logger.info(
+                        "[notify-ui] full refresh scheduling alert processing for %d active alert(s): %s",
+                        len(active_alerts),
+                        [
+                            {
+                                "id": alert.get_unique_id(),
+                                "event": alert.event,
+                                "severity": alert.severity,
+                            }
+                            for alert in active_alerts
+                        ],
+                    )
+                    self.app.run_async(
+                        self.app.alert_notification_system.process_and_notify(weather_data.alerts)
                     )
-            else:
-                self._set_forecast_sections(
-                    "No daily forecast available.", "No hourly forecast available."
-                )
-
-            # Update lifecycle label map from the current active alerts, then refresh the alerts list.
-            if weather_data.alerts is not None:
-                from accessiweather.alert_lifecycle import compute_lifecycle_labels
-
-                active_alerts = weather_data.alerts.get_active_alerts()
-                self._alert_lifecycle_labels = compute_lifecycle_labels(active_alerts)
-
-            # Update alerts
-            self._update_alerts(weather_data.alerts, self._alert_lifecycle_labels)
-
-            # Process alert notifications on full refresh too (AlertManager deduplicates
-            # so the lightweight event poll won't re-notify for the same alerts).
-            if (
-                weather_data.alerts
-                and weather_data.alerts.has_alerts()
-                and self.app.alert_notification_system
-            ):
-                active_alerts = weather_data.alerts.get_active_alerts()
-                logger.info(
-                    "[notify-ui] full refresh scheduling alert processing for %d active alert(s): %s",
-                    len(active_alerts),
-                    [
-                        {
-                            "id": alert.get_unique_id(),
-                            "event": alert.event,
-                            "severity": alert.severity,
-                        }
-                        for alert in active_alerts
-                    ],
-                )
-                self.app.run_async(
-                    self.app.alert_notification_system.process_and_notify(weather_data.alerts)
-                )
 
-            location = self.app.config_manager.get_current_location()
-            location_name = location.name if location else "Unknown"
-
-            # Update system tray tooltip with current weather
-            self.app.update_tray_tooltip(weather_data, location_name)
-
-            # Process notification events (AFD updates, severe risk changes)
-            self._process_notification_events(weather_data)
-
-            # Surface the refresh time in the status bar so users have a
-            # passive indicator of data freshness without needing to re-read
-            # any panels.  Silent (no screen-reader announcement).
-            self._set_last_updated_status()
-
-            if play_refresh_sound:
-                # Play the weather-updated sound on successful refresh.
-                try:
-                    settings = self.app.config_manager.get_settings()
-                    if getattr(settings, "sound_enabled", True):
-                        from accessiweather.notifications.sound_player import (
-                            play_data_updated_sound,
-                        )
-
-                        sound_pack = getattr(settings, "sound_pack", "default")
-                        muted_events = getattr(settings, "muted_sound_events", [])
-                        play_data_updated_sound(sound_pack, muted_events=muted_events)
-                except Exception as sound_exc:
-                    logger.debug(f"Failed to play weather-updated sound: {sound_exc}")
+                location = self.app.config_manager.get_current_location()
+                location_name = location.name if location else "Unknown"
+
+                # Update system tray tooltip with current weather
+                self.app.update_tray_tooltip(weather_data, location_name)
+
+                # Process notification events (AFD updates, severe risk changes)
+                self._process_notification_events(weather_data)
+
+                # Surface the refresh time in the status bar so users have a
+                # passive indicator of data freshness without needing to re-read
+                # any panels.  Silent (no screen-reader announcement).
+                self._set_last_updated_status()
+
+                if play_refresh_sound:
+                    # Play the weather-updated sound on successful refresh.
+                    try:
+                        settings = self.app.config_manager.get_settings()
+                        if getattr(settings, "sound_enabled", True):
+                            from accessiweather.notifications.sound_player import (
+                                play_data_updated_sound,
+                            )
+
+                            sound_pack = getattr(settings, "sound_pack", "default")
+                            muted_events = getattr(settings, "muted_sound_events", [])
+                            play_data_updated_sound(sound_pack, muted_events=muted_events)
+                    except Exception as sound_exc:
+                        logger.debug(f"Failed to play weather-updated sound: {sound_exc}")
 
         except Exception as e:
             logger.error(f"Failed to update weather display: {e}")
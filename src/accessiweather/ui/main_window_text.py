@@ -0,0 +1,70 @@
+"""
+Text for the main window's weather sections, built off the UI thread.
+
+This module deliberately avoids wx so the (potentially slow) presenter work
+can run in a worker thread; the UI thread then only copies finished strings
+into controls.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..display import WeatherPresenter
+    from ..display.presentation.models import WeatherPresentation
+    from ..models import WeatherData
+
+NO_CURRENT_CONDITIONS = "No current conditions available."
+NO_DAILY_FORECAST = "No daily forecast available."
+NO_HOURLY_FORECAST = "No hourly forecast available."
+
+
+@dataclass(frozen=True, slots=True)
+class MainWindowText:
+    """Final text for each main window weather section."""
+
+    current_conditions: str
+    status: str
+    daily_forecast: str
+    hourly_forecast: str
+    mobility_briefing: str | None = None
+
+
+def main_window_text_from_presentation(presentation: WeatherPresentation) -> MainWindowText:
+    """Flatten a presentation into the strings shown by the main window."""
+    if presentation.current_conditions:
+        current_text = presentation.current_conditions.fallback_text
+    else:
+        current_text = NO_CURRENT_CONDITIONS
+    # Data source attribution is appended to current conditions for screen reader accessibility.
+    if presentation.source_attribution and presentation.source_attribution.summary_text:
+        current_text += f"\n\n{presentation.source_attribution.summary_text}"
+
+    forecast = presentation.forecast
+    if forecast:
+        daily_sections = [forecast.daily_section_text]
+        if forecast.marine_section_text:
+            daily_sections.append(forecast.marine_section_text)
+        daily_text = "\n\n".join(section for section in daily_sections if section).rstrip()
+        daily_text = daily_text or NO_DAILY_FORECAST
+        hourly_text = forecast.hourly_section_text or NO_HOURLY_FORECAST
+        mobility_briefing = forecast.mobility_briefing or None
+    else:
+        daily_text, hourly_text, mobility_briefing = NO_DAILY_FORECAST, NO_HOURLY_FORECAST, None
+
+    return MainWindowText(
+        current_conditions=current_text,
+        status=" ".join(presentation.status_messages) if presentation.status_messages else "",
+        daily_forecast=daily_text,
+        hourly_forecast=hourly_text,
+        mobility_briefing=mobility_briefing,
+    )
+
+
+def build_main_window_text(
+    presenter: WeatherPresenter, weather_data: WeatherData
+) -> MainWindowText:
+    """Run the presenter and flatten its output; safe to call from a worker thread."""
+    return main_window_text_from_presentation(presenter.present(weather_data))
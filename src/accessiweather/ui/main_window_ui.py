@@ -350,6 +350,17 @@ class MainWindowUIMixin:
                 "Run Notification &Diagnostics",
                 "Run pass/fail notification system diagnostics",
             )
+            debug_menu.AppendSeparator()
+            self._debug_menu_items["performance"] = debug_menu.Append(
+                wx.ID_ANY,
+                "&Performance Metrics...",
+                "Show request, parse and display latency percentiles for this session",
+            )
+            self._debug_menu_items["performance_json"] = debug_menu.Append(
+                wx.ID_ANY,
+                "Save Performance Metrics as &JSON...",
+                "Write the recorded performance metrics to a JSON file",
+            )
             help_menu.AppendSubMenu(debug_menu, "&Debug", "Debug and test tools")
         help_menu.AppendSeparator()
 
@@ -409,6 +420,16 @@ class MainWindowUIMixin:
                 lambda e: self._on_debug_simulate_alert(),
                 self._debug_menu_items["simulate_alert"],
             )
+            self.Bind(
+                wx.EVT_MENU,
+                lambda e: self._on_show_performance_metrics(),
+                self._debug_menu_items["performance"],
+            )
+            self.Bind(
+                wx.EVT_MENU,
+                lambda e: self._on_save_performance_metrics(),
+                self._debug_menu_items["performance_json"],
+            )
         self.Bind(wx.EVT_MENU, lambda e: self._on_report_issue(), report_issue_item)
         self.Bind(wx.EVT_MENU, lambda e: self._on_about(), about_item)
         self._update_precipitation_timeline_menu_state(self)
@@ -12,7 +12,10 @@ from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import TYPE_CHECKING, Literal
 
+from .climatology_store import build_window_normals
+
 if TYPE_CHECKING:
+    from .climatology_store import ClimatologyStore
     from .openmeteo_client import OpenMeteoApiClient
 
 logger = logging.getLogger(__name__)
@@ -53,12 +56,106 @@ def _build_description(anomaly_f: float, years: int) -> str:
     )
 
 
+def _anchor_date(current_date: date, years_back: int) -> date:
+    """Return the same calendar day ``years_back`` years earlier."""
+    try:
+        return current_date.replace(year=current_date.year - years_back)
+    except ValueError:
+        # Feb 29 on a non-leap year
+        return current_date.replace(year=current_date.year - years_back, day=28)
+
+
+def _callout_from_yearly_means(
+    current_temp_f: float, yearly_means: list[float]
+) -> AnomalyCallout | None:
+    """Turn per-year window means into a callout, or None if too few years."""
+    if len(yearly_means) < MIN_YEARS_REQUIRED:
+        logger.debug(
+            "Insufficient historical data: %d years (need %d)",
+            len(yearly_means),
+            MIN_YEARS_REQUIRED,
+        )
+        return None
+
+    baseline = sum(yearly_means) / len(yearly_means)
+    anomaly = current_temp_f - baseline
+    severity = _classify_severity(anomaly)
+    description = _build_description(anomaly, len(yearly_means))
+
+    return AnomalyCallout(
+        temp_anomaly=anomaly,
+        temp_anomaly_description=description,
+        precip_anomaly_description=None,
+        severity=severity,
+    )
+
+
+def _refresh_climatology(
+    lat: float,
+    lon: float,
+    current_date: date,
+    client: OpenMeteoApiClient,
+    store: ClimatologyStore,
+) -> None:
+    """Download every baseline year in one archive request and store its normals."""
+    years = list(range(current_date.year - YEARS_OF_HISTORY, current_date.year))
+    start = date(years[0], 1, 1) - timedelta(days=DATE_WINDOW_DAYS)
+    end = min(
+        date(years[-1], 12, 31) + timedelta(days=DATE_WINDOW_DAYS),
+        store.archived_through(),
+    )
+    if start >= end:
+        return
+
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "daily": ["temperature_2m_mean"],
+        "temperature_unit": "fahrenheit",
+        "timezone": "auto",
+    }
+    try:
+        response = client._make_request("archive", params, use_archive=True)
+    except Exception as exc:
+        logger.debug("Climatology archive fetch failed: %s", exc)
+        return
+    if not response or "daily" not in response:
+        return
+
+    daily = response["daily"]
+    raw_temps = daily.get("temperature_2m_mean") or []
+    times = daily.get("time")
+    if isinstance(times, list) and len(times) == len(raw_temps):
+        # Align by the returned dates in case the archive trimmed either end.
+        temps: list[float | None] = [None] * ((end - start).days + 1)
+        for stamp, value in zip(times, raw_temps, strict=True):
+            try:
+                index = (date.fromisoformat(str(stamp)[:10]) - start).days
+            except ValueError:
+                continue
+            if 0 <= index < len(temps):
+                temps[index] = value
+    else:
+        temps = list(raw_temps)
+
+    store.put(
+        lat,
+        lon,
+        base_year=current_date.year,
+        fetched_through=end,
+        normals=build_window_normals(start, temps, years, DATE_WINDOW_DAYS),
+    )
+
+
 def compute_anomaly(
     lat: float,
     lon: float,
     current_temp_f: float,
     current_date: date,
     client: OpenMeteoApiClient,
+    store: ClimatologyStore | None = None,
 ) -> AnomalyCallout | None:
     """
     Compute historical temperature anomaly for the given location and date.
@@ -66,17 +163,28 @@ def compute_anomaly(
     Fetches the last YEARS_OF_HISTORY years of daily temperature data for a
     +/-DATE_WINDOW_DAYS window around current_date and computes the baseline mean.
 
+    With a ``store``, the baseline comes from persisted day-of-year normals
+    that are downloaded in one archive request and rebuilt only when a new
+    year of data is due; otherwise each year is fetched separately.
+
     Returns None if fewer than MIN_YEARS_REQUIRED years of data are available
     or if all fetches fail.
     """
+    if store is not None:
+        if store.needs_refresh(lat, lon, current_date, DATE_WINDOW_DAYS):
+            _refresh_climatology(lat, lon, current_date, client, store)
+        stored_means = [
+            store.window_mean(lat, lon, _anchor_date(current_date, years_back))
+            for years_back in range(1, YEARS_OF_HISTORY + 1)
+        ]
+        return _callout_from_yearly_means(
+            current_temp_f, [mean for mean in stored_means if mean is not None]
+        )
+
     yearly_means: list[float] = []
 
     for years_back in range(1, YEARS_OF_HISTORY + 1):
-        try:
-            anchor = current_date.replace(year=current_date.year - years_back)
-        except ValueError:
-            # Feb 29 on a non-leap year
-            anchor = current_date.replace(year=current_date.year - years_back, day=28)
+        anchor = _anchor_date(current_date, years_back)
 
         start = anchor - timedelta(days=DATE_WINDOW_DAYS)
         end = anchor + timedelta(days=DATE_WINDOW_DAYS)
@@ -115,22 +223,4 @@ def compute_anomaly(
 
         yearly_means.append(sum(valid) / len(valid))
 
-    if len(yearly_means) < MIN_YEARS_REQUIRED:
-        logger.debug(
-            "Insufficient historical data: %d years (need %d)",
-            len(yearly_means),
-            MIN_YEARS_REQUIRED,
-        )
-        return None
-
-    baseline = sum(yearly_means) / len(yearly_means)
-    anomaly = current_temp_f - baseline
-    severity = _classify_severity(anomaly)
-    description = _build_description(anomaly, len(yearly_means))
-
-    return AnomalyCallout(
-        temp_anomaly=anomaly,
-        temp_anomaly_description=description,
-        precip_anomaly_description=None,
-        severity=severity,
-    )
+    return _callout_from_yearly_means(current_temp_f, yearly_means)
@@ -23,6 +23,7 @@ from .models import (
     WeatherAlerts,
     WeatherData,
 )
+from .performance.timer import span
 from .weather_client_alerts import AlertAggregator
 from .weather_client_fusion import DataFusionEngine
 from .weather_client_parallel import ParallelFetchCoordinator
@@ -249,16 +250,17 @@ class WeatherClientAutoMixin:
             logger.warning("All sources failed for %s, checking cache", location.name)
             return self._handle_all_sources_failed(location, source_results)
 
-        merged_current, current_attribution = fusion_engine.merge_current_conditions(
-            source_results, location
-        )
-        requested_days = getattr(self.settings, "forecast_duration_days", 7)
-        merged_forecast, forecast_attribution = fusion_engine.merge_forecasts(
-            source_results, location, requested_days=requested_days
-        )
-        merged_hourly, hourly_attribution = fusion_engine.merge_hourly_forecasts(
-            source_results, location
-        )
+        with span("fusion_merge"):
+            merged_current, current_attribution = fusion_engine.merge_current_conditions(
+                source_results, location
+            )
+            requested_days = getattr(self.settings, "forecast_duration_days", 7)
+            merged_forecast, forecast_attribution = fusion_engine.merge_forecasts(
+                source_results, location, requested_days=requested_days
+            )
+            merged_hourly, hourly_attribution = fusion_engine.merge_hourly_forecasts(
+                source_results, location
+            )
 
         _want_start = getattr(self.settings, "notify_minutely_precipitation_start", False)
         _want_stop = getattr(self.settings, "notify_minutely_precipitation_stop", False)
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 from . import weather_client_nws as nws_client
 from .api.avwx_client import AvwxApiError, fetch_avwx_taf, is_us_station
+from .geo_index import GeoShape, SpatialIndex
 from .models import AviationData, Location, WeatherData
 from .utils import decode_taf_text
 
@@ -15,6 +16,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Advisories whose polygon passes this close to the station are shown even
+# when the station itself sits just outside the hazard area.
+ADVISORY_PROXIMITY_MILES = 25.0
+
 
 def _normalize_token(value: Any) -> str | None:
     if value is None:
@@ -78,11 +83,35 @@ def _extract_strings(value: Any) -> list[str]:
         return []
 
 
-def _filter_advisories(entries: list[dict[str, Any]], tokens: set[str]) -> list[dict[str, Any]]:
+def _filter_advisories(
+    entries: list[dict[str, Any]],
+    tokens: set[str],
+    point: tuple[float, float] | None = None,
+    within_miles: float = ADVISORY_PROXIMITY_MILES,
+) -> list[dict[str, Any]]:
+    """
+    Return the advisories relevant to a station.
+
+    When the station position is known, advisories that carry a polygon are
+    kept only if they cover or come within ``within_miles`` of it. Advisories
+    without usable geometry fall back to matching station tokens in their text.
+    """
     if not entries:
         return []
     normalized_tokens = {token for token in tokens if token}
-    if not normalized_tokens:
+
+    located: set[int] = set()
+    nearby: set[int] = set()
+    if point is not None:
+        shapes = [
+            (index, shape)
+            for index, entry in enumerate(entries)
+            if (shape := GeoShape.from_geojson(entry.get("geometry"))) is not None
+        ]
+        located = {index for index, _ in shapes}
+        nearby = set(SpatialIndex(shapes).within(point[0], point[1], within_miles))
+
+    if not normalized_tokens and not located:
         return entries
 
     keys = (
@@ -104,12 +133,22 @@ def _filter_advisories(entries: list[dict[str, Any]], tokens: set[str]) -> list[
     )
 
     filtered: list[dict[str, Any]] = []
-    for entry in entries:
+    for index, entry in enumerate(entries):
+        if index in located:
+            if index in nearby:
+                filtered.append(entry)
+            continue
+        if not normalized_tokens:
+            filtered.append(entry)
+            continue
+
         candidates: list[str] = []
         for key in keys:
             candidates.extend(_extract_strings(entry.get(key)))
         if not candidates:
-            candidates = _extract_strings(entry)
+            candidates = _extract_strings(
+                {key: value for key, value in entry.items() if key != "geometry"}
+            )
 
         matches = any(
             token in candidate
@@ -123,6 +162,20 @@ def _filter_advisories(entries: list[dict[str, Any]], tokens: set[str]) -> list[
     return filtered
 
 
+def _station_point(station_metadata: dict[str, Any] | None) -> tuple[float, float] | None:
+    """Return the station's ``(lat, lon)`` from its GeoJSON point, if present."""
+    geometry = (station_metadata or {}).get("geometry")
+    if not isinstance(geometry, dict) or geometry.get("type") != "Point":
+        return None
+    coordinates = geometry.get("coordinates")
+    if not isinstance(coordinates, list | tuple) or len(coordinates) < 2:
+        return None
+    lon, lat = coordinates[0], coordinates[1]
+    if not isinstance(lon, int | float) or not isinstance(lat, int | float):
+        return None
+    return float(lat), float(lon)
+
+
 def _default_atsu(props: dict[str, Any]) -> str | None:
     country = _normalize_token(props.get("country"))
     if country in {"US", "USA"}:
@@ -172,12 +225,13 @@ async def get_aviation_weather(
 
     await _populate_taf(client, aviation, station, http_client)
     tokens = _build_station_tokens(station, metadata_props, aviation.airport_name, cwsu_id)
+    point = _station_point(station_metadata)
     sigmet_atsu = _normalize_token(atsu) or _default_atsu(metadata_props)
 
     if include_sigmets:
-        await _populate_sigmets(client, aviation, tokens, sigmet_atsu, http_client)
+        await _populate_sigmets(client, aviation, tokens, sigmet_atsu, http_client, point)
     if include_cwas:
-        await _populate_cwas(client, aviation, tokens, metadata_props, cwsu_id, http_client)
+        await _populate_cwas(client, aviation, tokens, metadata_props, cwsu_id, http_client, point)
 
     return aviation
 
@@ -255,6 +309,7 @@ async def _populate_sigmets(
     tokens: set[str],
     sigmet_atsu: str | None,
     http_client: Any,
+    point: tuple[float, float] | None = None,
 ) -> None:
     try:
         sigmets = await nws_client.get_nws_sigmets(
@@ -264,7 +319,7 @@ async def _populate_sigmets(
             http_client,
             atsu=sigmet_atsu,
         )
-        aviation.active_sigmets = _filter_advisories(sigmets, tokens)
+        aviation.active_sigmets = _filter_advisories(sigmets, tokens, point)
     except Exception as exc:  # noqa: BLE001
         logger.debug("Failed to fetch SIGMET data: %s", exc)
 
@@ -276,6 +331,7 @@ async def _populate_cwas(
     metadata_props: dict[str, Any],
     cwsu_id: str | None,
     http_client: Any,
+    point: tuple[float, float] | None = None,
 ) -> None:
     target_cwsu = _normalize_token(cwsu_id) or _normalize_token(metadata_props.get("cwa"))
     if not target_cwsu:
@@ -286,7 +342,7 @@ async def _populate_cwas(
         cwas = await nws_client.get_nws_cwas(
             target_cwsu, client.nws_base_url, client.user_agent, client.timeout, http_client
         )
-        aviation.active_cwas = _filter_advisories(cwas, tokens)
+        aviation.active_cwas = _filter_advisories(cwas, tokens, point)
     except Exception as exc:  # noqa: BLE001
         logger.debug("Failed to fetch CWA data for %s: %s", target_cwsu, exc)
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import time
 from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 
@@ -15,6 +16,8 @@ from . import (
     weather_client_openmeteo as openmeteo_client,
 )
 from .cache import WeatherDataCache
+from .http_session import close_shared_transports, shared_transport
+from .location_classification import is_us_location
 from .models import (
     AppSettings,
     CurrentConditions,
@@ -25,9 +28,19 @@ from .models import (
     WeatherData,
 )
 from .pirate_weather_client import PirateWeatherClient
+from .refresh_scheduler import plan_refresh_interval
 from .services import EnvironmentalDataClient
 from .utils.retry import APITimeoutError, retry_with_backoff
 from .weather_client_auto import WeatherClientAutoMixin
+from .weather_client_batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    NWS_HOST,
+    OPENMETEO_HOST,
+    PIRATE_WEATHER_HOST,
+    BatchRefreshCoordinator,
+    ProgressCallback,
+    order_by_priority,
+)
 from .weather_client_fetch import WeatherClientFetchMixin
 from .weather_client_notification import WeatherClientNotificationMixin
 from .weather_client_sources import WeatherClientSourcesMixin
@@ -223,6 +236,36 @@ class WeatherClient(
             return True
         return self._utcnow() - last_poll >= target_interval
 
+    def suggest_refresh_interval(
+        self, location: Location, *, active_location: bool = True
+    ) -> timedelta | None:
+        """
+        Return when ``location`` should next get a full background refresh.
+
+        Combines known active alerts, forecast precipitation risk (the same
+        signal that drives fast minutely polling) and the NWS forecast's own
+        ``Cache-Control``/``Expires`` freshness. Locations other than the active
+        one only get planned while they carry active alerts; ``None`` means no
+        scheduled refresh is needed.
+        """
+        active_alerts = self._has_known_active_alerts(location)
+        if not active_location and not active_alerts:
+            return None
+        base_interval = timedelta(
+            minutes=max(1, int(getattr(self.settings, "update_interval_minutes", 10)))
+        )
+        fresh_for = None
+        if getattr(self, "data_source", "auto") in ("auto", "nws"):
+            fresh_until = nws_client.nws_forecast_fresh_until(location)
+            if fresh_until is not None:
+                fresh_for = timedelta(seconds=max(0.0, fresh_until - time.time()))
+        return plan_refresh_interval(
+            base_interval,
+            active_alerts=active_alerts,
+            precipitation_likely=self._should_use_fast_minutely_poll(location),
+            fresh_for=fresh_for,
+        )
+
     async def _fetch_nws_cancel_references(self) -> set[str]:
         """Fetch recent NWS cancel references for verifying genuine cancellations."""
         return await nws_client.fetch_nws_cancel_references(
@@ -236,15 +279,15 @@ class WeatherClient(
     def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create the reusable HTTP client with optimized connection pooling."""
         if self._http_client is None or getattr(self._http_client, "is_closed", False):
-            # Optimized connection pool for concurrent requests:
-            # - max_connections=30: Allows multiple concurrent API calls
-            # - max_keepalive_connections=15: Reuses connections for performance
-            # - timeout with connect=3.0: Fast connection timeout
+            # Requests go through the process-wide pooled transport (see
+            # http_session), which owns the connection limits and is shared
+            # with every other API client. connect=3.0 keeps connection
+            # failures fast.
             timeout_config = httpx.Timeout(connect=3.0, read=5.0, write=5.0, pool=5.0)
             client = httpx.AsyncClient(
                 timeout=timeout_config,
                 follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=15, max_connections=30),
+                transport=shared_transport(),
             )
             # Use explicit test mode flag instead of brittle isinstance check
             # The _test_mode flag is set in __init__ based on PYTEST_CURRENT_TEST env var
@@ -391,10 +434,11 @@ class WeatherClient(
         return self._get_forecast_days_for_source(location, "openmeteo") > 7
 
     async def close(self) -> None:
-        """Close the HTTP client and release resources."""
+        """Close the HTTP client and release the shared connection pool."""
         if self._http_client is not None and not self._http_client.is_closed:
             await self._http_client.aclose()
             self._http_client = None
+        await close_shared_transports()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -438,28 +482,84 @@ class WeatherClient(
             logger.error(f"Cache pre-warm failed for {location.name}: {exc}")
             return False
 
-    async def pre_warm_batch(self, locations: list[Location]) -> int:
+    async def pre_warm_batch(
+        self,
+        locations: list[Location],
+        *,
+        active_location: Location | None = None,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        host_budgets: dict[str, int] | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> int:
         """
-        Pre-warm forecast cache for multiple locations.
+        Pre-warm forecast cache for multiple locations concurrently.
+
+        Locations are refreshed at most ``max_concurrency`` at a time, with
+        ``host_budgets`` capping how many refreshes hit each provider host.
+        ``active_location`` is started first, followed by locations that
+        currently have active alerts. ``on_progress`` is called as each
+        location finishes so callers can render results incrementally.
 
         Returns the number of locations successfully warmed.
         """
         if not locations:
             return 0
 
-        warmed = 0
-        for loc in locations:
-            if await self.pre_warm_cache(loc):
-                warmed += 1
-        return warmed
+        ordered = order_by_priority(
+            locations,
+            active_location=active_location,
+            has_active_alerts=self._has_known_active_alerts,
+        )
+        coordinator = BatchRefreshCoordinator(
+            max_concurrency=max_concurrency, host_budgets=host_budgets
+        )
+        return await coordinator.run(
+            ordered,
+            self.pre_warm_cache,
+            hosts_for=self._provider_hosts_for,
+            on_progress=on_progress,
+        )
+
+    def _has_known_active_alerts(self, location: Location) -> bool:
+        """
+        Return True when the alerts last seen for a location include active ones.
 
-    def get_cached_weather(self, location: Location) -> WeatherData | None:
+        Only in-memory state is consulted (the latest alert poll, which also
+        covers the batched poll of other saved locations, then the latest full
+        refresh): this runs on the event loop while planning refreshes, so it
+        must not read the offline cache.
+        """
+        key = self._location_key(location)
+        alerts = getattr(self, "_previous_alerts", {}).get(key)
+        if alerts is None:
+            latest = getattr(self, "_latest_weather_by_location", {}).get(key)
+            alerts = latest.alerts if latest is not None else None
+        return bool(alerts is not None and alerts.get_active_alerts())
+
+    def _provider_hosts_for(self, location: Location) -> set[str]:
+        """Return the provider hosts a full refresh of ``location`` will contact."""
+        source = getattr(self, "data_source", "auto")
+        if source == "nws":
+            return {NWS_HOST}
+        if source == "openmeteo":
+            return {OPENMETEO_HOST}
+        if source == "pirateweather":
+            return {PIRATE_WEATHER_HOST}
+        if is_us_location(location):
+            return {NWS_HOST, OPENMETEO_HOST}
+        return {OPENMETEO_HOST}
+
+    def get_cached_weather(
+        self, location: Location, *, sections: Sequence[str] | None = None
+    ) -> WeatherData | None:
         """
         Retrieve cached weather data for a location without triggering a network fetch.
 
         Args:
         ----
             location: The location to retrieve cached data for.
+            sections: Only decode these ``WeatherData`` fields from the offline
+                cache (e.g. ``("current", "alerts")``); ``None`` loads everything.
 
         Returns:
         -------
@@ -470,7 +570,13 @@ class WeatherClient(
             return None
         # Load with allow_stale=True so we can show something immediately
         # The calling code can check .stale property if it cares
-        return self.offline_cache.load(location, allow_stale=True)
+        return self.offline_cache.load(location, allow_stale=True, sections=sections)
+
+    def locations_with_cached_data(self, locations: Sequence[Location]) -> list[Location]:
+        """Return the locations that already have offline-cached data (one index lookup)."""
+        if not self.offline_cache:
+            return []
+        return self.offline_cache.locations_with_data(locations)
 
     async def get_weather_data(
         self, location: Location, force_refresh: bool = False, skip_notifications: bool = False
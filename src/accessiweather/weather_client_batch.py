@@ -0,0 +1,163 @@
+"""Bounded-parallel refresh engine for multiple saved locations."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+
+from .models import Location
+
+logger = logging.getLogger(__name__)
+
+NWS_HOST = "api.weather.gov"
+OPENMETEO_HOST = "api.open-meteo.com"
+PIRATE_WEATHER_HOST = "api.pirateweather.net"
+
+DEFAULT_BATCH_CONCURRENCY = 4
+# Maximum number of location refreshes allowed to talk to one provider host at
+# the same time. Each refresh issues several requests, so these stay small.
+DEFAULT_HOST_BUDGETS: dict[str, int] = {
+    NWS_HOST: 3,
+    OPENMETEO_HOST: 3,
+    PIRATE_WEATHER_HOST: 2,
+}
+
+ProgressCallback = Callable[[Location, bool, int, int], None]
+"""Called as ``(location, success, completed, total)`` when each location finishes."""
+
+
+def order_by_priority(
+    locations: Sequence[Location],
+    *,
+    active_location: Location | None = None,
+    has_active_alerts: Callable[[Location], bool] | None = None,
+) -> list[Location]:
+    """
+    Return locations ordered for refresh: active first, then alerting, then the rest.
+
+    The relative order of the input is preserved inside each tier.
+    """
+
+    def tier(location: Location) -> int:
+        if active_location is not None and location.name == active_location.name:
+            return 0
+        if has_active_alerts is not None:
+            try:
+                if has_active_alerts(location):
+                    return 1
+            except Exception:  # noqa: BLE001
+                logger.debug("Alert check failed for %s", location.name, exc_info=True)
+        return 2
+
+    return sorted(locations, key=tier)
+
+
+class BatchRefreshCoordinator:
+    """
+    Refresh many locations concurrently under a global and per-host limit.
+
+    Locations are started in the order given (callers pass them already
+    prioritised), at most ``max_concurrency`` at a time. A location that will
+    contact a provider host also takes a slot from that host's budget, so a
+    batch of US locations never has more than ``host_budgets[NWS_HOST]``
+    refreshes hitting api.weather.gov at once.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        host_budgets: dict[str, int] | None = None,
+    ):
+        """
+        Initialize the coordinator.
+
+        Args:
+            max_concurrency: Maximum number of locations refreshed at once
+            host_budgets: Per-host limit on concurrent location refreshes
+
+        """
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.host_budgets = dict(DEFAULT_HOST_BUDGETS if host_budgets is None else host_budgets)
+
+    async def run(
+        self,
+        locations: Sequence[Location],
+        refresh: Callable[[Location], Awaitable[bool]],
+        *,
+        hosts_for: Callable[[Location], Iterable[str]] | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> int:
+        """
+        Refresh every location and return how many succeeded.
+
+        Args:
+            locations: Locations in the order they should be started
+            refresh: Coroutine function refreshing one location, returning success
+            hosts_for: Returns the provider hosts a location's refresh will contact
+            on_progress: Invoked after each location completes
+
+        """
+        total = len(locations)
+        if total == 0:
+            return 0
+
+        host_semaphores = {
+            host: asyncio.Semaphore(max(1, int(limit))) for host, limit in self.host_budgets.items()
+        }
+        pending: asyncio.Queue[Location] = asyncio.Queue()
+        for location in locations:
+            pending.put_nowait(location)
+
+        succeeded = 0
+        completed = 0
+
+        async def refresh_one(location: Location) -> bool:
+            hosts: list[str] = []
+            if hosts_for is not None:
+                try:
+                    hosts = sorted(set(hosts_for(location)))
+                except Exception:  # noqa: BLE001
+                    logger.debug("Host lookup failed for %s", location.name, exc_info=True)
+            # Acquire host slots in a stable order so two workers can never
+            # hold one host each while waiting on the other.
+            acquired: list[asyncio.Semaphore] = []
+            try:
+                for host in hosts:
+                    semaphore = host_semaphores.get(host)
+                    if semaphore is not None:
+                        await semaphore.acquire()
+                        acquired.append(semaphore)
+                return bool(await refresh(location))
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(f"Batch refresh failed for {location.name}: {exc}")
+                return False
+            finally:
+                for semaphore in reversed(acquired):
+                    semaphore.release()
+
+        async def worker() -> None:
+            nonlocal succeeded, completed
+            while True:
+                try:
+                    location = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                success = await refresh_one(location)
+                completed += 1
+                if success:
+                    succeeded += 1
+                if on_progress is not None:
+                    try:
+                        on_progress(location, success, completed, total)
+                    except Exception:  # noqa: BLE001
+                        logger.debug("Batch progress callback raised", exc_info=True)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_concurrency, total))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                if not task.done():
+                    task.cancel()
+        return succeeded
@@ -13,6 +13,7 @@ from .models import (
     WeatherAlerts,
     WeatherData,
 )
+from .performance.timer import span
 from .pirate_weather_client import PirateWeatherApiError
 
 if TYPE_CHECKING:
@@ -85,15 +86,18 @@ class WeatherClientFetchMixin:
                     raise PirateWeatherApiError("Pirate Weather API key not configured")
 
                 # Parallelize API calls for better performance
-                current, forecast, hourly_forecast, alerts = await asyncio.gather(
-                    pirate_weather_client.get_current_conditions(location),
-                    pirate_weather_client.get_forecast(
-                        location,
-                        days=self._get_forecast_days_for_source(location, source="pirateweather"),
-                    ),
-                    pirate_weather_client.get_hourly_forecast(location),
-                    pirate_weather_client.get_alerts(location),
-                )
+                with span("provider_fetch", provider="pirateweather"):
+                    current, forecast, hourly_forecast, alerts = await asyncio.gather(
+                        pirate_weather_client.get_current_conditions(location),
+                        pirate_weather_client.get_forecast(
+                            location,
+                            days=self._get_forecast_days_for_source(
+                                location, source="pirateweather"
+                            ),
+                        ),
+                        pirate_weather_client.get_hourly_forecast(location),
+                        pirate_weather_client.get_alerts(location),
+                    )
 
                 weather_data.current = current
                 weather_data.forecast = forecast
@@ -123,7 +127,8 @@ class WeatherClientFetchMixin:
         elif api_choice == "openmeteo":
             # Use Open-Meteo API only (user explicitly selected this source)
             try:
-                current, forecast, hourly_forecast = await self._fetch_openmeteo_data(location)
+                with span("provider_fetch", provider="openmeteo"):
+                    current, forecast, hourly_forecast = await self._fetch_openmeteo_data(location)
 
                 weather_data.current = current
                 weather_data.forecast = forecast
@@ -149,27 +154,32 @@ class WeatherClientFetchMixin:
                     location, source="nws"
                 )
 
-                if use_openmeteo_forecast:
-                    current_task = asyncio.create_task(self._get_nws_current_conditions(location))
-                    forecast_task = asyncio.create_task(self._get_openmeteo_forecast(location))
-                    discussion_task = asyncio.create_task(self._get_nws_discussion_only(location))
-                    alerts_task = asyncio.create_task(self._get_nws_alerts(location))
-                    hourly_task = asyncio.create_task(self._get_nws_hourly_forecast(location))
-
-                    current = await current_task
-                    forecast = await forecast_task
-                    discussion, discussion_issuance_time = await discussion_task
-                    alerts = await alerts_task
-                    hourly_forecast = await hourly_task
-                else:
-                    (
-                        current,
-                        forecast,
-                        discussion,
-                        discussion_issuance_time,
-                        alerts,
-                        hourly_forecast,
-                    ) = await self._fetch_nws_data(location)
+                with span("provider_fetch", provider="nws"):
+                    if use_openmeteo_forecast:
+                        current_task = asyncio.create_task(
+                            self._get_nws_current_conditions(location)
+                        )
+                        forecast_task = asyncio.create_task(self._get_openmeteo_forecast(location))
+                        discussion_task = asyncio.create_task(
+                            self._get_nws_discussion_only(location)
+                        )
+                        alerts_task = asyncio.create_task(self._get_nws_alerts(location))
+                        hourly_task = asyncio.create_task(self._get_nws_hourly_forecast(location))
+
+                        current = await current_task
+                        forecast = await forecast_task
+                        discussion, discussion_issuance_time = await discussion_task
+                        alerts = await alerts_task
+                        hourly_forecast = await hourly_task
+                    else:
+                        (
+                            current,
+                            forecast,
+                            discussion,
+                            discussion_issuance_time,
+                            alerts,
+                            hourly_forecast,
+                        ) = await self._fetch_nws_data(location)
 
                 weather_data.current = current
                 weather_data.forecast = forecast
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 from dataclasses import replace
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import Any
 
+from accessiweather.models.time_index import TimeIndex, epoch_seconds
 from accessiweather.models.weather import Forecast, HourlyForecast, Location, SourceData
 
 logger = logging.getLogger(__name__)
@@ -209,11 +210,14 @@ def overlay_hourly_pressure(
     display_hourly: HourlyForecast, pressure_hourly: HourlyForecast
 ) -> HourlyForecast:
     """Copy pressure-only fields from a pressure-capable hourly source by nearest time."""
-    pressure_periods = [
-        period
-        for period in pressure_hourly.periods
-        if period.pressure_in is not None or period.pressure_mb is not None
-    ]
+    pressure_periods = TimeIndex(
+        (
+            period
+            for period in pressure_hourly.periods
+            if period.pressure_in is not None or period.pressure_mb is not None
+        ),
+        lambda period: period.start_time,
+    )
     if not pressure_periods:
         return display_hourly
 
@@ -246,31 +250,22 @@ def overlay_hourly_pressure(
     return replace(display_hourly, periods=overlaid_periods)
 
 
-def nearest_hourly_pressure_period(target: datetime, pressure_periods: list):
-    """Find a pressure period close enough to the target display hour."""
+def nearest_hourly_pressure_period(target: datetime, pressure_periods: list | TimeIndex):
+    """
+    Find a pressure period close enough to the target display hour.
+
+    Pass a prebuilt :class:`TimeIndex` when matching many targets against the
+    same periods; a plain list is indexed on each call.
+    """
     target_ts = datetime_timestamp(target)
     if target_ts is None:
         return None
 
-    closest = None
-    best_delta = None
-    for period in pressure_periods:
-        period_ts = datetime_timestamp(period.start_time)
-        if period_ts is None:
-            continue
-        delta = abs(period_ts - target_ts)
-        if best_delta is None or delta < best_delta:
-            closest = period
-            best_delta = delta
-
-    if best_delta is None or best_delta > 90 * 60:
-        return None
-    return closest
+    if not isinstance(pressure_periods, TimeIndex):
+        pressure_periods = TimeIndex(pressure_periods, lambda period: period.start_time)
+    return pressure_periods.nearest(target_ts, max_delta_seconds=90 * 60)
 
 
 def datetime_timestamp(value: datetime | None) -> float | None:
     """Normalize aware and naive datetimes to comparable timestamps."""
-    if value is None:
-        return None
-    value = value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
-    return value.timestamp()
+    return epoch_seconds(value)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
+from collections.abc import Sequence
 
 from .alert_lifecycle import diff_alerts
 from .models import (
@@ -114,6 +115,89 @@ class WeatherClientNotificationMixin:
 
         return weather_data
 
+    def _batched_alert_zones(self, location: Location) -> list[str]:
+        """Return the stored NWS zones a batched alert poll should cover for ``location``."""
+        if not self._is_us_location(location):
+            return []
+        radius = getattr(self.settings, "alert_radius_type", "county")
+        if radius == "county":
+            zones = [location.county_zone_id]
+        elif radius in ("zone", "point"):
+            # Point locations fetch their own zones; alert polygons then narrow
+            # the result to the exact location (see get_nws_alerts_for_zones).
+            zones = [location.county_zone_id, location.forecast_zone_id]
+        else:
+            # State queries don't map onto zone ids; those locations keep
+            # relying on the full refresh.
+            return []
+        return [zone for zone in dict.fromkeys(zones) if zone]
+
+    async def get_batched_alert_event_data(
+        self, locations: Sequence[Location]
+    ) -> list[WeatherData]:
+        """
+        Poll NWS alerts for many saved locations with a single zone-list query.
+
+        Only locations whose county/forecast zones are already stored are
+        covered. Each location's share of the result is diffed against its own
+        previous snapshot, exactly like :meth:`get_notification_event_data`.
+        Returns one ``WeatherData`` (alerts and lifecycle diff only) per covered
+        location; an empty list when the poll could not run.
+        """
+        if self.data_source not in ("auto", "nws"):
+            return []
+
+        zones_by_key: dict[str, list[str]] = {}
+        locations_by_key: dict[str, Location] = {}
+        points_by_key: dict[str, tuple[float, float]] = {}
+        point_mode = getattr(self.settings, "alert_radius_type", "county") == "point"
+        for location in locations:
+            zones = self._batched_alert_zones(location)
+            if zones:
+                key = self._location_key(location)
+                zones_by_key[key] = zones
+                locations_by_key[key] = location
+                if point_mode:
+                    points_by_key[key] = (location.latitude, location.longitude)
+        if not zones_by_key:
+            return []
+
+        from . import weather_client_base as base_module
+
+        try:
+            alerts_by_key = await base_module.nws_client.get_nws_alerts_for_zones(
+                zones_by_key,
+                self.nws_base_url,
+                self.user_agent,
+                self.timeout,
+                client=self._get_http_client(),
+                points_by_key=points_by_key or None,
+            )
+        except Exception as exc:
+            # Keep the previous snapshots: an outage must not read as "all clear".
+            logger.warning(
+                "Batched alert poll failed for %d location(s): %s", len(zones_by_key), exc
+            )
+            return []
+
+        cancel_refs = await self._fetch_nws_cancel_references()
+        results: list[WeatherData] = []
+        for key, alerts in alerts_by_key.items():
+            if self.data_source == "auto":
+                alerts = AlertAggregator().aggregate_alerts(alerts, None)
+            weather_data = WeatherData(location=locations_by_key[key], alerts=alerts)
+            weather_data.alert_lifecycle_diff = diff_alerts(
+                self._previous_alerts.get(key), alerts, confirmed_cancel_ids=cancel_refs
+            )
+            self._previous_alerts[key] = alerts
+            results.append(weather_data)
+        logger.debug(
+            "Batched alert poll covered %d location(s) with %d zone(s)",
+            len(results),
+            len({zone for zones in zones_by_key.values() for zone in zones}),
+        )
+        return results
+
     async def _get_pirate_weather_minutely(
         self, location: Location
     ) -> MinutelyPrecipitationForecast | None:
@@ -15,7 +15,11 @@ from .utils.retry_utils import (
     async_retry_with_backoff,
     is_retryable_http_error,
 )
-from .weather_client_nws_alerts import fetch_nws_cancel_references, get_nws_alerts
+from .weather_client_nws_alerts import (
+    fetch_nws_cancel_references,
+    get_nws_alerts,
+    get_nws_alerts_for_zones,
+)
 from .weather_client_nws_aviation import (
     get_nws_cwas,
     get_nws_marine_forecast,
@@ -23,7 +27,13 @@ from .weather_client_nws_aviation import (
     get_nws_sigmets,
     get_nws_tafs,
 )
-from .weather_client_nws_common import _client_get, _extract_wind_speed_mph, logger
+from .weather_client_nws_common import (
+    _client_get,
+    _extract_wind_speed_mph,
+    _get_nws_point_data,
+    logger,
+    nws_forecast_fresh_until,
+)
 from .weather_client_nws_current import (
     get_nws_current_conditions,
     get_nws_primary_station_info,
@@ -58,6 +68,21 @@ def set_zone_drift_sink(sink):
     _common.set_zone_drift_sink(sink)
 
 
+def set_points_cache(cache):
+    """Register the persistent /points cache on the shared NWS implementation."""
+    _common.set_points_cache(cache)
+
+
+def set_validator_store(store):
+    """Register the conditional-request validator store on the shared NWS implementation."""
+    _common.set_validator_store(store)
+
+
+def set_cancel_reference_tracker(tracker):
+    """Register the incremental cancel-reference tracker on the shared NWS implementation."""
+    _common.set_cancel_reference_tracker(tracker)
+
+
 def _apply_zone_drift_correction(location: Location, point_data: dict | None) -> None:
     """Compatibility wrapper that honors patches to weather_client_nws.wx."""
     _common.wx = wx
@@ -86,22 +111,20 @@ async def get_nws_all_data_parallel(
     Returns: (current, forecast, discussion, discussion_issuance_time, alerts, hourly_forecast)
     """
     try:
-        # First, fetch grid data once
-        grid_url = f"{nws_base_url}/points/{location.latitude},{location.longitude}"
+        # First, resolve grid data once (served from the points cache when fresh)
         headers = {"User-Agent": user_agent}
-        feature_headers = headers.copy()
-        feature_headers["Feature-Flags"] = "forecast_temperature_qv, forecast_wind_speed_qv"
-
-        response = await _client_get(client, grid_url, headers=headers)
-        response.raise_for_status()
-        grid_data = response.json()
+        grid_data = await _get_nws_point_data(
+            client, nws_base_url, location.latitude, location.longitude, headers
+        )
 
         # Opportunistic zone-metadata drift correction. Never raises.
         _apply_zone_drift_correction(location, grid_data)
 
         # Now fetch all other data in parallel, reusing grid_data
         current_task = asyncio.create_task(
-            get_nws_current_conditions(location, nws_base_url, user_agent, timeout, client)
+            get_nws_current_conditions(
+                location, nws_base_url, user_agent, timeout, client, grid_data=grid_data
+            )
         )
         forecast_task = asyncio.create_task(
             get_nws_forecast_and_discussion(
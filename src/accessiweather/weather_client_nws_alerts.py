@@ -3,10 +3,43 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
+from .geo_index import GeoShape, SpatialIndex
 from .weather_client_nws_common import *  # noqa: F403
 from .weather_client_nws_parsers import parse_nws_alerts
 
 
+def _parse_alerts_response(response: httpx.Response) -> WeatherAlerts:
+    response.raise_for_status()
+    return parse_nws_alerts(response.json())
+
+
+def _parse_alert_features(response: httpx.Response) -> list[dict]:
+    response.raise_for_status()
+    return response.json().get("features", [])
+
+
+async def _resolve_point_data(
+    location: Location,
+    nws_base_url: str,
+    headers: dict[str, str],
+    timeout: float,
+    client: httpx.AsyncClient | None,
+) -> dict[str, Any]:
+    """Return ``/points`` metadata for alert zone resolution via the shared points cache."""
+    if client is not None:
+        return await _get_nws_point_data(
+            client, nws_base_url, location.latitude, location.longitude, headers
+        )
+    async with httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, transport=shared_transport()
+    ) as new_client:
+        return await _get_nws_point_data(
+            new_client, nws_base_url, location.latitude, location.longitude, headers
+        )
+
+
 @async_retry_with_backoff(max_attempts=3, base_delay=1.0, timeout=20.0)
 async def get_nws_alerts(
     location: Location,
@@ -42,16 +75,9 @@ async def get_nws_alerts(
                 params = {"zone": location.county_zone_id, "status": "actual"}
             else:
                 # Get county zone from point data
-                point_url = f"{nws_base_url}/points/{location.latitude},{location.longitude}"
-                if client is not None:
-                    point_response = await _client_get(client, point_url, headers=headers)
-                else:
-                    async with httpx.AsyncClient(
-                        timeout=timeout, follow_redirects=True
-                    ) as new_client:
-                        point_response = await new_client.get(point_url, headers=headers)
-                point_response.raise_for_status()
-                point_data = point_response.json()
+                point_data = await _resolve_point_data(
+                    location, nws_base_url, headers, timeout, client
+                )
 
                 county_url = point_data.get("properties", {}).get("county")
                 if county_url and "/county/" in county_url:
@@ -66,14 +92,7 @@ async def get_nws_alerts(
 
         elif alert_radius_type == "state":
             # Get state from location - need to fetch point data first
-            point_url = f"{nws_base_url}/points/{location.latitude},{location.longitude}"
-            if client is not None:
-                point_response = await _client_get(client, point_url, headers=headers)
-            else:
-                async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
-                    point_response = await new_client.get(point_url, headers=headers)
-            point_response.raise_for_status()
-            point_data = point_response.json()
+            point_data = await _resolve_point_data(location, nws_base_url, headers, timeout, client)
             state = (
                 point_data.get("properties", {})
                 .get("relativeLocation", {})
@@ -98,16 +117,9 @@ async def get_nws_alerts(
                 zone_ids.append(location.forecast_zone_id)
 
             if not zone_ids:
-                point_url = f"{nws_base_url}/points/{location.latitude},{location.longitude}"
-                if client is not None:
-                    point_response = await _client_get(client, point_url, headers=headers)
-                else:
-                    async with httpx.AsyncClient(
-                        timeout=timeout, follow_redirects=True
-                    ) as new_client:
-                        point_response = await new_client.get(point_url, headers=headers)
-                point_response.raise_for_status()
-                point_data = point_response.json()
+                point_data = await _resolve_point_data(
+                    location, nws_base_url, headers, timeout, client
+                )
 
                 county_url = point_data.get("properties", {}).get("county")
                 if county_url and "/county/" in county_url:
@@ -120,19 +132,21 @@ async def get_nws_alerts(
 
             if zone_ids:
                 combined_features: list[dict] = []
-                async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+                async with httpx.AsyncClient(
+                    timeout=timeout, follow_redirects=True, transport=shared_transport()
+                ) as new_client:
                     active_client = client or new_client
                     for zone_id in zone_ids:
                         try:
-                            response = await _client_get(
-                                active_client,
-                                alerts_url,
-                                headers=headers,
-                                params={"zone": zone_id, "status": "actual"},
+                            combined_features.extend(
+                                await _conditional_get(
+                                    active_client,
+                                    alerts_url,
+                                    _parse_alert_features,
+                                    headers=headers,
+                                    params={"zone": zone_id, "status": "actual"},
+                                )
                             )
-                            response.raise_for_status()
-                            alerts_data = response.json()
-                            combined_features.extend(alerts_data.get("features", []))
                         except Exception as exc:  # noqa: BLE001
                             logger.warning("Failed getting alerts for zone %s: %s", zone_id, exc)
                 return parse_nws_alerts({"features": combined_features})
@@ -154,15 +168,15 @@ async def get_nws_alerts(
 
         # Use provided client or create a new one
         if client is not None:
-            response = await _client_get(client, alerts_url, headers=headers, params=params)
-            response.raise_for_status()
-            alerts_data = response.json()
-            return parse_nws_alerts(alerts_data)
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
-            response = await new_client.get(alerts_url, params=params, headers=headers)
-            response.raise_for_status()
-            alerts_data = response.json()
-            return parse_nws_alerts(alerts_data)
+            return await _conditional_get(
+                client, alerts_url, _parse_alerts_response, headers=headers, params=params
+            )
+        async with httpx.AsyncClient(
+            timeout=timeout, follow_redirects=True, transport=shared_transport()
+        ) as new_client:
+            return await _conditional_get(
+                new_client, alerts_url, _parse_alerts_response, headers=headers, params=params
+            )
 
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Failed to get NWS alerts: {exc}")
@@ -171,6 +185,102 @@ async def get_nws_alerts(
         return WeatherAlerts(alerts=[])
 
 
+# /alerts/active accepts a comma-separated zone list; chunking keeps the query
+# string well below common proxy URL limits.
+MAX_ZONES_PER_ALERT_QUERY = 50
+
+
+def _feature_zone_ids(feature: dict[str, Any]) -> set[str]:
+    """Return the UGC zone ids an alert feature applies to."""
+    properties = feature.get("properties") or {}
+    geocode = properties.get("geocode") or {}
+    zone_ids = {str(code).upper() for code in geocode.get("UGC") or [] if code}
+    for zone_url in properties.get("affectedZones") or []:
+        if isinstance(zone_url, str) and zone_url:
+            zone_ids.add(zone_url.rstrip("/").rsplit("/", 1)[-1].upper())
+    return zone_ids
+
+
+@async_retry_with_backoff(max_attempts=3, base_delay=1.0, timeout=20.0)
+async def get_nws_alerts_for_zones(
+    zones_by_key: dict[str, list[str]],
+    nws_base_url: str,
+    user_agent: str,
+    timeout: float,
+    client: httpx.AsyncClient | None = None,
+    points_by_key: Mapping[str, tuple[float, float]] | None = None,
+) -> dict[str, WeatherAlerts]:
+    """
+    Fetch active alerts for many locations with one zone-list query per chunk.
+
+    ``zones_by_key`` maps a caller-chosen location key to that location's
+    county/forecast zone ids. All zones are fetched together from
+    ``/alerts/active?zone=A,B,...`` and each returned feature is assigned back
+    to every location whose zones it covers.
+
+    Keys listed in ``points_by_key`` (``key -> (lat, lon)``) get point
+    semantics instead, like ``/alerts/active?point=``: alerts with a polygon
+    must contain the point, and only alerts without geometry fall back to the
+    zone match. The polygons are indexed once for all such locations.
+
+    Unlike :func:`get_nws_alerts` a failed request raises instead of returning
+    an empty result, so callers never mistake an outage for "all clear".
+    """
+    alerts_url = f"{nws_base_url}/alerts/active"
+    headers = {"User-Agent": user_agent}
+    all_zones = sorted({zone.upper() for zones in zones_by_key.values() for zone in zones if zone})
+
+    async def _fetch(http_client: httpx.AsyncClient) -> list[dict]:
+        features: dict[str, dict] = {}
+        for start in range(0, len(all_zones), MAX_ZONES_PER_ALERT_QUERY):
+            chunk = all_zones[start : start + MAX_ZONES_PER_ALERT_QUERY]
+            for feature in await _conditional_get(
+                http_client,
+                alerts_url,
+                _parse_alert_features,
+                headers=headers,
+                params={"zone": ",".join(chunk), "status": "actual"},
+            ):
+                feature_id = feature.get("id") or (feature.get("properties") or {}).get("id")
+                features[str(feature_id) if feature_id else str(len(features))] = feature
+        return list(features.values())
+
+    if not all_zones:
+        features: list[dict] = []
+    elif client is not None:
+        features = await _fetch(client)
+    else:
+        async with httpx.AsyncClient(
+            timeout=timeout, follow_redirects=True, transport=shared_transport()
+        ) as new_client:
+            features = await _fetch(new_client)
+
+    feature_zones = [(feature, _feature_zone_ids(feature)) for feature in features]
+    points = dict(points_by_key or {})
+    shapes = [
+        (index, shape)
+        for index, (feature, _) in enumerate(feature_zones)
+        if (shape := GeoShape.from_geojson(feature.get("geometry"))) is not None
+    ]
+    with_polygon = {index for index, _ in shapes}
+    covering = SpatialIndex(shapes).match_points(points) if points and shapes else {}
+
+    results: dict[str, WeatherAlerts] = {}
+    for key, zones in zones_by_key.items():
+        wanted = {zone.upper() for zone in zones if zone}
+        if key in points:
+            inside = set(covering.get(key, ()))
+            matched = [
+                feature
+                for index, (feature, covered) in enumerate(feature_zones)
+                if (index in inside if index in with_polygon else covered & wanted)
+            ]
+        else:
+            matched = [feature for feature, covered in feature_zones if covered & wanted]
+        results[key] = parse_nws_alerts({"features": matched})
+    return results
+
+
 async def fetch_nws_cancel_references(
     nws_base_url: str,
     user_agent: str,
@@ -183,11 +293,17 @@ async def fetch_nws_cancel_references(
 
     Queries GET /alerts?message_type=cancel&start=<lookback ago>&end=<now>.
     Returns set of all referenced alert IDs (from properties.references[].identifier or @id).
-    On any failure, returns empty set (safe default: caller suppresses ambiguous cancels).
+    When a cancel-reference tracker is registered, ``start`` is the tracker's
+    high-water mark instead, so each poll only downloads cancels issued since
+    the last one, and the tracker's rolling set is returned.
+    On any failure, returns the tracker's current set, or an empty set without
+    one (safe default: caller suppresses ambiguous cancels).
     """
+    tracker = _cancel_reference_tracker()
     try:
-        now = datetime.now(UTC)
-        start = now - timedelta(minutes=lookback_minutes)
+        now = tracker.now() if tracker is not None else datetime.now(UTC)
+        lookback = timedelta(minutes=lookback_minutes)
+        start = tracker.query_start(now, lookback) if tracker is not None else now - lookback
         start_str = start.strftime("%Y-%m-%dT%H:%M:%SZ")
         end_str = now.strftime("%Y-%m-%dT%H:%M:%SZ")
         url = f"{nws_base_url}/alerts"
@@ -198,19 +314,37 @@ async def fetch_nws_cancel_references(
             response.raise_for_status()
             data = response.json()
         else:
-            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+            async with httpx.AsyncClient(
+                timeout=timeout, follow_redirects=True, transport=shared_transport()
+            ) as new_client:
                 response = await new_client.get(url, params=params, headers=headers)
                 response.raise_for_status()
                 data = response.json()
-        referenced_ids: set[str] = set()
+        sent_by_id: dict[str, datetime] = {}
         for feature in data.get("features", []):
             props = feature.get("properties", {})
+            sent = _parse_cancel_sent(props.get("sent"), now)
             for ref in props.get("references", []):
                 ref_id = ref.get("identifier") or ref.get("@id") or ref.get("id")
                 if ref_id:
-                    referenced_ids.add(ref_id)
-        logger.debug(f"Fetched {len(referenced_ids)} NWS cancel references")
-        return referenced_ids
+                    sent_by_id[ref_id] = max(sent, sent_by_id.get(ref_id, sent))
+        logger.debug(f"Fetched {len(sent_by_id)} NWS cancel references")
+        if tracker is not None:
+            return tracker.record(sent_by_id, now)
+        return set(sent_by_id)
     except Exception as exc:  # noqa: BLE001
         logger.warning(f"Failed to fetch NWS cancel references: {exc}")
-        return set()
+        return tracker.references() if tracker is not None else set()
+
+
+def _parse_cancel_sent(value: Any, default: datetime) -> datetime:
+    """Return a cancel message's ``sent`` time, clamped to ``default`` (the query end)."""
+    if not isinstance(value, str):
+        return default
+    try:
+        sent = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return default
+    if sent.tzinfo is None:
+        sent = sent.replace(tzinfo=UTC)
+    return min(sent, default)
@@ -105,6 +105,15 @@ async def get_nws_tafs(
     return None
 
 
+def _advisory_entry(feature: dict[str, Any]) -> dict[str, Any]:
+    """Return an advisory's properties, carrying the feature geometry along for matching."""
+    properties = feature.get("properties", feature)
+    geometry = feature.get("geometry")
+    if geometry and isinstance(properties, dict) and "geometry" not in properties:
+        return {**properties, "geometry": geometry}
+    return properties
+
+
 @async_retry_with_backoff(max_attempts=3, base_delay=1.0, timeout=20.0)
 async def get_nws_sigmets(
     nws_base_url: str,
@@ -132,7 +141,7 @@ async def get_nws_sigmets(
 
     data = response.json()
     features = data.get("features", [])
-    return [feature.get("properties", feature) for feature in features]
+    return [_advisory_entry(feature) for feature in features]
 
 
 @async_retry_with_backoff(max_attempts=3, base_delay=1.0, timeout=20.0)
@@ -160,7 +169,7 @@ async def get_nws_cwas(
 
     data = response.json()
     features = data.get("features", [])
-    return [feature.get("properties", feature) for feature in features]
+    return [_advisory_entry(feature) for feature in features]
 
 
 @async_retry_with_backoff(max_attempts=3, base_delay=1.0, timeout=20.0)
@@ -7,12 +7,15 @@ import asyncio
 import inspect
 import logging
 import re
+import time
+from collections.abc import Callable
 from dataclasses import replace
 from datetime import UTC, datetime, timedelta
-from typing import Any, Literal
+from typing import Any, Literal, TypeVar
 
 import httpx
 
+from .http_session import shared_transport
 from .models import (
     CurrentConditions,
     Forecast,
@@ -24,6 +27,8 @@ from .models import (
     WeatherAlert,
     WeatherAlerts,
 )
+from .nws_validator_store import freshness_lifetime
+from .performance.timer import span
 from .services.zone_enrichment_service import (
     _extract_zone_fields,
     diff_zone_fields,
@@ -45,10 +50,19 @@ except ImportError:  # pragma: no cover - handled at runtime
     wx = None  # type: ignore[assignment]
 
 _ZONE_DRIFT_SINK: Any = None
+_POINTS_CACHE: Any = None
+_VALIDATOR_STORE: Any = None
+_CANCEL_TRACKER: Any = None
+
+_T = TypeVar("_T")
 
 logger = logging.getLogger("accessiweather.weather_client_nws")
 
 MAX_STATION_OBSERVATION_ATTEMPTS = 10
+# Hedged station probing: how many stations are queried at once and how far
+# apart their starts are staggered so the preferred station gets a head start.
+STATION_PROBE_FANOUT = 3
+STATION_PROBE_STAGGER_SECONDS = 0.25
 MAX_OBSERVATION_AGE = timedelta(hours=2)
 VALID_QC_CODES = {"V", "C", None}
 
@@ -64,13 +78,17 @@ __all__ = [
     "MAX_OBSERVATION_AGE",
     "MAX_STATION_OBSERVATION_ATTEMPTS",
     "RETRYABLE_EXCEPTIONS",
+    "STATION_PROBE_FANOUT",
+    "STATION_PROBE_STAGGER_SECONDS",
     "TextProduct",
     "UTC",
     "VALID_QC_CODES",
     "WeatherAlert",
     "WeatherAlerts",
     "_apply_zone_drift_correction",
+    "_cancel_reference_tracker",
     "_client_get",
+    "_conditional_get",
     "_current_data_score",
     "_extract_float",
     "_extract_scalar",
@@ -78,11 +96,13 @@ __all__ = [
     "_extract_wind_speed_mph",
     "_format_unit",
     "_format_wind_speed",
+    "_get_nws_point_data",
     "_normalize_temperature_unit",
     "_parse_iso_datetime",
     "_scrub_measurements",
     "_station_sort_key",
     "async_retry_with_backoff",
+    "asyncio",
     "convert_pa_to_inches",
     "convert_pa_to_mb",
     "convert_wind_speed_to_mph_and_kph",
@@ -91,9 +111,14 @@ __all__ = [
     "inspect",
     "is_retryable_http_error",
     "logger",
+    "nws_forecast_fresh_until",
     "re",
     "replace",
+    "set_cancel_reference_tracker",
+    "set_points_cache",
+    "set_validator_store",
     "set_zone_drift_sink",
+    "shared_transport",
     "timedelta",
     "wx",
 ]
@@ -116,6 +141,47 @@ def set_zone_drift_sink(sink: Any) -> None:
     _ZONE_DRIFT_SINK = sink
 
 
+def set_points_cache(cache: Any) -> None:
+    """
+    Register (or clear) the persistent ``/points`` grid-metadata cache.
+
+    The ``cache`` must expose the :class:`accessiweather.nws_points_cache.NwsPointsCache`
+    interface. Like the zone drift sink this is a module-global registration so
+    every NWS fetch path consults the same cache without threading it through
+    each helper signature. Pass ``None`` to clear.
+    """
+    global _POINTS_CACHE
+    _POINTS_CACHE = cache
+
+
+def set_validator_store(store: Any) -> None:
+    """
+    Register (or clear) the store used for conditional NWS requests.
+
+    The ``store`` must expose the
+    :class:`accessiweather.nws_validator_store.NwsValidatorStore` interface.
+    Registered the same way as the points cache; pass ``None`` to clear.
+    """
+    global _VALIDATOR_STORE
+    _VALIDATOR_STORE = store
+
+
+def set_cancel_reference_tracker(tracker: Any) -> None:
+    """
+    Register (or clear) the incremental NWS cancel-reference tracker.
+
+    The ``tracker`` must expose the
+    :class:`accessiweather.nws_cancel_references.NwsCancelReferenceTracker`
+    interface. Pass ``None`` to fall back to a full lookback query per poll.
+    """
+    global _CANCEL_TRACKER
+    _CANCEL_TRACKER = tracker
+
+
+def _cancel_reference_tracker() -> Any:
+    return _CANCEL_TRACKER
+
+
 def _apply_zone_drift_correction(location: Location, point_data: dict[str, Any] | None) -> None:
     """
     Diff fresh ``/points`` properties against ``location`` and persist drift.
@@ -431,3 +497,152 @@ async def _client_get(
     if inspect.isawaitable(response):
         return await response
     return response
+
+
+def _parse_timed(response: httpx.Response, parse: Callable[[httpx.Response], _T]) -> _T:
+    """Run ``parse`` under the parse span, leaving HTTP error rejection out of it."""
+    if response.is_error:
+        # ``parse`` only raises (or reports) the HTTP error here; that is not
+        # parse time and would skew the metric.
+        return parse(response)
+    with span("parse", provider="nws"):
+        return parse(response)
+
+
+async def _conditional_get(
+    client: httpx.AsyncClient,
+    url: str,
+    parse: Callable[[httpx.Response], _T],
+    *,
+    headers: dict[str, str],
+    params: dict[str, Any] | None = None,
+    variant: str = "",
+) -> _T:
+    """
+    GET ``url`` and return ``parse(response)``, revalidating against the validator store.
+
+    When a previous response left an ``ETag`` or ``Last-Modified`` the request
+    carries ``If-None-Match``/``If-Modified-Since``; a ``304`` then returns the
+    model parsed last time without touching the (empty) body. ``parse`` is
+    responsible for rejecting error responses. Without a registered store this
+    is a plain GET.
+    """
+    store = _VALIDATOR_STORE
+    if store is None:
+        response = await _client_get(client, url, headers=headers, params=params)
+        return _parse_timed(response, parse)
+
+    key = store.key_for(url, params, variant)
+    record = store.get(key)
+    request_headers = dict(headers)
+    if record is not None:
+        if record.etag:
+            request_headers["If-None-Match"] = record.etag
+        if record.last_modified:
+            request_headers["If-Modified-Since"] = record.last_modified
+
+    response = await _client_get(client, url, headers=request_headers, params=params)
+    response_headers = getattr(response, "headers", None) or {}
+    lifetime = freshness_lifetime(response_headers)
+    fresh_until = time.time() + lifetime if lifetime is not None else None
+    if record is not None and response.status_code == 304:
+        logger.debug("NWS %s not modified, reusing parsed response", url)
+        store.put(
+            key,
+            record.value,
+            etag=record.etag,
+            last_modified=record.last_modified,
+            fresh_until=fresh_until if fresh_until is not None else record.fresh_until,
+        )
+        return record.value
+
+    value = _parse_timed(response, parse)
+    if response.status_code == 200:
+        store.put(
+            key,
+            value,
+            etag=response_headers.get("ETag"),
+            last_modified=response_headers.get("Last-Modified"),
+            fresh_until=fresh_until,
+        )
+    return value
+
+
+def nws_forecast_fresh_until(location: Location) -> float | None:
+    """
+    Return when NWS says the location's daily forecast next goes stale.
+
+    Looks the forecast URL up in the registered points cache and the deadline
+    in the validator store, so it costs no request. Returns ``None`` when
+    either is unregistered or has nothing for the location yet.
+    """
+    store = _VALIDATOR_STORE
+    cache = _POINTS_CACHE
+    if store is None or cache is None:
+        return None
+    record = cache.get_record(location.latitude, location.longitude)
+    properties = (record or {}).get("payload", {}).get("properties") or {}
+    forecast_url = properties.get("forecast")
+    if not isinstance(forecast_url, str):
+        return None
+    return store.fresh_until(store.key_for(forecast_url))
+
+
+async def _get_nws_point_data(
+    client: httpx.AsyncClient,
+    nws_base_url: str,
+    latitude: float,
+    longitude: float,
+    headers: dict[str, str],
+    *,
+    url: str | None = None,
+) -> dict[str, Any]:
+    """
+    Return ``/points`` grid metadata, consulting the registered points cache first.
+
+    Fresh cache entries cost no request. Expired entries are revalidated with
+    ``If-None-Match``/``If-Modified-Since`` and reused on ``304``; when the
+    revalidation fails outright the expired entry is served rather than
+    failing the refresh. Without a registered cache this is a plain GET.
+    """
+    point_url = url or f"{nws_base_url}/points/{latitude},{longitude}"
+    cache = _POINTS_CACHE
+    if cache is None:
+        response = await _client_get(client, point_url, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    cached = cache.get(latitude, longitude)
+    if cached is not None:
+        return cached
+
+    record = cache.get_record(latitude, longitude)
+    request_headers = dict(headers)
+    if record is not None:
+        if record.get("etag"):
+            request_headers["If-None-Match"] = record["etag"]
+        if record.get("last_modified"):
+            request_headers["If-Modified-Since"] = record["last_modified"]
+
+    try:
+        response = await _client_get(client, point_url, headers=request_headers)
+        if record is not None and response.status_code == 304:
+            cache.touch(latitude, longitude)
+            return record["payload"]
+        response.raise_for_status()
+        point_data = response.json()
+    except Exception as exc:  # noqa: BLE001
+        if record is None:
+            raise
+        logger.debug("Points revalidation failed, serving expired grid metadata: %s", exc)
+        return record["payload"]
+
+    response_headers = getattr(response, "headers", None) or {}
+    cache.put(
+        latitude,
+        longitude,
+        point_data,
+        etag=response_headers.get("ETag"),
+        last_modified=response_headers.get("Last-Modified"),
+    )
+    return point_data
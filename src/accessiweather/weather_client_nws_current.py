@@ -7,103 +7,241 @@ from .weather_client_nws_common import *  # noqa: F403
 from .weather_client_nws_parsers import parse_nws_current_conditions
 
 
-@async_retry_with_backoff(max_attempts=3, base_delay=1.0, timeout=20.0)
-async def get_nws_current_conditions(
+class StationHealthTracker:
+    """
+    Remember which observation stations answered recently, per location.
+
+    Kept in memory for the life of the process: the station that produced the
+    last usable observation for a location is probed first on the next
+    refresh, and stations that keep failing are pushed to the back.
+    """
+
+    def __init__(self, *, failure_penalty_after: int = 2) -> None:
+        """Initialize with the failure count at which a station is deprioritized."""
+        self._preferred: dict[str, str] = {}
+        self._failures: dict[str, int] = {}
+        self._failure_penalty_after = failure_penalty_after
+
+    @staticmethod
+    def location_key(location: Location) -> str:
+        """Return the tracker key for a location."""
+        return f"{location.latitude:.4f},{location.longitude:.4f}"
+
+    def preferred_station(self, location: Location) -> str | None:
+        """Return the station that last produced a usable observation for ``location``."""
+        return self._preferred.get(self.location_key(location))
+
+    def failure_count(self, station_id: str) -> int:
+        """Return the number of consecutive failed probes for a station."""
+        return self._failures.get(station_id, 0)
+
+    def record_success(self, location: Location, station_id: str) -> None:
+        """Mark ``station_id`` as the station that served ``location``."""
+        self._preferred[self.location_key(location)] = station_id
+        self._failures.pop(station_id, None)
+
+    def record_failure(self, station_id: str) -> None:
+        """Count a failed or unusable probe against ``station_id``."""
+        self._failures[station_id] = self._failures.get(station_id, 0) + 1
+
+    def order(self, location: Location, features: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Order station features: last-good station first, repeatedly failing stations last."""
+        preferred = self.preferred_station(location)
+
+        def rank(item: tuple[int, dict[str, Any]]) -> tuple[int, int]:
+            index, feature = item
+            station_id = (feature.get("properties", {}) or {}).get("stationIdentifier")
+            if preferred is not None and station_id == preferred:
+                return (0, index)
+            if station_id and self.failure_count(station_id) >= self._failure_penalty_after:
+                return (2, index)
+            return (1, index)
+
+        return [feature for _, feature in sorted(enumerate(features), key=rank)]
+
+    def clear(self) -> None:
+        """Forget all station history."""
+        self._preferred.clear()
+        self._failures.clear()
+
+
+station_health = StationHealthTracker()
+
+
+async def _probe_station(
+    station_id: str,
+    http_client: httpx.AsyncClient,
     location: Location,
     nws_base_url: str,
-    user_agent: str,
-    timeout: float,
-    client: httpx.AsyncClient | None = None,
-) -> CurrentConditions | None:
-    """Fetch current conditions from the NWS API for the given location."""
+    headers: dict[str, str],
+) -> tuple[CurrentConditions, bool, int] | None:
+    """
+    Fetch and parse the latest observation for one station.
+
+    Returns ``(current, stale, score)`` or ``None`` when the station produced
+    nothing usable.
+    """
+    obs_url = f"{nws_base_url}/stations/{station_id}/observations/latest"
     try:
-        grid_url = f"{nws_base_url}/points/{location.latitude},{location.longitude}"
-        headers = {"User-Agent": user_agent}
+        response = await _client_get(http_client, obs_url, headers=headers)
+        response.raise_for_status()
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Failed to fetch observation for %s: %s", station_id, exc)
+        return None
 
-        async def _select_best_observation(
-            features: list[dict[str, Any]],
-            http_client: httpx.AsyncClient,
-        ) -> CurrentConditions | None:
-            """Return the first observation with meaningful data, keeping a fallback."""
-            if not features:
-                return None
+    try:
+        obs_data = response.json()
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Invalid observation payload for %s: %s", station_id, exc)
+        return None
 
-            fallback: CurrentConditions | None = None
-            fallback_rank: tuple[int, int, int] | None = None
-            attempts = 0
+    obs_props = obs_data.get("properties", {}) or {}
+    timestamp = _parse_iso_datetime(obs_props.get("timestamp"))
+    stale = False
+    if timestamp is not None:
+        if timestamp.tzinfo is None:
+            timestamp_utc = timestamp.replace(tzinfo=UTC)
+        else:
+            timestamp_utc = timestamp.astimezone(UTC)
+        age = datetime.now(UTC) - timestamp_utc
+        if age > MAX_OBSERVATION_AGE:
+            stale = True
+    else:
+        stale = True
 
-            sorted_features = sorted(features, key=_station_sort_key)
+    try:
+        _scrub_measurements(obs_props)
+        current = parse_nws_current_conditions(obs_data, location=location)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Failed to parse observation for %s: %s", station_id, exc)
+        return None
 
-            for feature in sorted_features:
-                if attempts >= MAX_STATION_OBSERVATION_ATTEMPTS:
-                    break
+    score = _current_data_score(current)
+    if score == 0:
+        return None
+    return current, stale, score
 
-                props = feature.get("properties", {}) or {}
-                station_id = props.get("stationIdentifier")
-                if not station_id:
-                    continue
 
-                obs_url = f"{nws_base_url}/stations/{station_id}/observations/latest"
-                attempts += 1
+def _is_fresh_observation(current: CurrentConditions, stale: bool) -> bool:
+    """Return True when an observation is recent and has a temperature or description."""
+    has_temperature = current.temperature_f is not None or current.temperature_c is not None
+    has_description = bool(current.condition and current.condition.strip())
+    return not stale and (has_temperature or has_description)
 
-                try:
-                    response = await _client_get(http_client, obs_url, headers=headers)
-                    response.raise_for_status()
-                except Exception as exc:  # noqa: BLE001
-                    logger.debug("Failed to fetch observation for %s: %s", station_id, exc)
-                    continue
 
-                try:
-                    obs_data = response.json()
-                except Exception as exc:  # noqa: BLE001
-                    logger.debug("Invalid observation payload for %s: %s", station_id, exc)
-                    continue
+async def _select_best_observation(
+    features: list[dict[str, Any]],
+    http_client: httpx.AsyncClient,
+    location: Location,
+    nws_base_url: str,
+    headers: dict[str, str],
+    *,
+    fanout: int = STATION_PROBE_FANOUT,
+    stagger: float = STATION_PROBE_STAGGER_SECONDS,
+    health: StationHealthTracker | None = None,
+) -> CurrentConditions | None:
+    """
+    Return the first fresh observation from the candidate stations, keeping a fallback.
+
+    Up to ``fanout`` stations are probed concurrently, each started ``stagger``
+    seconds after the previous one so the preferred station gets a head start.
+    The first fresh observation wins and the remaining probes are cancelled;
+    a finished probe that was stale or empty frees its slot for the next
+    candidate. At most ``MAX_STATION_OBSERVATION_ATTEMPTS`` stations are tried.
+    """
+    if not features:
+        return None
 
-                obs_props = obs_data.get("properties", {}) or {}
-                timestamp = _parse_iso_datetime(obs_props.get("timestamp"))
-                stale = False
-                if timestamp is not None:
-                    if timestamp.tzinfo is None:
-                        timestamp_utc = timestamp.replace(tzinfo=UTC)
-                    else:
-                        timestamp_utc = timestamp.astimezone(UTC)
-                    age = datetime.now(UTC) - timestamp_utc
-                    if age > MAX_OBSERVATION_AGE:
-                        stale = True
-                else:
-                    stale = True
-
-                try:
-                    _scrub_measurements(obs_props)
-                    current = parse_nws_current_conditions(obs_data, location=location)
-                except Exception as exc:  # noqa: BLE001
-                    logger.debug("Failed to parse observation for %s: %s", station_id, exc)
-                    continue
+    health = health or station_health
+    ordered = health.order(location, sorted(features, key=_station_sort_key))
+    candidates: list[str] = []
+    for feature in ordered:
+        station_id = (feature.get("properties", {}) or {}).get("stationIdentifier")
+        if station_id and station_id not in candidates:
+            candidates.append(station_id)
+        if len(candidates) >= MAX_STATION_OBSERVATION_ATTEMPTS:
+            break
+    if not candidates:
+        return None
 
-                has_temperature = (
-                    current.temperature_f is not None or current.temperature_c is not None
-                )
-                has_description = bool(current.condition and current.condition.strip())
-                score = _current_data_score(current)
+    fallback: CurrentConditions | None = None
+    fallback_station: str | None = None
+    fallback_rank: tuple[int, int, int] | None = None
+    fanout = max(1, fanout)
 
-                if not stale and (has_temperature or has_description):
-                    return current
+    async def _staggered_probe(index: int, station_id: str, delay: float):
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return (
+            index,
+            station_id,
+            await _probe_station(station_id, http_client, location, nws_base_url, headers),
+        )
 
-                if score == 0:
-                    continue
+    in_flight: set[asyncio.Task] = set()
+    next_index = 0
+
+    def _launch(delay: float) -> None:
+        nonlocal next_index
+        station_id = candidates[next_index]
+        in_flight.add(asyncio.create_task(_staggered_probe(next_index, station_id, delay)))
+        next_index += 1
 
-                rank = (1 if stale else 0, -score, attempts)
+    for slot in range(min(fanout, len(candidates))):
+        _launch(slot * stagger)
+
+    try:
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            # Resolve completed probes in candidate order so ties favour the
+            # better-ranked station.
+            results = sorted((task.result() for task in done), key=lambda item: item[0])
+            in_flight.difference_update(done)
+            for index, station_id, outcome in results:
+                if outcome is None:
+                    health.record_failure(station_id)
+                    continue
+                current, stale, score = outcome
+                if _is_fresh_observation(current, stale):
+                    health.record_success(location, station_id)
+                    return current
+                rank = (1 if stale else 0, -score, index)
                 if fallback_rank is None or rank < fallback_rank:
                     fallback = current
+                    fallback_station = station_id
                     fallback_rank = rank
+            while len(in_flight) < fanout and next_index < len(candidates):
+                _launch(0.0)
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    if fallback_station is not None:
+        health.record_success(location, fallback_station)
+    return fallback
+
 
-            return fallback
+@async_retry_with_backoff(max_attempts=3, base_delay=1.0, timeout=20.0)
+async def get_nws_current_conditions(
+    location: Location,
+    nws_base_url: str,
+    user_agent: str,
+    timeout: float,
+    client: httpx.AsyncClient | None = None,
+    grid_data: dict[str, Any] | None = None,
+) -> CurrentConditions | None:
+    """Fetch current conditions from the NWS API for the given location."""
+    try:
+        headers = {"User-Agent": user_agent}
 
         # Use provided client or create a new one
         if client is not None:
-            response = await _client_get(client, grid_url, headers=headers)
-            response.raise_for_status()
-            grid_data = response.json()
+            if grid_data is None:
+                grid_data = await _get_nws_point_data(
+                    client, nws_base_url, location.latitude, location.longitude, headers
+                )
 
             # Extract timezone from grid data and update location
             if "properties" in grid_data and "timeZone" in grid_data["properties"]:
@@ -118,7 +256,9 @@ async def get_nws_current_conditions(
                 logger.warning("No observation stations found")
                 return None
 
-            current = await _select_best_observation(stations_data["features"], client)
+            current = await _select_best_observation(
+                stations_data["features"], client, location, nws_base_url, headers
+            )
             if current is None:
                 logger.warning(
                     "No usable observations found for %s (lat=%s, lon=%s)",
@@ -127,10 +267,13 @@ async def get_nws_current_conditions(
                     location.longitude,
                 )
             return current
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
-            response = await new_client.get(grid_url, headers=headers)
-            response.raise_for_status()
-            grid_data = response.json()
+        async with httpx.AsyncClient(
+            timeout=timeout, follow_redirects=True, transport=shared_transport()
+        ) as new_client:
+            if grid_data is None:
+                grid_data = await _get_nws_point_data(
+                    new_client, nws_base_url, location.latitude, location.longitude, headers
+                )
 
             # Extract timezone from grid data and update location
             if "properties" in grid_data and "timeZone" in grid_data["properties"]:
@@ -145,7 +288,9 @@ async def get_nws_current_conditions(
                 logger.warning("No observation stations found")
                 return None
 
-            current = await _select_best_observation(stations_data["features"], new_client)
+            current = await _select_best_observation(
+                stations_data["features"], new_client, location, nws_base_url, headers
+            )
             if current is None:
                 logger.warning(
                     "No usable observations found for %s (lat=%s, lon=%s)",
@@ -172,12 +317,11 @@ async def get_nws_primary_station_info(
     """Return the primary observation station identifier and name for a location."""
     try:
         headers = {"User-Agent": user_agent}
-        grid_url = f"{nws_base_url}/points/{location.latitude},{location.longitude}"
 
         if client is not None:
-            response = await _client_get(client, grid_url, headers=headers)
-            response.raise_for_status()
-            grid_data = response.json()
+            grid_data = await _get_nws_point_data(
+                client, nws_base_url, location.latitude, location.longitude, headers
+            )
             stations_url = grid_data.get("properties", {}).get("observationStations")
             if not stations_url:
                 logger.debug("No observationStations URL in NWS grid data")
@@ -187,10 +331,12 @@ async def get_nws_primary_station_info(
             response.raise_for_status()
             stations_data = response.json()
         else:
-            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
-                response = await new_client.get(grid_url, headers=headers)
-                response.raise_for_status()
-                grid_data = response.json()
+            async with httpx.AsyncClient(
+                timeout=timeout, follow_redirects=True, transport=shared_transport()
+            ) as new_client:
+                grid_data = await _get_nws_point_data(
+                    new_client, nws_base_url, location.latitude, location.longitude, headers
+                )
                 stations_url = grid_data.get("properties", {}).get("observationStations")
                 if not stations_url:
                     logger.debug("No observationStations URL in NWS grid data")
@@ -234,7 +380,9 @@ async def get_nws_station_metadata(
             response.raise_for_status()
             return response.json()
 
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+        async with httpx.AsyncClient(
+            timeout=timeout, follow_redirects=True, transport=shared_transport()
+        ) as new_client:
             response = await new_client.get(station_url, headers=headers)
             response.raise_for_status()
             return response.json()
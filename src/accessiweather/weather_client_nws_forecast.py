@@ -10,6 +10,11 @@ from .weather_client_nws_common import *  # noqa: F403
 from .weather_client_nws_parsers import parse_nws_forecast
 
 
+def _parse_forecast_response(response: httpx.Response) -> Forecast:
+    response.raise_for_status()
+    return parse_nws_forecast(response.json())
+
+
 @async_retry_with_backoff(max_attempts=3, base_delay=1.0, timeout=20.0)
 async def get_nws_forecast_and_discussion(
     location: Location,
@@ -38,18 +43,17 @@ async def get_nws_forecast_and_discussion(
         if client is not None:
             # Fetch grid data if not provided (needed by both forecast and discussion)
             if grid_data is None:
-                grid_url = f"{nws_base_url}/points/{location.latitude},{location.longitude}"
-                response = await _client_get(client, grid_url, headers=headers)
-                response.raise_for_status()
-                grid_data = response.json()
+                grid_data = await _get_nws_point_data(
+                    client, nws_base_url, location.latitude, location.longitude, headers
+                )
 
             # Fetch forecast independently so a failure doesn't kill the discussion
             parsed_forecast: Forecast | None = None
             try:
                 forecast_url = grid_data["properties"]["forecast"]
-                response = await _client_get(client, forecast_url, headers=feature_headers)
-                response.raise_for_status()
-                parsed_forecast = parse_nws_forecast(response.json())
+                parsed_forecast = await _conditional_get(
+                    client, forecast_url, _parse_forecast_response, headers=feature_headers
+                )
             except Exception as forecast_exc:  # noqa: BLE001
                 logger.warning(
                     "Forecast fetch failed (discussion will still be returned): %s", forecast_exc
@@ -67,20 +71,20 @@ async def get_nws_forecast_and_discussion(
 
             return parsed_forecast, discussion, discussion_issuance_time
 
-        grid_url = f"{nws_base_url}/points/{location.latitude},{location.longitude}"
-
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
-            response = await new_client.get(grid_url, headers=headers)
-            response.raise_for_status()
-            grid_data = response.json()
+        async with httpx.AsyncClient(
+            timeout=timeout, follow_redirects=True, transport=shared_transport()
+        ) as new_client:
+            grid_data = await _get_nws_point_data(
+                new_client, nws_base_url, location.latitude, location.longitude, headers
+            )
 
             # Fetch forecast independently so a failure doesn't kill the discussion
             parsed_forecast = None
             try:
                 forecast_url = grid_data["properties"]["forecast"]
-                response = await new_client.get(forecast_url, headers=feature_headers)
-                response.raise_for_status()
-                parsed_forecast = parse_nws_forecast(response.json())
+                parsed_forecast = await _conditional_get(
+                    new_client, forecast_url, _parse_forecast_response, headers=feature_headers
+                )
             except Exception as forecast_exc:  # noqa: BLE001
                 logger.warning(
                     "Forecast fetch failed (discussion will still be returned): %s", forecast_exc
@@ -134,10 +138,9 @@ async def get_nws_discussion_only(
         )
 
         if client is not None:
-            grid_url = f"{nws_base_url}/points/{location.latitude},{location.longitude}"
-            response = await _client_get(client, grid_url, headers=headers)
-            response.raise_for_status()
-            grid_data = response.json()
+            grid_data = await _get_nws_point_data(
+                client, nws_base_url, location.latitude, location.longitude, headers
+            )
             discussion, issuance_time = await get_nws_discussion(
                 client, headers, grid_data, nws_base_url
             )
@@ -148,11 +151,12 @@ async def get_nws_discussion_only(
             )
             return discussion, issuance_time
 
-        grid_url = f"{nws_base_url}/points/{location.latitude},{location.longitude}"
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
-            response = await new_client.get(grid_url, headers=headers)
-            response.raise_for_status()
-            grid_data = response.json()
+        async with httpx.AsyncClient(
+            timeout=timeout, follow_redirects=True, transport=shared_transport()
+        ) as new_client:
+            grid_data = await _get_nws_point_data(
+                new_client, nws_base_url, location.latitude, location.longitude, headers
+            )
             discussion, issuance_time = await get_nws_discussion(
                 new_client, headers, grid_data, nws_base_url
             )
@@ -201,20 +205,21 @@ async def _fetch_text_product_by_id(
 
     issuance_time = _parse_iso_datetime(entry.get("issuanceTime"))
 
-    product_url = f"{nws_base_url}/products/{product_id}"
-    response = await _client_get(client, product_url, headers=headers)
-    if response.status_code != 200:
-        logger.warning(
-            "Failed to get %s product text (%s): HTTP %s",
-            product_type,
-            product_id,
-            response.status_code,
-        )
-        raise TextProductFetchError(
-            f"HTTP {response.status_code} fetching {product_type} product {product_id}"
-        )
+    def _parse_product(response: httpx.Response) -> dict[str, Any]:
+        if response.status_code != 200:
+            logger.warning(
+                "Failed to get %s product text (%s): HTTP %s",
+                product_type,
+                product_id,
+                response.status_code,
+            )
+            raise TextProductFetchError(
+                f"HTTP {response.status_code} fetching {product_type} product {product_id}"
+            )
+        return response.json()
 
-    product_data = response.json()
+    product_url = f"{nws_base_url}/products/{product_id}"
+    product_data = await _conditional_get(client, product_url, _parse_product, headers=headers)
     product_text = product_data.get("productText")
     if not product_text:
         logger.warning("No productText in %s product %s", product_type, product_id)
@@ -273,22 +278,23 @@ async def get_nws_text_product(
     headers = {"User-Agent": user_agent}
     products_url = f"{nws_base_url}/products/types/{product_type}/locations/{cwa_office}"
 
+    def _parse_listing(response: httpx.Response) -> list[Any]:
+        if response.status_code != 200:
+            raise TextProductFetchError(
+                f"HTTP {response.status_code} fetching {product_type} listing for {cwa_office}"
+            )
+        return response.json().get("@graph") or []
+
     async def _run(http_client: httpx.AsyncClient) -> TextProduct | list[TextProduct] | None:
         try:
-            listing_response = await _client_get(http_client, products_url, headers=headers)
+            graph = await _conditional_get(
+                http_client, products_url, _parse_listing, headers=headers
+            )
         except (httpx.TimeoutException, httpx.TransportError, httpx.RequestError) as exc:
             raise TextProductFetchError(
                 f"Request failed fetching {product_type} listing for {cwa_office}: {exc}"
             ) from exc
 
-        if listing_response.status_code != 200:
-            raise TextProductFetchError(
-                f"HTTP {listing_response.status_code} fetching {product_type} "
-                f"listing for {cwa_office}"
-            )
-
-        graph = listing_response.json().get("@graph") or []
-
         if product_type == "SPS":
             products: list[TextProduct] = []
             try:
@@ -339,7 +345,9 @@ async def get_nws_text_product(
     if client is not None:
         return await _run(client)
 
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+    async with httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, transport=shared_transport()
+    ) as new_client:
         return await _run(new_client)
 
 
@@ -419,7 +427,9 @@ async def get_nws_text_product_history(
     if client is not None:
         return await _run(client)
 
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+    async with httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, transport=shared_transport()
+    ) as new_client:
         return await _run(new_client)
 
 
@@ -475,7 +485,9 @@ async def get_nws_daily_climate_locations(
     if client is not None:
         return await _run(client)
 
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+    async with httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, transport=shared_transport()
+    ) as new_client:
         return await _run(new_client)
 
 
@@ -495,10 +507,13 @@ async def get_nws_observation_station_ids_for_point(
 
     async def _run(http_client: httpx.AsyncClient) -> list[str]:
         try:
-            point_response = await _client_get(http_client, point_url, headers=headers)
-            if point_response.status_code != 200:
+            try:
+                point_data = await _get_nws_point_data(
+                    http_client, nws_base_url, latitude, longitude, headers, url=point_url
+                )
+            except httpx.HTTPStatusError:
                 return []
-            stations_url = point_response.json().get("properties", {}).get("observationStations")
+            stations_url = point_data.get("properties", {}).get("observationStations")
             if not isinstance(stations_url, str) or not stations_url:
                 return []
             stations_response = await _client_get(http_client, stations_url, headers=headers)
@@ -522,7 +537,9 @@ async def get_nws_observation_station_ids_for_point(
     if client is not None:
         return await _run(client)
 
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+    async with httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, transport=shared_transport()
+    ) as new_client:
         return await _run(new_client)
 
 
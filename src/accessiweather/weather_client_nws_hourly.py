@@ -11,6 +11,18 @@ from .weather_client_nws_parsers import (
 )
 
 
+def _parse_hourly_response(response: httpx.Response, location: Location) -> HourlyForecast:
+    response.raise_for_status()
+    return parse_nws_hourly_forecast(response.json(), location)
+
+
+def _parse_gridpoint_pressure_response(
+    response: httpx.Response,
+) -> dict[datetime, tuple[float | None, float | None]]:
+    response.raise_for_status()
+    return parse_nws_gridpoint_pressure(response.json())
+
+
 @async_retry_with_backoff(max_attempts=3, base_delay=1.0, timeout=20.0)
 async def get_nws_hourly_forecast(
     location: Location,
@@ -30,44 +42,47 @@ async def get_nws_hourly_forecast(
         if client is not None:
             # Fetch grid data if not provided
             if grid_data is None:
-                grid_url = f"{nws_base_url}/points/{location.latitude},{location.longitude}"
-                response = await _client_get(client, grid_url, headers=headers)
-                response.raise_for_status()
-                grid_data = response.json()
+                grid_data = await _get_nws_point_data(
+                    client, nws_base_url, location.latitude, location.longitude, headers
+                )
 
             hourly_forecast_url = grid_data.get("properties", {}).get("forecastHourly")
             if not hourly_forecast_url:
                 logger.warning("No hourly forecast URL found in grid data")
                 return None
 
-            response = await _client_get(client, hourly_forecast_url, headers=feature_headers)
-            response.raise_for_status()
-            hourly_data = response.json()
-
-            hourly = parse_nws_hourly_forecast(hourly_data, location)
+            hourly = await _conditional_get(
+                client,
+                hourly_forecast_url,
+                lambda response: _parse_hourly_response(response, location),
+                headers=feature_headers,
+                variant=location.timezone or "",
+            )
             pressure_data = await _fetch_nws_gridpoint_pressure(
                 grid_data,
                 client,
                 headers,
             )
             return apply_nws_gridpoint_pressure(hourly, pressure_data)
-        grid_url = f"{nws_base_url}/points/{location.latitude},{location.longitude}"
-
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
-            response = await new_client.get(grid_url, headers=headers)
-            response.raise_for_status()
-            grid_data = response.json()
+        async with httpx.AsyncClient(
+            timeout=timeout, follow_redirects=True, transport=shared_transport()
+        ) as new_client:
+            grid_data = await _get_nws_point_data(
+                new_client, nws_base_url, location.latitude, location.longitude, headers
+            )
 
             hourly_forecast_url = grid_data.get("properties", {}).get("forecastHourly")
             if not hourly_forecast_url:
                 logger.warning("No hourly forecast URL found in grid data")
                 return None
 
-            response = await new_client.get(hourly_forecast_url, headers=feature_headers)
-            response.raise_for_status()
-            hourly_data = response.json()
-
-            hourly = parse_nws_hourly_forecast(hourly_data, location)
+            hourly = await _conditional_get(
+                new_client,
+                hourly_forecast_url,
+                lambda response: _parse_hourly_response(response, location),
+                headers=feature_headers,
+                variant=location.timezone or "",
+            )
             pressure_data = await _fetch_nws_gridpoint_pressure(
                 grid_data,
                 new_client,
@@ -93,9 +108,9 @@ async def _fetch_nws_gridpoint_pressure(
         return {}
 
     try:
-        response = await _client_get(client, gridpoint_url, headers=headers)
-        response.raise_for_status()
-        return parse_nws_gridpoint_pressure(response.json())
+        return await _conditional_get(
+            client, gridpoint_url, _parse_gridpoint_pressure_response, headers=headers
+        )
     except Exception as exc:  # noqa: BLE001
         logger.debug("NWS gridpoint pressure fetch failed: %s", exc)
         if isinstance(exc, RETRYABLE_EXCEPTIONS) or is_retryable_http_error(exc):
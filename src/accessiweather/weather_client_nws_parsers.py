@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from .models.time_index import TimeIndex
 from .provider_normalization import (
     normalize_humidity_percent,
     normalize_pressure_pair,
@@ -413,6 +414,7 @@ def apply_nws_gridpoint_pressure(
     if not pressure_by_time:
         return hourly
 
+    pressure_index = _pressure_time_index(pressure_by_time)
     updated_periods: list[HourlyForecastPeriod] = []
     changed = False
     for period in hourly.periods:
@@ -420,7 +422,7 @@ def apply_nws_gridpoint_pressure(
             updated_periods.append(period)
             continue
 
-        pressure_pair = _nearest_pressure_pair(period.start_time, pressure_by_time)
+        pressure_pair = _nearest_pressure_pair(period.start_time, pressure_index)
         if pressure_pair is None:
             updated_periods.append(period)
             continue
@@ -443,23 +445,23 @@ def apply_nws_gridpoint_pressure(
     )
 
 
+def _pressure_time_index(
+    pressure_by_time: dict[datetime, tuple[float | None, float | None]],
+) -> TimeIndex[tuple[datetime, tuple[float | None, float | None]]]:
+    """Index gridpoint pressure pairs by valid time."""
+    return TimeIndex(pressure_by_time.items(), lambda item: item[0])
+
+
 def _nearest_pressure_pair(
     start_time: datetime,
-    pressure_by_time: dict[datetime, tuple[float | None, float | None]],
+    pressure_by_time: dict[datetime, tuple[float | None, float | None]]
+    | TimeIndex[tuple[datetime, tuple[float | None, float | None]]],
 ) -> tuple[float | None, float | None] | None:
     """Return pressure from the closest gridpoint valid time within 90 minutes."""
-    target_ts = _timestamp_utc(start_time)
-    best_pair = None
-    best_delta = None
-    for valid_time, pressure_pair in pressure_by_time.items():
-        delta = abs(_timestamp_utc(valid_time) - target_ts)
-        if best_delta is None or delta < best_delta:
-            best_delta = delta
-            best_pair = pressure_pair
-
-    if best_delta is None or best_delta > 90 * 60:
-        return None
-    return best_pair
+    if not isinstance(pressure_by_time, TimeIndex):
+        pressure_by_time = _pressure_time_index(pressure_by_time)
+    nearest = pressure_by_time.nearest(_timestamp_utc(start_time), max_delta_seconds=90 * 60)
+    return nearest[1] if nearest is not None else None
 
 
 def _parse_valid_time_start(valid_time: str | None) -> datetime | None:
@@ -5,11 +5,13 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
 import httpx
 
+from .http_session import shared_transport
 from .models import (
     CurrentConditions,
     Forecast,
@@ -18,9 +20,12 @@ from .models import (
     HourlyForecastPeriod,
     Location,
 )
+from .performance.timer import span
 from .provider_normalization import (
+    as_float,
     classify_apparent_temperature,
     normalize_dewpoint_pair,
+    visibility_converter,
 )
 from .utils.retry_utils import (
     RETRYABLE_EXCEPTIONS,
@@ -29,21 +34,24 @@ from .utils.retry_utils import (
 )
 from .weather_client_openmeteo_current import (
     parse_iso_datetime as _parse_iso_datetime,
+    parse_iso_datetime_column,
     parse_openmeteo_current_conditions as parse_openmeteo_current_conditions,
     pick_precipitation_type,
     resolve_current_condition_description,
 )
 from .weather_client_openmeteo_units import (
-    normalize_height_to_feet,
-    normalize_snow_depth_to_inches_and_cm,
-    normalize_visibility_to_miles_and_km,
+    VISIBILITY_CAP_MILES,
+    height_to_feet_converter,
+    snow_depth_to_inches_converter,
 )
 from .weather_client_parsers import (
     convert_wind_speed_to_mph_and_kph,
     degrees_to_cardinal,
     format_date_name,
-    normalize_pressure,
+    pressure_converter,
+    temperature_converter,
     weather_code_to_description,
+    wind_speed_to_mph_converter,
 )
 
 logger = logging.getLogger(__name__)
@@ -171,16 +179,20 @@ async def get_openmeteo_current_conditions(
             response.raise_for_status()
             data = response.json()
 
-            current = parse_openmeteo_current_conditions(data)
+            with span("parse", provider="openmeteo"):
+                current = parse_openmeteo_current_conditions(data)
             if isinstance(current.wind_direction, int | float):
                 current.wind_direction = degrees_to_cardinal(current.wind_direction)
             return current
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+        async with httpx.AsyncClient(
+            timeout=timeout, follow_redirects=True, transport=shared_transport()
+        ) as new_client:
             response = await new_client.get(url, params=params)
             response.raise_for_status()
             data = response.json()
 
-            current = parse_openmeteo_current_conditions(data)
+            with span("parse", provider="openmeteo"):
+                current = parse_openmeteo_current_conditions(data)
             if isinstance(current.wind_direction, int | float):
                 current.wind_direction = degrees_to_cardinal(current.wind_direction)
             return current
@@ -228,12 +240,16 @@ async def get_openmeteo_forecast(
             response = await _client_get(client, url, params=params)
             response.raise_for_status()
             data = response.json()
-            return parse_openmeteo_forecast(data)
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+            with span("parse", provider="openmeteo"):
+                return parse_openmeteo_forecast(data)
+        async with httpx.AsyncClient(
+            timeout=timeout, follow_redirects=True, transport=shared_transport()
+        ) as new_client:
             response = await new_client.get(url, params=params)
             response.raise_for_status()
             data = response.json()
-            return parse_openmeteo_forecast(data)
+            with span("parse", provider="openmeteo"):
+                return parse_openmeteo_forecast(data)
 
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Failed to get OpenMeteo forecast: {exc}")
@@ -279,12 +295,16 @@ async def get_openmeteo_hourly_forecast(
             response = await _client_get(client, url, params=params)
             response.raise_for_status()
             data = response.json()
-            return parse_openmeteo_hourly_forecast(data)
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+            with span("parse", provider="openmeteo"):
+                return parse_openmeteo_hourly_forecast(data)
+        async with httpx.AsyncClient(
+            timeout=timeout, follow_redirects=True, transport=shared_transport()
+        ) as new_client:
             response = await new_client.get(url, params=params)
             response.raise_for_status()
             data = response.json()
-            return parse_openmeteo_hourly_forecast(data)
+            with span("parse", provider="openmeteo"):
+                return parse_openmeteo_hourly_forecast(data)
 
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Failed to get OpenMeteo hourly forecast: {exc}")
@@ -347,112 +367,133 @@ def parse_openmeteo_forecast(data: dict) -> Forecast:
     return Forecast(periods=periods, generated_at=datetime.now())
 
 
+def _hourly_column(hourly: dict, key: str, length: int) -> list[Any]:
+    """Return an hourly array padded (or cut) to ``length`` with ``None`` for missing hours."""
+    values = list(hourly.get(key, [])[:length])
+    if len(values) < length:
+        values.extend([None] * (length - len(values)))
+    return values
+
+
+def _convert_column(values: list[Any], convert: Callable[[Any], Any]) -> list[Any]:
+    """Apply a resolved unit converter down a column, passing ``None`` through."""
+    return [None if value is None else convert(value) for value in values]
+
+
+def _lookup_column(values: list[Any], describe: Callable[[Any], Any]) -> list[Any]:
+    """Map a column with few distinct values (codes, bearings) through ``describe`` once each."""
+    table = {value: describe(value) for value in set(values)}
+    return [table[value] for value in values]
+
+
+def _fallback_dewpoint(
+    temperature_f: float | None, humidity: int | None
+) -> tuple[float | None, float | None]:
+    """Derive dewpoint from temperature and humidity for hours without one."""
+    pair = normalize_dewpoint_pair(
+        None, None, fallback_temperature_f=temperature_f, humidity_percent=humidity
+    )
+    return pair.fahrenheit, pair.celsius
+
+
 def parse_openmeteo_hourly_forecast(data: dict) -> HourlyForecast:
-    """Parse Open-Meteo hourly forecast payload into an HourlyForecast model."""
-    periods: list[HourlyForecastPeriod] = []
+    """
+    Parse Open-Meteo hourly forecast payload into an HourlyForecast model.
+
+    Open-Meteo sends each field as a parallel array, so the payload is
+    converted column by column: every unit is resolved once per column rather
+    than once per hour, and the periods are assembled in a single pass at the
+    end.
+    """
     hourly = data.get("hourly", {})
     hourly_units = data.get("hourly_units", {})
     utc_offset_seconds = data.get("utc_offset_seconds")
 
     times = hourly.get("time", [])
-    temperatures = hourly.get("temperature_2m", [])
-    humidities = hourly.get("relative_humidity_2m", [])
-    dew_points = hourly.get("dew_point_2m", [])
-    weather_codes = hourly.get("weather_code", [])
-    wind_speeds = hourly.get("wind_speed_10m", [])
-    wind_directions = hourly.get("wind_direction_10m", [])
-    pressures = hourly.get("pressure_msl", [])
-    precip_probs = hourly.get("precipitation_probability", [])
-    snowfalls = hourly.get("snowfall", [])
-    uv_indices = hourly.get("uv_index", [])
+    length = len(times)
+
+    def column(key: str) -> list[Any]:
+        return _hourly_column(hourly, key, length)
+
+    temperatures = column("temperature_2m")
+    humidities = column("relative_humidity_2m")
+    dew_points = column("dew_point_2m")
+    precip_probs = column("precipitation_probability")
+    snowfalls = column("snowfall")
+    uv_indices = column("uv_index")
+    apparent_temps = column("apparent_temperature")
+
+    start_times = parse_iso_datetime_column(times, utc_offset_seconds)
+    short_forecasts = _lookup_column(column("weather_code"), weather_code_to_description)
+    wind_directions = _lookup_column(column("wind_direction_10m"), degrees_to_cardinal)
+    wind_speeds_mph = _convert_column(
+        column("wind_speed_10m"),
+        wind_speed_to_mph_converter(hourly_units.get("wind_speed_10m", "mph")),
+    )
+    wind_speed_texts = [_format_wind_speed_mph(value) for value in wind_speeds_mph]
+    pressures = _convert_column(
+        column("pressure_msl"),
+        pressure_converter(hourly_units.get("pressure_msl", "hPa")),
+    )
     # Seasonal fields
-    snow_depths = hourly.get("snow_depth", [])
-    freezing_levels = hourly.get("freezing_level_height", [])
-    visibilities = hourly.get("visibility", [])
-    apparent_temps = hourly.get("apparent_temperature", [])
-
-    for i, time_str in enumerate(times):
-        start_time = _parse_iso_datetime(time_str, utc_offset_seconds) or datetime.now()
-
-        temperature = temperatures[i] if i < len(temperatures) else None
-        humidity = humidities[i] if i < len(humidities) else None
-        dewpoint = dew_points[i] if i < len(dew_points) else None
-        weather_code = weather_codes[i] if i < len(weather_codes) else None
-        wind_speed = wind_speeds[i] if i < len(wind_speeds) else None
-        wind_speed_mph, _wind_speed_kph = convert_wind_speed_to_mph_and_kph(
-            wind_speed,
-            hourly_units.get("wind_speed_10m", "mph"),
-        )
-        wind_direction = wind_directions[i] if i < len(wind_directions) else None
-        pressure_raw = pressures[i] if i < len(pressures) else None
-        pressure_in, pressure_mb = normalize_pressure(
-            pressure_raw,
-            hourly_units.get("pressure_msl", "hPa"),
-        )
-        precip_prob = precip_probs[i] if i < len(precip_probs) else None
-        snowfall = snowfalls[i] if i < len(snowfalls) else None
-        uv_index = uv_indices[i] if i < len(uv_indices) else None
-
-        # Seasonal fields
-        snow_depth_raw = snow_depths[i] if i < len(snow_depths) else None
-        snow_depth_in, _snow_depth_cm = normalize_snow_depth_to_inches_and_cm(
-            snow_depth_raw,
-            hourly_units.get("snow_depth"),
-        )
-
-        freezing_level_raw = freezing_levels[i] if i < len(freezing_levels) else None
-        freezing_level_ft = normalize_height_to_feet(
-            freezing_level_raw,
-            hourly_units.get("freezing_level_height"),
-        )
+    to_inches = snow_depth_to_inches_converter(hourly_units.get("snow_depth"))
+    snow_depths_in = _convert_column(column("snow_depth"), lambda value: to_inches(float(value)))
+    to_feet = height_to_feet_converter(hourly_units.get("freezing_level_height"))
+    freezing_levels_ft = _convert_column(
+        column("freezing_level_height"), lambda value: to_feet(float(value))
+    )
+    to_visibility = visibility_converter(
+        hourly_units.get("visibility"), cap_miles=VISIBILITY_CAP_MILES
+    )
+    visibilities = [
+        None if numeric is None else to_visibility(numeric)
+        for numeric in map(as_float, column("visibility"))
+    ]
+    to_dewpoint = temperature_converter(
+        hourly_units.get("dew_point_2m", hourly_units.get("temperature_2m", "°F"))
+    )
+    dewpoints = [
+        None if numeric is None else to_dewpoint(numeric) for numeric in map(as_float, dew_points)
+    ]
 
-        visibility_raw = visibilities[i] if i < len(visibilities) else None
-        visibility_miles, visibility_km = normalize_visibility_to_miles_and_km(
-            visibility_raw,
-            hourly_units.get("visibility"),
-        )
-
-        apparent_temp = apparent_temps[i] if i < len(apparent_temps) else None
-        dewpoint_pair = normalize_dewpoint_pair(
-            dewpoint,
-            hourly_units.get("dew_point_2m", hourly_units.get("temperature_2m", "°F")),
-            fallback_temperature_f=temperature,
-            humidity_percent=humidity,
-        )
-
-        apparent = classify_apparent_temperature(
-            temperature,
-            apparent_temp,
-            None,
-        )
-
-        period = HourlyForecastPeriod(
-            start_time=start_time or datetime.now(),
-            temperature=temperature,
-            temperature_unit="F",
-            short_forecast=weather_code_to_description(weather_code),
-            wind_speed=_format_wind_speed_mph(wind_speed_mph),
-            wind_direction=degrees_to_cardinal(wind_direction),
-            humidity=humidity,
-            dewpoint_f=dewpoint_pair.fahrenheit,
-            dewpoint_c=dewpoint_pair.celsius,
-            pressure_mb=pressure_mb,
-            pressure_in=pressure_in,
-            precipitation_probability=precip_prob,
-            snowfall=snowfall,
-            uv_index=uv_index,
-            wind_speed_mph=wind_speed_mph,
-            # Seasonal fields
-            snow_depth=snow_depth_in,
-            freezing_level_ft=freezing_level_ft,
-            visibility_miles=visibility_miles,
-            visibility_km=visibility_km,
-            feels_like=apparent_temp,
-            wind_chill_f=apparent.wind_chill_f,
-            wind_chill_c=apparent.wind_chill_c,
-            heat_index_f=apparent.heat_index_f,
-            heat_index_c=apparent.heat_index_c,
+    periods: list[HourlyForecastPeriod] = []
+    for i in range(length):
+        temperature = temperatures[i]
+        humidity = humidities[i]
+        apparent_temp = apparent_temps[i]
+        pressure_in, pressure_mb = pressures[i] or (None, None)
+        visibility = visibilities[i]
+        dewpoint_f, dewpoint_c = dewpoints[i] or _fallback_dewpoint(temperature, humidity)
+        apparent = classify_apparent_temperature(temperature, apparent_temp, None)
+
+        periods.append(
+            HourlyForecastPeriod(
+                start_time=start_times[i] or datetime.now(),
+                temperature=temperature,
+                temperature_unit="F",
+                short_forecast=short_forecasts[i],
+                wind_speed=wind_speed_texts[i],
+                wind_direction=wind_directions[i],
+                humidity=humidity,
+                dewpoint_f=dewpoint_f,
+                dewpoint_c=dewpoint_c,
+                pressure_mb=pressure_mb,
+                pressure_in=pressure_in,
+                precipitation_probability=precip_probs[i],
+                snowfall=snowfalls[i],
+                uv_index=uv_indices[i],
+                wind_speed_mph=wind_speeds_mph[i],
+                # Seasonal fields
+                snow_depth=snow_depths_in[i],
+                freezing_level_ft=freezing_levels_ft[i],
+                visibility_miles=visibility.miles if visibility else None,
+                visibility_km=visibility.kilometers if visibility else None,
+                feels_like=apparent_temp,
+                wind_chill_f=apparent.wind_chill_f,
+                wind_chill_c=apparent.wind_chill_c,
+                heat_index_f=apparent.heat_index_f,
+                heat_index_c=apparent.heat_index_c,
+            )
         )
-        periods.append(period)
 
     return HourlyForecast(periods=periods, generated_at=datetime.now())
@@ -110,6 +110,32 @@ def parse_iso_datetime(value: str | None, utc_offset_seconds: int | None = None)
     return None
 
 
+def parse_iso_datetime_column(
+    values: list[str | None], utc_offset_seconds: int | None = None
+) -> list[datetime | None]:
+    """
+    Parse a column of ISO 8601 strings with the same rules as :func:`parse_iso_datetime`.
+
+    Open-Meteo time columns are naive local times, so the location timezone is
+    built once and attached directly; anything else goes through the scalar
+    parser.
+    """
+    local_tz = (
+        timezone(timedelta(seconds=utc_offset_seconds)) if utc_offset_seconds is not None else UTC
+    )
+    parsed: list[datetime | None] = []
+    for value in values:
+        try:
+            dt = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            dt = None
+        if dt is None or dt.tzinfo is not None:
+            parsed.append(parse_iso_datetime(value, utc_offset_seconds))
+        else:
+            parsed.append(dt.replace(tzinfo=local_tz))
+    return parsed
+
+
 def _parse_uv_index(current: dict[str, Any], daily: dict[str, Any]) -> float | None:
     raw_current_uv = current.get("uv_index")
     if raw_current_uv is not None:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from .provider_normalization import normalize_visibility_pair
 
 CM_PER_INCH = 2.54
@@ -14,6 +16,22 @@ def _unit_text(unit: str | None) -> str:
     return (unit or "").strip().lower().replace(" ", "_")
 
 
+def snow_depth_to_inches_converter(unit: str | None) -> Callable[[float], float]:
+    """Resolve a snow depth unit once and return a value-to-inches converter."""
+    unit_text = _unit_text(unit)
+
+    if "ft" in unit_text or "feet" in unit_text:
+        return lambda numeric: numeric * INCHES_PER_FOOT
+    if "mm" in unit_text or "millimeter" in unit_text or "millimetre" in unit_text:
+        return lambda numeric: numeric / 25.4
+    if "cm" in unit_text or "centimeter" in unit_text or "centimetre" in unit_text:
+        return lambda numeric: numeric / CM_PER_INCH
+    if unit_text in {"in", "inch", "inches"}:
+        return lambda numeric: numeric
+    # Open-Meteo uses meters when no precipitation_unit override is applied.
+    return lambda numeric: numeric * FEET_PER_METER * INCHES_PER_FOOT
+
+
 def normalize_snow_depth_to_inches_and_cm(
     value: float | int | None,
     unit: str | None,
@@ -22,21 +40,7 @@ def normalize_snow_depth_to_inches_and_cm(
     if value is None:
         return None, None
 
-    numeric = float(value)
-    unit_text = _unit_text(unit)
-
-    if "ft" in unit_text or "feet" in unit_text:
-        inches = numeric * INCHES_PER_FOOT
-    elif "mm" in unit_text or "millimeter" in unit_text or "millimetre" in unit_text:
-        inches = numeric / 25.4
-    elif "cm" in unit_text or "centimeter" in unit_text or "centimetre" in unit_text:
-        inches = numeric / CM_PER_INCH
-    elif unit_text in {"in", "inch", "inches"}:
-        inches = numeric
-    else:
-        # Open-Meteo uses meters when no precipitation_unit override is applied.
-        inches = numeric * FEET_PER_METER * INCHES_PER_FOOT
-
+    inches = snow_depth_to_inches_converter(unit)(float(value))
     return inches, inches * CM_PER_INCH
 
 
@@ -62,20 +66,24 @@ def normalize_precipitation_to_inches_and_mm(
     return inches, inches * 25.4
 
 
-def normalize_height_to_feet(value: float | int | None, unit: str | None) -> float | None:
-    """Return a height value normalized to feet."""
-    if value is None:
-        return None
-
-    numeric = float(value)
+def height_to_feet_converter(unit: str | None) -> Callable[[float], float]:
+    """Resolve a height unit once and return a value-to-feet converter."""
     unit_text = _unit_text(unit)
 
     if "ft" in unit_text or "feet" in unit_text:
-        return numeric
+        return lambda numeric: numeric
     if "km" in unit_text or "kilometer" in unit_text or "kilometre" in unit_text:
-        return numeric * 1000 * FEET_PER_METER
+        return lambda numeric: numeric * 1000 * FEET_PER_METER
+
+    return lambda numeric: numeric * FEET_PER_METER
+
+
+def normalize_height_to_feet(value: float | int | None, unit: str | None) -> float | None:
+    """Return a height value normalized to feet."""
+    if value is None:
+        return None
 
-    return numeric * FEET_PER_METER
+    return height_to_feet_converter(unit)(float(value))
 
 
 def normalize_visibility_to_miles_and_km(
@@ -15,6 +15,7 @@ from accessiweather.models.weather import (
     Location,
     SourceData,
 )
+from accessiweather.performance.timer import span
 
 if TYPE_CHECKING:
     from accessiweather.models.alerts import WeatherAlerts
@@ -142,7 +143,8 @@ class ParallelFetchCoordinator:
 
         """
         try:
-            return await asyncio.wait_for(coro, timeout=self.timeout)
+            with span("provider_fetch", provider=source_name):
+                return await asyncio.wait_for(coro, timeout=self.timeout)
         except TimeoutError:
             logger.warning(f"Source {source_name} timed out after {self.timeout}s")
             return None
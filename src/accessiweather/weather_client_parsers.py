@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -14,10 +15,14 @@ __all__ = [
     "convert_wind_speed_to_mph",
     "convert_wind_speed_to_kph",
     "convert_wind_speed_to_mph_and_kph",
+    "wind_speed_to_mph_converter",
+    "wind_speed_to_kph_converter",
     "convert_pa_to_inches",
     "convert_pa_to_mb",
     "normalize_temperature",
+    "temperature_converter",
     "normalize_pressure",
+    "pressure_converter",
     "convert_f_to_c",
     "degrees_to_cardinal",
     "weather_code_to_description",
@@ -65,40 +70,54 @@ def convert_mps_to_mph(mps: float | None) -> float | None:
     return mps * 2.237 if mps is not None else None
 
 
-def convert_wind_speed_to_mph(value: float | None, unit_code: str | None) -> float | None:
-    """Normalize WMO wind speed units to miles per hour."""
-    if value is None:
-        return None
+def _identity(value: float) -> float:
+    return value
+
+
+def wind_speed_to_mph_converter(unit_code: str | None) -> Callable[[float], float]:
+    """Resolve a WMO wind speed unit once and return a value-to-mph converter."""
     if not unit_code:
-        return value
+        return _identity
     unit_code = unit_code.lower()
     if unit_code.endswith(("m_s-1", "mps")):
-        return value * 2.237
+        return lambda value: value * 2.237
     if unit_code.endswith(("km_h-1", "kmh", "km/h")):
-        return value * 0.621371
+        return lambda value: value * 0.621371
     if unit_code.endswith(("mi_h-1", "mph", "mp/h")):
-        return value
+        return _identity
     if unit_code.endswith(("kn", "kt")):
-        return value * 1.15078
-    return value
+        return lambda value: value * 1.15078
+    return _identity
 
 
-def convert_wind_speed_to_kph(value: float | None, unit_code: str | None) -> float | None:
-    """Normalize WMO wind speed units to kilometers per hour."""
-    if value is None:
-        return None
+def wind_speed_to_kph_converter(unit_code: str | None) -> Callable[[float], float]:
+    """Resolve a WMO wind speed unit once and return a value-to-km/h converter."""
     if not unit_code:
-        return value
+        return _identity
     unit_code = unit_code.lower()
     if unit_code.endswith(("m_s-1", "mps")):
-        return value * 3.6
+        return lambda value: value * 3.6
     if unit_code.endswith(("km_h-1", "kmh", "km/h")):
-        return value
+        return _identity
     if unit_code.endswith(("mi_h-1", "mph", "mp/h")):
-        return value * 1.60934
+        return lambda value: value * 1.60934
     if unit_code.endswith(("kn", "kt")):
-        return value * 1.852
-    return value
+        return lambda value: value * 1.852
+    return _identity
+
+
+def convert_wind_speed_to_mph(value: float | None, unit_code: str | None) -> float | None:
+    """Normalize WMO wind speed units to miles per hour."""
+    if value is None:
+        return None
+    return wind_speed_to_mph_converter(unit_code)(value)
+
+
+def convert_wind_speed_to_kph(value: float | None, unit_code: str | None) -> float | None:
+    """Normalize WMO wind speed units to kilometers per hour."""
+    if value is None:
+        return None
+    return wind_speed_to_kph_converter(unit_code)(value)
 
 
 def convert_wind_speed_to_mph_and_kph(
@@ -121,45 +140,44 @@ def convert_pa_to_mb(pa: float | None) -> float | None:
     return pa / 100 if pa is not None else None
 
 
+def temperature_converter(
+    unit: str | None,
+) -> Callable[[float], tuple[float | None, float | None]]:
+    """Resolve a temperature unit once and return a value-to-(F, C) converter."""
+    unit_lower = (unit or "").lower()
+    if "c" in unit_lower and "f" not in unit_lower:
+        return lambda value: ((value * 9 / 5) + 32, value)
+    return lambda value: (value, convert_f_to_c(value))
+
+
 def normalize_temperature(
     value: float | None, unit: str | None
 ) -> tuple[float | None, float | None]:
     """Return temperature normalized to both Fahrenheit and Celsius."""
     if value is None:
         return None, None
+    return temperature_converter(unit)(value)
+
 
+def pressure_converter(
+    unit: str | None,
+) -> Callable[[float], tuple[float | None, float | None]]:
+    """Resolve a pressure unit once and return a value-to-(inHg, mb) converter."""
     unit_lower = (unit or "").lower()
-    if "f" in unit_lower:
-        temp_f = value
-        temp_c = convert_f_to_c(temp_f)
-    elif "c" in unit_lower:
-        temp_c = value
-        temp_f = (temp_c * 9 / 5) + 32
-    else:
-        temp_f = value
-        temp_c = convert_f_to_c(temp_f)
-    return temp_f, temp_c
+    if "hpa" in unit_lower or "mb" in unit_lower:
+        return lambda value: (value * 0.0295299830714, value)
+    if "pa" in unit_lower:
+        return lambda value: (convert_pa_to_inches(value), value / 100)
+    if "inch" in unit_lower or unit_lower.endswith("in"):
+        return lambda value: (value, value * 33.8639)
+    return lambda value: (None, value)
 
 
 def normalize_pressure(value: float | None, unit: str | None) -> tuple[float | None, float | None]:
     """Return pressure normalized to both inches of mercury and millibars."""
     if value is None:
         return None, None
-
-    unit_lower = (unit or "").lower()
-    if "hpa" in unit_lower or "mb" in unit_lower:
-        pressure_mb = value
-        pressure_in = value * 0.0295299830714
-    elif "pa" in unit_lower:
-        pressure_mb = value / 100
-        pressure_in = convert_pa_to_inches(value)
-    elif "inch" in unit_lower or unit_lower.endswith("in"):
-        pressure_in = value
-        pressure_mb = value * 33.8639
-    else:
-        pressure_mb = value
-        pressure_in = None
-    return pressure_in, pressure_mb
+    return pressure_converter(unit)(value)
 
 
 def convert_f_to_c(fahrenheit: float | None) -> float | None:
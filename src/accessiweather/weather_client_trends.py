@@ -6,7 +6,8 @@ import logging
 from collections.abc import Sequence
 from datetime import datetime, timedelta
 
-from .models import HourlyForecastPeriod, TrendInsight, WeatherData
+from .models import HourlyForecast, HourlyForecastPeriod, TrendInsight, WeatherData
+from .models.time_index import TimeIndex
 
 logger = logging.getLogger(__name__)
 
@@ -60,8 +61,8 @@ def compute_temperature_trend(
 ) -> TrendInsight | None:
     """Compute the projected temperature trend over the configured number of hours."""
     current = weather_data.current
-    hourly = weather_data.hourly_forecast.periods if weather_data.hourly_forecast else []
-    if current is None or not hourly:
+    hourly = weather_data.hourly_forecast
+    if current is None or hourly is None or not hourly.periods:
         logger.debug("Insufficient data for temperature trend calculation")
         return None
 
@@ -103,8 +104,8 @@ def compute_pressure_trend(
 ) -> TrendInsight | None:
     """Compute the projected pressure trend over the configured number of hours."""
     current = weather_data.current
-    hourly = weather_data.hourly_forecast.periods if weather_data.hourly_forecast else []
-    if current is None or not hourly:
+    hourly = weather_data.hourly_forecast
+    if current is None or hourly is None or not hourly.periods:
         logger.debug("Insufficient data for pressure trend calculation")
         return None
 
@@ -261,41 +262,29 @@ def trend_descriptor(change: float, *, minor: float, strong: float) -> tuple[str
 
 
 def period_for_hours_ahead(
-    periods: Sequence[HourlyForecastPeriod],
+    periods: Sequence[HourlyForecastPeriod] | HourlyForecast,
     hours_ahead: int,
     *,
     max_delta_hours: float | None = None,
 ) -> HourlyForecastPeriod | None:
-    """Return the forecast period closest to the target number of hours ahead."""
-    if not periods:
-        return None
+    """
+    Return the forecast period closest to the target number of hours ahead.
 
-    target = normalize_datetime(datetime.now())
-    if target is None:
-        return None
-    target = target + timedelta(hours=hours_ahead)
-
-    closest = None
-    best_delta: float | None = None
-    for period in periods:
-        start = normalize_datetime(period.start_time)
-        if start is None:
-            continue
-        try:
-            delta = abs((start - target).total_seconds())
-        except TypeError:
-            # Skip if datetime comparison fails (e.g., mixed naive/aware)
-            continue
-        if best_delta is None or delta < best_delta:
-            closest = period
-            best_delta = delta
-    if (
-        max_delta_hours is not None
-        and best_delta is not None
-        and best_delta > max_delta_hours * 3600
-    ):
+    Passing the ``HourlyForecast`` reuses its cached time index; a plain
+    sequence of periods (naive times read as local) is indexed on each call.
+    """
+    if isinstance(periods, HourlyForecast):
+        index = periods.time_index()
+    else:
+        index = TimeIndex(periods, lambda period: period.start_time, naive_as="local")
+    if not index:
         return None
-    return closest
+
+    target = datetime.now() + timedelta(hours=hours_ahead)
+    return index.nearest(
+        target.timestamp(),
+        max_delta_seconds=max_delta_hours * 3600 if max_delta_hours is not None else None,
+    )
 
 
 def normalize_datetime(value: datetime | None) -> datetime | None:
@@ -2,19 +2,23 @@
 Weather history comparison functionality using Open-Meteo archive API.
 
 This module provides functionality to compare current weather conditions with
-historical data from Open-Meteo's archive endpoint. No local storage required.
-Designed with accessibility in mind for screen reader users.
+historical data from Open-Meteo's archive endpoint. An optional
+WeatherHistoryArchive keeps fetched days on disk so repeated comparisons are
+answered locally. Designed with accessibility in mind for screen reader users.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .models import CurrentConditions, Location
+    from .weather_history_archive import WeatherHistoryArchive
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +32,16 @@ def _daily_value(daily: dict, field_name: str, target_date: date) -> float | int
     return values[0]
 
 
+_DAILY_FIELDS = [
+    "weather_code",
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "temperature_2m_mean",
+    "wind_speed_10m_max",
+    "wind_direction_10m_dominant",
+]
+
+
 @dataclass
 class HistoricalWeatherData:
     """Historical weather data for a specific date."""
@@ -132,7 +146,11 @@ class WeatherComparison:
 class WeatherHistoryService:
     """Service for fetching historical weather data and making comparisons."""
 
-    def __init__(self, openmeteo_client=None):
+    def __init__(
+        self,
+        openmeteo_client=None,
+        archive: WeatherHistoryArchive | None = None,
+    ):
         """
         Initialize the weather history service.
 
@@ -140,6 +158,8 @@ class WeatherHistoryService:
         ----
             openmeteo_client: Optional OpenMeteoApiClient instance. If not provided,
                             one will be created.
+            archive: Optional local archive. When set, lookups are answered from
+                     it and only missing date ranges are fetched.
 
         """
         if openmeteo_client is None:
@@ -151,6 +171,131 @@ class WeatherHistoryService:
             )
         else:
             self.openmeteo_client = openmeteo_client
+        self.archive = archive
+
+    def _fetch_daily(
+        self,
+        latitude: float,
+        longitude: float,
+        start: date,
+        end: date,
+        temperature_unit: str,
+    ) -> dict[str, Any] | None:
+        """Fetch the archive ``daily`` block for ``start``..``end`` in one request."""
+        params = {
+            "latitude": latitude,
+            "longitude": longitude,
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "daily": list(_DAILY_FIELDS),
+            "temperature_unit": temperature_unit,
+            "timezone": "auto",
+        }
+        # Call archive endpoint (uses different base URL than forecast)
+        response = self.openmeteo_client._make_request("archive", params, use_archive=True)
+        if not response or "daily" not in response:
+            logger.warning(f"No historical data available for {start}..{end}")
+            return None
+        return response["daily"]
+
+    def _build_historical(
+        self, target_date: date, values: dict[str, Any]
+    ) -> HistoricalWeatherData | None:
+        """Build a HistoricalWeatherData from one day's raw archive values."""
+        missing = [
+            field
+            for field in _DAILY_FIELDS
+            if field != "wind_direction_10m_dominant" and values.get(field) is None
+        ]
+        if missing:
+            logger.warning(
+                "Archive response for %s is missing required daily values: %s",
+                target_date,
+                ", ".join(missing),
+            )
+            return None
+
+        wind_direction = values.get("wind_direction_10m_dominant")
+        return HistoricalWeatherData(
+            date=target_date,
+            temperature_max=float(values["temperature_2m_max"]),
+            temperature_min=float(values["temperature_2m_min"]),
+            temperature_mean=float(values["temperature_2m_mean"]),
+            condition=self.openmeteo_client.get_weather_description(values["weather_code"]),
+            humidity=None,  # Not available in archive endpoint
+            wind_speed=float(values["wind_speed_10m_max"]),
+            wind_direction=int(wind_direction) if wind_direction is not None else None,
+            pressure=None,  # Not available in archive endpoint
+        )
+
+    def get_historical_range(
+        self,
+        latitude: float,
+        longitude: float,
+        start: date,
+        end: date,
+        temperature_unit: str = "fahrenheit",
+    ) -> dict[date, HistoricalWeatherData]:
+        """
+        Fetch historical weather data for every day from ``start`` to ``end``.
+
+        With an archive, only the date gaps it does not already hold are
+        requested (one request per contiguous gap); otherwise the whole range
+        is fetched in a single request.
+
+        Returns
+        -------
+            Mapping of date to HistoricalWeatherData for the days that are available
+
+        """
+        if end < start:
+            return {}
+
+        if self.archive is None:
+            try:
+                daily = self._fetch_daily(latitude, longitude, start, end, temperature_unit)
+            except Exception as e:
+                logger.error(f"Failed to fetch historical weather data: {e}")
+                return {}
+            if daily is None:
+                return {}
+            results: dict[date, HistoricalWeatherData] = {}
+            for index, stamp in enumerate(daily.get("time") or []):
+                try:
+                    day = date.fromisoformat(str(stamp)[:10])
+                except ValueError:
+                    continue
+                values = {
+                    field: daily[field][index]
+                    if isinstance(daily.get(field), list) and index < len(daily[field])
+                    else None
+                    for field in _DAILY_FIELDS
+                }
+                historical = self._build_historical(day, values)
+                if historical is not None:
+                    results[day] = historical
+            return results
+
+        for gap_start, gap_end in self.archive.missing_ranges(
+            latitude, longitude, temperature_unit, start, end
+        ):
+            try:
+                daily = self._fetch_daily(latitude, longitude, gap_start, gap_end, temperature_unit)
+            except Exception as e:
+                logger.error(f"Failed to fetch historical weather data: {e}")
+                continue
+            if daily is not None:
+                self.archive.merge(latitude, longitude, temperature_unit, daily)
+
+        results = {}
+        for offset in range((end - start).days + 1):
+            day = start + timedelta(days=offset)
+            values = self.archive.get(latitude, longitude, temperature_unit, day)
+            if values is not None:
+                historical = self._build_historical(day, values)
+                if historical is not None:
+                    results[day] = historical
+        return results
 
     def get_historical_weather(
         self,
@@ -174,73 +319,24 @@ class WeatherHistoryService:
             HistoricalWeatherData if successful, None otherwise
 
         """
+        if self.archive is not None:
+            return self.get_historical_range(
+                latitude, longitude, target_date, target_date, temperature_unit
+            ).get(target_date)
+
         try:
-            # Use Open-Meteo archive endpoint for historical data
-            params = {
-                "latitude": latitude,
-                "longitude": longitude,
-                "start_date": target_date.isoformat(),
-                "end_date": target_date.isoformat(),
-                "daily": [
-                    "weather_code",
-                    "temperature_2m_max",
-                    "temperature_2m_min",
-                    "temperature_2m_mean",
-                    "wind_speed_10m_max",
-                    "wind_direction_10m_dominant",
-                ],
-                "temperature_unit": temperature_unit,
-                "timezone": "auto",
-            }
-
-            # Call archive endpoint (uses different base URL than forecast)
-            response = self.openmeteo_client._make_request("archive", params, use_archive=True)
-
-            if not response or "daily" not in response:
-                logger.warning(f"No historical data available for {target_date}")
+            daily = self._fetch_daily(
+                latitude, longitude, target_date, target_date, temperature_unit
+            )
+            if daily is None:
                 return None
 
-            daily = response["daily"]
-
             # Extract data for the requested date
             if not daily.get("time") or len(daily["time"]) == 0:
                 return None
 
-            weather_code = _daily_value(daily, "weather_code", target_date)
-            condition = self.openmeteo_client.get_weather_description(weather_code)
-            temperature_max = _daily_value(daily, "temperature_2m_max", target_date)
-            temperature_min = _daily_value(daily, "temperature_2m_min", target_date)
-            temperature_mean = _daily_value(daily, "temperature_2m_mean", target_date)
-            wind_speed = _daily_value(daily, "wind_speed_10m_max", target_date)
-            wind_direction = _daily_value(daily, "wind_direction_10m_dominant", target_date)
-
-            required_values = {
-                "weather_code": weather_code,
-                "temperature_2m_max": temperature_max,
-                "temperature_2m_min": temperature_min,
-                "temperature_2m_mean": temperature_mean,
-                "wind_speed_10m_max": wind_speed,
-            }
-            missing = [field for field, value in required_values.items() if value is None]
-            if missing:
-                logger.warning(
-                    "Archive response for %s is missing required daily values: %s",
-                    target_date,
-                    ", ".join(missing),
-                )
-                return None
-
-            return HistoricalWeatherData(
-                date=target_date,
-                temperature_max=float(temperature_max),
-                temperature_min=float(temperature_min),
-                temperature_mean=float(temperature_mean),
-                condition=condition,
-                humidity=None,  # Not available in archive endpoint
-                wind_speed=float(wind_speed),
-                wind_direction=int(wind_direction) if wind_direction is not None else None,
-                pressure=None,  # Not available in archive endpoint
-            )
+            values = {field: _daily_value(daily, field, target_date) for field in _DAILY_FIELDS}
+            return self._build_historical(target_date, values)
 
         except Exception as e:
             logger.error(f"Failed to fetch historical weather data: {e}")
@@ -337,3 +433,71 @@ class WeatherHistoryService:
             return None
 
         return WeatherComparison.compare(current_conditions, historical, days_ago=days_ago)
+
+    def compare_recent(
+        self,
+        location: Location,
+        current_conditions: CurrentConditions,
+        days_ago: Iterable[int] = (1, 7),
+        temperature_unit: str = "fahrenheit",
+    ) -> dict[int, WeatherComparison]:
+        """
+        Compare current weather with several past days using one date range.
+
+        Args:
+        ----
+            location: Location for the comparison
+            current_conditions: Current weather conditions
+            days_ago: Offsets in days to compare against (e.g. 1 and 7)
+            temperature_unit: Temperature unit for API request
+
+        Returns:
+        -------
+            Mapping of days ago to WeatherComparison for the days with data
+
+        """
+        offsets = sorted({int(days) for days in days_ago if int(days) > 0})
+        if not offsets:
+            return {}
+
+        today = datetime.now().date()
+        history = self.get_historical_range(
+            location.latitude,
+            location.longitude,
+            today - timedelta(days=offsets[-1]),
+            today - timedelta(days=offsets[0]),
+            temperature_unit,
+        )
+        comparisons: dict[int, WeatherComparison] = {}
+        for days in offsets:
+            historical = history.get(today - timedelta(days=days))
+            if historical is not None:
+                comparisons[days] = WeatherComparison.compare(
+                    current_conditions, historical, days_ago=days
+                )
+        return comparisons
+
+    async def get_historical_range_async(
+        self,
+        latitude: float,
+        longitude: float,
+        start: date,
+        end: date,
+        temperature_unit: str = "fahrenheit",
+    ) -> dict[date, HistoricalWeatherData]:
+        """Run :meth:`get_historical_range` off the event loop."""
+        return await asyncio.to_thread(
+            self.get_historical_range, latitude, longitude, start, end, temperature_unit
+        )
+
+    async def compare_recent_async(
+        self,
+        location: Location,
+        current_conditions: CurrentConditions,
+        days_ago: Iterable[int] = (1, 7),
+        temperature_unit: str = "fahrenheit",
+    ) -> dict[int, WeatherComparison]:
+        """Run :meth:`compare_recent` off the event loop."""
+        return await asyncio.to_thread(
+            self.compare_recent, location, current_conditions, tuple(days_ago), temperature_unit
+        )
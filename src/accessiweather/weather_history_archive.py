@@ -0,0 +1,236 @@
+"""Persistent per-location archive of daily historical weather records."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Mapping
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from .json_store import VersionedJsonStore
+from .paths import RuntimeStoragePaths, resolve_default_runtime_storage
+
+logger = logging.getLogger(__name__)
+
+HISTORY_ARCHIVE_SCHEMA_VERSION = 1
+MAX_HISTORY_ARCHIVE_LOCATIONS = 32
+# About thirteen months per location covers "same day last year" comparisons.
+MAX_HISTORY_ARCHIVE_DAYS = 400
+
+# Daily archive fields kept as columns; a day counts as archived only when all
+# of the required columns hold a value.
+HISTORY_COLUMNS = (
+    "weather_code",
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "temperature_2m_mean",
+    "wind_speed_10m_max",
+    "wind_direction_10m_dominant",
+)
+REQUIRED_HISTORY_COLUMNS = HISTORY_COLUMNS[:-1]
+
+
+class WeatherHistoryArchive:
+    """
+    Keep daily archive values per location and unit as contiguous columns.
+
+    Each location holds a ``start`` date plus one list per field, so day ``n``
+    of every column is ``start + n`` days. Gaps are stored as ``None`` and
+    reported by :meth:`missing_ranges` so callers only fetch what is absent.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: Path | str | None = None,
+        runtime_paths: RuntimeStoragePaths | None = None,
+        max_locations: int = MAX_HISTORY_ARCHIVE_LOCATIONS,
+        max_days: int = MAX_HISTORY_ARCHIVE_DAYS,
+    ) -> None:
+        """Initialize the archive with an optional persistence path and size limits."""
+        resolved_path = path
+        if resolved_path is None:
+            resolved_path = (
+                runtime_paths or resolve_default_runtime_storage()
+            ).weather_history_archive_file
+        self._store = VersionedJsonStore(
+            resolved_path,
+            schema_version=HISTORY_ARCHIVE_SCHEMA_VERSION,
+            label="weather history archive",
+        )
+        self._max_locations = max(1, int(max_locations))
+        self._max_days = max(1, int(max_days))
+        self._lock = threading.Lock()
+        self._records: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def key_for(latitude: float, longitude: float, temperature_unit: str) -> str:
+        """Return the archive key; daily history differs per unit, so the unit is part of it."""
+        return f"{float(latitude):.2f},{float(longitude):.2f}|{temperature_unit}"
+
+    def missing_ranges(
+        self,
+        latitude: float,
+        longitude: float,
+        temperature_unit: str,
+        start: date,
+        end: date,
+    ) -> list[tuple[date, date]]:
+        """Return the inclusive date ranges within ``start``..``end`` not yet archived."""
+        with self._lock:
+            record = self._records.get(self.key_for(latitude, longitude, temperature_unit))
+            present = [
+                self._row(record, start + timedelta(days=offset)) is not None
+                for offset in range((end - start).days + 1)
+            ]
+
+        gaps: list[tuple[date, date]] = []
+        gap_start: date | None = None
+        for offset, is_present in enumerate(present):
+            day = start + timedelta(days=offset)
+            if not is_present and gap_start is None:
+                gap_start = day
+            elif is_present and gap_start is not None:
+                gaps.append((gap_start, day - timedelta(days=1)))
+                gap_start = None
+        if gap_start is not None:
+            gaps.append((gap_start, end))
+        return gaps
+
+    def get(
+        self, latitude: float, longitude: float, temperature_unit: str, day: date
+    ) -> dict[str, Any] | None:
+        """Return the archived field values for ``day``, or ``None`` when absent."""
+        with self._lock:
+            record = self._records.get(self.key_for(latitude, longitude, temperature_unit))
+            return self._row(record, day)
+
+    def merge(
+        self,
+        latitude: float,
+        longitude: float,
+        temperature_unit: str,
+        daily: Mapping[str, Any],
+    ) -> int:
+        """
+        Merge an Open-Meteo ``daily`` block into the archive.
+
+        Days missing a required value are skipped so they are fetched again
+        later. Returns the number of days stored.
+        """
+        times = daily.get("time")
+        if not isinstance(times, list) or not times:
+            return 0
+
+        rows: dict[date, dict[str, Any]] = {}
+        for index, stamp in enumerate(times):
+            try:
+                day = date.fromisoformat(str(stamp)[:10])
+            except ValueError:
+                continue
+            row = {}
+            for column in HISTORY_COLUMNS:
+                values = daily.get(column)
+                row[column] = (
+                    values[index] if isinstance(values, list) and index < len(values) else None
+                )
+            if any(row[column] is None for column in REQUIRED_HISTORY_COLUMNS):
+                continue
+            rows[day] = row
+        if not rows:
+            return 0
+
+        with self._lock:
+            key = self.key_for(latitude, longitude, temperature_unit)
+            record = self._records.pop(key, None) or {
+                "start": min(rows).isoformat(),
+                "columns": {column: [] for column in HISTORY_COLUMNS},
+            }
+            self._records[key] = record
+            for day, row in rows.items():
+                self._write_row(record, day, row)
+            self._trim(record, min(rows), max(rows))
+            while len(self._records) > self._max_locations:
+                self._records.pop(next(iter(self._records)))
+            self._store.save(self._records)
+        return len(rows)
+
+    def __len__(self) -> int:
+        """Return the number of archived locations."""
+        return len(self._records)
+
+    @staticmethod
+    def _row(record: dict[str, Any] | None, day: date) -> dict[str, Any] | None:
+        if record is None:
+            return None
+        index = (day - date.fromisoformat(record["start"])).days
+        columns = record["columns"]
+        if index < 0 or index >= len(columns["weather_code"]):
+            return None
+        row = {column: columns[column][index] for column in HISTORY_COLUMNS}
+        if any(row[column] is None for column in REQUIRED_HISTORY_COLUMNS):
+            return None
+        return row
+
+    @staticmethod
+    def _write_row(record: dict[str, Any], day: date, row: dict[str, Any]) -> None:
+        columns = record["columns"]
+        start = date.fromisoformat(record["start"])
+        if day < start:
+            padding = [None] * (start - day).days
+            for column in HISTORY_COLUMNS:
+                columns[column][:0] = padding
+            record["start"] = day.isoformat()
+            start = day
+        index = (day - start).days
+        length = len(columns["weather_code"])
+        if index >= length:
+            for column in HISTORY_COLUMNS:
+                columns[column].extend([None] * (index + 1 - length))
+        for column in HISTORY_COLUMNS:
+            columns[column][index] = row[column]
+
+    def _trim(self, record: dict[str, Any], keep_from: date, keep_to: date) -> None:
+        """
+        Cut the columns back to ``max_days`` without evicting ``keep_from``..``keep_to``.
+
+        The retained window is the latest one that still covers the just-merged
+        days, so an old comparison date pushes out recent days rather than
+        being dropped straight after it was fetched.
+        """
+        columns = record["columns"]
+        length = len(columns["weather_code"])
+        window = max(self._max_days, (keep_to - keep_from).days + 1)
+        if length <= window:
+            return
+        start = date.fromisoformat(record["start"])
+        end = start + timedelta(days=length - 1)
+        last = min(end, keep_from + timedelta(days=window - 1))
+        first = last - timedelta(days=window - 1)
+        lo, hi = (first - start).days, (last - start).days + 1
+        for column in HISTORY_COLUMNS:
+            columns[column][:] = columns[column][lo:hi]
+        record["start"] = first.isoformat()
+
+    def _load(self) -> None:
+        records: dict[str, dict[str, Any]] = {}
+        for key, record in self._store.load().items():
+            columns = record.get("columns")
+            try:
+                date.fromisoformat(record.get("start"))
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(columns, dict) or not all(
+                isinstance(columns.get(column), list) for column in HISTORY_COLUMNS
+            ):
+                continue
+            if len({len(columns[column]) for column in HISTORY_COLUMNS}) != 1:
+                continue
+            records[key] = {
+                "start": record["start"],
+                "columns": {column: columns[column] for column in HISTORY_COLUMNS},
+            }
+        self._records = records
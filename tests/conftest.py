@@ -669,3 +669,25 @@ def _suppress_real_notification_backends(monkeypatch):
         (None, None, None, None, None, None),
     )
     monkeypatch.setattr(toast_notifier, "SafeDesktopNotifier", toast_notifier._TestModeNotifier)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_nws_module_state(monkeypatch):
+    """Keep NWS points-cache, validator, cancel-tracker and station-health state from leaking between tests."""
+    import accessiweather.weather_client_nws_common as nws_common
+    import accessiweather.weather_client_nws_current as nws_current
+
+    monkeypatch.setattr(nws_common, "_POINTS_CACHE", None)
+    monkeypatch.setattr(nws_common, "_VALIDATOR_STORE", None)
+    monkeypatch.setattr(nws_common, "_CANCEL_TRACKER", None)
+    monkeypatch.setattr(nws_current, "station_health", nws_current.StationHealthTracker())
+
+
+@pytest.fixture(autouse=True)
+def _isolate_shared_http_transports():
+    """Give each test a fresh set of pooled HTTP transports."""
+    from accessiweather import http_session
+
+    http_session.reset_shared_transports()
+    yield
+    http_session.reset_shared_transports()
@@ -198,3 +198,86 @@ class TestWeatherToolExecutor:
 
         result = executor.execute("get_alerts", {"location": "NYC"})
         assert "Tornado Warning" in result
+
+
+class TestBatchedToolExecution:
+    """Tests for batched tool execution, result reuse and geocoding memoization."""
+
+    @pytest.fixture()
+    def geocoding(self):
+        service = MagicMock()
+        service.geocode_address.side_effect = lambda query: (1.0, 2.0, query.title())
+        return service
+
+    @pytest.fixture()
+    def weather(self):
+        service = MagicMock()
+        service.get_current_conditions.return_value = {"status": "ok"}
+        service.get_alerts.return_value = {"features": []}
+        return service
+
+    def test_execute_many_preserves_order_and_dedupes_batch(self, weather, geocoding):
+        executor = WeatherToolExecutor(weather, geocoding)
+        results = executor.execute_many(
+            [
+                ("get_current_weather", {"location": "paris"}),
+                ("get_alerts", {"location": "paris"}),
+                ("get_current_weather", {"location": "paris"}),
+                ("get_current_weather", {"location": "rome"}),
+            ]
+        )
+
+        assert "Paris" in results[0]
+        assert results[2] == results[0]
+        assert "Rome" in results[3]
+        assert weather.get_current_conditions.call_count == 2
+        assert geocoding.geocode_address.call_count == 2
+
+    def test_batch_and_memo_share_one_call_key(self, weather, geocoding):
+        from datetime import date
+
+        executor = WeatherToolExecutor(weather, geocoding)
+        arguments = {"location": "paris", "day": date(2026, 1, 1)}
+        executor.execute_many([("get_current_weather", arguments)])
+        executor.execute("get_current_weather", dict(arguments))
+
+        assert weather.get_current_conditions.call_count == 1
+
+    def test_execute_many_reports_unknown_tool_in_place(self, weather, geocoding):
+        executor = WeatherToolExecutor(weather, geocoding)
+        results = executor.execute_many(
+            [("nope", {}), ("get_current_weather", {"location": "paris"})]
+        )
+        assert results[0].startswith("Error executing nope")
+        assert "Paris" in results[1]
+
+    def test_repeated_calls_reuse_results_until_cleared(self, weather, geocoding):
+        executor = WeatherToolExecutor(weather, geocoding)
+        executor.execute("get_current_weather", {"location": "paris"})
+        executor.execute("get_current_weather", {"location": "paris"})
+        assert weather.get_current_conditions.call_count == 1
+
+        # Different spelling is a new call but reuses the geocoding lookup.
+        executor.execute("get_current_weather", {"location": "Paris "})
+        assert weather.get_current_conditions.call_count == 2
+        assert geocoding.geocode_address.call_count == 1
+
+        executor.clear_cache()
+        executor.execute("get_current_weather", {"location": "paris"})
+        assert weather.get_current_conditions.call_count == 3
+        assert geocoding.geocode_address.call_count == 1
+
+    def test_errors_and_location_writes_are_not_reused(self, weather, geocoding):
+        weather.get_current_conditions.side_effect = [RuntimeError("down"), {"status": "ok"}]
+        config = MagicMock()
+        config.get_location_names.return_value = []
+        config.add_location.return_value = True
+        executor = WeatherToolExecutor(weather, geocoding, config_manager=config)
+
+        assert executor.execute("get_current_weather", {"location": "x"}).startswith("Error")
+        assert "status: ok" in executor.execute("get_current_weather", {"location": "x"})
+
+        args = {"name": "Home", "latitude": 1.0, "longitude": 2.0}
+        executor.execute("add_location", args)
+        executor.execute("add_location", args)
+        assert config.add_location.call_count == 2
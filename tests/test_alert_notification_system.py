@@ -310,6 +310,17 @@ class TestAlertNotificationBatchSound:
         # The single alert should play sound
         assert calls[0].kwargs.get("play_sound", True) is True
 
+    @pytest.mark.asyncio
+    async def test_other_location_alerts_name_the_location(
+        self, notification_system, mock_notifier, multiple_alerts
+    ):
+        """Alerts polled for another saved location say which location they are for."""
+        await notification_system.process_and_notify(multiple_alerts, location_name="Boston")
+
+        titles = [call.kwargs["title"] for call in mock_notifier.send_notification.call_args_list]
+        assert titles
+        assert all(title.startswith("Boston: ") for title in titles)
+
     @pytest.mark.asyncio
     async def test_no_alerts_no_sound(self, notification_system, mock_notifier):
         """Test that no alerts means no notifications or sounds."""
@@ -712,6 +723,30 @@ class TestNotifyLifecycleChanges:
         assert result == 2
         assert mock_notifier.send_notification.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_lifecycle_titles_name_other_location(self, notification_system, mock_notifier):
+        """Lifecycle notifications for another saved location carry its name."""
+        from accessiweather.alert_lifecycle import AlertChange, AlertChangeKind
+
+        updated_change = AlertChange(
+            kind=AlertChangeKind.UPDATED,
+            alert=self._make_alert("upd-4", "Wind Advisory"),
+            alert_id="upd-4",
+            title="Wind Advisory",
+            old_severity="Minor",
+            new_severity="Minor",
+        )
+        cancelled_change = AlertChange(
+            kind=AlertChangeKind.CANCELLED, alert_id="cxl-4", title="Dense Fog Advisory"
+        )
+        diff = self._make_diff(updated=[updated_change], cancelled=[cancelled_change])
+
+        await notification_system.notify_lifecycle_changes(diff, location_name="Boston")
+
+        titles = [call.kwargs["title"] for call in mock_notifier.send_notification.call_args_list]
+        assert titles[0].startswith("Boston: UPDATED")
+        assert titles[1] == "Boston: CANCELLED: Dense Fog Advisory"
+
 
 @pytest.mark.asyncio
 async def test_update_settings_refreshes_alert_manager_runtime_filters():
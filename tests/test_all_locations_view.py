@@ -232,7 +232,7 @@ class TestShowAllLocationsSummary:
         wd_boston = _make_weather_data(locs[0], temp_f=55.0, condition="Cloudy")
         wd_austin = _make_weather_data(locs[1], temp_f=80.0, condition="Sunny")
 
-        def get_cached(loc):
+        def get_cached(loc, **_kwargs):
             return wd_boston if loc.name == "Boston" else wd_austin
 
         win.app.weather_client.get_cached_weather.side_effect = get_cached
@@ -309,7 +309,7 @@ class TestAllLocationsAlerts:
         wd_a = _make_weather_data(loc_a, alerts=[alert_a])
         wd_b = _make_weather_data(loc_b, alerts=[alert_b])
 
-        def get_cached(loc):
+        def get_cached(loc, **_kwargs):
             return wd_a if loc.name == "Boston" else wd_b
 
         win.app.weather_client.get_cached_weather.side_effect = get_cached
@@ -660,6 +660,27 @@ class TestAllLocationsRefresh:
         win._show_all_locations_summary.assert_not_called()
         win.refresh_button.Enable.assert_called_once()
 
+    def test_progress_coalesces_rerenders_until_rendered(self):
+        """Bursts of batch completions schedule a single pending summary re-render."""
+        from accessiweather.ui.main_window import MainWindow
+
+        win = _make_window()
+        win._all_locations_active = True
+        win._show_all_locations_summary = MagicMock()
+        win._render_all_locations_progress = MainWindow._render_all_locations_progress.__get__(
+            win, MainWindow
+        )
+        loc = _make_location("Boston")
+
+        with patch("accessiweather.ui.main_window_refresh.wx.CallAfter") as call_after:
+            MainWindow._on_all_locations_progress(win, loc, True, 1, 3)
+            MainWindow._on_all_locations_progress(win, loc, True, 2, 3)
+
+        call_after.assert_called_once_with(win._render_all_locations_progress)
+        win._render_all_locations_progress()
+        win._show_all_locations_summary.assert_called_once()
+        assert win._all_locations_render_pending is False
+
 
 # ---------------------------------------------------------------------------
 # _get_all_locations_tray_data — tray priority logic
@@ -685,7 +706,7 @@ class TestGetAllLocationsTrayData:
         wd_boston = _make_weather_data(locs[0], temp_f=55.0, alerts=[])
         wd_austin = _make_weather_data(locs[1], temp_f=80.0, alerts=[])
 
-        def get_cached(loc):
+        def get_cached(loc, **_kwargs):
             return wd_boston if loc.name == "Boston" else wd_austin
 
         win.app.weather_client.get_cached_weather.side_effect = get_cached
@@ -706,7 +727,7 @@ class TestGetAllLocationsTrayData:
         wd_boston = _make_weather_data(locs[0], alerts=[moderate_alert])
         wd_austin = _make_weather_data(locs[1], alerts=[severe_alert])
 
-        def get_cached(loc):
+        def get_cached(loc, **_kwargs):
             return wd_boston if loc.name == "Boston" else wd_austin
 
         win.app.weather_client.get_cached_weather.side_effect = get_cached
@@ -727,7 +748,7 @@ class TestGetAllLocationsTrayData:
         wd_boston = _make_weather_data(locs[0], alerts=[severe_alert])
         wd_austin = _make_weather_data(locs[1], alerts=[extreme_alert])
 
-        def get_cached(loc):
+        def get_cached(loc, **_kwargs):
             return wd_boston if loc.name == "Boston" else wd_austin
 
         win.app.weather_client.get_cached_weather.side_effect = get_cached
@@ -748,7 +769,7 @@ class TestGetAllLocationsTrayData:
         wd_boston = _make_weather_data(locs[0], alerts=[unknown_alert])
         wd_austin = _make_weather_data(locs[1], alerts=[minor_alert])
 
-        def get_cached(loc):
+        def get_cached(loc, **_kwargs):
             return wd_boston if loc.name == "Boston" else wd_austin
 
         win.app.weather_client.get_cached_weather.side_effect = get_cached
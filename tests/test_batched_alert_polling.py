@@ -0,0 +1,209 @@
+"""Tests for batched multi-location NWS alert polling."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from accessiweather.models import AppSettings, Location, WeatherAlert, WeatherAlerts
+from accessiweather.weather_client import WeatherClient
+from accessiweather.weather_client_nws_alerts import (
+    MAX_ZONES_PER_ALERT_QUERY,
+    get_nws_alerts_for_zones,
+)
+
+BASE_URL = "https://api.weather.gov"
+
+
+def _feature(alert_id: str, ugc: list[str], event: str = "Flood Warning") -> dict:
+    return {
+        "id": alert_id,
+        "properties": {
+            "id": alert_id,
+            "event": event,
+            "headline": f"{event} issued",
+            "severity": "Severe",
+            "geocode": {"UGC": ugc},
+            "affectedZones": [f"{BASE_URL}/zones/county/{zone}" for zone in ugc],
+        },
+    }
+
+
+def _resp(features: list[dict]) -> MagicMock:
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 200
+    response.json.return_value = {"features": features}
+    response.headers = {}
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def _alerts(alert_ids: list[str]) -> WeatherAlerts:
+    return WeatherAlerts(
+        alerts=[
+            WeatherAlert(
+                id=alert_id,
+                title="Flood Warning",
+                description="Flooding is occurring.",
+                event="Flood Warning",
+                severity="Severe",
+                source="NWS",
+            )
+            for alert_id in alert_ids
+        ]
+    )
+
+
+def _location(name: str, county: str, forecast: str | None = None) -> Location:
+    return Location(
+        name=name,
+        latitude=40.0 + len(name) / 100,
+        longitude=-75.0,
+        country_code="US",
+        county_zone_id=county,
+        forecast_zone_id=forecast,
+    )
+
+
+class TestGetNwsAlertsForZones:
+    @pytest.mark.asyncio
+    async def test_single_query_split_back_per_location(self):
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.return_value = _resp(
+            [
+                _feature("a", ["PAC101"]),
+                _feature("b", ["NJC005", "PAC101"], event="Wind Advisory"),
+            ]
+        )
+
+        results = await get_nws_alerts_for_zones(
+            {"philly": ["PAC101"], "trenton": ["NJC005"], "quiet": ["NYC061"]},
+            BASE_URL,
+            "Test/1.0",
+            10.0,
+            client=client,
+        )
+
+        client.get.assert_called_once()
+        assert client.get.call_args.kwargs["params"]["zone"] == "NJC005,NYC061,PAC101"
+        assert sorted(alert.event for alert in results["philly"].alerts) == [
+            "Flood Warning",
+            "Wind Advisory",
+        ]
+        assert [alert.event for alert in results["trenton"].alerts] == ["Wind Advisory"]
+        assert results["quiet"].alerts == []
+
+    @pytest.mark.asyncio
+    async def test_zone_list_is_chunked_and_features_deduplicated(self):
+        zones = [f"TXC{index:03d}" for index in range(MAX_ZONES_PER_ALERT_QUERY + 1)]
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.return_value = _resp([_feature("shared", [zones[0], zones[-1]])])
+
+        results = await get_nws_alerts_for_zones(
+            {"all": zones}, BASE_URL, "Test/1.0", 10.0, client=client
+        )
+
+        assert client.get.call_count == 2
+        assert len(results["all"].alerts) == 1
+
+    @pytest.mark.asyncio
+    async def test_point_locations_only_get_polygons_containing_them(self):
+        square = {
+            "type": "Polygon",
+            "coordinates": [[[-75.5, 39.5], [-74.5, 39.5], [-74.5, 40.5], [-75.5, 40.5]]],
+        }
+        storm = _feature("storm", ["PAC101"], event="Tornado Warning")
+        storm["geometry"] = square
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.return_value = _resp([storm, _feature("flood", ["PAC101"])])
+
+        results = await get_nws_alerts_for_zones(
+            {"inside": ["PAC101"], "outside": ["PAC101"], "county": ["PAC101"]},
+            BASE_URL,
+            "Test/1.0",
+            10.0,
+            client=client,
+            points_by_key={"inside": (40.0, -75.0), "outside": (40.9, -75.0)},
+        )
+
+        client.get.assert_called_once()
+        assert sorted(alert.event for alert in results["inside"].alerts) == [
+            "Flood Warning",
+            "Tornado Warning",
+        ]
+        assert [alert.event for alert in results["outside"].alerts] == ["Flood Warning"]
+        assert len(results["county"].alerts) == 2
+
+
+class TestGetBatchedAlertEventData:
+    @pytest.fixture
+    def client(self) -> WeatherClient:
+        client = WeatherClient(settings=AppSettings(alert_radius_type="zone"))
+        client.data_source = "nws"
+        client._fetch_nws_cancel_references = AsyncMock(return_value=set())
+        return client
+
+    @pytest.mark.asyncio
+    async def test_diffs_each_location_against_its_own_snapshot(self, client):
+        philly = _location("Philadelphia", "PAC101", "PAZ071")
+        trenton = _location("Trenton", "NJC021")
+        fetch = AsyncMock(
+            return_value={
+                client._location_key(philly): _alerts(["a"]),
+                client._location_key(trenton): _alerts([]),
+            }
+        )
+
+        with patch("accessiweather.weather_client_base.nws_client.get_nws_alerts_for_zones", fetch):
+            first = await client.get_batched_alert_event_data([philly, trenton])
+            second = await client.get_batched_alert_event_data([philly, trenton])
+
+        zones_by_key = fetch.call_args.args[0]
+        assert zones_by_key[client._location_key(philly)] == ["PAC101", "PAZ071"]
+        assert zones_by_key[client._location_key(trenton)] == ["NJC021"]
+        by_name = {data.location.name: data for data in first}
+        assert len(by_name["Philadelphia"].alert_lifecycle_diff.new_alerts) == 1
+        assert by_name["Trenton"].alert_lifecycle_diff.has_changes is False
+        assert all(not data.alert_lifecycle_diff.has_changes for data in second)
+
+    @pytest.mark.asyncio
+    async def test_failed_poll_keeps_previous_snapshots(self, client):
+        philly = _location("Philadelphia", "PAC101")
+        key = client._location_key(philly)
+        previous = _alerts(["a"])
+        client._previous_alerts[key] = previous
+        fetch = AsyncMock(side_effect=httpx.ConnectError("offline"))
+
+        with patch("accessiweather.weather_client_base.nws_client.get_nws_alerts_for_zones", fetch):
+            results = await client.get_batched_alert_event_data([philly])
+
+        assert results == []
+        assert client._previous_alerts[key] is previous
+
+    @pytest.mark.asyncio
+    async def test_locations_without_stored_zones_or_in_state_mode_are_skipped(self, client):
+        fetch = AsyncMock()
+        no_zones = Location(name="Nowhere", latitude=40.0, longitude=-75.0, country_code="US")
+
+        with patch("accessiweather.weather_client_base.nws_client.get_nws_alerts_for_zones", fetch):
+            assert await client.get_batched_alert_event_data([no_zones]) == []
+            client.settings.alert_radius_type = "state"
+            assert await client.get_batched_alert_event_data([_location("A", "PAC101")]) == []
+
+        fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_point_mode_polls_zones_and_passes_location_points(self, client):
+        client.settings.alert_radius_type = "point"
+        philly = _location("Philadelphia", "PAC101", "PAZ071")
+        key = client._location_key(philly)
+        fetch = AsyncMock(return_value={key: _alerts([])})
+
+        with patch("accessiweather.weather_client_base.nws_client.get_nws_alerts_for_zones", fetch):
+            results = await client.get_batched_alert_event_data([philly])
+
+        assert len(results) == 1
+        assert fetch.call_args.args[0] == {key: ["PAC101", "PAZ071"]}
+        assert fetch.call_args.kwargs["points_by_key"] == {key: (philly.latitude, philly.longitude)}
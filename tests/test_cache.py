@@ -11,7 +11,16 @@ from datetime import UTC, datetime
 
 import pytest
 
-from accessiweather.cache import Cache, WeatherDataCache
+from accessiweather.cache import CACHE_SCHEMA_VERSION, Cache, WeatherDataCache
+from accessiweather.cache_format import (
+    SECTION_COMPRESSED,
+    CacheFormatError,
+    decode_header,
+    decode_sections,
+    encode_cache_entry,
+)
+from accessiweather.cache_serialization import _safe_location_key
+from accessiweather.cache_store import STORE_FILENAME, SnapshotRow
 from accessiweather.models import (
     CurrentConditions,
     Forecast,
@@ -83,6 +92,96 @@ class TestCache:
         assert cache.get("key1") is None
         assert cache.get("key2") == "value2"
 
+    def test_lru_eviction_at_max_entries(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = Cache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.has_key("a")
+        assert not cache.has_key("b")
+        assert cache.stats().evictions == 1
+
+    def test_byte_budget_evicts_oldest(self):
+        """Test that the approximate byte budget bounds memory."""
+        cache = Cache(max_bytes=5_000)
+        cache.set("first", "x" * 3_000)
+        cache.set("second", "y" * 3_000)
+
+        assert cache.get("first") is None
+        assert cache.get("second") == "y" * 3_000
+        assert cache.stats().approx_bytes <= 5_000
+
+    def test_namespace_quota_only_evicts_within_namespace(self):
+        """Test that per-namespace quotas leave other namespaces alone."""
+        cache = Cache(namespace_quotas={"ai_explanation": 1})
+        cache.set("nws_text_product:AFD:PHI", "afd")
+        cache.set("ai_explanation:one", "first")
+        cache.set("ai_explanation:two", "second")
+
+        assert cache.get("ai_explanation:one") is None
+        assert cache.get("ai_explanation:two") == "second"
+        assert cache.get("nws_text_product:AFD:PHI") == "afd"
+        assert cache.stats().namespaces == {"nws_text_product": 1, "ai_explanation": 1}
+
+    def test_stats_count_hits_misses_and_expirations(self):
+        """Test the hit/miss/expiry counters."""
+        cache = Cache()
+        cache.set("key", "value")
+        cache.set("short", "value", ttl=0.01)
+        time.sleep(0.02)
+
+        cache.get("key")
+        cache.get("missing")
+        cache.get("short")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.expirations) == (1, 2, 1)
+        assert stats.entries == 1
+
+    def test_replacing_a_key_keeps_accounting_consistent(self):
+        """Test that overwriting an entry does not double count its size."""
+        cache = Cache()
+        cache.set("key", "x" * 1_000)
+        cache.set("key", "y" * 10)
+        cache.invalidate("key")
+
+        assert cache.stats().approx_bytes == 0
+        assert cache.stats().entries == 0
+
+    def test_stale_window_keeps_expired_entry_readable(self, monkeypatch):
+        """Test that get_entry(allow_stale=True) serves entries inside stale_ttl."""
+        now = [1_000.0]
+        monkeypatch.setattr("accessiweather.cache.time.time", lambda: now[0])
+        cache = Cache()
+        cache.set("key", "value", ttl=10, stale_ttl=10)
+        now[0] += 15
+
+        assert cache.get("key") is None
+        assert cache.get_entry("key") is None
+        assert cache.get_entry("key", allow_stale=True).value == "value"
+
+        now[0] += 10
+        cache.cleanup()
+        assert cache.get_entry("key", allow_stale=True) is None
+
+    def test_background_sweep_removes_expired_entries(self):
+        """Test that the background sweep expires entries without reads."""
+        cache = Cache(default_ttl=0.01)
+        cache.set("key", "value")
+        cache.start_background_sweep(interval_seconds=0.02)
+        try:
+            deadline = time.time() + 2
+            while cache.data and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            cache.stop_background_sweep()
+
+        assert not cache.data
+        assert cache.stats().expirations == 1
+
 
 class TestWeatherDataCache:
     """Tests for the file-based WeatherDataCache class."""
@@ -174,3 +273,147 @@ class TestWeatherDataCache:
         cache.purge_expired()
         # File should be deleted after purge
         assert cache.load(location, allow_stale=True) is None
+
+    def test_sections_limit_decoding(self, cache, location, weather_data):
+        """Test that only requested sections are materialized."""
+        cache.store(location, weather_data)
+
+        loaded = cache.load(location, sections=("current",))
+
+        assert loaded is not None
+        assert loaded.current.temperature_f == 72.0
+        assert loaded.forecast is None
+        assert loaded.alerts is None
+        assert loaded.location.name == "Test City"
+
+    def test_schema_mismatch_invalidates(self, cache, location, weather_data):
+        """Test that entries from another schema version are discarded."""
+        cache.store(location, weather_data)
+        key = _safe_location_key(location)
+        row = cache._store.get(key)
+        cache._store.put(SnapshotRow(key, row.schema_version - 1, row.saved_at, row.payload))
+
+        assert cache.load(location) is None
+        assert cache._store.get(key) is None
+
+    def test_corrupt_payload_is_ignored_and_purged(self, cache, location):
+        """Test that an undecodable entry fails soft and is deleted."""
+        key = _safe_location_key(location)
+        cache._store.put(SnapshotRow(key, CACHE_SCHEMA_VERSION, time.time(), b"garbage"))
+
+        assert cache.load(location) is None
+        assert cache._store.get(key) is None
+
+    def test_load_many_returns_only_cached_locations(self, cache, location, weather_data):
+        """Test batch loading several locations with one query."""
+        other = Location(name="Elsewhere", latitude=41.0, longitude=-75.0)
+        cache.store(location, weather_data)
+
+        loaded = cache.load_many([location, other], sections=("current",))
+
+        assert list(loaded) == ["Test City"]
+        assert loaded["Test City"].current.temperature_f == 72.0
+
+    def test_locations_with_data_respects_freshness(self, cache, location, weather_data):
+        """Test the index-only freshness query."""
+        other = Location(name="Elsewhere", latitude=41.0, longitude=-75.0)
+        cache.store(location, weather_data)
+        cache.store(other, weather_data)
+        key = _safe_location_key(other)
+        row = cache._store.get(key)
+        cache._store.put(SnapshotRow(key, row.schema_version, row.saved_at - 7200, row.payload))
+
+        assert cache.locations_with_data([other, location]) == [other, location]
+        assert cache.locations_with_data([other, location], fresh_only=True) == [location]
+
+    def test_purge_removes_only_expired_rows(self, cache, location, weather_data):
+        """Test that purge is a single indexed delete of old rows."""
+        other = Location(name="Elsewhere", latitude=41.0, longitude=-75.0)
+        cache.store(location, weather_data)
+        cache.store(other, weather_data)
+        key = _safe_location_key(other)
+        row = cache._store.get(key)
+        cache._store.put(SnapshotRow(key, row.schema_version, row.saved_at - 3 * 3600, row.payload))
+
+        cache.purge_expired()
+
+        assert cache.load(location) is not None
+        assert cache.load(other) is None
+
+    def test_entries_persist_across_instances_and_compaction(
+        self, cache, cache_dir, location, weather_data
+    ):
+        """Test that the single database file survives reopen and compaction."""
+        cache.store(location, weather_data)
+        cache.compact()
+        cache.close()
+
+        reopened = WeatherDataCache(cache_dir, max_age_minutes=60)
+
+        assert reopened.load(location).current.condition == "Sunny"
+        assert sorted(path.name for path in cache_dir.glob("*.sqlite3")) == [STORE_FILENAME]
+
+    def test_unreadable_database_is_recreated(self, cache_dir, location, weather_data):
+        """Test that a corrupt database file is replaced instead of failing forever."""
+        cache_dir.mkdir(parents=True)
+        (cache_dir / STORE_FILENAME).write_bytes(b"this is not sqlite" * 100)
+        cache = WeatherDataCache(cache_dir)
+
+        cache.store(location, weather_data)
+
+        assert cache.load(location) is not None
+
+    def test_purge_removes_legacy_per_location_files(self, cache, cache_dir):
+        """Test that files from earlier per-location formats are removed."""
+        legacy_json = cache_dir / "Test_City-40_0--74_0.json"
+        legacy_json.write_text("{}", encoding="utf-8")
+        legacy_binary = cache_dir / "Test_City-40_0--74_0.awc"
+        legacy_binary.write_bytes(b"AWXC")
+
+        cache.purge_expired()
+
+        assert not legacy_json.exists()
+        assert not legacy_binary.exists()
+
+
+class TestCacheFormat:
+    """Tests for the binary cache container."""
+
+    def test_header_round_trip_without_payload(self):
+        """Test that the header decodes on its own."""
+        encoded = encode_cache_entry(
+            schema_version=3,
+            saved_at=1234.5,
+            location_key="home",
+            sections={"current": {"t": 1}, "hourly_forecast": {"periods": list(range(500))}},
+        )
+
+        header = decode_header(encoded)
+
+        assert header.schema_version == 3
+        assert header.saved_at == 1234.5
+        assert header.location_key == "home"
+        assert set(header.sections) == {"current", "hourly_forecast"}
+
+    def test_large_sections_are_compressed(self):
+        """Test that large sections round-trip through compression."""
+        hourly = {"periods": [{"temperature": value} for value in range(500)]}
+        encoded = encode_cache_entry(
+            schema_version=1, saved_at=0.0, location_key="k", sections={"hourly": hourly}
+        )
+        header = decode_header(encoded)
+
+        flags, _offset, length = header.sections["hourly"]
+
+        assert flags & SECTION_COMPRESSED
+        assert length < len(str(hourly))
+        assert decode_sections(encoded, header) == {"hourly": hourly}
+
+    def test_truncated_buffer_raises(self):
+        """Test that truncated data is rejected."""
+        encoded = encode_cache_entry(
+            schema_version=1, saved_at=0.0, location_key="k", sections={"current": {"t": 1}}
+        )
+
+        with pytest.raises(CacheFormatError):
+            decode_sections(encoded[:-2], decode_header(encoded))
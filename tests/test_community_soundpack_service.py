@@ -6,8 +6,15 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from accessiweather.notifications.sound_pack_installer import SoundPackInstaller
 from accessiweather.services.community_soundpack_models import CommunityPack
-from accessiweather.services.community_soundpack_service import CommunitySoundPackService
+from accessiweather.services.community_soundpack_service import (
+    INSTALL_MANIFEST_NAME,
+    CommunitySoundPackService,
+    git_blob_sha,
+    is_managed_install,
+    read_install_manifest,
+)
 
 
 def _repo_pack() -> CommunityPack:
@@ -36,3 +43,194 @@ async def test_download_repo_pack_rejects_path_traversal(tmp_path):
             await service._download_repo_pack(_repo_pack(), tmp_path / "pack.zip", None)
     finally:
         await service.aclose()
+
+
+def _serve_files(service: CommunitySoundPackService, files: dict[str, bytes], requested: list):
+    import asyncio
+
+    import httpx
+
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        rel_path = request.url.path.split("/packs/example/", 1)[1]
+        requested.append(rel_path)
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if rel_path not in files:
+            return httpx.Response(404)
+        return httpx.Response(200, content=files[rel_path])
+
+    service._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service._fetch_tree_entries = AsyncMock(
+        return_value=[
+            {"type": "blob", "path": path, "size": len(data), "sha": git_blob_sha(data)}
+            for path, data in files.items()
+        ]
+        + [{"type": "tree", "path": "sounds"}]
+    )
+    return in_flight
+
+
+_FILES = {
+    "pack.json": b'{"name": "Example", "sounds": {"alert": "sounds/alert.wav"}}',
+    "sounds/alert.wav": b"RIFF-alert",
+    "sounds/notify.wav": b"RIFF-notify",
+    "sounds/error.wav": b"RIFF-error",
+}
+
+
+@pytest.mark.asyncio
+async def test_download_repo_pack_streams_blobs_into_zip_concurrently(tmp_path):
+    import zipfile
+
+    service = CommunitySoundPackService(repo_owner="example", repo_name="repo")
+    requested: list[str] = []
+    in_flight = _serve_files(service, _FILES, requested)
+    progress: list[int] = []
+
+    try:
+        zip_path = await service._download_repo_pack(
+            _repo_pack(), tmp_path / "pack.zip", lambda _pct, done, _total: progress.append(done)
+        )
+    finally:
+        await service.aclose()
+
+    with zipfile.ZipFile(zip_path) as zipf:
+        assert {name: zipf.read(name) for name in zipf.namelist()} == _FILES
+    assert in_flight["max"] > 1
+    assert progress[-1] == sum(len(data) for data in _FILES.values())
+    assert not [path for path in tmp_path.iterdir() if path.name != "pack.zip"]
+
+
+@pytest.mark.asyncio
+async def test_install_repo_pack_over_unmanaged_directory_keeps_user_files(tmp_path):
+    target = tmp_path / "Example"
+    (target / "sounds").mkdir(parents=True)
+    (target / "sounds" / "alert.wav").write_bytes(_FILES["sounds/alert.wav"])
+    (target / "sounds" / "notify.wav").write_bytes(b"old notify")
+    (target / "sounds" / "retired.wav").write_bytes(b"no longer in the repo")
+
+    service = CommunitySoundPackService(repo_owner="example", repo_name="repo")
+    requested: list[str] = []
+    _serve_files(service, _FILES, requested)
+    try:
+        with pytest.raises(RuntimeError, match="confirm before replacing"):
+            await service.install_repo_pack(_repo_pack(), target)
+        assert requested == []
+        assert (target / "sounds" / "notify.wav").read_bytes() == b"old notify"
+
+        await service.install_repo_pack(_repo_pack(), target, overwrite_unmanaged=True)
+    finally:
+        await service.aclose()
+
+    assert sorted(requested) == ["pack.json", "sounds/error.wav", "sounds/notify.wav"]
+    for rel_path, data in _FILES.items():
+        assert (target / rel_path).read_bytes() == data
+    assert not list(target.rglob("*.part"))
+    assert (target / "sounds" / "retired.wav").exists()
+    assert read_install_manifest(target) == {
+        rel_path: git_blob_sha(data) for rel_path, data in _FILES.items()
+    }
+
+
+@pytest.mark.asyncio
+async def test_install_repo_pack_update_only_touches_files_it_installed(tmp_path):
+    target = tmp_path / "Example"
+    old_files = {**_FILES, "sounds/retired.wav": b"RIFF-retired", "extras/old.txt": b"old"}
+    service = CommunitySoundPackService(repo_owner="example", repo_name="repo")
+    _serve_files(service, old_files, [])
+    try:
+        await service.install_repo_pack(_repo_pack(), target)
+    finally:
+        await service.aclose()
+    assert is_managed_install(target)
+
+    # The user maps their own sound in, edits pack.json and an installed file
+    # that is later dropped from the repository.
+    (target / "sounds" / "custom.wav").write_bytes(b"RIFF-mine")
+    (target / "pack.json").write_bytes(b'{"name": "Example", "edited": true}')
+    (target / "extras" / "old.txt").write_bytes(b"my notes")
+
+    new_files = {**_FILES, "sounds/notify.wav": b"RIFF-notify-v2"}
+    service = CommunitySoundPackService(repo_owner="example", repo_name="repo")
+    requested: list[str] = []
+    _serve_files(service, new_files, requested)
+    try:
+        await service.install_repo_pack(_repo_pack(), target)
+    finally:
+        await service.aclose()
+
+    assert requested == ["sounds/notify.wav"]
+    assert (target / "sounds" / "notify.wav").read_bytes() == b"RIFF-notify-v2"
+    assert not (target / "sounds" / "retired.wav").exists()
+    assert (target / "sounds" / "custom.wav").read_bytes() == b"RIFF-mine"
+    assert (target / "pack.json").read_bytes() == b'{"name": "Example", "edited": true}'
+    assert (target / "extras" / "old.txt").read_bytes() == b"my notes"
+    manifest = read_install_manifest(target)
+    assert manifest["sounds/notify.wav"] == git_blob_sha(b"RIFF-notify-v2")
+    assert "pack.json" not in manifest
+    assert "sounds/retired.wav" not in manifest
+
+
+@pytest.mark.asyncio
+async def test_install_repo_pack_removes_fresh_install_on_failure(tmp_path):
+    service = CommunitySoundPackService(repo_owner="example", repo_name="repo")
+    _serve_files(service, _FILES, [])
+    service._fetch_tree_entries.return_value.append(
+        {"type": "blob", "path": "sounds/missing.wav", "size": 1, "sha": "0" * 40}
+    )
+    try:
+        with pytest.raises(RuntimeError, match="missing.wav"):
+            await service.install_repo_pack(_repo_pack(), tmp_path / "Example")
+    finally:
+        await service.aclose()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_install_repo_pack_validates_fresh_install_before_moving_into_place(tmp_path):
+    service = CommunitySoundPackService(repo_owner="example", repo_name="repo")
+    _serve_files(service, _FILES, [])
+    checked = []
+
+    def reject(pack_dir):
+        checked.append(sorted(p.relative_to(pack_dir).as_posix() for p in pack_dir.rglob("*.wav")))
+        return False, "missing sounds"
+
+    try:
+        with pytest.raises(RuntimeError, match="Invalid sound pack: missing sounds"):
+            await service.install_repo_pack(_repo_pack(), tmp_path / "Example", validate=reject)
+        assert list(tmp_path.iterdir()) == []
+
+        target = await service.install_repo_pack(
+            _repo_pack(), tmp_path / "Example", validate=lambda pack_dir: (True, "")
+        )
+    finally:
+        await service.aclose()
+
+    assert checked == [["sounds/alert.wav", "sounds/error.wav", "sounds/notify.wav"]]
+    assert target == tmp_path / "Example"
+    assert (target / "pack.json").read_bytes() == _FILES["pack.json"]
+    assert (target / INSTALL_MANIFEST_NAME).is_file()
+    assert [path.name for path in tmp_path.iterdir()] == ["Example"]
+
+
+@pytest.mark.parametrize("pack_dir", ["../escape", "..", ".", "a/../../escape", "/tmp/abs"])
+def test_resolve_pack_directory_rejects_paths_outside_soundpacks_dir(tmp_path, pack_dir):
+    installer = SoundPackInstaller(tmp_path / "soundpacks")
+
+    with pytest.raises(ValueError, match="Unsafe sound pack directory"):
+        installer.resolve_pack_directory(pack_dir)
+
+
+def test_resolve_pack_directory_accepts_plain_names(tmp_path):
+    installer = SoundPackInstaller(tmp_path / "soundpacks")
+
+    assert (
+        installer.resolve_pack_directory("Example-1.0")
+        == (tmp_path / "soundpacks" / "Example-1.0").resolve()
+    )
@@ -10,6 +10,7 @@ Covers:
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 
@@ -345,6 +346,107 @@ class TestForecastProductServiceErrorPropagation:
         assert fetcher.call_count == 2
 
 
+class TestForecastProductServiceSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self):
+        cache = Cache()
+        release = asyncio.Event()
+        calls = 0
+
+        async def slow_fetch(product_type, office, **kwargs):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return _afd()
+
+        service = ForecastProductService(cache, fetcher=slow_fetch)
+        waiters = [asyncio.create_task(service.get("AFD", "PHI")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert calls == 1
+        assert results[0] is results[1] is results[2]
+
+    @pytest.mark.asyncio
+    async def test_shared_fetch_error_reaches_every_caller(self):
+        cache = Cache()
+        fetcher = AsyncMock(side_effect=TextProductFetchError("boom"))
+        service = ForecastProductService(cache, fetcher=fetcher)
+
+        results = await asyncio.gather(
+            service.get("AFD", "PHI"), service.get("AFD", "PHI"), return_exceptions=True
+        )
+
+        assert all(isinstance(result, TextProductFetchError) for result in results)
+        fetcher.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self):
+        cache = Cache()
+        release = asyncio.Event()
+
+        async def slow_fetch(product_type, office, **kwargs):
+            await release.wait()
+            return _afd()
+
+        service = ForecastProductService(cache, fetcher=slow_fetch)
+        first = asyncio.create_task(service.get("AFD", "PHI"))
+        second = asyncio.create_task(service.get("AFD", "PHI"))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert (await second).product_id == "afd-1"
+
+    @pytest.mark.asyncio
+    async def test_expired_product_served_stale_while_refreshing(self, monkeypatch):
+        cache = Cache()
+        fake_time = [1_000_000.0]
+        monkeypatch.setattr("accessiweather.cache.time.time", lambda: fake_time[0])
+        fetcher = AsyncMock(side_effect=[_sps(product_id="old"), _sps(product_id="new")])
+        service = ForecastProductService(cache, fetcher=fetcher)
+
+        await service.get("SPS", "PHI")
+        fake_time[0] += 1000  # past the 900 s SPS TTL, inside the stale window
+
+        stale = await service.get("SPS", "PHI")
+        assert stale.product_id == "old"
+        await asyncio.sleep(0)
+
+        fresh = await service.get("SPS", "PHI")
+        assert fresh.product_id == "new"
+        assert fetcher.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_fresh_waits_for_refresh_instead_of_serving_stale(self, monkeypatch):
+        cache = Cache()
+        fake_time = [1_000_000.0]
+        monkeypatch.setattr("accessiweather.cache.time.time", lambda: fake_time[0])
+        fetcher = AsyncMock(side_effect=[_sps(product_id="old"), _sps(product_id="new")])
+        service = ForecastProductService(cache, fetcher=fetcher)
+
+        assert (await service.get_fresh("SPS", "PHI")).product_id == "old"
+        assert (await service.get_fresh("SPS", "PHI")).product_id == "old"
+        fake_time[0] += 1000  # past the 900 s SPS TTL, inside the stale window
+
+        assert (await service.get_fresh("SPS", "PHI")).product_id == "new"
+        assert fetcher.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_product_past_stale_window_is_fetched_inline(self, monkeypatch):
+        cache = Cache()
+        fake_time = [1_000_000.0]
+        monkeypatch.setattr("accessiweather.cache.time.time", lambda: fake_time[0])
+        fetcher = AsyncMock(side_effect=[_sps(product_id="old"), _sps(product_id="new")])
+        service = ForecastProductService(cache, fetcher=fetcher)
+
+        await service.get("SPS", "PHI")
+        fake_time[0] += 2000
+
+        assert (await service.get("SPS", "PHI")).product_id == "new"
+
+
 class TestForecastProductServiceHistory:
     @pytest.mark.asyncio
     async def test_history_uses_separate_cache_key(self):
@@ -0,0 +1,294 @@
+"""Tests for the offline gazetteer and offline location suggestions."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from accessiweather.gazetteer import (
+    BUNDLED_GAZETTEER_FILE,
+    Gazetteer,
+    GazetteerEntry,
+    build_gazetteer_from_geonames,
+    download_gazetteer,
+    load_gazetteer,
+    load_or_download_gazetteer,
+    parse_geonames_admin1_names,
+    parse_geonames_country_names,
+)
+from accessiweather.geocoding import GeocodingService
+from accessiweather.paths import RuntimeStoragePaths
+
+PLACES = [
+    GazetteerEntry("San Antonio", 29.42412, -98.49363, "US", "Texas", 1_434_625, "United States"),
+    GazetteerEntry("Santa Fe", 35.68698, -105.9378, "US", "New Mexico", 84_683, "United States"),
+    GazetteerEntry("São Paulo", -23.5475, -46.63611, "BR", "São Paulo", 10_021_295, "Brazil"),
+    GazetteerEntry("Santiago", -33.45694, -70.64827, "CL", "Santiago Metropolitan", 4_837_295),
+    GazetteerEntry("Zürich", 47.36667, 8.55, "CH", "Zurich", 341_730, "Switzerland"),
+    GazetteerEntry("Salem", 44.9429, -123.0351, "US", "Oregon", 154_637, "United States"),
+]
+
+# A GeoNames cities row; "11" is a numeric admin1 code (Île-de-France).
+PARIS_ROW = ["2988507", "Paris", "Paris", "", "48.85341", "2.3488", "P", "PPLC", "FR"]
+PARIS_ROW += ["", "11", "75", "", "", "2138551", "", "42", "Europe/Paris", ""]
+COUNTRY_INFO = "#ISO\tISO3\tISO-Numeric\tfips\tCountry\nFR\tFRA\t250\tFR\tFrance\n"
+
+
+@pytest.fixture
+def gazetteer() -> Gazetteer:
+    return Gazetteer(PLACES)
+
+
+class TestGazetteerSearch:
+    def test_prefix_results_are_ranked_by_population(self, gazetteer):
+        names = [entry.name for entry in gazetteer.search("sa", limit=10)]
+
+        assert names == ["São Paulo", "Santiago", "San Antonio", "Salem", "Santa Fe"]
+
+    def test_search_folds_accents_case_and_punctuation(self, gazetteer):
+        assert [e.name for e in gazetteer.search("ZURICH")] == ["Zürich"]
+        assert [e.name for e in gazetteer.search("sao paulo")] == ["São Paulo"]
+        assert [e.name for e in gazetteer.search("San Antonio, Tex")] == ["San Antonio"]
+
+    def test_limit_and_country_filter(self, gazetteer):
+        results = gazetteer.search("sa", limit=2, country_codes=["us"])
+
+        assert [e.name for e in results] == ["San Antonio", "Salem"]
+
+    def test_no_match_or_blank_query(self, gazetteer):
+        assert gazetteer.search("xyz") == []
+        assert gazetteer.search("  ,, ") == []
+
+    def test_display_name_matches_the_online_search_format(self):
+        from accessiweather.location_manager import LocationManager
+
+        online = LocationManager()._parse_geocoding_result(
+            {"name": "San Antonio", "admin1": "Texas", "country": "United States"}
+        )
+
+        assert PLACES[0].display_name == online.name == "San Antonio, Texas"
+        assert PLACES[4].display_name == "Zürich, Zurich, Switzerland"
+        assert PLACES[3].display_name == "Santiago, Santiago Metropolitan, CL"
+
+    def test_write_and_load_round_trip(self, gazetteer, tmp_path):
+        path = tmp_path / "gazetteer.tsv.gz"
+        gazetteer.write(path)
+
+        loaded = Gazetteer.from_file(path)
+
+        assert len(loaded) == len(PLACES)
+        assert loaded.search("santi") == gazetteer.search("santi")
+
+    def test_from_file_rejects_other_formats(self, tmp_path):
+        import gzip
+
+        path = tmp_path / "bogus.tsv.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as handle:
+            handle.write("not a gazetteer\n")
+
+        with pytest.raises(ValueError):
+            Gazetteer.from_file(path)
+
+    def test_prefix_search_is_fast_on_a_large_index(self):
+        entries = [
+            GazetteerEntry(f"Place {i:06d}", 0.0, 0.0, "US", "TX", i) for i in range(100_000)
+        ]
+        big = Gazetteer(entries)
+
+        started = time.perf_counter()
+        results = big.search("place 01", limit=10)
+        elapsed = time.perf_counter() - started
+
+        assert results[0].name == "Place 019999"
+        assert elapsed < 0.05
+
+
+class TestGazetteerLoading:
+    def test_build_from_geonames_keeps_populated_places(self, tmp_path):
+        source = tmp_path / "cities.txt"
+        rows = [
+            ["4726206", "San Antonio", "San Antonio", "", "29.42412", "-98.49363", "P", "PPLA2"]
+            + ["US", "", "TX", "029", "", "", "1434625", "", "198", "America/Chicago", ""],
+            ["1", "Mount Nowhere", "Mount Nowhere", "", "1.0", "2.0", "T", "MT"]
+            + ["US", "", "TX", "", "", "", "0", "", "", "", ""],
+        ]
+        source.write_text("\n".join("\t".join(row) for row in rows) + "\n", encoding="utf-8")
+
+        built = build_gazetteer_from_geonames(
+            source, admin1_names={"US.TX": "Texas"}, country_names={"US": "United States"}
+        )
+
+        assert [e.display_name for e in built.search("san")] == ["San Antonio, Texas"]
+        assert len(built) == 1
+
+    def test_build_names_non_us_admin1_or_drops_unknown_codes(self, tmp_path):
+        source = tmp_path / "cities.txt"
+        rows = [
+            PARIS_ROW,
+            ["3448439", "Sao Paulo", "Sao Paulo", "", "-23.5475", "-46.63611", "P", "PPLA"]
+            + ["BR", "", "27", "", "", "", "10021295", "", "", "", ""],
+        ]
+        source.write_text("\n".join("\t".join(row) for row in rows) + "\n", encoding="utf-8")
+        admin1 = tmp_path / "admin1CodesASCII.txt"
+        admin1.write_text("FR.11\tÎle-de-France\tIle-de-France\t3012874\n", encoding="utf-8")
+        countries = tmp_path / "countryInfo.txt"
+        countries.write_text(COUNTRY_INFO, encoding="utf-8")
+
+        built = build_gazetteer_from_geonames(
+            source,
+            admin1_names=parse_geonames_admin1_names(admin1),
+            country_names=parse_geonames_country_names(countries),
+        )
+
+        assert [e.display_name for e in built.search("paris")] == ["Paris, Île-de-France, France"]
+        assert [e.display_name for e in built.search("sao")] == ["Sao Paulo, BR"]
+
+    def test_download_builds_and_writes_the_runtime_file(self, tmp_path):
+        import io
+        import zipfile
+
+        import httpx
+
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("cities15000.txt", "\t".join(PARIS_ROW) + "\n")
+        files = {
+            "/export/dump/cities15000.zip": archive.getvalue(),
+            "/export/dump/admin1CodesASCII.txt": "FR.11\tÎle-de-France\tx\t1\n".encode(),
+            "/export/dump/countryInfo.txt": COUNTRY_INFO.encode(),
+        }
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=files[request.url.path])
+        )
+        destination = tmp_path / "config" / "gazetteer.tsv.gz"
+
+        with httpx.Client(transport=transport) as client:
+            built = download_gazetteer(destination, client=client)
+
+        assert len(built) == 1
+        loaded = Gazetteer.from_file(destination)
+        assert [e.display_name for e in loaded.search("par")] == ["Paris, Île-de-France, France"]
+        assert sorted(path.name for path in destination.parent.iterdir()) == [destination.name]
+
+    def test_failed_download_leaves_no_files(self, tmp_path):
+        import httpx
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(503))
+        destination = tmp_path / "gazetteer.tsv.gz"
+
+        with httpx.Client(transport=transport) as client, pytest.raises(httpx.HTTPStatusError):
+            download_gazetteer(destination, client=client)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_load_prefers_runtime_file_and_handles_absence(self, gazetteer, tmp_path):
+        runtime_paths = RuntimeStoragePaths(config_root=tmp_path)
+        if not BUNDLED_GAZETTEER_FILE.exists():
+            assert load_gazetteer(runtime_paths) is None
+
+        gazetteer.write(runtime_paths.gazetteer_file)
+        loaded = load_gazetteer(runtime_paths)
+
+        assert loaded is not None
+        assert len(loaded) == len(PLACES)
+
+    def test_failed_download_is_not_retried_until_the_interval_passes(self, tmp_path, monkeypatch):
+        import httpx
+
+        monkeypatch.setattr("accessiweather.gazetteer.load_gazetteer", lambda paths: None)
+        runtime_paths = RuntimeStoragePaths(config_root=tmp_path)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(503)
+
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            assert load_or_download_gazetteer(runtime_paths, client=client) is None
+            assert runtime_paths.gazetteer_download_failed_file.exists()
+            attempts = len(requests)
+
+            assert load_or_download_gazetteer(runtime_paths, client=client) is None
+            assert len(requests) == attempts
+
+            assert (
+                load_or_download_gazetteer(runtime_paths, retry_interval=0, client=client) is None
+            )
+            assert len(requests) > attempts
+
+    def test_successful_download_clears_the_failure_marker(self, tmp_path, monkeypatch):
+        import io
+        import zipfile
+
+        import httpx
+
+        monkeypatch.setattr("accessiweather.gazetteer.load_gazetteer", lambda paths: None)
+        runtime_paths = RuntimeStoragePaths(config_root=tmp_path)
+        runtime_paths.gazetteer_download_failed_file.touch()
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("cities15000.txt", "\t".join(PARIS_ROW) + "\n")
+        files = {
+            "/export/dump/cities15000.zip": archive.getvalue(),
+            "/export/dump/admin1CodesASCII.txt": b"",
+            "/export/dump/countryInfo.txt": COUNTRY_INFO.encode(),
+        }
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=files[request.url.path])
+        )
+
+        with httpx.Client(transport=transport) as client:
+            built = load_or_download_gazetteer(runtime_paths, retry_interval=0, client=client)
+
+        assert built is not None and len(built) == 1
+        assert runtime_paths.gazetteer_file.exists()
+        assert not runtime_paths.gazetteer_download_failed_file.exists()
+
+
+class TestOfflineSuggestions:
+    def test_offline_matches_skip_the_network_when_they_fill_the_limit(self, gazetteer):
+        service = GeocodingService(data_source="auto", gazetteer=gazetteer)
+        service.client.search = MagicMock()
+
+        suggestions = service.suggest_locations("sa", limit=2)
+
+        assert suggestions == ["São Paulo, Brazil", "Santiago, Santiago Metropolitan, CL"]
+        service.client.search.assert_not_called()
+
+    def test_network_refines_when_offline_matches_are_short(self, gazetteer):
+        service = GeocodingService(data_source="nws", gazetteer=gazetteer)
+        service.client.search = MagicMock(return_value=[])
+
+        suggestions = service.suggest_locations("santa", limit=3)
+
+        assert suggestions == ["Santa Fe, New Mexico"]
+        service.client.search.assert_called_once()
+
+    def test_dialog_appends_online_results_below_offline_matches(self):
+        from accessiweather.models import Location
+        from accessiweather.ui.dialogs.location_dialog import AddLocationDialog
+
+        dialog = AddLocationDialog.__new__(AddLocationDialog)
+        dialog.results_list = MagicMock()
+        dialog.results_list.GetItemCount.side_effect = lambda: len(dialog._search_results) - 1
+        dialog.location_manager = MagicMock()
+        dialog.name_input = MagicMock()
+        dialog.search_button = MagicMock()
+        dialog._update_status = MagicMock()
+        dialog._is_searching = True
+        paris = Location(name="Paris, Île-de-France, France", latitude=48.85341, longitude=2.3488)
+        dialog._show_search_results([paris])
+        dialog.results_list.DeleteAllItems.reset_mock()
+
+        online_paris = Location(name=paris.name, latitude=48.8534, longitude=2.3488)
+        texas = Location(name="Paris, Texas", latitude=33.66094, longitude=-95.55551)
+        dialog._on_search_complete([online_paris, texas])
+
+        assert dialog._search_results == [paris, texas]
+        dialog.results_list.DeleteAllItems.assert_not_called()
+        dialog.results_list.InsertItem.assert_called_with(1, "Paris, Texas")
+        dialog._update_status.assert_called_once_with(
+            "Found 1 more online locations; 2 locations listed"
+        )
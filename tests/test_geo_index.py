@@ -0,0 +1,138 @@
+"""Tests for advisory geometry matching."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from accessiweather.geo_index import BBox, GeoShape, SpatialIndex
+from accessiweather.weather_client_aviation import _filter_advisories, _station_point
+from accessiweather.weather_client_nws_aviation import _advisory_entry
+
+
+def _square(lon: float, lat: float, size: float = 1.0) -> dict:
+    return {
+        "type": "Polygon",
+        "coordinates": [
+            [
+                [lon, lat],
+                [lon + size, lat],
+                [lon + size, lat + size],
+                [lon, lat + size],
+                [lon, lat],
+            ]
+        ],
+    }
+
+
+class TestGeoShape:
+    def test_contains_respects_holes_and_multipolygons(self):
+        donut = GeoShape.from_geojson(
+            {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [
+                        [[0, 0], [4, 0], [4, 4], [0, 4]],
+                        [[1, 1], [3, 1], [3, 3], [1, 3]],
+                    ],
+                    [[[10, 10], [11, 10], [11, 11]]],
+                ],
+            }
+        )
+
+        assert donut.contains(0.5, 0.5)
+        assert not donut.contains(2, 2)  # inside the hole
+        assert donut.contains(10.2, 10.8)
+        assert not donut.contains(5, 5)
+
+    def test_distance_is_zero_inside_and_in_miles_outside(self):
+        shape = GeoShape.from_geojson(_square(-75.0, 40.0))
+
+        assert shape.distance_miles(40.5, -74.5) == 0.0
+        # One degree of latitude is about 69 miles.
+        assert shape.distance_miles(42.0, -74.5) == pytest.approx(69.1, abs=0.2)
+        assert shape.within(41.2, -74.5, miles=15)
+        assert not shape.within(41.2, -74.5, miles=10)
+
+    @pytest.mark.parametrize(
+        "geometry",
+        [
+            None,
+            {"type": "Point", "coordinates": [-75, 40]},
+            {"type": "Polygon", "coordinates": [[[0, 0], [1, 1]]]},
+            {"type": "Polygon", "coordinates": [[["a", 0], [1, 0], [1, 1]]]},
+            {"type": "MultiPolygon", "coordinates": "bad"},
+        ],
+    )
+    def test_unusable_geometry_returns_none(self, geometry):
+        assert GeoShape.from_geojson(geometry) is None
+
+    def test_geometry_collection_members_are_combined(self):
+        shape = GeoShape.from_geojson(
+            {"type": "GeometryCollection", "geometries": [_square(0, 0), _square(5, 5)]}
+        )
+
+        assert shape.contains(0.5, 0.5) and shape.contains(5.5, 5.5)
+        assert shape.bbox == BBox(0, 0, 6, 6)
+
+
+class TestSpatialIndex:
+    def test_matches_brute_force_for_many_shapes_and_points(self):
+        rng = random.Random(7)
+        shapes = [
+            (f"s{i}", GeoShape.from_geojson(_square(rng.uniform(-120, -70), rng.uniform(25, 48))))
+            for i in range(300)
+        ]
+        index = SpatialIndex(shapes, node_capacity=4)
+        points = {f"p{i}": (rng.uniform(25, 49), rng.uniform(-121, -69)) for i in range(200)}
+
+        matched = index.match_points(points, miles=20)
+
+        for key, (lat, lon) in points.items():
+            expected = [name for name, shape in shapes if shape.within(lat, lon, 20)]
+            assert matched[key] == expected
+
+    def test_empty_index(self):
+        index = SpatialIndex([])
+
+        assert len(index) == 0
+        assert index.within(40, -75, miles=100) == []
+
+
+class TestAdvisoryFiltering:
+    def test_polygons_match_by_position_and_others_by_token(self):
+        entries = [
+            {"name": "covering", "geometry": _square(-75.5, 39.5)},
+            {"name": "far away KPHL", "geometry": _square(-100, 30)},
+            {"name": "text only KPHL"},
+            {"name": "text only elsewhere"},
+        ]
+
+        filtered = _filter_advisories(entries, {"KPHL"}, point=(39.87, -75.24))
+
+        assert [entry["name"] for entry in filtered] == ["covering", "text only KPHL"]
+
+    def test_nearby_polygons_are_kept_within_radius(self):
+        entries = [{"name": "edge", "geometry": _square(-75.0, 40.1)}]
+
+        assert _filter_advisories(entries, set(), point=(40.0, -74.5), within_miles=10)
+        assert not _filter_advisories(entries, set(), point=(40.0, -74.5), within_miles=5)
+
+    def test_without_station_position_tokens_still_apply(self):
+        entries = [{"name": "KPHL area", "geometry": _square(-100, 30)}, {"name": "other"}]
+
+        assert _filter_advisories(entries, {"KPHL"}) == [entries[0]]
+
+    def test_station_point_and_advisory_entry_helpers(self):
+        assert _station_point({"geometry": {"type": "Point", "coordinates": [-75.2, 39.9]}}) == (
+            39.9,
+            -75.2,
+        )
+        assert _station_point({"geometry": None}) is None
+        assert _station_point(None) is None
+
+        geometry = _square(0, 0)
+        entry = _advisory_entry({"properties": {"name": "A"}, "geometry": geometry})
+        assert entry == {"name": "A", "geometry": geometry}
+        assert _advisory_entry({"properties": {"name": "B"}, "geometry": None}) == {"name": "B"}
@@ -6,12 +6,18 @@ Tests geocoding functionality including address lookup and coordinate validation
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
 
 from accessiweather.geocoding import GeocodingService
-from accessiweather.openmeteo_geocoding_client import GeocodingResult
+from accessiweather.openmeteo_geocoding_client import (
+    GeocodingResult,
+    OpenMeteoGeocodingClient,
+    OpenMeteoGeocodingNetworkError,
+)
 
 
 class TestGeocodingServiceInit:
@@ -223,7 +229,7 @@ class TestGeocodeAddress:
 
         result = service.geocode_address("New York, NY")
 
-        assert result == (40.7128, -74.006, "New York, New York, United States")
+        assert result == (40.7128, -74.006, "New York")
         queried_names = [
             call.args[1]["name"] for call in service.client._make_request.call_args_list
         ]
@@ -309,6 +315,92 @@ class TestGeocodeAddress:
         assert "Tromsø, Norway" in queried_names
 
 
+class TestAsyncGeocodingFallback:
+    """Tests for the concurrent, non-blocking fallback search."""
+
+    @staticmethod
+    def _client_with(handler) -> OpenMeteoGeocodingClient:
+        client = OpenMeteoGeocodingClient()
+        client._async_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    @staticmethod
+    def _tromso() -> dict:
+        return {
+            "name": "Tromsø",
+            "latitude": 69.6492,
+            "longitude": 18.9553,
+            "country": "Norway",
+            "country_code": "NO",
+            "timezone": "Europe/Oslo",
+            "admin1": "Troms",
+        }
+
+    async def test_search_async_matches_unicode_variant(self):
+        tromso = self._tromso()
+        queried: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            name = request.url.params["name"]
+            queried.append(name)
+            return httpx.Response(200, json={"results": [tromso]} if name == "Tromsø" else {})
+
+        client = self._client_with(handler)
+        results = await client.search_async("Tromso", count=5)
+
+        assert [result.name for result in results] == ["Tromsø"]
+        assert queried[0] == "Tromso"
+        assert "Tromsø" in queried
+
+    async def test_fallbacks_respect_query_priority_and_cancel_the_rest(self):
+        tromso = self._tromso()
+        client = OpenMeteoGeocodingClient()
+        queries = client._build_fallback_queries("Tromso")
+        preferred, later = queries[0], queries[-1]
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            name = request.url.params["name"]
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                # The later variant answers first; the preferred one must still win.
+                await asyncio.sleep(0 if name == later else 0.01)
+                matched = name in (preferred, later)
+                return httpx.Response(200, json={"results": [tromso]} if matched else {})
+            finally:
+                in_flight -= 1
+
+        client._async_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        results = await client.search_fallbacks_async("Tromso", count=5, max_concurrency=3)
+
+        assert [result.name for result in results] == ["Tromsø"]
+        assert peak <= 3
+
+    async def test_fallbacks_raise_when_any_query_fails_without_a_match(self):
+        client = OpenMeteoGeocodingClient()
+        failing = client._build_fallback_queries("Tromso")[-1]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["name"] == failing:
+                raise httpx.ConnectError("offline", request=request)
+            return httpx.Response(200, json={})
+
+        client._async_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with pytest.raises(OpenMeteoGeocodingNetworkError):
+            await client.search_fallbacks_async("Tromso", count=5)
+
+    async def test_fallbacks_raise_when_every_query_fails(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("offline", request=request)
+
+        client = self._client_with(handler)
+        with pytest.raises(OpenMeteoGeocodingNetworkError):
+            await client.search_fallbacks_async("Tromso", count=5)
+
+
 class TestSuggestLocations:
     """Tests for location suggestions."""
 
@@ -0,0 +1,149 @@
+"""Tests for the persistent geocoding search cache and cached location search."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from accessiweather.geocoding_cache import GeocodingCache
+from accessiweather.location_manager import LocationManager
+from accessiweather.openmeteo_geocoding_client import GeocodingResult
+
+TROMSO = {
+    "name": "Tromsø",
+    "latitude": 69.6492,
+    "longitude": 18.9553,
+    "country": "Norway",
+    "country_code": "NO",
+    "timezone": "Europe/Oslo",
+    "admin1": "Troms",
+}
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_response(payload: dict) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = payload
+    response.raise_for_status = MagicMock()
+    return response
+
+
+class TestGeocodingCache:
+    def test_put_get_roundtrip_is_case_and_whitespace_insensitive(self, tmp_path):
+        cache = GeocodingCache(path=tmp_path / "geo.json")
+        cache.put("Tromso", 5, [TROMSO])
+
+        assert cache.get("  tromso ", 5) == [TROMSO]
+        assert cache.get("Tromso", 10) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "geo.json"
+        cache = GeocodingCache(path=path)
+        cache.put("Tromso", 5, [TROMSO])
+        cache.flush()
+
+        assert GeocodingCache(path=path).get("Tromso", 5) == [TROMSO]
+
+    def test_put_defers_the_file_write(self, tmp_path):
+        path = tmp_path / "geo.json"
+        cache = GeocodingCache(path=path, save_delay=60)
+        cache.put("Tromso", 5, [TROMSO])
+        cache.put("Oslo", 5, [])
+
+        assert not path.exists()
+        cache.flush()
+        reloaded = GeocodingCache(path=path)
+        assert reloaded.get("Tromso", 5) == [TROMSO]
+        assert reloaded.get("Oslo", 5) == []
+
+    def test_misses_expire_sooner_than_hits(self, tmp_path):
+        clock = _Clock()
+        cache = GeocodingCache(
+            path=tmp_path / "geo.json", ttl_seconds=100, miss_ttl_seconds=10, time_fn=clock
+        )
+        cache.put("Tromso", 5, [TROMSO])
+        cache.put("Nowhereville", 5, [])
+
+        clock.now += 50
+        assert cache.get("Nowhereville", 5) is None
+        assert cache.get("Tromso", 5) == [TROMSO]
+
+    def test_enforces_max_entries(self, tmp_path):
+        clock = _Clock()
+        cache = GeocodingCache(path=tmp_path / "geo.json", max_entries=2, time_fn=clock)
+        for name in ("a-town", "b-town", "c-town"):
+            clock.now += 1
+            cache.put(name, 5, [])
+
+        assert len(cache) == 2
+        assert cache.get("a-town", 5) is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "geo.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert len(GeocodingCache(path=path)) == 0
+
+
+class TestCachedLocationSearch:
+    @pytest.mark.asyncio
+    async def test_repeat_search_is_served_from_cache(self, tmp_path):
+        manager = LocationManager(geocoding_cache=GeocodingCache(path=tmp_path / "geo.json"))
+
+        with patch("accessiweather.location_manager.httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.get.return_value = _make_response({"results": [TROMSO]})
+
+            first = await manager.search_locations("Tromso", limit=5)
+            second = await manager.search_locations("tromso", limit=5)
+
+        assert first == second
+        assert first[0].name == "Tromsø, Troms, Norway"
+        assert mock_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fallback_runs_async_and_result_is_cached(self, tmp_path):
+        cache = GeocodingCache(path=tmp_path / "geo.json")
+        manager = LocationManager(geocoding_cache=cache)
+        fallback = MagicMock()
+        fallback.search_fallbacks_async = AsyncMock(return_value=[GeocodingResult(**TROMSO)])
+        manager._fallback_geocoder = fallback
+
+        with patch("accessiweather.location_manager.httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.get.return_value = _make_response({"results": []})
+
+            locations = await manager.search_locations("Tromso", limit=5)
+            again = await manager.search_locations("Tromso", limit=5)
+
+        assert [loc.name for loc in locations] == ["Tromsø, Troms, Norway"]
+        assert again == locations
+        fallback.search_fallbacks_async.assert_awaited_once_with("Tromso", count=5)
+        assert mock_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fallback_is_not_cached_as_a_miss(self, tmp_path):
+        cache = GeocodingCache(path=tmp_path / "geo.json")
+        manager = LocationManager(geocoding_cache=cache)
+        fallback = MagicMock()
+        fallback.search_fallbacks_async = AsyncMock(side_effect=RuntimeError("variant failed"))
+        manager._fallback_geocoder = fallback
+
+        with patch("accessiweather.location_manager.httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.get.return_value = _make_response({"results": []})
+
+            assert await manager.search_locations("Tromso", limit=5) == []
+
+        assert cache.get("Tromso", 5) is None
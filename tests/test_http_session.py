@@ -0,0 +1,106 @@
+"""Tests for the process-wide pooled HTTP transport."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from accessiweather import http_session
+from accessiweather.http_session import close_shared_transports, shared_transport
+from accessiweather.weather_client import WeatherClient
+
+
+def _counting_pool(monkeypatch) -> list[httpx.Request]:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    monkeypatch.setattr(http_session, "_build_pool", lambda: httpx.MockTransport(handler))
+    return seen
+
+
+def test_no_shared_transport_outside_event_loop():
+    assert shared_transport() is None
+
+
+@pytest.mark.asyncio
+async def test_same_transport_is_reused_within_a_loop():
+    assert shared_transport() is shared_transport()
+
+
+@pytest.mark.asyncio
+async def test_closing_a_client_keeps_the_pool_open(monkeypatch):
+    seen = _counting_pool(monkeypatch)
+
+    async with httpx.AsyncClient(transport=shared_transport()) as client:
+        await client.get("https://api.weather.gov/a")
+    async with httpx.AsyncClient(transport=shared_transport()) as client:
+        response = await client.get("https://api.weather.gov/b")
+
+    assert response.json() == {"ok": True}
+    assert [request.url.path for request in seen] == ["/a", "/b"]
+
+
+@pytest.mark.asyncio
+async def test_close_shared_transports_replaces_the_pool(monkeypatch):
+    _counting_pool(monkeypatch)
+    first = shared_transport()
+
+    await close_shared_transports()
+
+    assert first.is_closed
+    assert shared_transport() is not first
+
+
+def test_each_event_loop_gets_its_own_pool():
+    async def grab():
+        return shared_transport()
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_weather_client_close_releases_shared_pool(monkeypatch):
+    _counting_pool(monkeypatch)
+    pool = shared_transport()
+    client = WeatherClient()
+
+    await client.close()
+
+    assert pool.is_closed
+
+
+def _proxy_env(monkeypatch, **values: str) -> None:
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    for name, value in values.items():
+        monkeypatch.setenv(name, value)
+
+
+def test_pool_is_direct_without_proxy_settings(monkeypatch):
+    _proxy_env(monkeypatch)
+
+    assert isinstance(http_session._build_pool(), httpx.AsyncHTTPTransport)
+
+
+def test_proxy_is_mounted_per_scheme_and_honors_no_proxy(monkeypatch):
+    _proxy_env(
+        monkeypatch,
+        HTTPS_PROXY="http://proxy.internal:3128",
+        NO_PROXY="localhost,api.weather.gov",
+    )
+
+    pool = http_session._build_pool()
+    direct = pool._transport_for(httpx.URL("http://example.com/"))
+
+    assert pool._transport_for(httpx.URL("https://api.pirateweather.net/")) is not direct
+    assert pool._transport_for(httpx.URL("https://api.weather.gov/alerts")) is direct
+    assert pool._transport_for(httpx.URL("http://localhost:8080/")) is direct
@@ -0,0 +1,77 @@
+"""Tests for the shared versioned JSON store behind the on-disk caches."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from accessiweather.json_store import VersionedJsonStore
+
+
+def _store(tmp_path, **kwargs) -> VersionedJsonStore:
+    return VersionedJsonStore(tmp_path / "cache.json", schema_version=2, label="test", **kwargs)
+
+
+def test_round_trip_keeps_only_object_entries(tmp_path):
+    store = _store(tmp_path)
+
+    assert store.save({"a": {"value": 1}})
+    raw = json.loads(store.path.read_text(encoding="utf-8"))
+    raw["entries"]["bad"] = [1, 2]
+    store.path.write_text(json.dumps(raw), encoding="utf-8")
+
+    assert store.load() == {"a": {"value": 1}}
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_unusable_files_load_as_empty(tmp_path):
+    store = _store(tmp_path)
+    assert store.load() == {}
+
+    store.path.write_text("{not json", encoding="utf-8")
+    assert store.load() == {}
+
+    store.path.write_text(json.dumps({"schema_version": 1, "entries": {"a": {}}}), "utf-8")
+    assert store.load() == {}
+
+
+def test_failed_save_keeps_previous_file_and_removes_temp(tmp_path):
+    store = _store(tmp_path)
+    store.save({"a": {"value": 1}})
+
+    with patch("accessiweather.json_store.os.replace", side_effect=OSError("disk full")):
+        assert not store.save({"a": {"value": 2}})
+
+    assert store.load() == {"a": {"value": 1}}
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_save_soon_coalesces_until_flushed(tmp_path):
+    store = _store(tmp_path, save_delay=60)
+    calls = []
+
+    def snapshot(value):
+        def take():
+            calls.append(value)
+            return {"a": {"value": value}}
+
+        return take
+
+    store.save_soon(snapshot(1))
+    store.save_soon(snapshot(2))
+    assert not store.path.exists()
+
+    store.flush()
+
+    assert calls == [2]
+    assert store.load() == {"a": {"value": 2}}
+    store.flush()
+    assert calls == [2]
+
+
+def test_zero_delay_saves_immediately(tmp_path):
+    store = _store(tmp_path, save_delay=0)
+
+    store.save_soon(lambda: {"a": {"value": 3}})
+
+    assert store.load() == {"a": {"value": 3}}
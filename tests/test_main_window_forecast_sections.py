@@ -3,6 +3,7 @@ from __future__ import annotations
 from unittest.mock import MagicMock, patch
 
 from accessiweather.display.weather_presenter import ForecastPresentation
+from accessiweather.ui.main_window_text import MainWindowText
 
 
 def _make_window():
@@ -107,3 +108,43 @@ def test_on_weather_data_received_appends_marine_to_daily_forecast_section():
 
     win.daily_forecast_display.SetValue.assert_called_once_with("Daily section\n\nMarine section")
     win.hourly_forecast_display.SetValue.assert_called_once_with("Hourly section")
+
+
+def test_on_weather_data_received_skips_unchanged_sections():
+    win = _make_window()
+    win.current_conditions.GetValue.return_value = "Current conditions"
+    win.stale_warning_label.GetLabel.return_value = ""
+    win.daily_forecast_display.GetValue.return_value = "Daily section"
+    win.hourly_forecast_display.GetValue.return_value = "Old hourly"
+
+    weather_data = MagicMock()
+    weather_data.alerts = None
+    weather_data.alert_lifecycle_diff = None
+
+    win._on_weather_data_received(weather_data)
+
+    win.current_conditions.SetValue.assert_not_called()
+    win.stale_warning_label.SetLabel.assert_not_called()
+    win.daily_forecast_display.SetValue.assert_not_called()
+    win.hourly_forecast_display.SetValue.assert_called_once_with("Hourly section")
+
+
+def test_on_weather_data_received_uses_prebuilt_text_without_presenting():
+    win = _make_window()
+    text = MainWindowText(
+        current_conditions="Prebuilt current",
+        status="Showing cached data.",
+        daily_forecast="Prebuilt daily",
+        hourly_forecast="Prebuilt hourly",
+    )
+
+    weather_data = MagicMock()
+    weather_data.alerts = None
+    weather_data.alert_lifecycle_diff = None
+
+    win._on_weather_data_received(weather_data, text=text)
+
+    win.app.presenter.present.assert_not_called()
+    win.current_conditions.SetValue.assert_called_once_with("Prebuilt current")
+    win.stale_warning_label.SetLabel.assert_called_once_with("Showing cached data.")
+    win.hourly_forecast_display.SetValue.assert_called_once_with("Prebuilt hourly")
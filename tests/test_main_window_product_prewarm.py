@@ -75,6 +75,22 @@ def test_pre_warm_fetches_text_products_and_daily_climate_for_us_location():
     service.get_daily_climate_report_for_location.assert_awaited_once()
 
 
+def test_pre_warm_for_notifications_reads_hwo_and_sps_fresh_only():
+    """The active location's HWO/SPS feed notifications, so they are never served stale."""
+    service = MagicMock()
+    service.get = AsyncMock(return_value=None)
+    service.get_fresh = AsyncMock(return_value=None)
+    service.get_daily_climate_report_for_location = AsyncMock(return_value=None)
+
+    win = _make_window(service)
+    asyncio.run(
+        win._pre_warm_products_for_location(_us_location("Philadelphia"), for_notifications=True)
+    )
+
+    assert {call.args[0] for call in service.get.await_args_list} == {"AFD", "SRF"}
+    assert {call.args[0] for call in service.get_fresh.await_args_list} == {"HWO", "SPS"}
+
+
 def test_pre_warm_starts_daily_climate_without_waiting_for_other_products():
     """CLI pre-warm should begin beside AFD/HWO/SPS/SRF so the tab opens warm."""
     started: list[str] = []
@@ -176,8 +192,8 @@ class _FakeWeatherClient:
     def __init__(self) -> None:
         self.pre_warm_batch = AsyncMock()
 
-    def get_cached_weather(self, _location):  # pragma: no cover - exercised indirectly
-        return None
+    def locations_with_cached_data(self, _locations):
+        return []
 
 
 class _FakeConfigManager:
@@ -217,21 +233,31 @@ async def test_fetch_weather_data_warms_active_products_before_ui_delivery():
     win.app.config_manager.get_current_location.return_value = location
     win.app.weather_client.get_weather_data = AsyncMock(return_value=weather_data)
     win._fetch_generation = 1
-    win._pre_warm_products_for_location = AsyncMock(side_effect=lambda _loc: order.append("warm"))
+    win._pre_warm_products_for_location = AsyncMock(
+        side_effect=lambda _loc, **_kwargs: order.append("warm")
+    )
     win._pre_warm_other_locations = AsyncMock(side_effect=lambda _loc: order.append("others"))
     win._on_weather_data_received = MagicMock()
     win._on_weather_error = MagicMock()
 
-    def _call_after(callback, *args):
-        order.append("ui")
-        callback(*args)
+    text = object()
 
-    with patch("accessiweather.ui.main_window_refresh.wx.CallAfter", side_effect=_call_after):
+    def _call_after(callback, *args, **kwargs):
+        order.append("ui")
+        callback(*args, **kwargs)
+
+    with (
+        patch("accessiweather.ui.main_window_refresh.wx.CallAfter", side_effect=_call_after),
+        patch(
+            "accessiweather.ui.main_window_refresh.build_main_window_text", return_value=text
+        ) as build_text,
+    ):
         await win._fetch_weather_data(force_refresh=False, generation=1)
 
     assert order == ["warm", "ui", "others"]
-    win._pre_warm_products_for_location.assert_awaited_once_with(location)
-    win._on_weather_data_received.assert_called_once_with(weather_data)
+    win._pre_warm_products_for_location.assert_awaited_once_with(location, for_notifications=True)
+    build_text.assert_called_once_with(win.app.presenter, weather_data)
+    win._on_weather_data_received.assert_called_once_with(weather_data, text=text)
 
 
 @pytest.mark.asyncio
@@ -219,6 +219,26 @@ class TestRadioPreferences:
         reordered = prefs.reorder_urls("TEST1", urls)
         assert reordered == urls
 
+    def test_reorder_urls_sorts_by_stream_scores(self, tmp_path):
+        prefs = RadioPreferences(config_dir=tmp_path)
+        urls = ["http://dead.com", "http://new.com", "http://slow.com", "http://fast.com"]
+        scores = {"http://dead.com": 61.0, "http://slow.com": 2.5, "http://fast.com": 0.4}
+        reordered = prefs.reorder_urls("TEST1", urls, stream_scores=scores)
+        assert reordered == [
+            "http://fast.com",
+            "http://slow.com",
+            "http://new.com",
+            "http://dead.com",
+        ]
+
+    def test_reorder_urls_preferred_beats_stream_scores(self, tmp_path):
+        prefs = RadioPreferences(config_dir=tmp_path)
+        prefs.set_preferred_url("TEST1", "http://slow.com")
+        urls = ["http://fast.com", "http://slow.com"]
+        scores = {"http://slow.com": 3.0, "http://fast.com": 0.2}
+        reordered = prefs.reorder_urls("TEST1", urls, stream_scores=scores)
+        assert reordered == ["http://slow.com", "http://fast.com"]
+
     def test_case_insensitive(self, tmp_path):
         prefs = RadioPreferences(config_dir=tmp_path)
         prefs.set_preferred_url("test1", "http://stream.com")
@@ -62,3 +62,47 @@ def test_path_based_persistence_works_across_instances(tmp_path):
         "reason": "all_streams_failed",
         "expires_at": 2800.0,
     }
+
+
+def test_stream_history_scores_fastest_live_mirror_lowest(tmp_path):
+    cache = StationAvailabilityCache(path=tmp_path / "availability.json")
+
+    cache.record_stream_result("https://a.example/live", 2.0)
+    cache.record_stream_result("https://a.example/live", 1.0)
+    cache.record_stream_result("https://b.example/live", 0.5)
+    cache.record_stream_result("https://c.example/live", None)
+
+    scores = cache.get_stream_scores(
+        ["https://a.example/live", "https://b.example/live", "https://c.example/live", "x"]
+    )
+
+    assert scores["https://a.example/live"] == 1.5
+    assert scores["https://b.example/live"] == 0.5
+    assert scores["https://c.example/live"] >= 60.0
+    assert "x" not in scores
+
+
+def test_stream_success_resets_failures(tmp_path):
+    cache = StationAvailabilityCache(path=tmp_path / "availability.json")
+    cache.record_stream_result("https://a.example/live", None)
+    cache.record_stream_result("https://a.example/live", None)
+
+    cache.record_stream_result("https://a.example/live", 0.8)
+
+    record = cache.get_stream_record("https://a.example/live")
+    assert record is not None
+    assert record["failures"] == 0
+    assert record["latency"] == 0.8
+
+
+def test_stream_history_persists_alongside_suppressions(tmp_path):
+    path = tmp_path / "availability.json"
+    cache = StationAvailabilityCache(path=path)
+    cache.suppress("WXK27", ttl_seconds=1800, reason="all_streams_failed")
+    cache.record_stream_result("https://a.example/live", 0.7)
+
+    reloaded = StationAvailabilityCache(path=path)
+
+    assert reloaded.is_suppressed("WXK27") is True
+    assert reloaded.get_suppressed_call_signs() == ["WXK27"]
+    assert reloaded.get_stream_scores(["https://a.example/live"]) == {"https://a.example/live": 0.7}
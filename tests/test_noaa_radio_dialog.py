@@ -174,6 +174,7 @@ def _make_dialog_instance(module):
     dlg._prefs.is_favorite_station.return_value = False
     dlg._prefs.get_favorite_stations.return_value = []
     dlg._availability_cache = MagicMock()
+    dlg._stream_prober = MagicMock()
     dlg._station_availability = MagicMock()
     dlg._current_urls = ["http://example.com/stream1", "http://example.com/stream2"]
     dlg._current_url_index = 0
@@ -913,3 +914,64 @@ class TestSuppressionFeedback:
 
         dlg._availability_cache.suppress.assert_not_called()
         dlg._availability_cache.clear.assert_called_with("KEC49")
+
+
+class TestStreamRace:
+    """Tests for racing stream mirrors before playback."""
+
+    def test_on_play_races_when_several_mirrors(self, noaa_dialog_module):
+        dlg = _make_dialog_instance(noaa_dialog_module)
+        urls = ["https://example.com/1", "https://example.com/2"]
+        dlg._url_provider.get_stream_urls.return_value = urls
+        dlg._prefs.reorder_urls.return_value = urls
+        dlg._race_streams_async = MagicMock()
+
+        dlg._on_play(MagicMock())
+
+        dlg._race_streams_async.assert_called_once_with("KEC49", urls)
+        dlg._player.play.assert_not_called()
+
+    def test_race_winner_is_played_first(self, noaa_dialog_module):
+        dlg = _make_dialog_instance(noaa_dialog_module)
+        urls = ["https://example.com/1", "https://example.com/2", "https://example.com/3"]
+        dlg._session.current_urls = urls
+        dlg._closed = False
+        winner = noaa_dialog_module.StreamProbeResult(url="https://example.com/3", latency=0.2)
+
+        dlg._on_stream_race_finished("KEC49", urls, winner)
+
+        dlg._player.play.assert_called_once_with("https://example.com/3")
+        assert dlg._current_urls == [
+            "https://example.com/3",
+            "https://example.com/1",
+            "https://example.com/2",
+        ]
+
+    def test_race_winner_does_not_displace_preferred_stream(self, noaa_dialog_module):
+        dlg = _make_dialog_instance(noaa_dialog_module)
+        urls = ["https://example.com/2", "https://example.com/1", "https://example.com/3"]
+        dlg._session.current_urls = urls
+        dlg._closed = False
+        dlg._prefs.get_preferred_url.return_value = "https://example.com/2"
+        winner = noaa_dialog_module.StreamProbeResult(url="https://example.com/3", latency=0.2)
+
+        dlg._on_stream_race_finished("KEC49", urls, winner)
+
+        dlg._prefs.get_preferred_url.assert_called_once_with("KEC49")
+        dlg._player.play.assert_called_once_with("https://example.com/2")
+        assert dlg._current_urls == [
+            "https://example.com/2",
+            "https://example.com/3",
+            "https://example.com/1",
+        ]
+
+    def test_stale_race_is_ignored(self, noaa_dialog_module):
+        dlg = _make_dialog_instance(noaa_dialog_module)
+        urls = ["https://example.com/1", "https://example.com/2"]
+        dlg._session.current_urls = ["https://other.example/1"]
+        dlg._closed = False
+        winner = noaa_dialog_module.StreamProbeResult(url="https://example.com/2", latency=0.2)
+
+        dlg._on_stream_race_finished("KEC49", urls, winner)
+
+        dlg._player.play.assert_not_called()
@@ -160,6 +160,7 @@ def _make_dialog(module):
     dlg._prefs.is_favorite_station.return_value = False
     dlg._prefs.get_favorite_stations.return_value = []
     dlg._availability_cache = MagicMock()
+    dlg._stream_prober = MagicMock()
     dlg._station_availability = MagicMock()
     dlg._current_urls = ["http://example.com/stream1", "http://example.com/stream2"]
     dlg._current_url_index = 0
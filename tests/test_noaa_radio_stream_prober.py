@@ -0,0 +1,82 @@
+"""Tests for concurrent NOAA radio stream probing."""
+
+from __future__ import annotations
+
+import threading
+
+import httpx
+
+from accessiweather.noaa_radio.availability_cache import StationAvailabilityCache
+from accessiweather.noaa_radio.stream_prober import StreamProber
+
+
+def _client(handler) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_race_returns_first_stream_with_audio(tmp_path):
+    slow_release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "slow.example":
+            slow_release.wait(timeout=5)
+        if request.url.host == "dead.example":
+            return httpx.Response(503)
+        return httpx.Response(200, content=b"ID3audio")
+
+    history = StationAvailabilityCache(path=tmp_path / "availability.json")
+    prober = StreamProber(client=_client(handler), history=history)
+    try:
+        winner = prober.race(
+            ["https://dead.example/s", "https://slow.example/s", "https://fast.example/s"]
+        )
+        assert winner is not None
+        assert winner.url == "https://fast.example/s"
+        assert winner.ok
+    finally:
+        slow_release.set()
+        prober._executor.shutdown(wait=True)
+
+    scores = history.get_stream_scores(
+        ["https://dead.example/s", "https://slow.example/s", "https://fast.example/s"]
+    )
+    assert scores["https://dead.example/s"] >= 60.0
+    assert "https://slow.example/s" in scores
+    assert "https://fast.example/s" in scores
+
+
+def test_race_returns_none_when_every_probe_fails():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "empty.example":
+            return httpx.Response(200, content=b"")
+        raise httpx.ConnectError("refused", request=request)
+
+    prober = StreamProber(client=_client(handler))
+    try:
+        assert prober.race(["https://down.example/s", "https://empty.example/s"]) is None
+    finally:
+        prober.close()
+
+
+def test_probe_all_orders_live_streams_by_latency():
+    ticks = iter([0.0, 0.3, 0.0, 0.1, 0.0])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "down.example":
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"audio")
+
+    prober = StreamProber(client=_client(handler), max_workers=1, clock=lambda: next(ticks))
+    try:
+        results = prober.probe_all(
+            ["https://a.example/s", "https://b.example/s", "https://down.example/s"]
+        )
+    finally:
+        prober.close()
+
+    assert [result.url for result in results] == [
+        "https://b.example/s",
+        "https://a.example/s",
+        "https://down.example/s",
+    ]
+    assert results[-1].ok is False
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from accessiweather import weather_client_nws
+from accessiweather.nws_cancel_references import NwsCancelReferenceTracker
+from accessiweather.runtime_state import RuntimeStateManager
 from accessiweather.weather_client_nws import fetch_nws_cancel_references
 
+BASE_URL = "https://api.weather.gov"
+
 
 @pytest.mark.asyncio
 async def test_returns_referenced_ids():
@@ -105,3 +111,100 @@ async def test_creates_http_client_when_none_provided():
 
     assert "cancel-ref-1" in result
     assert "cancel-ref-2" in result
+
+
+class _Clock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _cancel_response(*refs: tuple[str, str]) -> MagicMock:
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json = MagicMock(
+        return_value={
+            "features": [
+                {"properties": {"sent": sent, "references": [{"identifier": ref_id}]}}
+                for ref_id, sent in refs
+            ]
+        }
+    )
+    return response
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock(datetime(2026, 1, 1, 12, 0, tzinfo=UTC))
+
+
+@pytest.fixture
+def tracker(clock):
+    tracker = NwsCancelReferenceTracker(time_fn=clock)
+    weather_client_nws.set_cancel_reference_tracker(tracker)
+    yield tracker
+    weather_client_nws.set_cancel_reference_tracker(None)
+
+
+class TestIncrementalCancelReferences:
+    @pytest.mark.asyncio
+    async def test_second_poll_starts_from_high_water_mark(self, tracker, clock):
+        client = AsyncMock()
+        client.get = AsyncMock(
+            side_effect=[
+                _cancel_response(("old", "2026-01-01T11:58:00Z")),
+                _cancel_response(("new", "2026-01-01T12:04:00Z")),
+            ]
+        )
+
+        await fetch_nws_cancel_references(BASE_URL, "TestAgent/1.0", 10.0, client=client)
+        clock.now += timedelta(minutes=5)
+        result = await fetch_nws_cancel_references(BASE_URL, "TestAgent/1.0", 10.0, client=client)
+
+        first, second = (call.kwargs["params"] for call in client.get.call_args_list)
+        assert first["start"] == "2026-01-01T11:45:00Z"
+        # Previous end (12:00) minus the overlap, not a full 15-minute lookback.
+        assert second["start"] == "2026-01-01T11:58:00Z"
+        assert result == {"old", "new"}
+
+    @pytest.mark.asyncio
+    async def test_references_expire_by_cancel_age(self, tracker, clock):
+        client = AsyncMock()
+        client.get = AsyncMock(
+            side_effect=[
+                _cancel_response(("old", "2026-01-01T11:50:00Z")),
+                _cancel_response(),
+            ]
+        )
+
+        await fetch_nws_cancel_references(BASE_URL, "TestAgent/1.0", 10.0, client=client)
+        clock.now += timedelta(minutes=6)
+        result = await fetch_nws_cancel_references(BASE_URL, "TestAgent/1.0", 10.0, client=client)
+
+        assert result == set()
+
+    @pytest.mark.asyncio
+    async def test_failure_returns_tracked_references(self, tracker):
+        client = AsyncMock()
+        client.get = AsyncMock(
+            side_effect=[_cancel_response(("a", "2026-01-01T11:59:00Z")), Exception("offline")]
+        )
+
+        await fetch_nws_cancel_references(BASE_URL, "TestAgent/1.0", 10.0, client=client)
+        result = await fetch_nws_cancel_references(BASE_URL, "TestAgent/1.0", 10.0, client=client)
+
+        assert result == {"a"}
+
+    def test_state_round_trips_through_runtime_state(self, tmp_path, clock):
+        manager = RuntimeStateManager(tmp_path)
+        tracker = NwsCancelReferenceTracker(runtime_state_manager=manager, time_fn=clock)
+        tracker.record({"a": clock.now - timedelta(minutes=1)}, clock.now)
+
+        restored = NwsCancelReferenceTracker(runtime_state_manager=manager, time_fn=clock)
+
+        assert restored.references() == {"a"}
+        assert restored.query_start(clock.now, timedelta(minutes=15)) == clock.now - timedelta(
+            minutes=2
+        )
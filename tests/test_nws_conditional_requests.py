@@ -0,0 +1,206 @@
+"""Tests for ETag/Last-Modified revalidation of NWS forecast, alert and product fetches."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from accessiweather import weather_client_nws
+from accessiweather.models import Location
+from accessiweather.nws_validator_store import NwsValidatorStore
+from accessiweather.weather_client_nws import (
+    get_nws_alerts,
+    get_nws_forecast_and_discussion,
+    get_nws_text_product,
+)
+
+BASE_URL = "https://api.weather.gov"
+USER_AGENT = "Test/1.0"
+FORECAST_URL = f"{BASE_URL}/gridpoints/OKX/33,35/forecast"
+
+GRID_DATA = {
+    "properties": {
+        "forecast": FORECAST_URL,
+        "forecastOffice": f"{BASE_URL}/offices/OKX",
+    }
+}
+
+FORECAST_PAYLOAD = {
+    "properties": {
+        "periods": [
+            {
+                "name": "Tonight",
+                "temperature": 50,
+                "temperatureUnit": "F",
+                "shortForecast": "Clear",
+                "startTime": "2026-01-01T18:00:00-05:00",
+            }
+        ]
+    }
+}
+
+ALERT_PAYLOAD = {
+    "features": [
+        {
+            "id": "urn:oid:alert-1",
+            "properties": {
+                "id": "urn:oid:alert-1",
+                "event": "Flood Watch",
+                "headline": "Flood Watch issued",
+                "severity": "Moderate",
+            },
+        }
+    ]
+}
+
+
+def _resp(payload: dict, status_code: int = 200, headers: dict | None = None) -> MagicMock:
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.headers = headers or {}
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def _calls_to(client: MagicMock, fragment: str) -> list:
+    return [call for call in client.get.call_args_list if fragment in call.args[0]]
+
+
+@pytest.fixture
+def location() -> Location:
+    return Location(name="New York", latitude=40.7128, longitude=-74.0060)
+
+
+@pytest.fixture
+def validator_store():
+    store = NwsValidatorStore()
+    weather_client_nws.set_validator_store(store)
+    yield store
+    weather_client_nws.set_validator_store(None)
+
+
+class TestNwsValidatorStore:
+    def test_key_ignores_param_order(self):
+        assert NwsValidatorStore.key_for("u", {"a": 1, "b": 2}) == NwsValidatorStore.key_for(
+            "u", {"b": 2, "a": 1}
+        )
+
+    def test_response_without_validators_is_not_stored(self):
+        store = NwsValidatorStore()
+        store.put("k", object(), etag=None, last_modified=None)
+
+        assert store.get("k") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        store = NwsValidatorStore(max_entries=2)
+        store.put("a", 1, etag='"a"')
+        store.put("b", 2, etag='"b"')
+        store.get("a")
+        store.put("c", 3, etag='"c"')
+
+        assert store.get("b") is None
+        assert store.get("a") is not None
+
+
+class TestConditionalFetchPaths:
+    @pytest.mark.asyncio
+    async def test_forecast_304_reuses_parsed_model(self, validator_store, location):
+        client = MagicMock(spec=httpx.AsyncClient)
+        responses = [
+            _resp(FORECAST_PAYLOAD, headers={"ETag": '"f1"'}),
+            _resp({}, status_code=304),
+        ]
+
+        def side_effect(url, **_kwargs):
+            if url == FORECAST_URL:
+                return responses.pop(0)
+            return _resp({"@graph": []})
+
+        client.get.side_effect = side_effect
+
+        with patch(
+            "accessiweather.weather_client_nws_forecast.parse_nws_forecast",
+            wraps=weather_client_nws.parse_nws_forecast,
+        ) as parse:
+            first, _, _ = await get_nws_forecast_and_discussion(
+                location, BASE_URL, USER_AGENT, 10.0, client, GRID_DATA
+            )
+            second, _, _ = await get_nws_forecast_and_discussion(
+                location, BASE_URL, USER_AGENT, 10.0, client, GRID_DATA
+            )
+
+        assert second is first
+        assert parse.call_count == 1
+        revalidation = _calls_to(client, FORECAST_URL)[1]
+        assert revalidation.kwargs["headers"]["If-None-Match"] == '"f1"'
+
+    @pytest.mark.asyncio
+    async def test_alerts_send_last_modified_and_reuse_on_304(self, validator_store, location):
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.side_effect = [
+            _resp(ALERT_PAYLOAD, headers={"Last-Modified": "Thu, 01 Jan 2026 00:00:00 GMT"}),
+            _resp({}, status_code=304),
+        ]
+
+        first = await get_nws_alerts(
+            location, BASE_URL, USER_AGENT, 10.0, client, alert_radius_type="point"
+        )
+        second = await get_nws_alerts(
+            location, BASE_URL, USER_AGENT, 10.0, client, alert_radius_type="point"
+        )
+
+        assert second is first
+        assert len(second.alerts) == 1
+        headers = client.get.call_args_list[1].kwargs["headers"]
+        assert headers["If-Modified-Since"] == "Thu, 01 Jan 2026 00:00:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_changed_document_is_parsed_again(self, validator_store, location):
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.side_effect = [
+            _resp(ALERT_PAYLOAD, headers={"ETag": '"a1"'}),
+            _resp({"features": []}, headers={"ETag": '"a2"'}),
+        ]
+
+        await get_nws_alerts(location, BASE_URL, USER_AGENT, 10.0, client, "point")
+        second = await get_nws_alerts(location, BASE_URL, USER_AGENT, 10.0, client, "point")
+
+        assert second.alerts == []
+        (record,) = validator_store._records.values()
+        assert record.etag == '"a2"'
+
+    @pytest.mark.asyncio
+    async def test_text_product_listing_and_body_revalidate(self, validator_store):
+        product_payload = {
+            "id": "AFD-1",
+            "productText": "Area forecast discussion",
+            "issuanceTime": "2026-01-01T12:00:00+00:00",
+        }
+        listing = {"@graph": [{"id": "AFD-1", "issuanceTime": "2026-01-01T12:00:00+00:00"}]}
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.side_effect = [
+            _resp(listing, headers={"ETag": '"l1"'}),
+            _resp(product_payload, headers={"ETag": '"p1"'}),
+            _resp({}, status_code=304),
+            _resp({}, status_code=304),
+        ]
+
+        first = await get_nws_text_product("AFD", "OKX", client=client)
+        second = await get_nws_text_product("AFD", "OKX", client=client)
+
+        assert second == first
+        assert second.product_text == "Area forecast discussion"
+
+    @pytest.mark.asyncio
+    async def test_without_store_no_conditional_headers_are_sent(self, location):
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.return_value = _resp(ALERT_PAYLOAD, headers={"ETag": '"a1"'})
+
+        await get_nws_alerts(location, BASE_URL, USER_AGENT, 10.0, client, "point")
+        await get_nws_alerts(location, BASE_URL, USER_AGENT, 10.0, client, "point")
+
+        for call in client.get.call_args_list:
+            assert "If-None-Match" not in call.kwargs["headers"]
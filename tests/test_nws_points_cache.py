@@ -0,0 +1,218 @@
+"""Tests for the persistent NWS /points grid-metadata cache."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from accessiweather import weather_client_nws
+from accessiweather.models import Location
+from accessiweather.nws_points_cache import NwsPointsCache
+from accessiweather.weather_client_nws import (
+    get_nws_alerts,
+    get_nws_current_conditions,
+    get_nws_hourly_forecast,
+)
+
+BASE_URL = "https://api.weather.gov"
+USER_AGENT = "Test/1.0"
+
+POINT_PAYLOAD = {
+    "@context": ["https://geojson.org/geojson-ld/geojson-context.jsonld"],
+    "geometry": {"type": "Point", "coordinates": [-74.006, 40.7128]},
+    "properties": {
+        "gridId": "OKX",
+        "forecast": f"{BASE_URL}/gridpoints/OKX/33,35/forecast",
+        "forecastHourly": f"{BASE_URL}/gridpoints/OKX/33,35/forecast/hourly",
+        "forecastGridData": f"{BASE_URL}/gridpoints/OKX/33,35",
+        "observationStations": f"{BASE_URL}/gridpoints/OKX/33,35/stations",
+        "county": f"{BASE_URL}/zones/county/NYC061",
+        "forecastZone": f"{BASE_URL}/zones/forecast/NYZ072",
+        "timeZone": "America/New_York",
+    },
+}
+
+
+def _resp(payload: dict, status_code: int = 200, headers: dict | None = None) -> MagicMock:
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.headers = headers or {}
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def _points_calls(client: MagicMock) -> list:
+    return [call for call in client.get.call_args_list if "/points/" in call.args[0]]
+
+
+@pytest.fixture
+def location() -> Location:
+    return Location(name="New York", latitude=40.7128, longitude=-74.0060)
+
+
+@pytest.fixture
+def clock():
+    return {"now": 1_000.0}
+
+
+@pytest.fixture
+def points_cache(tmp_path, clock):
+    cache = NwsPointsCache(
+        path=tmp_path / "points.json", ttl_seconds=3600, time_fn=lambda: clock["now"]
+    )
+    weather_client_nws.set_points_cache(cache)
+    yield cache
+    weather_client_nws.set_points_cache(None)
+
+
+class TestNwsPointsCache:
+    def test_put_and_get_strips_to_properties(self, tmp_path):
+        cache = NwsPointsCache(path=tmp_path / "points.json")
+
+        cache.put(40.7128, -74.006, POINT_PAYLOAD)
+
+        assert cache.get(40.71280001, -74.00600001) == {"properties": POINT_PAYLOAD["properties"]}
+
+    def test_entry_expires_after_ttl_but_record_is_kept(self, tmp_path, clock):
+        cache = NwsPointsCache(
+            path=tmp_path / "points.json", ttl_seconds=60, time_fn=lambda: clock["now"]
+        )
+        cache.put(40.7128, -74.006, POINT_PAYLOAD, etag='"abc"')
+
+        clock["now"] += 61
+
+        assert cache.get(40.7128, -74.006) is None
+        assert cache.get_record(40.7128, -74.006)["etag"] == '"abc"'
+
+    def test_touch_extends_freshness(self, tmp_path, clock):
+        cache = NwsPointsCache(
+            path=tmp_path / "points.json", ttl_seconds=60, time_fn=lambda: clock["now"]
+        )
+        cache.put(40.7128, -74.006, POINT_PAYLOAD)
+        clock["now"] += 61
+
+        cache.touch(40.7128, -74.006)
+
+        assert cache.is_fresh(40.7128, -74.006)
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "points.json"
+        cache = NwsPointsCache(path=path, time_fn=lambda: 1000.0)
+        cache.put(40.7128, -74.006, POINT_PAYLOAD)
+        cache.flush()
+
+        reloaded = NwsPointsCache(path=path, time_fn=lambda: 1000.0)
+
+        assert reloaded.get(40.7128, -74.006) is not None
+
+    def test_get_returns_a_copy(self, tmp_path):
+        cache = NwsPointsCache(path=tmp_path / "points.json")
+        cache.put(40.7128, -74.006, POINT_PAYLOAD)
+
+        cache.get(40.7128, -74.006)["properties"]["gridId"] = "XXX"
+        cache.get_record(40.7128, -74.006)["payload"]["properties"]["gridId"] = "YYY"
+
+        assert cache.get(40.7128, -74.006)["properties"]["gridId"] == "OKX"
+
+    def test_put_and_touch_defer_the_file_write(self, tmp_path):
+        path = tmp_path / "points.json"
+        cache = NwsPointsCache(path=path, save_delay=60)
+        cache.put(40.7128, -74.006, POINT_PAYLOAD)
+        cache.put(41.0, -74.0, POINT_PAYLOAD)
+        cache.touch(40.7128, -74.006)
+
+        assert not path.exists()
+        cache.flush()
+        assert len(NwsPointsCache(path=path)) == 2
+
+    def test_corrupt_file_fails_soft(self, tmp_path):
+        path = tmp_path / "points.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        cache = NwsPointsCache(path=path)
+
+        assert len(cache) == 0
+
+    def test_max_entries_drops_oldest(self, tmp_path, clock):
+        cache = NwsPointsCache(
+            path=tmp_path / "points.json", max_entries=2, time_fn=lambda: clock["now"]
+        )
+        for offset in range(3):
+            clock["now"] += 1
+            cache.put(40.0 + offset, -74.0, POINT_PAYLOAD)
+
+        assert len(cache) == 2
+        assert cache.get(40.0, -74.0) is None
+
+
+class TestPointsCacheFetchPaths:
+    @pytest.mark.asyncio
+    async def test_fresh_cache_skips_points_request_across_fetchers(self, points_cache, location):
+        points_cache.put(location.latitude, location.longitude, POINT_PAYLOAD)
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get.return_value = _resp({"features": [], "properties": {"periods": []}})
+
+        await get_nws_current_conditions(location, BASE_URL, USER_AGENT, 10.0, client)
+        await get_nws_hourly_forecast(location, BASE_URL, USER_AGENT, 10.0, client)
+        await get_nws_alerts(location, BASE_URL, USER_AGENT, 10.0, client)
+
+        assert _points_calls(client) == []
+        assert location.timezone == "America/New_York"
+
+    @pytest.mark.asyncio
+    async def test_miss_fetches_once_then_serves_from_cache(self, points_cache, location):
+        client = MagicMock(spec=httpx.AsyncClient)
+
+        def side_effect(url, **_kwargs):
+            if "/points/" in url:
+                return _resp(POINT_PAYLOAD, headers={"ETag": '"v1"'})
+            return _resp({"features": []})
+
+        client.get.side_effect = side_effect
+
+        await get_nws_current_conditions(location, BASE_URL, USER_AGENT, 10.0, client)
+        await get_nws_current_conditions(location, BASE_URL, USER_AGENT, 10.0, client)
+
+        assert len(_points_calls(client)) == 1
+        assert points_cache.get_record(location.latitude, location.longitude)["etag"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_revalidates_with_etag(self, points_cache, clock, location):
+        points_cache.put(location.latitude, location.longitude, POINT_PAYLOAD, etag='"v1"')
+        clock["now"] += 3601
+        client = MagicMock(spec=httpx.AsyncClient)
+
+        def side_effect(url, **_kwargs):
+            if "/points/" in url:
+                return _resp({}, status_code=304)
+            return _resp({"features": []})
+
+        client.get.side_effect = side_effect
+
+        await get_nws_current_conditions(location, BASE_URL, USER_AGENT, 10.0, client)
+
+        (points_call,) = _points_calls(client)
+        assert points_call.kwargs["headers"]["If-None-Match"] == '"v1"'
+        assert points_cache.is_fresh(location.latitude, location.longitude)
+
+    @pytest.mark.asyncio
+    async def test_failed_revalidation_serves_expired_entry(self, points_cache, clock, location):
+        points_cache.put(location.latitude, location.longitude, POINT_PAYLOAD)
+        clock["now"] += 3601
+        client = MagicMock(spec=httpx.AsyncClient)
+        stations_url = POINT_PAYLOAD["properties"]["observationStations"]
+
+        def side_effect(url, **_kwargs):
+            if "/points/" in url:
+                raise httpx.ConnectError("offline")
+            return _resp({"features": []})
+
+        client.get.side_effect = side_effect
+
+        await get_nws_current_conditions(location, BASE_URL, USER_AGENT, 10.0, client)
+
+        requested = [call.args[0] for call in client.get.call_args_list]
+        assert stations_url in requested
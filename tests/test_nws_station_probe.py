@@ -0,0 +1,186 @@
+"""Tests for hedged, concurrent NWS observation-station probing."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from accessiweather.models import Location
+from accessiweather.weather_client_nws_current import (
+    StationHealthTracker,
+    _select_best_observation,
+)
+
+BASE_URL = "https://api.weather.gov"
+HEADERS = {"User-Agent": "Test/1.0"}
+
+
+def _feature(station_id: str, distance: float) -> dict:
+    return {
+        "properties": {
+            "stationIdentifier": station_id,
+            "distance": {"value": distance},
+        }
+    }
+
+
+def _observation(minutes_old: int, temperature_c: float | None = 20.0) -> dict:
+    return {
+        "properties": {
+            "timestamp": (datetime.now(UTC) - timedelta(minutes=minutes_old)).isoformat(),
+            "temperature": {"value": temperature_c, "unitCode": "wmoUnit:degC"},
+            "textDescription": "Clear" if temperature_c is not None else None,
+        }
+    }
+
+
+def _resp(payload: dict) -> MagicMock:
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 200
+    response.json.return_value = payload
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def _error_resp() -> MagicMock:
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 503
+    response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "HTTP 503", request=MagicMock(), response=response
+    )
+    return response
+
+
+def _station_from_url(url: str) -> str:
+    return url.split("/stations/")[1].split("/")[0]
+
+
+def _async_client(responses: dict[str, MagicMock], delays: dict[str, float] | None = None):
+    delays = delays or {}
+    requested: list[str] = []
+
+    async def get(url, **_kwargs):
+        station_id = _station_from_url(url)
+        requested.append(station_id)
+        await asyncio.sleep(delays.get(station_id, 0))
+        return responses[station_id]
+
+    client = MagicMock(spec=httpx.AsyncClient)
+    client.get.side_effect = get
+    return client, requested
+
+
+@pytest.fixture
+def location() -> Location:
+    return Location(name="Testville", latitude=40.0, longitude=-75.0)
+
+
+@pytest.mark.asyncio
+async def test_first_fresh_result_wins_and_slow_probes_are_cancelled(location):
+    features = [_feature("KAAA", 1000), _feature("KBBB", 2000), _feature("KCCC", 3000)]
+    client, _requested = _async_client(
+        {
+            "KAAA": _resp(_observation(5)),
+            "KBBB": _resp(_observation(5, temperature_c=10.0)),
+            "KCCC": _resp(_observation(5)),
+        },
+        delays={"KAAA": 5.0},
+    )
+
+    current = await asyncio.wait_for(
+        _select_best_observation(
+            features,
+            client,
+            location,
+            BASE_URL,
+            HEADERS,
+            stagger=0.0,
+            health=StationHealthTracker(),
+        ),
+        timeout=2.0,
+    )
+
+    assert current is not None
+    assert current.temperature_c == pytest.approx(10.0)
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_frees_slot_for_next_candidate(location):
+    features = [_feature(f"K00{i}", 1000 * i) for i in range(1, 5)]
+    client, requested = _async_client(
+        {
+            "K001": _error_resp(),
+            "K002": _error_resp(),
+            "K003": _resp(_observation(5)),
+            "K004": _resp(_observation(5)),
+        }
+    )
+
+    current = await _select_best_observation(
+        features,
+        client,
+        location,
+        BASE_URL,
+        HEADERS,
+        fanout=2,
+        stagger=0.0,
+        health=StationHealthTracker(),
+    )
+
+    assert current is not None
+    assert requested[:3] == ["K001", "K002", "K003"]
+
+
+@pytest.mark.asyncio
+async def test_stale_observation_is_used_as_fallback(location):
+    features = [_feature("KAAA", 1000), _feature("KBBB", 2000)]
+    client, _requested = _async_client(
+        {"KAAA": _resp(_observation(600)), "KBBB": _error_resp()},
+    )
+
+    current = await _select_best_observation(
+        features, client, location, BASE_URL, HEADERS, stagger=0.0, health=StationHealthTracker()
+    )
+
+    assert current is not None
+    assert current.temperature_c == pytest.approx(20.0)
+
+
+@pytest.mark.asyncio
+async def test_station_that_worked_last_time_is_probed_first(location):
+    health = StationHealthTracker()
+    features = [_feature("KAAA", 1000), _feature("KBBB", 2000), _feature("KCCC", 3000)]
+    client, requested = _async_client(
+        {
+            "KAAA": _error_resp(),
+            "KBBB": _error_resp(),
+            "KCCC": _resp(_observation(5)),
+        }
+    )
+
+    await _select_best_observation(
+        features, client, location, BASE_URL, HEADERS, fanout=1, stagger=0.0, health=health
+    )
+    assert health.preferred_station(location) == "KCCC"
+
+    requested.clear()
+    await _select_best_observation(
+        features, client, location, BASE_URL, HEADERS, fanout=1, stagger=0.0, health=health
+    )
+
+    assert requested == ["KCCC"]
+
+
+def test_repeatedly_failing_stations_move_to_the_back(location):
+    health = StationHealthTracker(failure_penalty_after=2)
+    features = [_feature("KAAA", 1000), _feature("KBBB", 2000)]
+    health.record_failure("KAAA")
+    health.record_failure("KAAA")
+
+    ordered = health.order(location, features)
+
+    assert [f["properties"]["stationIdentifier"] for f in ordered] == ["KBBB", "KAAA"]
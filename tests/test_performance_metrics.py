@@ -0,0 +1,105 @@
+"""Tests for performance/metrics.py and the span() recorder."""
+
+import json
+
+import pytest
+
+from accessiweather.performance import (
+    MetricsRegistry,
+    format_operation_stats,
+    get_metrics_registry,
+    span,
+)
+
+
+class TestMetricsRegistry:
+    def test_percentiles_and_max_per_operation_and_provider(self):
+        registry = MetricsRegistry()
+        for value in range(1, 101):
+            registry.record("http_request", float(value), provider="api.weather.gov")
+        registry.record("http_request", 5.0, provider="api.open-meteo.com")
+
+        stats = {item.provider: item for item in registry.snapshot()}
+        assert stats["api.weather.gov"].count == 100
+        assert stats["api.weather.gov"].p50_ms == 50.0
+        assert stats["api.weather.gov"].p95_ms == 95.0
+        assert stats["api.weather.gov"].max_ms == 100.0
+        assert stats["api.open-meteo.com"].p95_ms == 5.0
+
+    def test_window_bounds_samples_but_not_totals(self):
+        registry = MetricsRegistry(window_size=3)
+        for value in (100.0, 1.0, 1.0, 1.0):
+            registry.record("parse", value, provider="nws", failed=value > 50)
+
+        (stats,) = registry.snapshot()
+
+        assert stats.count == 4
+        assert stats.failures == 1
+        assert stats.p95_ms == 1.0
+        assert stats.max_ms == 100.0
+
+    def test_json_dump_and_reset(self):
+        registry = MetricsRegistry(time_fn=lambda: 1000.0)
+        registry.record("ui_update", 12.5)
+
+        payload = json.loads(registry.to_json())
+
+        assert payload["operations"][0]["operation"] == "ui_update"
+        assert payload["operations"][0]["p50_ms"] == 12.5
+        registry.reset()
+        assert registry.snapshot() == []
+
+    def test_format_report(self):
+        registry = MetricsRegistry()
+        registry.record("provider_fetch", 40.0, provider="nws", failed=True)
+
+        text = format_operation_stats(registry.snapshot())
+
+        assert text == "provider_fetch (nws): 1 calls, 1 failed; p50 40 ms, p95 40 ms, max 40 ms"
+        assert format_operation_stats([]) == "No operations have been recorded yet."
+
+
+class TestSpan:
+    def test_span_records_success_and_failure(self):
+        registry = get_metrics_registry()
+        registry.reset()
+
+        with span("presenter_build"):
+            pass
+        with pytest.raises(ValueError), span("presenter_build"):
+            raise ValueError("boom")
+
+        (stats,) = registry.snapshot()
+        assert stats.operation == "presenter_build"
+        assert stats.count == 2
+        assert stats.failures == 1
+        registry.reset()
+
+    @pytest.mark.asyncio
+    async def test_nws_parse_span_excludes_http_errors(self, monkeypatch):
+        import httpx
+
+        from accessiweather import weather_client_nws_common as common
+
+        async def fake_get(client, url, headers, params=None):
+            status = 404 if url.endswith("/missing") else 200
+            return httpx.Response(status, json={}, request=httpx.Request("GET", url))
+
+        def parse(response):
+            response.raise_for_status()
+            return response.json()
+
+        monkeypatch.setattr(common, "_client_get", fake_get)
+        monkeypatch.setattr(common, "_VALIDATOR_STORE", None)
+        registry = get_metrics_registry()
+        registry.reset()
+
+        await common._conditional_get(None, "https://api.weather.gov/ok", parse, headers={})
+        with pytest.raises(httpx.HTTPStatusError):
+            await common._conditional_get(
+                None, "https://api.weather.gov/missing", parse, headers={}
+            )
+
+        (stats,) = registry.snapshot()
+        assert (stats.operation, stats.count, stats.failures) == ("parse", 1, 0)
+        registry.reset()
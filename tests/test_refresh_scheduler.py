@@ -0,0 +1,222 @@
+"""Tests for the adaptive background refresh scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import wx
+
+from accessiweather import app_timer_manager
+from accessiweather.models import AppSettings, Location
+from accessiweather.nws_validator_store import freshness_lifetime
+from accessiweather.refresh_scheduler import (
+    ACTIVE_REFRESH_INTERVAL,
+    ALL_LOCATIONS,
+    EVENTS,
+    QUIET_MAX_REFRESH_INTERVAL,
+    WEATHER,
+    RefreshScheduler,
+    plan_refresh_interval,
+)
+from accessiweather.weather_client import WeatherClient
+
+BASE = timedelta(minutes=10)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestPlanRefreshInterval:
+    def test_active_weather_tightens_cadence(self):
+        assert (
+            plan_refresh_interval(BASE, active_alerts=True, precipitation_likely=False)
+            == ACTIVE_REFRESH_INTERVAL
+        )
+        assert plan_refresh_interval(
+            timedelta(minutes=2), active_alerts=False, precipitation_likely=True
+        ) == timedelta(minutes=2)
+
+    def test_quiet_weather_backs_off_within_bounds(self):
+        assert plan_refresh_interval(
+            BASE, active_alerts=False, precipitation_likely=False
+        ) == timedelta(minutes=20)
+        assert (
+            plan_refresh_interval(
+                BASE,
+                active_alerts=False,
+                precipitation_likely=False,
+                fresh_for=timedelta(hours=3),
+            )
+            == QUIET_MAX_REFRESH_INTERVAL
+        )
+        assert plan_refresh_interval(
+            timedelta(minutes=90), active_alerts=False, precipitation_likely=False
+        ) == timedelta(minutes=90)
+
+
+class TestRefreshScheduler:
+    def test_due_work_is_coalesced_with_work_inside_the_window(self):
+        clock = _Clock()
+        scheduler = RefreshScheduler(coalesce_window=30, time_fn=clock)
+        scheduler.schedule("A", WEATHER, timedelta(seconds=60))
+        scheduler.schedule("B", WEATHER, timedelta(seconds=80))
+        scheduler.schedule("C", WEATHER, timedelta(seconds=200))
+
+        assert scheduler.pop_due() == []
+        assert scheduler.seconds_until_next() == 60
+        clock.now += 60
+
+        assert scheduler.pop_due() == [("A", WEATHER), ("B", WEATHER)]
+        assert scheduler.planned_keys(WEATHER) == {"C"}
+
+    def test_replanning_and_cancelling_supersede_earlier_plans(self):
+        clock = _Clock()
+        scheduler = RefreshScheduler(coalesce_window=0, time_fn=clock)
+        scheduler.schedule("A", WEATHER, timedelta(seconds=10))
+        scheduler.schedule("A", WEATHER, timedelta(seconds=100))
+        assert scheduler.seconds_until("A", WEATHER) == 100
+        scheduler.schedule("B", WEATHER, timedelta(seconds=5))
+        scheduler.cancel("B", WEATHER)
+
+        clock.now += 50
+        assert scheduler.pop_due() == []
+        assert scheduler.seconds_until_next() == 50
+        assert scheduler.seconds_until("B", WEATHER) is None
+
+
+class TestSchedulerDispatch:
+    @pytest.fixture
+    def app(self):
+        home = Location(name="Home", latitude=40.0, longitude=-75.0)
+        cabin = Location(name="Cabin", latitude=41.0, longitude=-76.0)
+        beach = Location(name="Beach", latitude=39.0, longitude=-74.0)
+        config_manager = MagicMock()
+        config_manager.get_current_location.return_value = home
+        config_manager.get_all_locations.return_value = [home, cabin, beach]
+        weather_client = MagicMock()
+        weather_client.pre_warm_batch = AsyncMock(return_value=1)
+        return SimpleNamespace(
+            config_manager=config_manager,
+            weather_client=weather_client,
+            _on_background_update=MagicMock(),
+            _on_event_check_update=MagicMock(),
+        )
+
+    def test_only_active_location_and_alerting_locations_are_planned(self, app):
+        app.weather_client.suggest_refresh_interval.side_effect = lambda loc, active_location: (
+            BASE if active_location or loc.name == "Cabin" else None
+        )
+        scheduler = RefreshScheduler()
+        scheduler.schedule("Removed", WEATHER, BASE)
+
+        app_timer_manager.plan_location_refreshes(app, scheduler)
+
+        assert scheduler.planned_keys(WEATHER) == {"Home", "Cabin"}
+
+    def test_shorter_interval_pulls_an_existing_plan_forward(self, app):
+        clock = _Clock()
+        scheduler = RefreshScheduler(time_fn=clock)
+        app.config_manager.get_all_locations.return_value = [
+            app.config_manager.get_current_location.return_value
+        ]
+        app.weather_client.suggest_refresh_interval.return_value = QUIET_MAX_REFRESH_INTERVAL
+        app_timer_manager.plan_location_refreshes(app, scheduler)
+        clock.now += 60
+
+        app_timer_manager.plan_location_refreshes(app, scheduler)
+        assert scheduler.seconds_until("Home", WEATHER) == (
+            QUIET_MAX_REFRESH_INTERVAL.total_seconds() - 60
+        )
+
+        app.weather_client.suggest_refresh_interval.return_value = ACTIVE_REFRESH_INTERVAL
+        app_timer_manager.plan_location_refreshes(app, scheduler)
+        assert scheduler.seconds_until("Home", WEATHER) == ACTIVE_REFRESH_INTERVAL.total_seconds()
+
+    @pytest.mark.asyncio
+    async def test_due_batch_routes_active_location_and_batches_the_rest(self, app, monkeypatch):
+        call_after = MagicMock()
+        monkeypatch.setattr(wx, "CallAfter", call_after)
+
+        await app_timer_manager.dispatch_due_refreshes(
+            app,
+            [(ALL_LOCATIONS, EVENTS), ("Home", WEATHER), ("Cabin", WEATHER), ("Beach", WEATHER)],
+        )
+        await asyncio.gather(*app._pre_warm_tasks)
+
+        call_after.assert_any_call(app._on_event_check_update, None)
+        call_after.assert_any_call(app._on_background_update, None)
+        refreshed = app.weather_client.pre_warm_batch.call_args.args[0]
+        assert [location.name for location in refreshed] == ["Cabin", "Beach"]
+        assert app._pre_warm_tasks == set()
+
+    @pytest.mark.asyncio
+    async def test_pre_warm_batch_does_not_block_dispatch(self, app, monkeypatch):
+        monkeypatch.setattr(wx, "CallAfter", MagicMock())
+        release = asyncio.Event()
+
+        async def slow_batch(locations, active_location=None):
+            await release.wait()
+            return len(locations)
+
+        app.weather_client.pre_warm_batch = AsyncMock(side_effect=slow_batch)
+
+        await asyncio.wait_for(
+            app_timer_manager.dispatch_due_refreshes(app, [("Cabin", WEATHER)]), timeout=1
+        )
+
+        (task,) = app._pre_warm_tasks
+        assert not task.done()
+        release.set()
+        assert await task == 1
+
+    def test_start_uses_scheduler_when_async_loop_is_running(self, app, monkeypatch):
+        future = MagicMock()
+        run_threadsafe = MagicMock(return_value=future)
+        monkeypatch.setattr(app_timer_manager.asyncio, "run_coroutine_threadsafe", run_threadsafe)
+        app.config_manager.get_settings.return_value = SimpleNamespace(update_interval_minutes=10)
+        app._async_loop = object()
+
+        app_timer_manager.start_background_updates(app)
+        run_threadsafe.call_args.args[0].close()
+        app_timer_manager.stop_background_updates(app)
+
+        assert run_threadsafe.call_args.args[1] is app._async_loop
+        future.cancel.assert_called_once()
+
+
+class TestSuggestRefreshInterval:
+    def test_nws_freshness_holds_off_quiet_refresh(self, monkeypatch):
+        client = WeatherClient(settings=AppSettings(update_interval_minutes=10))
+        location = Location(name="Home", latitude=40.0, longitude=-75.0)
+        monkeypatch.setattr(
+            "accessiweather.weather_client_base.nws_client.nws_forecast_fresh_until",
+            lambda _location: time.time() + 45 * 60,
+        )
+
+        interval = client.suggest_refresh_interval(location)
+
+        assert timedelta(minutes=44) < interval <= timedelta(minutes=45)
+        assert client.suggest_refresh_interval(location, active_location=False) is None
+
+    def test_freshness_lifetime_prefers_max_age_over_expires(self):
+        assert freshness_lifetime({"Cache-Control": "public, max-age=600"}) == 600
+        assert (
+            freshness_lifetime(
+                {
+                    "Expires": "Thu, 01 Jan 2026 00:15:00 GMT",
+                    "Date": "Thu, 01 Jan 2026 00:00:00 GMT",
+                }
+            )
+            == 900
+        )
+        assert freshness_lifetime({}) is None
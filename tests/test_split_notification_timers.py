@@ -21,6 +21,7 @@ from accessiweather.models import (
     HourlyForecastPeriod,
     Location,
     TextProduct,
+    WeatherAlert,
     WeatherAlerts,
     WeatherData,
 )
@@ -292,6 +293,57 @@ class TestFetchNotificationEventData:
                 win._on_notification_event_data_received, weather_data
             )
 
+    @pytest.mark.asyncio
+    async def test_polls_other_saved_locations_in_one_batch(self):
+        win = self._make_window()
+        loc = Location(name="NYC", latitude=40.71, longitude=-74.0)
+        other = Location(name="Boston", latitude=42.36, longitude=-71.06)
+        win.app.config_manager.get_current_location.return_value = loc
+        win.app.config_manager.get_all_locations.return_value = [loc, other]
+        win.app.weather_client.get_notification_event_data = AsyncMock(
+            return_value=WeatherData(location=loc)
+        )
+        other_data = WeatherData(
+            location=other,
+            alerts=WeatherAlerts(alerts=[WeatherAlert(title="Flood Warning", description="")]),
+        )
+        quiet_data = WeatherData(location=other, alerts=WeatherAlerts(alerts=[]))
+        win.app.weather_client.get_batched_alert_event_data = AsyncMock(
+            return_value=[other_data, quiet_data]
+        )
+
+        with patch("accessiweather.ui.main_window_notification_events.wx") as mock_wx:
+            await win._fetch_notification_event_data()
+
+        win.app.weather_client.get_batched_alert_event_data.assert_awaited_once_with([other])
+        posted = [call.args[1:] for call in mock_wx.CallAfter.call_args_list]
+        assert (WeatherData(location=loc),) in posted
+        assert (other_data, "Boston") in posted
+        assert len(posted) == 2
+
+    @pytest.mark.asyncio
+    async def test_other_locations_are_polled_when_current_location_fails(self):
+        win = self._make_window()
+        loc = Location(name="NYC", latitude=40.71, longitude=-74.0)
+        other = Location(name="Boston", latitude=42.36, longitude=-71.06)
+        win.app.config_manager.get_current_location.return_value = loc
+        win.app.config_manager.get_all_locations.return_value = [loc, other]
+        win.app.weather_client.get_notification_event_data = AsyncMock(
+            side_effect=RuntimeError("network error")
+        )
+        other_data = WeatherData(
+            location=other,
+            alerts=WeatherAlerts(alerts=[WeatherAlert(title="Flood Warning", description="")]),
+        )
+        win.app.weather_client.get_batched_alert_event_data = AsyncMock(return_value=[other_data])
+
+        with patch("accessiweather.ui.main_window_notification_events.wx") as mock_wx:
+            await win._fetch_notification_event_data()
+
+        mock_wx.CallAfter.assert_called_once_with(
+            win._on_notification_event_data_received, other_data, "Boston"
+        )
+
     @pytest.mark.asyncio
     async def test_handles_exception_gracefully(self):
         win = self._make_window()
@@ -387,6 +439,25 @@ class TestOnNotificationEventDataReceived:
         # _process_notification_events is NOT called
         win._process_notification_events.assert_not_called()
 
+    def test_other_location_name_reaches_alert_notifications(self):
+        """Alerts for another saved location are notified under that location's name."""
+        win = self._make_window()
+        win.app.run_async = MagicMock(side_effect=lambda coro: coro)
+        alerts = MagicMock()
+        alerts.has_alerts.return_value = True
+        diff = MagicMock()
+        diff.has_changes = True
+
+        weather_data = MagicMock()
+        weather_data.alerts = alerts
+        weather_data.alert_lifecycle_diff = diff
+
+        win._on_notification_event_data_received(weather_data, "Boston")
+
+        system = win.app.alert_notification_system
+        system.process_and_notify.assert_called_once_with(alerts, location_name="Boston")
+        system.notify_lifecycle_changes.assert_called_once_with(diff, location_name="Boston")
+
     def test_no_alerts_no_diff_does_nothing(self):
         """When there's nothing to process, nothing is done."""
         win = self._make_window()
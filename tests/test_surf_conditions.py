@@ -8,6 +8,7 @@ import httpx
 import pytest
 
 from accessiweather import surf_conditions
+from accessiweather.http_session import shared_transport
 from accessiweather.models import Location, TextProduct
 from accessiweather.surf_conditions import (
     fetch_openmeteo_marine_surf_conditions,
@@ -171,7 +172,11 @@ async def test_fetch_openmeteo_marine_surf_conditions_creates_client(monkeypatch
     )
 
     def fake_async_client(**kwargs):
-        assert kwargs == {"timeout": 3.0, "follow_redirects": True}
+        assert kwargs == {
+            "timeout": 3.0,
+            "follow_redirects": True,
+            "transport": shared_transport(),
+        }
         return _AsyncClientContext(client)
 
     monkeypatch.setattr(surf_conditions.httpx, "AsyncClient", fake_async_client)
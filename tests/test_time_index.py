@@ -0,0 +1,118 @@
+"""Tests for the sorted time index used by hourly forecast lookups."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from accessiweather.models import HourlyForecast, HourlyForecastPeriod
+from accessiweather.models.time_index import TimeIndex, epoch_seconds
+from accessiweather.weather_client_fusion_forecasts import overlay_hourly_pressure
+
+BASE = datetime(2026, 3, 1, tzinfo=UTC)
+
+
+def _index(hours: list[float | None]) -> TimeIndex:
+    return TimeIndex(
+        hours,
+        lambda h: BASE + timedelta(hours=h) if h is not None else None,
+    )
+
+
+def _ts(hours: float) -> float:
+    return (BASE + timedelta(hours=hours)).timestamp()
+
+
+class TestTimeIndex:
+    def test_items_are_sorted_and_untimed_kept_aside(self):
+        index = _index([3, None, 1, 2])
+
+        assert index.items == [1, 2, 3]
+        assert index.untimed == [None]
+        assert len(index) == 3
+
+    def test_nearest_prefers_closest_and_earlier_on_ties(self):
+        index = _index([0, 1, 2, 3])
+
+        assert index.nearest(_ts(1.4)) == 1
+        assert index.nearest(_ts(1.6)) == 2
+        assert index.nearest(_ts(1.5)) == 1
+        assert index.nearest(_ts(-5)) == 0
+        assert index.nearest(_ts(10)) == 3
+
+    def test_nearest_respects_max_delta(self):
+        index = _index([0, 4])
+
+        assert index.nearest(_ts(2), max_delta_seconds=90 * 60) is None
+        assert index.nearest(_ts(1), max_delta_seconds=90 * 60) == 0
+
+    def test_nearest_on_empty_index(self):
+        assert _index([]).nearest(_ts(0)) is None
+
+    def test_window_and_next_n(self):
+        index = _index([0, 1, 2, 3, 4])
+
+        assert index.window(_ts(1), _ts(3)) == [1, 2]
+        assert index.next_n(_ts(2.5), 2) == [3, 4]
+        assert index.next_n(_ts(2.5), 0) == []
+
+    def test_naive_times_can_be_read_as_utc_or_local(self):
+        naive = datetime(2026, 3, 1, 12, 0)
+
+        assert epoch_seconds(naive) == naive.replace(tzinfo=UTC).timestamp()
+        assert epoch_seconds(naive, naive_as="local") == naive.timestamp()
+        assert epoch_seconds(None) is None
+
+
+class TestHourlyForecastTimeIndex:
+    def test_index_is_cached_until_periods_change(self):
+        now = datetime.now(UTC)
+        forecast = HourlyForecast(
+            periods=[HourlyForecastPeriod(start_time=now + timedelta(hours=h)) for h in range(3)]
+        )
+
+        first = forecast.time_index()
+        assert forecast.time_index() is first
+
+        forecast.periods.append(HourlyForecastPeriod(start_time=now + timedelta(hours=3)))
+        assert forecast.time_index() is not first
+        assert len(forecast.time_index()) == 4
+
+    def test_get_next_hours_skips_past_periods_in_time_order(self):
+        now = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+        periods = [
+            HourlyForecastPeriod(start_time=now + timedelta(hours=h), temperature=float(h))
+            for h in (3, -5, 1, 0, 2, -2)
+        ]
+        forecast = HourlyForecast(periods=periods)
+
+        assert [p.temperature for p in forecast.get_next_hours(3)] == [0.0, 1.0, 2.0]
+
+    def test_cached_index_does_not_affect_equality(self):
+        period = HourlyForecastPeriod(start_time=BASE)
+        a = HourlyForecast(periods=[period])
+        b = HourlyForecast(periods=[period])
+        a.time_index()
+
+        assert a == b
+
+
+def test_pressure_overlay_matches_nearest_period_on_long_forecast():
+    display = HourlyForecast(
+        periods=[
+            HourlyForecastPeriod(start_time=BASE + timedelta(hours=h, minutes=20))
+            for h in range(384)
+        ]
+    )
+    pressure = HourlyForecast(
+        periods=[
+            HourlyForecastPeriod(start_time=BASE + timedelta(hours=h), pressure_mb=1000.0 + h)
+            for h in range(0, 384, 3)
+        ]
+    )
+
+    overlaid = overlay_hourly_pressure(display, pressure)
+
+    assert overlaid.periods[0].pressure_mb == 1000.0
+    assert overlaid.periods[2].pressure_mb == 1003.0  # 02:20 is 40 min from 03:00
+    assert overlaid.periods[382].pressure_mb == 1381.0
+    assert overlaid.periods[383].pressure_mb is None  # beyond the 90 minute cutoff
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
 from unittest.mock import MagicMock
 
 import pytest
 
+from accessiweather.climatology_store import ClimatologyStore
 from accessiweather.weather_anomaly import (
     MIN_YEARS_REQUIRED,
     AnomalyCallout,
@@ -275,3 +276,120 @@ class TestComputeAnomaly:
 
     def test_min_years_required_constant(self):
         assert MIN_YEARS_REQUIRED == 3
+
+
+# ---------------------------------------------------------------------------
+# compute_anomaly with a ClimatologyStore
+# ---------------------------------------------------------------------------
+
+
+def _bulk_response(start: date, end: date, temp_for) -> dict:
+    days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+    return {
+        "daily": {
+            "time": [day.isoformat() for day in days],
+            "temperature_2m_mean": [temp_for(day) for day in days],
+        }
+    }
+
+
+class TestClimatologyStore:
+    CURRENT = date(2025, 7, 15)
+
+    def _store(self, tmp_path, today=date(2025, 7, 20)):
+        return ClimatologyStore(path=tmp_path / "climatology.json", today_fn=lambda: today)
+
+    def _client(self, temp_for=lambda day: 60.0 + day.year - 2020):
+        client = MagicMock()
+        client._make_request.side_effect = lambda _endpoint, params, use_archive: _bulk_response(
+            date.fromisoformat(params["start_date"]),
+            date.fromisoformat(params["end_date"]),
+            temp_for,
+        )
+        return client
+
+    def test_one_bulk_download_then_served_from_disk(self, tmp_path):
+        client = self._client()
+        store = self._store(tmp_path)
+
+        first = compute_anomaly(40.0, -74.0, 70.0, self.CURRENT, client, store=store)
+        second = compute_anomaly(
+            40.0, -74.0, 70.0, self.CURRENT, client, store=self._store(tmp_path)
+        )
+
+        assert client._make_request.call_count == 1
+        params = client._make_request.call_args.args[1]
+        assert (params["start_date"], params["end_date"]) == ("2019-12-25", "2025-01-07")
+        # Years 2020..2024 average 62°F.
+        assert first.temp_anomaly == pytest.approx(8.0)
+        assert second.temp_anomaly == pytest.approx(first.temp_anomaly)
+
+    def test_matches_per_year_baseline(self, tmp_path):
+        temp_for = lambda day: 50.0 + (day.toordinal() % 11)  # noqa: E731
+        legacy_client = MagicMock()
+        legacy_client._make_request.side_effect = lambda _endpoint, params, use_archive: (
+            _bulk_response(
+                date.fromisoformat(params["start_date"]),
+                date.fromisoformat(params["end_date"]),
+                temp_for,
+            )
+        )
+
+        legacy = compute_anomaly(40.0, -74.0, 70.0, self.CURRENT, legacy_client)
+        cached = compute_anomaly(
+            40.0, -74.0, 70.0, self.CURRENT, self._client(temp_for), store=self._store(tmp_path)
+        )
+
+        assert legacy_client._make_request.call_count == 5
+        assert cached.temp_anomaly == pytest.approx(legacy.temp_anomaly)
+
+    def test_refreshes_only_when_a_new_year_is_due(self, tmp_path):
+        client = self._client()
+        store = self._store(tmp_path)
+        compute_anomaly(40.0, -74.0, 70.0, self.CURRENT, client, store=store)
+        compute_anomaly(40.0, -74.0, 70.0, date(2025, 12, 31), client, store=store)
+        assert client._make_request.call_count == 1
+
+        compute_anomaly(40.0, -74.0, 70.0, date(2026, 1, 2), client, store=store)
+        assert client._make_request.call_count == 2
+
+    def test_truncated_download_is_extended_once_archive_catches_up(self, tmp_path):
+        client = self._client()
+        compute_anomaly(
+            40.0,
+            -74.0,
+            70.0,
+            date(2026, 1, 3),
+            client,
+            store=self._store(tmp_path, date(2026, 1, 3)),
+        )
+        assert client._make_request.call_args.args[1]["end_date"] == "2025-12-29"
+
+        compute_anomaly(
+            40.0,
+            -74.0,
+            70.0,
+            date(2026, 1, 4),
+            client,
+            store=self._store(tmp_path, date(2026, 1, 4)),
+        )
+        assert client._make_request.call_count == 1
+
+        compute_anomaly(
+            40.0,
+            -74.0,
+            70.0,
+            date(2026, 1, 12),
+            client,
+            store=self._store(tmp_path, date(2026, 1, 12)),
+        )
+        assert client._make_request.call_count == 2
+        assert client._make_request.call_args.args[1]["end_date"] == "2026-01-07"
+
+    def test_failed_download_returns_none_without_storing(self, tmp_path):
+        client = MagicMock()
+        client._make_request.side_effect = RuntimeError("offline")
+        store = self._store(tmp_path)
+
+        assert compute_anomaly(40.0, -74.0, 70.0, self.CURRENT, client, store=store) is None
+        assert len(store) == 0
@@ -1,5 +1,7 @@
 """Tests for Open-Meteo parser behavior."""
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 from accessiweather.weather_client_openmeteo import (
@@ -9,6 +11,12 @@ from accessiweather.weather_client_openmeteo import (
     parse_openmeteo_forecast,
     parse_openmeteo_hourly_forecast,
 )
+from accessiweather.weather_client_openmeteo_units import (
+    normalize_height_to_feet,
+    normalize_snow_depth_to_inches_and_cm,
+    normalize_visibility_to_miles_and_km,
+)
+from accessiweather.weather_client_parsers import convert_wind_speed_to_mph, normalize_pressure
 
 
 def test_parse_openmeteo_forecast_sets_start_time_for_periods():
@@ -336,6 +344,73 @@ def test_parse_openmeteo_hourly_forecast_calculates_dewpoint_when_missing():
     assert period.dewpoint_c is not None
 
 
+def test_parse_openmeteo_hourly_forecast_pads_short_columns_with_none():
+    data = {
+        "utc_offset_seconds": -18000,
+        "hourly": {
+            "time": ["2026-03-19T12:00", "2026-03-19T13:00", "2026-03-19T20:00Z"],
+            "temperature_2m": [40.0, None],
+            "pressure_msl": [1015.0],
+            "visibility": [None, "", 1000.0, 2000.0],
+            "weather_code": [3, 3, 61],
+        },
+    }
+
+    hourly = parse_openmeteo_hourly_forecast(data)
+
+    assert len(hourly.periods) == 3
+    first, second, third = hourly.periods
+    assert first.start_time.utcoffset() == timedelta(hours=-5)
+    assert third.start_time == datetime(2026, 3, 19, 15, 0, tzinfo=timezone(timedelta(hours=-5)))
+    assert second.temperature is None
+    assert third.temperature is None
+    assert first.pressure_mb == 1015.0
+    assert second.pressure_mb is None and second.pressure_in is None
+    assert first.visibility_miles is None and second.visibility_miles is None
+    assert third.visibility_km == pytest.approx(1.0)
+    assert [p.short_forecast for p in hourly.periods] == ["Overcast", "Overcast", "Slight rain"]
+
+
+@pytest.mark.parametrize(
+    "units",
+    [
+        {},
+        {"wind_speed_10m": "kn", "pressure_msl": "Pa", "snow_depth": "cm", "visibility": "km"},
+        {"wind_speed_10m": "m/s", "pressure_msl": "inHg", "freezing_level_height": "km"},
+    ],
+)
+def test_parse_openmeteo_hourly_forecast_matches_scalar_unit_helpers(units):
+    data = {
+        "hourly": {
+            "time": ["2026-03-19T12:00"],
+            "wind_speed_10m": [12.5],
+            "pressure_msl": [1009.3],
+            "snow_depth": [0.42],
+            "freezing_level_height": [1.7],
+            "visibility": [8123.0],
+        },
+        "hourly_units": units,
+    }
+
+    period = parse_openmeteo_hourly_forecast(data).periods[0]
+
+    assert period.wind_speed_mph == convert_wind_speed_to_mph(
+        12.5, units.get("wind_speed_10m", "mph")
+    )
+    assert (period.pressure_in, period.pressure_mb) == normalize_pressure(
+        1009.3, units.get("pressure_msl", "hPa")
+    )
+    assert (
+        period.snow_depth == normalize_snow_depth_to_inches_and_cm(0.42, units.get("snow_depth"))[0]
+    )
+    assert period.freezing_level_ft == normalize_height_to_feet(
+        1.7, units.get("freezing_level_height")
+    )
+    assert (period.visibility_miles, period.visibility_km) == normalize_visibility_to_miles_and_km(
+        8123.0, units.get("visibility")
+    )
+
+
 def _make_current_data(uv_current=None, uv_daily_max=None):
     """Build minimal parse_openmeteo_current_conditions input."""
     data = {
@@ -49,3 +49,124 @@ class TestPreWarmBatch:
         result = await client.pre_warm_batch(locs)
 
         assert result == 1
+
+    @pytest.mark.asyncio
+    async def test_active_then_alerting_locations_start_first(self):
+        """The active location is warmed first, followed by locations with alerts."""
+        from accessiweather.models import Location
+
+        client = self._make_client()
+        quiet = Location(name="Quiet", latitude=40.0, longitude=-75.0)
+        alerting = Location(name="Alerting", latitude=41.0, longitude=-75.0)
+        active = Location(name="Active", latitude=42.0, longitude=-75.0)
+        client._has_known_active_alerts = lambda loc: loc.name == "Alerting"
+        order: list[str] = []
+
+        async def warm(loc):
+            order.append(loc.name)
+            return True
+
+        client.pre_warm_cache = warm
+
+        await client.pre_warm_batch(
+            [quiet, alerting, active], active_location=active, max_concurrency=1
+        )
+
+        assert order == ["Active", "Alerting", "Quiet"]
+
+    @pytest.mark.asyncio
+    async def test_locations_run_concurrently_up_to_limit(self):
+        """No more than max_concurrency locations are warmed at the same time."""
+        import asyncio
+
+        client = self._make_client()
+        client.data_source = "openmeteo"
+        in_flight = 0
+        peak = 0
+
+        async def warm(_loc):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        client.pre_warm_cache = warm
+        locs = [MagicMock(name=f"L{i}") for i in range(6)]
+
+        result = await client.pre_warm_batch(locs, max_concurrency=3, host_budgets={})
+
+        assert result == 6
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_progress_callback_reports_each_location(self):
+        """on_progress is invoked once per location with running totals."""
+        client = self._make_client()
+        client.pre_warm_cache = AsyncMock(side_effect=[True, False])
+        locs = [MagicMock(name="Loc1"), MagicMock(name="Loc2")]
+        progress = MagicMock()
+
+        await client.pre_warm_batch(locs, max_concurrency=1, on_progress=progress)
+
+        assert [call.args[1:] for call in progress.call_args_list] == [(True, 1, 2), (False, 2, 2)]
+
+    def test_known_active_alerts_come_from_memory_only(self):
+        """Refresh planning never falls back to a synchronous offline-cache read."""
+        from accessiweather.models import Location, WeatherAlert, WeatherAlerts
+
+        client = self._make_client()
+        alerting = Location(name="Alerting", latitude=41.0, longitude=-75.0)
+        unknown = Location(name="Unknown", latitude=42.0, longitude=-75.0)
+        client._previous_alerts = {
+            client._location_key(alerting): WeatherAlerts(
+                alerts=[WeatherAlert(title="Flood Warning", description="")]
+            )
+        }
+        client._latest_weather_by_location = {}
+        client.offline_cache = MagicMock()
+        client.get_cached_weather = MagicMock(side_effect=AssertionError("cache read"))
+
+        assert client._has_known_active_alerts(alerting)
+        assert not client._has_known_active_alerts(unknown)
+        client.get_cached_weather.assert_not_called()
+
+
+class TestBatchRefreshCoordinator:
+    """Tests for the per-host budget enforced by BatchRefreshCoordinator."""
+
+    @pytest.mark.asyncio
+    async def test_host_budget_caps_concurrent_refreshes_per_host(self):
+        import asyncio
+
+        from accessiweather.weather_client_batch import NWS_HOST, BatchRefreshCoordinator
+
+        coordinator = BatchRefreshCoordinator(max_concurrency=5, host_budgets={NWS_HOST: 2})
+        in_flight = 0
+        peak = 0
+
+        async def refresh(_loc):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        locs = [MagicMock(name=f"L{i}") for i in range(5)]
+        result = await coordinator.run(locs, refresh, hosts_for=lambda _loc: {NWS_HOST})
+
+        assert result == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_exception_counts_as_failure(self):
+        from accessiweather.weather_client_batch import BatchRefreshCoordinator
+
+        coordinator = BatchRefreshCoordinator(max_concurrency=2)
+        refresh = AsyncMock(side_effect=[RuntimeError("boom"), True])
+
+        result = await coordinator.run([MagicMock(), MagicMock()], refresh)
+
+        assert result == 1
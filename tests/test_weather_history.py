@@ -342,3 +342,144 @@ class TestHistoricalWeatherData:
         assert data.temperature_min == 60.0
         assert data.humidity is None
         assert data.pressure is None
+
+
+# --- WeatherHistoryService with a WeatherHistoryArchive ---
+
+
+def _range_response(start: date, end: date, temp_for=lambda day: 60.0 + day.day) -> dict:
+    days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+    return {
+        "daily": {
+            "time": [day.isoformat() for day in days],
+            "weather_code": [0 for _ in days],
+            "temperature_2m_max": [temp_for(day) + 10 for day in days],
+            "temperature_2m_min": [temp_for(day) - 10 for day in days],
+            "temperature_2m_mean": [temp_for(day) for day in days],
+            "wind_speed_10m_max": [5.0 for _ in days],
+            "wind_direction_10m_dominant": [180 for _ in days],
+        }
+    }
+
+
+def _range_client() -> MagicMock:
+    client = MagicMock()
+    client._make_request.side_effect = lambda _endpoint, params, use_archive: _range_response(
+        date.fromisoformat(params["start_date"]), date.fromisoformat(params["end_date"])
+    )
+    client.get_weather_description.return_value = "Clear"
+    return client
+
+
+class TestWeatherHistoryArchive:
+    def _service(self, tmp_path, client):
+        from accessiweather.weather_history_archive import WeatherHistoryArchive
+
+        archive = WeatherHistoryArchive(path=tmp_path / "history.json")
+        return WeatherHistoryService(openmeteo_client=client, archive=archive)
+
+    def test_compare_recent_fetches_one_range_then_uses_archive(self, tmp_path):
+        client = _range_client()
+        current = _make_current_conditions(temperature=80.0)
+
+        first = self._service(tmp_path, client).compare_recent(_make_location(), current)
+        second = self._service(tmp_path, client).compare_recent(_make_location(), current)
+
+        assert client._make_request.call_count == 1
+        params = client._make_request.call_args.args[1]
+        today = date.today()
+        assert params["start_date"] == (today - timedelta(days=7)).isoformat()
+        assert params["end_date"] == (today - timedelta(days=1)).isoformat()
+        assert set(first) == {1, 7}
+        yesterday = today - timedelta(days=1)
+        assert first[1].temperature_difference == pytest.approx(80.0 - (60.0 + yesterday.day))
+        assert second[7].temperature_difference == pytest.approx(first[7].temperature_difference)
+
+        service = self._service(tmp_path, client)
+        assert service.compare_with_yesterday(_make_location(), current) is not None
+        assert service.compare_with_last_week(_make_location(), current) is not None
+        assert client._make_request.call_count == 1
+
+    def test_only_missing_gaps_are_fetched(self, tmp_path):
+        client = _range_client()
+        service = self._service(tmp_path, client)
+
+        service.get_historical_range(40.0, -74.0, date(2025, 1, 10), date(2025, 1, 12))
+        result = service.get_historical_range(40.0, -74.0, date(2025, 1, 5), date(2025, 1, 15))
+
+        requested = [
+            (call.args[1]["start_date"], call.args[1]["end_date"])
+            for call in client._make_request.call_args_list
+        ]
+        assert requested == [
+            ("2025-01-10", "2025-01-12"),
+            ("2025-01-05", "2025-01-09"),
+            ("2025-01-13", "2025-01-15"),
+        ]
+        assert sorted(result) == [date(2025, 1, day) for day in range(5, 16)]
+
+    def test_days_with_missing_values_are_refetched(self, tmp_path):
+        client = MagicMock()
+        response = _range_response(date(2025, 1, 1), date(2025, 1, 2))
+        response["daily"]["temperature_2m_mean"][1] = None
+        client._make_request.return_value = response
+        client.get_weather_description.return_value = "Clear"
+        service = self._service(tmp_path, client)
+
+        result = service.get_historical_range(40.0, -74.0, date(2025, 1, 1), date(2025, 1, 2))
+        service.get_historical_range(40.0, -74.0, date(2025, 1, 1), date(2025, 1, 2))
+
+        assert list(result) == [date(2025, 1, 1)]
+        assert client._make_request.call_args.args[1]["start_date"] == "2025-01-02"
+        assert client._make_request.call_count == 2
+
+    def test_units_are_archived_separately(self, tmp_path):
+        client = _range_client()
+        service = self._service(tmp_path, client)
+
+        service.get_historical_weather(40.0, -74.0, date(2025, 1, 1))
+        service.get_historical_weather(40.0, -74.0, date(2025, 1, 1), "celsius")
+
+        assert client._make_request.call_count == 2
+
+    def test_merging_a_date_older_than_the_window_keeps_it(self, tmp_path):
+        from accessiweather.weather_history_archive import WeatherHistoryArchive
+
+        archive = WeatherHistoryArchive(path=tmp_path / "history.json", max_days=400)
+        recent = date(2026, 3, 1)
+        old = recent - timedelta(days=500)
+        archive.merge(40.0, -74.0, "fahrenheit", _range_response(recent, recent)["daily"])
+
+        stored = archive.merge(40.0, -74.0, "fahrenheit", _range_response(old, old)["daily"])
+
+        assert stored == 1
+        assert archive.get(40.0, -74.0, "fahrenheit", old) is not None
+        assert archive.missing_ranges(40.0, -74.0, "fahrenheit", old, old) == []
+        reloaded = WeatherHistoryArchive(path=tmp_path / "history.json", max_days=400)
+        assert reloaded.get(40.0, -74.0, "fahrenheit", old) is not None
+
+    def test_trim_keeps_latest_window_around_merged_days(self, tmp_path):
+        from accessiweather.weather_history_archive import WeatherHistoryArchive
+
+        archive = WeatherHistoryArchive(path=tmp_path / "history.json", max_days=10)
+        archive.merge(
+            40.0, -74.0, "fahrenheit", _range_response(date(2025, 1, 1), date(2025, 1, 8))["daily"]
+        )
+        archive.merge(
+            40.0,
+            -74.0,
+            "fahrenheit",
+            _range_response(date(2025, 1, 12), date(2025, 1, 12))["daily"],
+        )
+
+        assert archive.get(40.0, -74.0, "fahrenheit", date(2025, 1, 12)) is not None
+        assert archive.get(40.0, -74.0, "fahrenheit", date(2025, 1, 3)) is not None
+        assert archive.get(40.0, -74.0, "fahrenheit", date(2025, 1, 2)) is None
+
+    @pytest.mark.asyncio
+    async def test_compare_recent_async(self, tmp_path):
+        service = self._service(tmp_path, _range_client())
+        result = await service.compare_recent_async(
+            _make_location(), _make_current_conditions(), days_ago=[1]
+        )
+        assert list(result) == [1]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from accessiweather.display.presentation.memo import PresentationMemo, format_memo_stats
+from accessiweather.display.weather_presenter import WeatherPresenter
+from accessiweather.models import (
+    AppSettings,
+    CurrentConditions,
+    Forecast,
+    ForecastPeriod,
+    HourlyForecast,
+    HourlyForecastPeriod,
+    Location,
+    WeatherAlert,
+    WeatherAlerts,
+    WeatherData,
+)
+
+
+def _weather_data() -> WeatherData:
+    start = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+    return WeatherData(
+        location=Location(name="Testville", latitude=40.0, longitude=-75.0, timezone="UTC"),
+        current=CurrentConditions(temperature_f=70.0, condition="Cloudy"),
+        forecast=Forecast(
+            periods=[ForecastPeriod(name="Today", temperature=72.0, short_forecast="Cloudy")]
+        ),
+        hourly_forecast=HourlyForecast(
+            periods=[
+                HourlyForecastPeriod(start_time=start + timedelta(hours=hour), temperature=70.0)
+                for hour in range(6)
+            ]
+        ),
+        alerts=WeatherAlerts(alerts=[]),
+    )
+
+
+def _stats(presenter: WeatherPresenter) -> dict[str, tuple[int, int]]:
+    return {item.section: (item.hits, item.misses) for item in presenter.memo_stats()}
+
+
+def test_unchanged_inputs_reuse_every_memoized_section():
+    presenter = WeatherPresenter(AppSettings())
+    weather_data = _weather_data()
+
+    first = presenter.present(weather_data)
+    with patch("accessiweather.display.weather_presenter.build_forecast") as build_forecast:
+        second = presenter.present(weather_data)
+
+    build_forecast.assert_not_called()
+    assert second.forecast is first.forecast
+    assert second.current_conditions is first.current_conditions
+    assert all(misses == 1 and hits >= 1 for hits, misses in _stats(presenter).values())
+
+
+def test_only_the_changed_section_is_rebuilt():
+    presenter = WeatherPresenter(AppSettings())
+    weather_data = _weather_data()
+    first = presenter.present(weather_data)
+
+    alert = WeatherAlert(
+        id="a", title="Flood Warning", description="Flooding.", event="Flood Warning"
+    )
+    updated = replace(weather_data, alerts=WeatherAlerts(alerts=[alert]))
+    second = presenter.present(updated)
+
+    assert second.forecast is first.forecast
+    assert second.alerts is not first.alerts
+    assert _stats(presenter)["alerts"] == (0, 2)
+    assert _stats(presenter)["forecast"] == (1, 1)
+
+
+def test_settings_change_invalidates_sections():
+    presenter = WeatherPresenter(AppSettings(temperature_unit="f"))
+    weather_data = _weather_data()
+    first = presenter.present(weather_data)
+
+    presenter.settings.temperature_unit = "c"
+    second = presenter.present(weather_data)
+
+    assert second.current_conditions is not first.current_conditions
+    assert _stats(presenter)["current_conditions"] == (0, 2)
+
+
+def test_memo_evicts_oldest_entry_and_formats_hit_rates():
+    memo = PresentationMemo(max_entries_per_section=1)
+    memo.get_or_build("forecast", "a", (), lambda: 1)
+    memo.get_or_build("forecast", "b", (), lambda: 2)
+
+    assert memo.get_or_build("forecast", "a", (), lambda: 3) == 3
+    assert format_memo_stats(memo.stats()) == "forecast: 0 reused, 3 rebuilt (0% reused)"